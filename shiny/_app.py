@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import os
 import secrets
 from contextlib import AsyncExitStack, asynccontextmanager
@@ -8,6 +9,7 @@ from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    Awaitable,
     Callable,
     Literal,
     Mapping,
@@ -31,6 +33,8 @@ from htmltools import (
 
 if TYPE_CHECKING:
     from htmltools import Tagified
+
+    from .render._try_render_plot import PlotExecutor
 from starlette.requests import Request
 from starlette.responses import HTMLResponse, JSONResponse, Response
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
@@ -38,6 +42,9 @@ from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from ._autoreload import InjectAutoreloadMiddleware, autoreload_url
 from ._connection import Connection, StarletteConnection
 from ._error import ErrorMiddleware
+from ._fileupload import UploadHash
+from ._http_range import not_modified
+from ._json import JSONCodec, JSONCodecName
 from ._shinyenv import is_pyodide
 from ._utils import guess_mime_type, is_async_callable, is_test_mode, sort_keys_length
 from .bookmark._global import as_bookmark_dir_fn
@@ -50,11 +57,18 @@ from .bookmark._types import (
 )
 from .html_dependencies import jquery_deps, require_deps, shiny_deps
 from .http_staticfiles import FileResponse, StaticFiles
+from .reactive._cache import CacheBackend, MemoryCache, _hash_key
+from .reactive._core import FlushMode
 from .session._session import AppSession, Inputs, Outputs, Session, session_context
 from .types import MISSING, MISSING_TYPE
 
 T = TypeVar("T")
 
+# Returns the key under which a request's page is cached (see `App.ui_cache_key`)
+UICacheKeyFn = Callable[[Request], object] | Callable[[Request], Awaitable[object]]
+# A cached page: its HTML, ETag, and HTML dependencies
+CachedPage = tuple[str, str, list[HTMLDependency]]
+
 # Default values for App options.
 LIB_PREFIX: str = "lib/"
 SANITIZE_ERRORS: bool = False
@@ -62,6 +76,20 @@ SANITIZE_ERROR_MSG: str = (
     "An error has occurred. Check your logs or contact the app author for clarification."
 )
 SANITIZE_OTEL_ERRORS: bool = True
+FLUSH_MODE: FlushMode = "sequential"
+FLUSH_MAX_CONCURRENCY: int = 10
+COALESCE_INPUT_UPDATES: bool = False
+JSON_CODEC: JSONCodecName = "orjson"
+PLOT_EXECUTOR: PlotExecutor = "inline"
+UPLOAD_MAX_FILE_SIZE: Optional[int] = None
+UPLOAD_MAX_SESSION_SIZE: Optional[int] = None
+UPLOAD_SPOOL_SIZE: int = 1024 * 1024
+UPLOAD_HASH: Optional[UploadHash] = None
+DEPENDENCY_MAX_AGE: Optional[int] = None
+DEPENDENCY_COMPRESSION: bool = True
+UI_CACHE_KEY: Optional[UICacheKeyFn] = None
+UI_CACHE_MAX_ENTRIES: int = 100
+UI_CACHE_TTL: float = 5 * 60
 
 
 class App:
@@ -140,6 +168,133 @@ class App:
     ``SafeException`` messages bypass sanitization regardless of this setting.
     """
 
+    flush_mode: FlushMode = "sequential"
+    """
+    How each new session runs its pending reactive effects during a flush. With
+    ``"sequential"`` (the default), effects (including outputs) run one at a time. With
+    ``"concurrent"``, effects that share the same priority run concurrently, so outputs
+    that each await a slow async call (e.g. a database query) render in roughly the time
+    of the slowest call rather than the sum of all of them. Effects with a higher
+    priority still finish before effects with a lower priority start. Can be overridden
+    per session with :meth:`~shiny.Session.set_flush_mode`.
+    """
+
+    flush_max_concurrency: int = 10
+    """
+    When ``flush_mode="concurrent"``, the maximum number of effects that a session runs
+    at the same time.
+    """
+
+    coalesce_input_updates: bool = False
+    """
+    Whether new sessions merge input updates that arrive together. When ``True`` and
+    several input update messages are already waiting to be processed (for example,
+    while the user drags a slider), they're applied together, with the latest value of
+    each input winning, and reactives are flushed once rather than for each message.
+    Repeated events (like action and task button clicks) are never merged. ``False``
+    (the default) applies and flushes each message separately. Can be overridden per
+    session with :meth:`~shiny.Session.set_coalesce_input_updates`.
+    """
+
+    json_codec: JSONCodecName | JSONCodec = "orjson"
+    """
+    How new sessions encode and decode websocket messages. ``"orjson"`` (the default)
+    uses the `orjson` package, which is considerably faster than ``"json"``, Python's
+    standard library module. Note that `orjson` sends ``NaN`` and ``Infinity`` as
+    ``null``.
+    """
+
+    plot_executor: PlotExecutor = "inline"
+    """
+    Where :class:`~shiny.render.plot` rasterizes plots, unless its ``executor`` argument
+    is set. ``"inline"`` (the default) saves plots to PNG on the event loop, which blocks
+    every session in the process while it runs. ``"thread"`` and ``"process"`` save them
+    in a (process-wide) pool of threads or processes, so other sessions stay responsive
+    while a slow plot renders. A :class:`concurrent.futures.Executor` may also be given.
+    """
+
+    upload_max_file_size: Optional[int] = None
+    """
+    The largest file, in bytes, that can be uploaded with :func:`~shiny.ui.input_file`.
+    Uploads that declare a larger size are refused before they're sent, and an upload
+    whose data turns out to be larger is stopped (with a 413 response) and removed.
+    ``None`` (the default) means no limit.
+    """
+
+    upload_max_session_size: Optional[int] = None
+    """
+    The most bytes, in total, that each session can upload. Files stay on disk until
+    the session ends, so this bounds the disk space one session can use. ``None`` (the
+    default) means no limit.
+    """
+
+    upload_spool_size: int = 1024 * 1024
+    """
+    Uploaded files up to this many bytes are kept in memory while they're received, and
+    written to disk (in a worker thread) once they're complete. Larger files are
+    written to disk in a worker thread as they're received, so that uploads don't block
+    the event loop.
+    """
+
+    upload_hash: Optional[UploadHash] = None
+    """
+    A checksum to compute for each uploaded file as it's received: ``"sha256"`` or
+    ``"crc32"``. The hex digest is added to the file's
+    :class:`~shiny.types.FileInfo`, under the same name. ``None`` (the default)
+    computes nothing.
+    """
+
+    dependency_max_age: Optional[int] = None
+    """
+    How long, in seconds, browsers may cache the files of HTML dependencies (like
+    Bootstrap, themes, and those of other packages) without checking with the server.
+    Each file has an ETag that's a hash of its content, so with ``None`` (the default),
+    browsers check every time, but only download files that have changed. A dependency
+    can change without a new version (and so without a new URL), so a browser may use
+    an outdated file for up to this long. Shiny's own JavaScript and CSS, which are
+    versioned with Shiny, are always cached for a year, as ``immutable``. While the app
+    is autoreloading (with ``shiny run --reload``), nothing is cached without checking.
+    """
+
+    dependency_compression: bool = True
+    """
+    Whether to send the text files of HTML dependencies (JavaScript, CSS, etc.)
+    compressed, to browsers that accept it: with brotli (if a ``.br`` copy of the file
+    exists, or the `brotli` package is installed), or else gzip. A ``.br`` or ``.gz``
+    copy next to a file is used if it's at least as new. Otherwise, the file is
+    compressed in a worker thread the first time it's requested (and sent uncompressed
+    until that's done), and cached on disk.
+    """
+
+    ui_cache_key: Optional[UICacheKeyFn] = None
+    """
+    Opt in to caching the page rendered by a function ``ui``. When set, this is called
+    (with the :class:`starlette.requests.Request`) for each request for the page, and
+    should return a picklable key that covers everything that the page depends on: for
+    example, ``lambda request: request.url.query``, or a tuple that also includes the
+    user's group. Requests with the same key get the same page, from
+    :attr:`ui_cache`, without calling ``ui``. Cached pages are sent with an ETag, so
+    that a browser that already has the page gets a 304 (Not Modified) response.
+    Requests that restore a bookmark from URL-encoded state are cached separately for
+    each state; ones that restore a bookmark saved on the server always call ``ui``.
+    ``None`` (the default) calls ``ui`` for every request.
+    """
+
+    ui_cache: CacheBackend
+    """
+    Where pages are cached when :attr:`ui_cache_key` is set. Defaults to a
+    :class:`~shiny.reactive.MemoryCache` of up to 100 pages, each of which expires
+    after 5 minutes.
+    """
+
+    cache: CacheBackend
+    """
+    The cache that :func:`~shiny.reactive.cache` uses by default, which is shared by all
+    of the app's sessions. Each app starts with its own
+    :class:`~shiny.reactive.MemoryCache`; set this to use a different size or backend
+    (like a :class:`~shiny.reactive.DiskCache`).
+    """
+
     ui: RenderedHTML | Callable[[Request], Tag | TagList]
     server: Callable[[Inputs, Outputs, Session], None]
 
@@ -197,6 +352,22 @@ class App:
         self.sanitize_errors: bool = SANITIZE_ERRORS
         self.sanitize_error_msg: str = SANITIZE_ERROR_MSG
         self.sanitize_otel_errors: bool = SANITIZE_OTEL_ERRORS
+        self.flush_mode: FlushMode = FLUSH_MODE
+        self.flush_max_concurrency: int = FLUSH_MAX_CONCURRENCY
+        self.coalesce_input_updates: bool = COALESCE_INPUT_UPDATES
+        self.json_codec: JSONCodecName | JSONCodec = JSON_CODEC
+        self.plot_executor: PlotExecutor = PLOT_EXECUTOR
+        self.upload_max_file_size: Optional[int] = UPLOAD_MAX_FILE_SIZE
+        self.upload_max_session_size: Optional[int] = UPLOAD_MAX_SESSION_SIZE
+        self.upload_spool_size: int = UPLOAD_SPOOL_SIZE
+        self.upload_hash: Optional[UploadHash] = UPLOAD_HASH
+        self.dependency_max_age: Optional[int] = DEPENDENCY_MAX_AGE
+        self.dependency_compression: bool = DEPENDENCY_COMPRESSION
+        self.ui_cache_key: Optional[UICacheKeyFn] = UI_CACHE_KEY
+        self.ui_cache: CacheBackend = MemoryCache(
+            max_entries=UI_CACHE_MAX_ENTRIES, ttl=UI_CACHE_TTL
+        )
+        self.cache: CacheBackend = MemoryCache()
 
         if static_assets is None:
             static_assets = {}
@@ -225,8 +396,6 @@ class App:
 
         self._sessions: dict[str, AppSession] = {}
 
-        # self._sessions_needing_flush: dict[int, AppSession] = {}
-
         self._registered_dependencies: dict[str, HTMLDependency] = {}
         self._dependency_handler = starlette.routing.Router()
 
@@ -418,12 +587,54 @@ class App:
         if callable(self.ui):
             # At this point, if `app.bookmark_store != "disable"`, then we've already
             # checked that `ui` is a function (in `App._init_bookmarking()`). No need to throw warning if `ui` is _not_ a function.
+            if self.ui_cache_key is not None and restore_ctx.dir is None:
+                return await self._cached_page_response(request, restore_ctx)
             with restore_context(restore_ctx):
                 ui = self._render_page(self.ui(request), self.lib_prefix)
         else:
             ui = self.ui
         return HTMLResponse(content=ui["html"])
 
+    async def _cached_page_response(
+        self, request: Request, restore_ctx: RestoreContext
+    ) -> Response:
+        assert callable(self.ui) and self.ui_cache_key is not None
+
+        key_fn = self.ui_cache_key
+        if is_async_callable(key_fn):
+            key = await key_fn(request)
+        else:
+            key = key_fn(request)
+        # With bookmarking enabled, every restore context is active; only ones that
+        # restore some (URL-encoded) state change the page, so those are cached
+        # separately for each state.
+        restores_state = bool(restore_ctx.input.as_dict() or restore_ctx.values)
+        restore_key = request.url.query if restores_state else None
+        cache_key = _hash_key("shiny.App.ui", (key, restore_key))
+
+        page = self.ui_cache.get(cache_key)
+        # Files that no longer exist (like those of a theme that was compiled to a
+        # temporary directory, by another process) mean the page must be rendered again
+        if isinstance(page, MISSING_TYPE) or not self._dependency_sources_exist(
+            cast("CachedPage", page)[2]
+        ):
+            with restore_context(restore_ctx):
+                rendered = self._render_page(self.ui(request), self.lib_prefix)
+            html = rendered["html"]
+            etag = '"' + hashlib.sha256(html.encode()).hexdigest()[:32] + '"'
+            page = (html, etag, rendered["dependencies"])
+            self.ui_cache.set(cache_key, page)
+        html, etag, deps = cast("CachedPage", page)
+        # The page may have been rendered by another process (sharing a `DiskCache`), or
+        # before a restart, so make sure that its dependencies are served here too
+        self._ensure_web_dependencies(deps)
+
+        # The page may depend on who the user is, so only their browser may keep it
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if not_modified(request, etag, None):
+            return Response(status_code=304, headers=headers)
+        return HTMLResponse(content=html, headers=headers)
+
     async def _on_connect_cb(self, ws: starlette.websockets.WebSocket) -> None:
         """
         Callback which is invoked when a new WebSocket connection is established.
@@ -454,10 +665,10 @@ class App:
     # Flush
     # ==========================================================================
     def _request_flush(self, session: AppSession) -> None:
-        # TODO: Until we have reactive domains, because we can't yet keep track
-        # of which sessions need a flush.
-        pass
-        # self._sessions_needing_flush[session.id] = session
+        # Mark the session's reactive domain as pending, so that the next flush sends
+        # its outbound messages even if no reactive contexts were invalidated. Sessions
+        # that didn't request a flush (and have nothing pending) are skipped.
+        session._reactive_domain.request_flush()
 
     # ==========================================================================
     # HTML Dependency stuff
@@ -466,6 +677,14 @@ class App:
         for dep in deps:
             self._register_web_dependency(dep)
 
+    def _dependency_sources_exist(self, deps: list[HTMLDependency]) -> bool:
+        for dep in deps:
+            if dep.source:
+                source = dep.source_path_map(lib_prefix=self.lib_prefix)["source"]
+                if source != "" and not os.path.isdir(source):
+                    return False
+        return True
+
     def _register_web_dependency(self, dep: HTMLDependency) -> None:
         # If the dependency has been seen before, quit early.
 
@@ -488,13 +707,20 @@ class App:
         if dep.source:
             paths = dep.source_path_map(lib_prefix=self.lib_prefix)
             if paths["source"] != "":
+                files: ASGIApp
+                if is_pyodide:
+                    files = StaticFiles(directory=paths["source"])
+                else:
+                    from ._dependency_files import DependencyFiles, is_immutable
+
+                    files = DependencyFiles(
+                        directory=paths["source"],
+                        app=self,
+                        immutable=is_immutable(dep),
+                    )
                 self._dependency_handler.routes.insert(
                     0,
-                    starlette.routing.Mount(
-                        "/" + paths["href"],
-                        StaticFiles(directory=paths["source"]),
-                        name=dep_name,
-                    ),
+                    starlette.routing.Mount("/" + paths["href"], files, name=dep_name),
                 )
 
         self._registered_dependencies[dep_name] = dep
@@ -19,6 +19,13 @@ class Connection(ABC):
     @abstractmethod
     async def receive(self) -> str: ...
 
+    async def receive_ready(self) -> Optional[str]:
+        """
+        Return the next message if one has already arrived, or ``None`` if receiving
+        one would have to wait. Connections that can't tell always return ``None``.
+        """
+        return None
+
     @abstractmethod
     async def close(self, code: int, reason: Optional[str]) -> None: ...
 
@@ -41,16 +48,29 @@ class MockConnection(Connection):
             }
         )
         self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._disconnect_received = False
 
     async def send(self, message: str) -> None:
         pass
 
     async def receive(self) -> str:
+        if self._disconnect_received:
+            raise ConnectionClosed()
         msg = await self._queue.get()
         if msg == "":
             raise ConnectionClosed()
         return msg
 
+    async def receive_ready(self) -> Optional[str]:
+        if self._queue.empty() or self._disconnect_received:
+            return None
+        msg = self._queue.get_nowait()
+        if msg == "":
+            # Leave the disconnect for the next `receive()`
+            self._disconnect_received = True
+            return None
+        return msg
+
     async def close(self, code: int, reason: Optional[str]) -> None:
         pass
 
@@ -72,6 +92,9 @@ class StarletteConnection(Connection):
     def __init__(self, conn: starlette.websockets.WebSocket):
         self.conn: starlette.websockets.WebSocket = conn
         self._closed = False
+        # A receive started by `receive_ready()` that hadn't completed yet; the next
+        # `receive()` picks it up, so that no message is lost or reordered.
+        self._pending_receive: Optional[asyncio.Future[str]] = None
 
     async def accept(self, subprotocol: Optional[str] = None):
         await self.conn.accept(subprotocol)  # type: ignore
@@ -96,6 +119,23 @@ class StarletteConnection(Connection):
             return
 
     async def receive(self) -> str:
+        if self._pending_receive is not None:
+            pending, self._pending_receive = self._pending_receive, None
+            return await pending
+        return await self._receive()
+
+    async def receive_ready(self) -> Optional[str]:
+        if self._pending_receive is None:
+            self._pending_receive = asyncio.ensure_future(self._receive())
+        # If a message has already arrived, one turn of the event loop is enough for
+        # the receive to complete
+        await asyncio.sleep(0)
+        if not self._pending_receive.done():
+            return None
+        pending, self._pending_receive = self._pending_receive, None
+        return pending.result()
+
+    async def _receive(self) -> str:
         if self._is_closed():
             raise ConnectionClosed()
 
@@ -122,6 +162,9 @@ class StarletteConnection(Connection):
 
         # Even if self.conn.close() fails, treat this as closed.
         self._closed = True
+        if self._pending_receive is not None:
+            self._pending_receive.cancel()
+            self._pending_receive = None
 
         try:
             await self.conn.close(code)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from queue import PriorityQueue
+import heapq
 from typing import Generic, TypeVar
 
 T = TypeVar("T")
@@ -12,10 +12,13 @@ class PriorityQueueFIFO(Generic[T]):
     priority, they are returned in the order they were inserted. Also, the item
     is kept separate from the priority value (with PriorityQueue, the priority
     is part of the item).
+
+    Unlike queue.PriorityQueue, this is not thread-safe: it is a plain binary heap
+    with no locking, meant to be used from a single event loop.
     """
 
     def __init__(self) -> None:
-        self._pq: PriorityQueue[tuple[int, int, T]] = PriorityQueue()
+        self._heap: list[tuple[int, int, T]] = []
         self._counter: int = 0
 
     def put(self, priority: int, item: T) -> None:
@@ -32,11 +35,27 @@ class PriorityQueueFIFO(Generic[T]):
             The item to put in the queue.
         """
         self._counter += 1
-        self._pq.put((-priority, self._counter, item))
+        heapq.heappush(self._heap, (-priority, self._counter, item))
 
     def get(self) -> T:
-        iteminfo: tuple[int, int, T] = self._pq.get()
-        return iteminfo[2]
+        return heapq.heappop(self._heap)[2]
+
+    def get_same_priority(self) -> list[T]:
+        """
+        Remove and return all items that share the highest priority in the queue, in
+        insertion order.
+        """
+        heap = self._heap
+        if not heap:
+            return []
+        top = heap[0][0]
+        items: list[T] = []
+        while heap and heap[0][0] == top:
+            items.append(heapq.heappop(heap)[2])
+        return items
 
     def empty(self) -> bool:
-        return self._pq.empty()
+        return not self._heap
+
+    def __len__(self) -> int:
+        return len(self._heap)
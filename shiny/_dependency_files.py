@@ -0,0 +1,352 @@
+"""
+Serve the files of HTML dependencies (like Bootstrap, and Shiny's own JavaScript and
+CSS) compressed, and with long-lived caching.
+
+Each file gets an ETag from a hash of its content: a fingerprint that, unlike the
+dependency's version (which is in the URL), changes whenever the file does, so browsers
+can revalidate their copy cheaply. Only Shiny's own dependencies, whose version (and so
+URL) changes with every release of Shiny, are cached as ``immutable``. Browsers
+that accept brotli or gzip get a compressed copy of text files: a ``.br`` or ``.gz``
+file next to the original (written at build time, by running this module on a
+directory), or else one that's compressed in a worker thread the first time the file
+is requested, and cached on disk under its fingerprint. (Until that's done, the file is
+sent uncompressed.)
+
+This uses Starlette's `StaticFiles`, which needs threads, so it isn't used under
+Pyodide.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import importlib.util
+import os
+import sys
+import tempfile
+from typing import TYPE_CHECKING, Callable, Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from . import _utils
+from ._autoreload import autoreload_url
+
+if TYPE_CHECKING:
+    from htmltools import HTMLDependency
+
+    from ._app import App
+
+__all__ = ("DependencyFiles", "is_immutable")
+
+# How long browsers may cache the files of an immutable dependency
+_IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+# Files smaller than this aren't worth compressing
+_MIN_SIZE = 1024
+_COMPRESSIBLE_TYPES = (
+    "application/javascript",
+    "application/json",
+    "application/wasm",
+    "application/xml",
+    "image/svg+xml",
+    "image/x-icon",
+    "text/",
+)
+
+
+def _compress_br(data: bytes) -> bytes:
+    import brotli  # pyright: ignore[reportMissingImports]
+
+    return brotli.compress(data)  # pyright: ignore
+
+
+def _compress_gzip(data: bytes) -> bytes:
+    # mtime=0 so that the same content always compresses to the same bytes
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+# The content codings that can be sent, most preferred first, with the file extension
+# of their compressed copies
+_ENCODINGS: dict[str, tuple[str, Optional[Callable[[bytes], bytes]]]] = {
+    "br": (
+        ".br",
+        _compress_br if importlib.util.find_spec("brotli") is not None else None,
+    ),
+    "gzip": (".gz", _compress_gzip),
+}
+
+
+def default_cache_dir() -> str:
+    import platformdirs
+
+    return os.path.join(platformdirs.user_cache_dir("shiny"), "compressed")
+
+
+def is_compressible(path: str | os.PathLike[str], size: int) -> bool:
+    media_type = _utils.guess_mime_type(path)
+    return size >= _MIN_SIZE and media_type.startswith(_COMPRESSIBLE_TYPES)
+
+
+def fingerprint(path: str | os.PathLike[str]) -> str:
+    """A hash of a file's content."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:32]
+
+
+def accepted_encodings(header: str) -> set[str]:
+    """The content codings in an ``Accept-Encoding`` header (except ``q=0`` ones)."""
+    accepted: set[str] = set()
+    for item in header.split(","):
+        coding, *params = (x.strip() for x in item.split(";"))
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0
+        if q <= 0:
+            continue
+        if coding == "*":
+            accepted.update(_ENCODINGS)
+        elif coding:
+            accepted.add(coding.lower())
+    return accepted
+
+
+def _stat(path: str) -> Optional[os.stat_result]:
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+class _Asset:
+    """What's known about one file: its fingerprint and compressed copies."""
+
+    __slots__ = (
+        "mtime_ns",
+        "size",
+        "fingerprint",
+        "compressible",
+        "compressed",
+        "pending",
+    )
+
+    def __init__(self, path: str, stat_result: os.stat_result, cache_dir: str):
+        self.mtime_ns = stat_result.st_mtime_ns
+        self.size = stat_result.st_size
+        self.fingerprint = fingerprint(path)
+        self.compressible = is_compressible(path, self.size)
+        # Compressed copies, by content coding. `None` means there's no copy to send
+        # (because it'd be no smaller, or it can't be made).
+        self.compressed: dict[str, Optional[tuple[str, os.stat_result]]] = {}
+        # Content codings that are being compressed
+        self.pending: set[str] = set()
+
+        if not self.compressible:
+            return
+        for coding, (ext, _) in _ENCODINGS.items():
+            # A copy next to the original must not be older than it
+            sidecar_stat = _stat(path + ext)
+            if sidecar_stat is not None and sidecar_stat.st_mtime_ns >= self.mtime_ns:
+                self.compressed[coding] = (path + ext, sidecar_stat)
+                continue
+            cached = os.path.join(cache_dir, self.fingerprint + ext)
+            cached_stat = _stat(cached)
+            if cached_stat is not None:
+                self.compressed[coding] = (cached, cached_stat)
+
+
+def is_immutable(dep: HTMLDependency) -> bool:
+    """
+    Whether the files of a dependency can be cached as ``immutable``: only Shiny's own
+    dependencies that are versioned with Shiny are, since any other dependency (like
+    Bootstrap, a theme, or a third-party package) can change without a new version.
+    """
+    from . import __version__
+
+    return (
+        dep.source is not None
+        and dep.source.get("package") == "shiny"
+        and str(dep.version) == __version__
+    )
+
+
+class DependencyFiles(StaticFiles):
+    """
+    Serve a directory of HTML dependency files, with ETags from their content,
+    compressed copies, and caching as configured by the app's ``dependency_max_age``
+    and ``dependency_compression``. With ``immutable=True`` (and unless the app is
+    autoreloading), files are cached for a year, as ``immutable``.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: str | os.PathLike[str],
+        app: App,
+        cache_dir: Optional[str] = None,
+        immutable: bool = False,
+    ):
+        super().__init__(directory=directory)
+        self._app = app
+        self._immutable = immutable
+        self._cache_dir = default_cache_dir() if cache_dir is None else cache_dir
+        self._assets: dict[str, _Asset] = {}
+
+    # Runs in a worker thread, so this is where files are read to fingerprint them
+    def lookup_path(self, path: str) -> tuple[str, os.stat_result | None]:
+        full_path, stat_result = super().lookup_path(path)
+        if stat_result is not None and os.path.isfile(full_path):
+            asset = self._assets.get(full_path)
+            if (
+                asset is None
+                or asset.mtime_ns != stat_result.st_mtime_ns
+                or asset.size != stat_result.st_size
+            ):
+                self._assets[full_path] = _Asset(
+                    full_path, stat_result, self._cache_dir
+                )
+        return full_path, stat_result
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        full_path = str(full_path)
+        asset = self._assets.get(full_path)
+        if asset is None:
+            # Not looked up by `lookup_path()`; shouldn't happen
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        request_headers = Headers(scope=scope)
+        max_age = self._app.dependency_max_age
+        if autoreload_url():
+            cache_control = "no-cache"
+        elif self._immutable:
+            cache_control = f"public, max-age={_IMMUTABLE_MAX_AGE}, immutable"
+        elif max_age is not None:
+            cache_control = f"public, max-age={max_age}"
+        else:
+            cache_control = "no-cache"
+        headers = {"Cache-Control": cache_control}
+
+        path, path_stat, coding = full_path, stat_result, None
+        if self._app.dependency_compression and asset.compressible:
+            headers["Vary"] = "Accept-Encoding"
+            accepted = accepted_encodings(request_headers.get("accept-encoding", ""))
+            for candidate in _ENCODINGS:
+                if candidate not in accepted:
+                    continue
+                if candidate not in asset.compressed:
+                    self._compress_later(full_path, asset, candidate)
+                    continue
+                compressed = asset.compressed[candidate]
+                if compressed is not None:
+                    path, path_stat = compressed
+                    coding = candidate
+                    break
+
+        if coding is None:
+            headers["ETag"] = f'"{asset.fingerprint}"'
+        else:
+            headers["ETag"] = f'"{asset.fingerprint}-{coding}"'
+            headers["Content-Encoding"] = coding
+
+        response = FileResponse(
+            path,
+            status_code=status_code,
+            headers=headers,
+            media_type=_utils.guess_mime_type(full_path),
+            stat_result=path_stat,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def _compress_later(self, path: str, asset: _Asset, coding: str) -> None:
+        compress = _ENCODINGS[coding][1]
+        if compress is None:
+            asset.compressed[coding] = None
+            return
+        if coding in asset.pending:
+            return
+        asset.pending.add(coding)
+
+        def done(future: asyncio.Future[Optional[tuple[str, os.stat_result]]]) -> None:
+            asset.pending.discard(coding)
+            if future.cancelled() or future.exception() is not None:
+                # E.g., the cache directory isn't writable; don't try again
+                asset.compressed[coding] = None
+            else:
+                asset.compressed[coding] = future.result()
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            None,
+            _write_compressed,
+            path,
+            os.path.join(self._cache_dir, asset.fingerprint + _ENCODINGS[coding][0]),
+            compress,
+        )
+        future.add_done_callback(done)
+
+
+def _write_compressed(
+    path: str, dest: str, compress: Callable[[bytes], bytes]
+) -> Optional[tuple[str, os.stat_result]]:
+    """
+    Write a compressed copy of a file (atomically, since other processes may be doing
+    the same). Returns its path and stat, or `None` if it's no smaller.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    compressed = compress(data)
+    if len(compressed) >= len(data):
+        return None
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(dest))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(compressed)
+        os.replace(tmp, dest)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return dest, os.stat(dest)
+
+
+def precompress(directory: str) -> int:
+    """
+    Write a compressed copy next to each file in a directory (recursively) that's worth
+    compressing, for each content coding that's available. Returns the number written.
+    """
+    n = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if name.endswith(tuple(ext for ext, _ in _ENCODINGS.values())):
+                continue
+            path = os.path.join(root, name)
+            if not is_compressible(path, os.path.getsize(path)):
+                continue
+            for ext, compress in _ENCODINGS.values():
+                if compress is not None and _write_compressed(
+                    path, path + ext, compress
+                ):
+                    n += 1
+    return n
+
+
+if __name__ == "__main__":
+    for directory in sys.argv[1:]:
+        n = precompress(directory)
+        print(f"Wrote {n} compressed files in {directory}")
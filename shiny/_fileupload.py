@@ -1,14 +1,35 @@
 from __future__ import annotations
 
+import asyncio
 import copy
+import hashlib
 import os
 import pathlib
 import shutil
 import tempfile
-from typing import BinaryIO, List, Optional, cast
+import zlib
+from typing import (
+    Any,
+    AsyncIterable,
+    BinaryIO,
+    List,
+    Literal,
+    Optional,
+    Protocol,
+    cast,
+)
 
 from . import _utils
-from .types import FileInfo
+from .types import FileInfo, SafeException
+
+UploadHash = Literal["sha256", "crc32"]
+
+# Received data is written to disk (in a worker thread) in pieces of at least this
+# size, so that each file doesn't need a thread hop for every chunk of the request.
+_WRITE_SIZE = 256 * 1024
+
+# The most bytes that one chunk of the chunked upload protocol (below) can have.
+MAX_CHUNK_SIZE = 16 * 1024 * 1024
 
 # File uploads happen through a series of requests. This requires a browser
 # which supports the HTML5 File API.
@@ -22,7 +43,8 @@ from .types import FileInfo
 #
 # 2. For each file (sequentially):
 #    b. Client makes a POST request with the file data.
-#    c. Server sends a 200 response to the client.
+#    c. Server sends a 200 response to the client (or a 413 response if the file is
+#       larger than the app's upload limits allow).
 #
 # 3. Repeat 2 until all files have been uploaded.
 #
@@ -31,6 +53,251 @@ from .types import FileInfo
 #    with the tag ID and a null message. The messages look like this:
 #    RECV {"method":"uploadEnd","args":["1651ddebfb643a26e6f18aa1","file1"],"tag":3}
 #    SEND {"response":{"tag":3,"value":null}}
+#
+# Instead of step 2, a client can upload the files in chunks, which can be sent in
+# any order, in parallel (including chunks of different files), and retried, so that
+# an interrupted upload can be resumed rather than restarted:
+#
+# 2. For each chunk, the client makes a POST request to the "uploadUrl" with
+#    `file=<index of the file in uploadInit>&offset=<byte offset of the chunk>`
+#    added to the query string, and the chunk's data as the body. The server
+#    responds with the byte ranges of that file that it has received so far, and
+#    whether it's complete:
+#    {"received": [[0, 1048576], [2097152, 3145728]], "complete": false}
+#    Chunks may overlap or repeat; a chunk that would extend past the file's size
+#    (from uploadInit) gets a 400 response, and one larger than `MAX_CHUNK_SIZE` gets
+#    a 413 response. A file of size 0 is uploaded with one empty chunk at offset 0.
+#
+# 3. To resume, the client makes a GET request to the "uploadUrl" with `file=<index>`,
+#    which responds in the same way, and sends the chunks that are missing.
+
+
+class UploadSizeError(SafeException):
+    """
+    Raised when an upload is larger than the app's upload limits allow. The message is
+    shown to the user, even when errors are sanitized.
+    """
+
+
+class _Hasher(Protocol):
+    def update(self, data: bytes, /) -> None: ...
+
+    def hexdigest(self) -> str: ...
+
+
+class _CRC32:
+    # `zlib.crc32()` with the same interface as the `hashlib` objects.
+    def __init__(self) -> None:
+        self._value = 0
+
+    def update(self, data: bytes, /) -> None:
+        self._value = zlib.crc32(data, self._value)
+
+    def hexdigest(self) -> str:
+        return f"{self._value:08x}"
+
+
+def _new_hasher(hash: UploadHash) -> _Hasher:
+    if hash == "sha256":
+        return hashlib.sha256()
+    if hash == "crc32":
+        return _CRC32()
+    raise ValueError(f"Unknown upload hash: {hash!r}")
+
+
+class _UploadFileWriter:
+    """
+    Writes one uploaded file without blocking the event loop.
+
+    Data is kept in memory until there's more than `spool_size` bytes of it, so a small
+    file is written (and hashed) with one call in a worker thread when it's closed.
+    After that, data is written in pieces of at least `_WRITE_SIZE` bytes, each in a
+    worker thread while the next piece is received.
+    """
+
+    def __init__(
+        self, path: str, spool_size: int, hasher: Optional[_Hasher] = None
+    ) -> None:
+        self.path = path
+        self.size: int = 0
+        self._spool_size = spool_size
+        self._hasher = hasher
+        self._buffer: list[bytes] = []
+        self._buffer_size: int = 0
+        self._file: Optional[BinaryIO] = None
+        # Whether anything has been (or is being) written to disk
+        self._on_disk: bool = False
+        self._pending: Optional[asyncio.Future[None]] = None
+
+    async def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        self._buffer.append(chunk)
+        self._buffer_size += len(chunk)
+        limit = _WRITE_SIZE if self._on_disk else self._spool_size
+        if self._buffer_size > limit:
+            await self._write_buffer(close=False)
+
+    async def close(self) -> Optional[str]:
+        """Write the rest of the file, and return its hash (if it's being hashed)."""
+        await self._write_buffer(close=True)
+        await self._wait()
+        return None if self._hasher is None else self._hasher.hexdigest()
+
+    async def abort(self) -> None:
+        """Stop writing, and remove whatever was written."""
+        self._buffer.clear()
+        try:
+            await self._wait()
+        except Exception:
+            pass
+        await asyncio.get_running_loop().run_in_executor(None, self._remove)
+
+    async def _write_buffer(self, *, close: bool) -> None:
+        data = b"".join(self._buffer)
+        self._buffer.clear()
+        self._buffer_size = 0
+        # Writes happen one at a time, in order; wait for the previous one
+        await self._wait()
+        self._on_disk = True
+        self._pending = asyncio.get_running_loop().run_in_executor(
+            None, self._write_sync, data, close
+        )
+
+    async def _wait(self) -> None:
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            await pending
+
+    # These run in a worker thread.
+    def _write_sync(self, data: bytes, close: bool) -> None:
+        if self._file is None:
+            self._file = open(self.path, "ab")
+        if self._hasher is not None:
+            self._hasher.update(data)
+        self._file.write(data)
+        if close:
+            self._file.close()
+
+    def _remove(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class _ChunkedUploadFile:
+    """
+    A file that's uploaded in chunks, which can arrive in any order, concurrently, and
+    more than once. Each chunk is written at its offset as it's received, in pieces of
+    at least `_WRITE_SIZE` bytes (each in a worker thread while the next piece is
+    received), and the received byte ranges are kept (merged, and in order) to know
+    when it's complete.
+    """
+
+    def __init__(self, path: str, size: int, hash: Optional[UploadHash]) -> None:
+        self.path = path
+        self.size = size
+        self._hash: Optional[UploadHash] = hash
+        self.received: list[tuple[int, int]] = []
+        self.digest: Optional[str] = None
+        # Creating the (sparse, full-size) file, and finishing it once it's complete;
+        # every chunk that's received while these are happening waits for them
+        self._created: Optional[asyncio.Future[None]] = None
+        self._finished: Optional[asyncio.Future[None]] = None
+
+    @property
+    def complete(self) -> bool:
+        return self.received == [(0, self.size)] or (
+            self.size == 0 and self._created is not None
+        )
+
+    @property
+    def done(self) -> bool:
+        return self._finished is not None and self._finished.done()
+
+    async def write(self, offset: int, chunks: AsyncIterable[bytes]) -> None:
+        loop = asyncio.get_running_loop()
+        if self._created is None:
+            self._created = loop.run_in_executor(None, self._create_sync)
+        await asyncio.shield(self._created)
+
+        buffer: list[bytes] = []
+        buffer_size = 0
+        # The piece that's being written, and where
+        pending: Optional[tuple[asyncio.Future[None], int, int]] = None
+
+        async def wait() -> None:
+            nonlocal pending
+            if pending is not None:
+                future, start, end = pending
+                pending = None
+                await future
+                self.received = _add_range(self.received, start, end)
+
+        async def write_buffer() -> None:
+            nonlocal buffer_size, offset, pending
+            data = b"".join(buffer)
+            buffer.clear()
+            buffer_size = 0
+            # Writes happen one at a time, in order; wait for the previous one
+            await wait()
+            future = loop.run_in_executor(None, self._write_sync, offset, data)
+            pending = (future, offset, offset + len(data))
+            offset += len(data)
+
+        try:
+            async for chunk in chunks:
+                buffer.append(chunk)
+                buffer_size += len(chunk)
+                if buffer_size >= _WRITE_SIZE:
+                    await write_buffer()
+            if buffer_size > 0:
+                await write_buffer()
+        finally:
+            # What's been written so far counts as received, even if the rest of the
+            # chunk didn't arrive
+            await wait()
+
+        if self.complete:
+            if self._finished is None:
+                self._finished = loop.run_in_executor(None, self._finish_sync)
+            await asyncio.shield(self._finished)
+
+    # These run in a worker thread.
+    def _create_sync(self) -> None:
+        with open(self.path, "wb") as f:
+            f.truncate(self.size)
+
+    def _write_sync(self, offset: int, data: bytes) -> None:
+        with open(self.path, "r+b") as f:
+            f.seek(offset)
+            f.write(data)
+
+    def _finish_sync(self) -> None:
+        hash = self._hash
+        if hash is None:
+            return
+        # The chunks can't be hashed as they arrive, since they're out of order
+        hasher = _new_hasher(hash)
+        with open(self.path, "rb") as f:
+            while data := f.read(_WRITE_SIZE):
+                hasher.update(data)
+        self.digest = hasher.hexdigest()
+
+
+def _add_range(
+    ranges: list[tuple[int, int]], start: int, end: int
+) -> list[tuple[int, int]]:
+    """Add the range [start, end) to sorted, non-overlapping ranges, merging them."""
+    result: list[tuple[int, int]] = []
+    for r_start, r_end in ranges:
+        if r_end < start or r_start > end:
+            result.append((r_start, r_end))
+        else:
+            start, end = min(start, r_start), max(end, r_end)
+    result.append((start, end))
+    result.sort()
+    return result
 
 
 class FileUploadOperation:
@@ -45,54 +312,191 @@ class FileUploadOperation:
             cast(FileInfo, {**fi, "datapath": ""}) for fi in copy.deepcopy(file_infos)
         ]
         self._n_uploaded: int = 0
-        self._current_file_obj: Optional[BinaryIO] = None
+        self._current_file: Optional[_UploadFileWriter] = None
+        # Files that are being uploaded in chunks, by index
+        self._chunked_files: dict[int, _ChunkedUploadFile] = {}
+
+    def _set_datapath(self, index: int) -> str:
+        file_info: FileInfo = self._file_infos[index]
+        file_ext = pathlib.Path(file_info["name"]).suffix
+        file_info["datapath"] = os.path.join(self._dir, str(index) + file_ext)
+        return file_info["datapath"]
+
+    def _set_digest(self, index: int, digest: Optional[str]) -> None:
+        hash = self._parent.hash
+        if digest is not None and hash is not None:
+            file_info = cast(dict[str, Any], self._file_infos[index])
+            file_info[hash] = digest
 
     # Start uploading one of the files.
     def file_begin(self) -> None:
-        file_info: FileInfo = self._file_infos[self._n_uploaded]
-        file_ext = pathlib.Path(file_info["name"]).suffix
-        file_info["datapath"] = os.path.join(
-            self._dir, str(self._n_uploaded) + file_ext
+        datapath = self._set_datapath(self._n_uploaded)
+        hash = self._parent.hash
+        self._current_file = _UploadFileWriter(
+            datapath,
+            spool_size=self._parent.spool_size,
+            hasher=None if hash is None else _new_hasher(hash),
         )
-        self._current_file_obj = open(file_info["datapath"], "ab")
 
     # Finish uploading one of the files.
-    def file_end(self) -> None:
-        if self._current_file_obj is not None:
-            self._current_file_obj.close()
-        self._current_file_obj = None
+    async def file_end(self) -> None:
+        if self._current_file is not None:
+            self._set_digest(self._n_uploaded, await self._current_file.close())
+        self._current_file = None
         self._n_uploaded += 1
 
+    # Stop uploading one of the files (because the request failed or was too large),
+    # and remove its data. The file doesn't count as uploaded.
+    async def file_abort(self) -> None:
+        if self._current_file is not None:
+            self._parent.release(self._current_file.size)
+            await self._current_file.abort()
+        self._current_file = None
+
     # Write a chunk of data for the currently-open file.
-    def write_chunk(self, chunk: bytes) -> None:
-        if self._current_file_obj is None:
+    async def write_chunk(self, chunk: bytes) -> None:
+        if self._current_file is None:
             raise RuntimeError(f"FileUploadOperation for {self._id} is not open.")
-        self._current_file_obj.write(chunk)
+        max_file_size = self._parent.max_file_size
+        if (
+            max_file_size is not None
+            and self._current_file.size + len(chunk) > max_file_size
+        ):
+            raise UploadSizeError(
+                f"File is larger than the maximum upload size of {max_file_size} bytes."
+            )
+        self._parent.reserve(len(chunk))
+        await self._current_file.write(chunk)
+
+    # The most bytes that a chunk of one of the files, starting at `offset`, can have.
+    # Raises ValueError if there's no such file or offset.
+    def max_chunk_size(self, index: int, offset: int) -> int:
+        if not 0 <= index < len(self._file_infos):
+            raise ValueError(f"There is no file {index} in upload {self._id}.")
+        size = self._file_infos[index]["size"]
+        if not 0 <= offset <= size:
+            raise ValueError(f"Offset {offset} is outside of file {index}.")
+        return size - offset
+
+    # Check that a chunk of one of the files, starting at `offset`, can have `size`
+    # bytes. Raises UploadSizeError if it's larger than MAX_CHUNK_SIZE, and ValueError
+    # if it extends past the end of the file.
+    def check_chunk_size(self, index: int, offset: int, size: int) -> None:
+        if size > MAX_CHUNK_SIZE:
+            raise UploadSizeError(
+                f"Chunk is larger than the maximum of {MAX_CHUNK_SIZE} bytes."
+            )
+        if size > self.max_chunk_size(index, offset):
+            raise ValueError(f"Chunk extends past the end of file {index}.")
+
+    # Write a chunk of one of the files, for the chunked upload protocol.
+    async def write_file_chunk(self, index: int, offset: int, data: bytes) -> None:
+        async def chunks():
+            yield data
+
+        await self.stream_file_chunk(index, offset, chunks())
+
+    # Write a chunk of one of the files, for the chunked upload protocol, as its data
+    # is received. Raises like `check_chunk_size()` once too much data arrives, with
+    # the data before that point written.
+    async def stream_file_chunk(
+        self, index: int, offset: int, chunks: AsyncIterable[bytes]
+    ) -> None:
+        self.check_chunk_size(index, offset, 0)
+
+        async def checked_chunks():
+            n = 0
+            async for chunk in chunks:
+                n += len(chunk)
+                self.check_chunk_size(index, offset, n)
+                yield chunk
+
+        file = self._chunked_files.get(index)
+        if file is None:
+            size = self._file_infos[index]["size"]
+            # The whole file counts against the session's upload limit once its first
+            # chunk arrives, so parallel chunks can't go over it
+            self._parent.reserve(size)
+            file = _ChunkedUploadFile(
+                self._set_datapath(index), size, hash=self._parent.hash
+            )
+            self._chunked_files[index] = file
+        await file.write(offset, checked_chunks())
+        if file.done:
+            self._set_digest(index, file.digest)
+
+    # The byte ranges of one of the files that have been received, for the chunked
+    # upload protocol, and whether the file is complete.
+    def file_received(self, index: int) -> tuple[list[tuple[int, int]], bool]:
+        self.max_chunk_size(index, 0)
+        file = self._chunked_files.get(index)
+        if file is None:
+            return [], False
+        return list(file.received), file.done
+
+    def _n_complete(self) -> int:
+        n_chunked = sum(1 for file in self._chunked_files.values() if file.done)
+        return self._n_uploaded + n_chunked
 
     # End the entire operation, which can consist of multiple files.
     def finish(self) -> List[FileInfo]:
-        if self._n_uploaded != len(self._file_infos):
+        if self._n_complete() != len(self._file_infos):
             raise RuntimeError(
                 f"Not all files for FileUploadOperation {self._id} were uploaded."
             )
         self._parent.on_job_finished(self._id)
         return self._file_infos
 
-    # Context handlers for `with`
-    def __enter__(self) -> None:
+    # Context handlers for `async with`
+    async def __aenter__(self) -> None:
         self.file_begin()
 
-    def __exit__(self, type, value, trace) -> None:  # type: ignore
-        self.file_end()
+    async def __aexit__(self, type, value, trace) -> None:  # type: ignore
+        if type is None:
+            await self.file_end()
+        else:
+            await self.file_abort()
 
 
 class FileUploadManager:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        max_file_size: Optional[int] = None,
+        max_session_size: Optional[int] = None,
+        spool_size: int = 1024 * 1024,
+        hash: Optional[UploadHash] = None,
+    ) -> None:
         # TODO: Remove basedir when app exits.
         self._basedir: str = tempfile.mkdtemp(prefix="fileupload-")
         self._operations: dict[str, FileUploadOperation] = {}
+        self.max_file_size: Optional[int] = max_file_size
+        self.max_session_size: Optional[int] = max_session_size
+        self.spool_size: int = spool_size
+        self.hash: Optional[UploadHash] = hash
+        # The bytes of all of the files that have been (or are being) uploaded
+        self._n_bytes: int = 0
 
     def create_upload_operation(self, file_infos: List[FileInfo]) -> str:
+        # Reject uploads that are too large before they're sent, going by the sizes
+        # that the client reports. (The data is still checked as it's received.)
+        sizes = [fi.get("size", 0) for fi in file_infos]
+        if self.max_file_size is not None and any(
+            size > self.max_file_size for size in sizes
+        ):
+            raise UploadSizeError(
+                "File is larger than the maximum upload size of "
+                f"{self.max_file_size} bytes."
+            )
+        if (
+            self.max_session_size is not None
+            and self._n_bytes + sum(sizes) > self.max_session_size
+        ):
+            raise UploadSizeError(
+                "Files are larger than the maximum total upload size of "
+                f"{self.max_session_size} bytes."
+            )
+
         job_id = _utils.rand_hex(12)
         dir = tempfile.mkdtemp(dir=self._basedir)
         self._operations[job_id] = FileUploadOperation(self, job_id, dir, file_infos)
@@ -107,7 +511,25 @@ class FileUploadManager:
     def on_job_finished(self, job_id: str) -> None:
         del self._operations[job_id]
 
+    # Count bytes that are about to be written against the session's upload limit.
+    def reserve(self, n_bytes: int) -> None:
+        if (
+            self.max_session_size is not None
+            and self._n_bytes + n_bytes > self.max_session_size
+        ):
+            raise UploadSizeError(
+                "Files are larger than the maximum total upload size of "
+                f"{self.max_session_size} bytes."
+            )
+        self._n_bytes += n_bytes
+
+    # Stop counting bytes from a file that was removed.
+    def release(self, n_bytes: int) -> None:
+        self._n_bytes -= n_bytes
+
     # Remove the directories containing file uploads; this is to be called when
     # a session ends.
-    def rm_upload_dir(self) -> None:
-        shutil.rmtree(self._basedir)
+    async def rm_upload_dir(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(
+            None, shutil.rmtree, self._basedir
+        )
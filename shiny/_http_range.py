@@ -0,0 +1,320 @@
+"""
+HTTP range and conditional requests, for session downloads and dynamic routes.
+
+Implements the parts of RFC 9110 that let a client resume a download or seek within
+media: ``Range`` (one or more byte ranges, the latter as ``multipart/byteranges``),
+``If-Range``, and ``If-None-Match``/``If-Modified-Since`` (for 304 responses). This is
+done here, rather than relying on Starlette's ``FileResponse``, because only recent
+versions of Starlette support ranges, and the same logic is needed for generated
+content (:class:`~shiny.types.SeekableContent`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import os
+import secrets
+from datetime import datetime
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable, Optional
+
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+
+from ._shinyenv import is_pyodide
+from .types import SeekableContent
+
+__all__ = (
+    "RangeReader",
+    "file_reader",
+    "file_validators",
+    "not_modified",
+    "range_response",
+    "seekable_response",
+    "validator_headers",
+)
+
+# Reads the bytes [start, end) of some content
+RangeReader = Callable[[int, int], AsyncIterator[bytes]]
+
+_READ_SIZE = 64 * 1024
+# Requests for more ranges than this get the whole content instead. (Many tiny ranges
+# cost far more to serve than the content itself.)
+_MAX_RANGES = 100
+
+
+class _RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_range(header: str, size: int) -> Optional[list[tuple[int, int]]]:
+    """
+    Parse a ``Range`` header into sorted, non-overlapping ``[start, end)`` byte ranges.
+
+    Returns ``None`` if the header should be ignored (it's malformed, isn't for bytes,
+    or asks for too many ranges), in which case the whole content is sent. Raises
+    `_RangeNotSatisfiable` if none of the ranges overlap the content.
+    """
+    unit, _, range_set = header.partition("=")
+    if unit.strip().lower() != "bytes" or not range_set.strip():
+        return None
+    specs = range_set.split(",")
+    if len(specs) > _MAX_RANGES:
+        return None
+
+    ranges: list[tuple[int, int]] = []
+    for spec in specs:
+        first, dash, last = spec.strip().partition("-")
+        if not dash:
+            return None
+        try:
+            if first == "":
+                # A suffix range: the last `last` bytes
+                suffix = int(last)
+                if suffix < 0:
+                    return None
+                if suffix > 0 and size > 0:
+                    ranges.append((max(size - suffix, 0), size))
+                continue
+            start = int(first)
+            end = int(last) + 1 if last != "" else None
+        except ValueError:
+            return None
+        if start < 0 or (end is not None and end <= start):
+            return None
+        if start < size:
+            ranges.append((start, size if end is None else min(end, size)))
+
+    if not ranges:
+        raise _RangeNotSatisfiable()
+
+    # Merge ranges that overlap or touch
+    ranges.sort()
+    merged = [ranges[0]]
+    for start, end in ranges[1:]:
+        prev_start, prev_end = merged[-1]
+        if start <= prev_end:
+            merged[-1] = (prev_start, max(prev_end, end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _http_date(timestamp: float) -> str:
+    return email.utils.formatdate(timestamp, usegmt=True)
+
+
+def _parse_http_date(value: str) -> Optional[float]:
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _etag_matches(header: str, etag: str, *, weak: bool) -> bool:
+    if header.strip() == "*":
+        return True
+
+    def opaque(tag: str) -> str:
+        return tag[2:] if tag.startswith("W/") else tag
+
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if weak:
+            if opaque(candidate) == opaque(etag):
+                return True
+        elif candidate == etag and not etag.startswith("W/"):
+            return True
+    return False
+
+
+def not_modified(
+    request: Request, etag: Optional[str], last_modified: Optional[float]
+) -> bool:
+    """Whether the client already has the current version (so should get a 304)."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag is not None and _etag_matches(if_none_match, etag, weak=True)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None and last_modified is not None:
+        since = _parse_http_date(if_modified_since)
+        # HTTP dates have a resolution of one second
+        return since is not None and int(last_modified) <= since
+    return False
+
+
+def _if_range_matches(
+    request: Request, etag: Optional[str], last_modified: Optional[float]
+) -> bool:
+    if_range = request.headers.get("if-range")
+    if if_range is None:
+        return True
+    if_range = if_range.strip()
+    if if_range.startswith(('"', "W/")):
+        return etag is not None and _etag_matches(if_range, etag, weak=False)
+    date = _parse_http_date(if_range)
+    return date is not None and last_modified is not None and int(last_modified) == date
+
+
+def validator_headers(
+    etag: Optional[str], last_modified: Optional[float]
+) -> dict[str, str]:
+    """The headers that let clients make range and conditional requests."""
+    headers = {"Accept-Ranges": "bytes"}
+    if etag is not None:
+        headers["ETag"] = etag
+    if last_modified is not None:
+        headers["Last-Modified"] = _http_date(last_modified)
+    return headers
+
+
+def range_response(
+    request: Request,
+    *,
+    size: int,
+    read: RangeReader,
+    headers: dict[str, str],
+    media_type: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[float] = None,
+) -> Optional[Response]:
+    """
+    The response to a conditional or range request for some content: a 304 (Not
+    Modified), a 206 (Partial Content) with the requested ranges, or a 416 (Range Not
+    Satisfiable). Returns ``None`` if the whole content should be sent, as usual (with
+    `validator_headers()` added).
+    """
+    headers = {**headers, **validator_headers(etag, last_modified)}
+
+    if not_modified(request, etag, last_modified):
+        # A 304 has the headers that a 200 would, but no content headers
+        not_modified_headers = {
+            k: v for k, v in headers.items() if k.lower() != "content-disposition"
+        }
+        return Response(status_code=304, headers=not_modified_headers)
+
+    range_header = request.headers.get("range")
+    if range_header is None or not _if_range_matches(request, etag, last_modified):
+        return None
+    try:
+        ranges = parse_range(range_header, size)
+    except _RangeNotSatisfiable:
+        return Response(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+    if ranges is None:
+        return None
+
+    if len(ranges) == 1:
+        [(start, end)] = ranges
+        headers["Content-Range"] = f"bytes {start}-{end - 1}/{size}"
+        headers["Content-Length"] = str(end - start)
+        return StreamingResponse(
+            read(start, end), 206, headers=headers, media_type=media_type
+        )
+
+    boundary = secrets.token_hex(16)
+    part_headers = [
+        (
+            f"--{boundary}\r\n"
+            f"Content-Type: {media_type}\r\n"
+            f"Content-Range: bytes {start}-{end - 1}/{size}\r\n\r\n"
+        ).encode("latin-1")
+        for start, end in ranges
+    ]
+    trailer = f"--{boundary}--\r\n".encode("latin-1")
+    length = sum(
+        len(h) + (end - start) + 2 for h, (start, end) in zip(part_headers, ranges)
+    )
+    headers["Content-Length"] = str(length + len(trailer))
+
+    async def multipart() -> AsyncIterator[bytes]:
+        for part_header, (start, end) in zip(part_headers, ranges):
+            yield part_header
+            async for chunk in read(start, end):
+                yield chunk
+            yield b"\r\n"
+        yield trailer
+
+    return StreamingResponse(
+        multipart(),
+        206,
+        headers=headers,
+        media_type=f"multipart/byteranges; boundary={boundary}",
+    )
+
+
+def file_validators(path: str | os.PathLike[str]) -> tuple[int, str, float]:
+    """The size, ETag, and modification time of a file."""
+    stat = os.stat(path)
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    return stat.st_size, etag, stat.st_mtime
+
+
+def file_reader(path: str | os.PathLike[str]) -> RangeReader:
+    """Read ranges of a file, in a worker thread (except under Pyodide)."""
+
+    async def read(start: int, end: int) -> AsyncIterator[bytes]:
+        loop = asyncio.get_running_loop()
+        f = open(path, "rb")
+        try:
+            f.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                n = min(remaining, _READ_SIZE)
+                if is_pyodide:
+                    data = f.read(n)
+                else:
+                    data = await loop.run_in_executor(None, f.read, n)
+                if not data:
+                    break
+                remaining -= len(data)
+                yield data
+        finally:
+            f.close()
+
+    return read
+
+
+def seekable_response(
+    request: Request,
+    content: SeekableContent,
+    *,
+    headers: dict[str, str],
+    media_type: str,
+    wrap: Callable[[Iterable[bytes] | AsyncIterable[bytes]], AsyncIterable[bytes]],
+) -> Response:
+    """
+    The response to a request for a `SeekableContent`, with `wrap()` turning whatever
+    its `read()` returns into an async iterable of bytes (in the right context).
+    """
+
+    async def read(start: int, end: int) -> AsyncIterator[bytes]:
+        async for chunk in wrap(content.read(start, end)):
+            yield chunk
+
+    etag = content.etag
+    last_modified = content.last_modified
+    if isinstance(last_modified, datetime):
+        last_modified = last_modified.timestamp()
+    if etag is not None or last_modified is not None:
+        # Let clients keep the content, as long as they check that it's still current
+        headers = {**headers, "Cache-Control": "no-cache"}
+
+    response = range_response(
+        request,
+        size=content.size,
+        read=read,
+        headers=headers,
+        media_type=media_type,
+        etag=etag,
+        last_modified=last_modified,
+    )
+    if response is not None:
+        return response
+    headers = {
+        **headers,
+        **validator_headers(etag, last_modified),
+        "Content-Length": str(content.size),
+    }
+    return StreamingResponse(
+        read(0, content.size), 200, headers=headers, media_type=media_type
+    )
@@ -0,0 +1,182 @@
+"""
+JSON codecs for the messages exchanged with the browser over the websocket.
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Literal, TypeVar, Union, cast
+
+import orjson
+
+T = TypeVar("T")
+
+__all__ = (
+    "JSONCodec",
+    "JSONCodecName",
+    "OrjsonCodec",
+    "RawJSON",
+    "StdlibJSONCodec",
+    "freeze_lists",
+    "resolve_json_codec",
+)
+
+JSONCodecName = Literal["orjson", "json"]
+
+
+class RawJSON:
+    """
+    A value that has already been encoded as JSON.
+
+    JSON codecs splice the text into their output as-is, so large payloads (like the
+    rows of a data frame) don't need to be decoded and encoded again on their way to
+    the browser.
+    """
+
+    __slots__ = ("json",)
+
+    def __init__(self, json: str | bytes):
+        self.json: str = json.decode() if isinstance(json, bytes) else json
+
+    def loads(self) -> Any:
+        return orjson.loads(self.json)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, RawJSON) and self.json == other.json
+
+    __hash__ = None  # pyright: ignore[reportAssignmentType]
+
+    def __repr__(self) -> str:
+        return f"RawJSON({self.json!r})"
+
+
+def freeze_lists(x: T) -> T:
+    """
+    Replace every list nested inside a JSON object with a tuple, in place.
+
+    Equivalent to decoding with ``object_hook=_utils.lists_to_tuples``, but it visits
+    each value once, and only allocates the tuples. As with the ``object_hook``, a
+    top-level list stays a list.
+    """
+    t = type(cast(object, x))
+    if t is dict:
+        _freeze_dict(cast("dict[str, object]", x))
+    elif t is list:
+        for item in cast("list[object]", x):
+            if type(item) is dict:
+                _freeze_dict(cast("dict[str, object]", item))
+    return x
+
+
+def _freeze_dict(x: dict[str, object]) -> None:
+    for key, value in x.items():
+        t = type(value)
+        if t is list:
+            x[key] = _to_tuple(cast("list[object]", value))
+        elif t is dict:
+            _freeze_dict(cast("dict[str, object]", value))
+
+
+def _to_tuple(x: list[object]) -> tuple[object, ...]:
+    for i, value in enumerate(x):
+        t = type(value)
+        if t is list:
+            x[i] = _to_tuple(cast("list[object]", value))
+        elif t is dict:
+            _freeze_dict(cast("dict[str, object]", value))
+    return tuple(x)
+
+
+class JSONCodec(ABC):
+    """
+    Encodes outgoing messages and decodes incoming messages for a session.
+    """
+
+    name: str
+
+    @abstractmethod
+    def dumps(self, value: object) -> str:
+        """
+        Encode `value` as JSON text. :class:`RawJSON` values are spliced in as-is.
+        """
+
+    @abstractmethod
+    def loads(self, data: str | bytes) -> Any:
+        """
+        Decode JSON text, with the arrays nested in objects returned as tuples (see
+        :func:`freeze_lists`). Raises :class:`json.JSONDecodeError` on invalid input.
+        """
+
+
+class StdlibJSONCodec(JSONCodec):
+    """
+    A codec backed by Python's :mod:`json` module.
+    """
+
+    name = "json"
+
+    def dumps(self, value: object) -> str:
+        raw: list[str] = []
+        token = f"__shiny_raw_json_{uuid.uuid4().hex}_"
+
+        def default(obj: object) -> str:
+            if isinstance(obj, RawJSON):
+                raw.append(obj.json)
+                return f"{token}{len(raw) - 1}"
+            raise TypeError(
+                f"Object of type {obj.__class__.__name__} is not JSON serializable"
+            )
+
+        res = json.dumps(value, default=default)
+        for i, text in enumerate(raw):
+            res = res.replace(f'"{token}{i}"', text, 1)
+        return res
+
+    def loads(self, data: str | bytes) -> Any:
+        return freeze_lists(json.loads(data))
+
+
+def _orjson_default(obj: object) -> object:
+    if isinstance(obj, RawJSON):
+        return orjson.Fragment(obj.json)
+    raise TypeError
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    A codec backed by `orjson`. This is the default.
+
+    Unlike :mod:`json`, `orjson` encodes ``NaN`` and ``Infinity`` as ``null`` (which
+    the browser can parse). Values that `orjson` can't encode but :mod:`json` can,
+    like integers wider than 64 bits, fall back to :class:`StdlibJSONCodec`.
+    """
+
+    name = "orjson"
+
+    _options = orjson.OPT_NON_STR_KEYS
+
+    def __init__(self) -> None:
+        self._fallback = StdlibJSONCodec()
+
+    def dumps(self, value: object) -> str:
+        try:
+            return orjson.dumps(
+                value, default=_orjson_default, option=self._options
+            ).decode()
+        except orjson.JSONEncodeError:
+            return self._fallback.dumps(value)
+
+    def loads(self, data: str | bytes) -> Any:
+        return freeze_lists(orjson.loads(data))
+
+
+def resolve_json_codec(codec: Union[JSONCodecName, JSONCodec]) -> JSONCodec:
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec == "orjson":
+        return OrjsonCodec()
+    if codec == "json":
+        return StdlibJSONCodec()
+    raise ValueError('`json_codec` must be "orjson", "json", or a JSONCodec object.')
@@ -0,0 +1,25 @@
+import time
+
+from shiny import App, Inputs, Outputs, Session, reactive, render, ui
+
+app_ui = ui.page_fluid(
+    ui.input_select("region", "Region", ["North", "South", "East", "West"]),
+    ui.input_slider("year", "Year", min=2015, max=2024, value=2020, sep=""),
+    ui.output_text_verbatim("result"),
+)
+
+
+def server(input: Inputs, output: Outputs, session: Session):
+    # Values are shared by all sessions, so each region/year is only computed once
+    @reactive.cache(key=lambda: (input.region(), input.year()))
+    @reactive.calc
+    def sales():
+        time.sleep(2)  # A slow query
+        return hash((input.region(), input.year())) % 1000
+
+    @render.text
+    def result():
+        return f"Sales: {sales()}\nCache: {session.app.cache}"
+
+
+app = App(app_ui, server)
@@ -0,0 +1,20 @@
+import time
+
+from shiny import reactive
+from shiny.express import input, render, session, ui
+
+ui.input_select("region", "Region", ["North", "South", "East", "West"])
+ui.input_slider("year", "Year", min=2015, max=2024, value=2020, sep="")
+
+
+# Values are shared by all sessions, so each region/year is only computed once
+@reactive.cache(key=lambda: (input.region(), input.year()))
+@reactive.calc
+def sales():
+    time.sleep(2)  # A slow query
+    return hash((input.region(), input.year())) % 1000
+
+
+@render.text
+def result():
+    return f"Sales: {sales()}\nCache: {session.app.cache}"
@@ -0,0 +1,20 @@
+from shiny import App, Inputs, Outputs, Session, reactive, render, ui
+
+app_ui = ui.page_fluid(
+    ui.input_text("query", "Search", placeholder="Type quickly..."),
+    ui.output_text_verbatim("result"),
+)
+
+
+def server(input: Inputs, output: Outputs, session: Session):
+    # Only updates once the user has stopped typing for half a second
+    @reactive.debounce(0.5)
+    def query():
+        return input.query()
+
+    @render.text
+    def result():
+        return f"Searching for: {query()!r}"
+
+
+app = App(app_ui, server)
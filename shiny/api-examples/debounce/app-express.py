@@ -0,0 +1,15 @@
+from shiny import reactive
+from shiny.express import input, render, ui
+
+ui.input_text("query", "Search", placeholder="Type quickly...")
+
+
+# Only updates once the user has stopped typing for half a second
+@reactive.debounce(0.5)
+def query():
+    return input.query()
+
+
+@render.text
+def result():
+    return f"Searching for: {query()!r}"
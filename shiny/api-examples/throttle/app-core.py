@@ -0,0 +1,20 @@
+from shiny import App, Inputs, Outputs, Session, reactive, render, ui
+
+app_ui = ui.page_fluid(
+    ui.input_slider("n", "Drag me", min=0, max=1000, value=500),
+    ui.output_text_verbatim("result"),
+)
+
+
+def server(input: Inputs, output: Outputs, session: Session):
+    # Updates at most once a second while the slider is dragged
+    @reactive.throttle(1)
+    def n():
+        return input.n()
+
+    @render.text
+    def result():
+        return f"Slider value: {n()}"
+
+
+app = App(app_ui, server)
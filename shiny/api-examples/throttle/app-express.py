@@ -0,0 +1,15 @@
+from shiny import reactive
+from shiny.express import input, render, ui
+
+ui.input_slider("n", "Drag me", min=0, max=1000, value=500)
+
+
+# Updates at most once a second while the slider is dragged
+@reactive.throttle(1)
+def n():
+    return input.n()
+
+
+@render.text
+def result():
+    return f"Slider value: {n()}"
@@ -7,6 +7,7 @@ from htmltools import TagChild
 from .._namespaces import Id, Root
 from ..bookmark import BookmarkExpressStub
 from ..module import ResolvedId
+from ..reactive._core import FlushMode, _reactive_environment
 from ..session import Inputs, Outputs, Session
 from ..session._session import SessionProxy
 
@@ -42,6 +43,8 @@ class ExpressStubSession(Session):
         # match the type declared in the Session abstract base class.
         self._outbound_message_queues = None  # pyright: ignore
         self._downloads = None  # pyright: ignore
+        # Effects are never set up in a stub session, so nothing is scheduled here.
+        self._reactive_domain = _reactive_environment.global_domain
 
         # Application-level (not session-level) options that may be set via app_opts().
         self.app_opts: AppOpts = {}
@@ -65,6 +68,15 @@ class ExpressStubSession(Session):
     def _is_closed(self) -> bool:
         return False
 
+    def set_flush_mode(
+        self, mode: FlushMode, *, max_concurrency: Optional[int] = None
+    ) -> None:
+        # The stub shares the app-global domain; don't reconfigure it.
+        return None
+
+    def set_coalesce_input_updates(self, value: bool) -> None:
+        return None
+
     # This is needed so that Outputs don't throw an error.
     def _is_hidden(self, name: str) -> bool:
         return False
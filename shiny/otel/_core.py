@@ -5,7 +5,7 @@ from __future__ import annotations
 import contextlib
 import time
 from contextvars import ContextVar
-from typing import Any, Generator, Union
+from typing import Any, Generator, Literal, Union
 
 from opentelemetry import context as otel_context
 from opentelemetry import trace
@@ -29,6 +29,10 @@ __all__ = (
 _tracer: Union[Tracer, None] = None
 _logger: Union[Any, None] = None
 
+# The OTel SDK's TracerProvider class (None if the SDK isn't installed), looked up on
+# first use
+_sdk_tracer_provider_class: Union[type, None, Literal[False]] = False
+
 # Test-only override for is_otel_tracing_enabled()
 # This is used by test helpers to control tracing state without manipulating
 # the global TracerProvider (which OpenTelemetry doesn't allow after setup)
@@ -79,6 +83,18 @@ def get_otel_logger() -> Any:  # type: ignore
     return _logger
 
 
+def _get_sdk_tracer_provider_class() -> Union[type, None]:
+    global _sdk_tracer_provider_class
+    if _sdk_tracer_provider_class is False:
+        try:
+            from opentelemetry.sdk.trace import TracerProvider as SDKTracerProvider
+        except ImportError:
+            _sdk_tracer_provider_class = None
+        else:
+            _sdk_tracer_provider_class = SDKTracerProvider
+    return _sdk_tracer_provider_class
+
+
 def is_otel_tracing_enabled() -> bool:
     """
     Check if OpenTelemetry tracing is enabled.
@@ -100,11 +116,11 @@ def is_otel_tracing_enabled() -> bool:
         return test_override
 
     # Note: This function does not cache its result to allow users to set up their
-    # TracerProvider after importing Shiny. The performance impact is negligible
-    # (~0.22μs per check), and the check only happens when creating spans.
-    try:
-        from opentelemetry.sdk.trace import TracerProvider as SDKTracerProvider
-    except ImportError:
+    # TracerProvider after importing Shiny. Only the lookup of the SDK's
+    # TracerProvider class is cached, so the check stays cheap on hot paths (it runs
+    # for every reactive execution).
+    SDKTracerProvider = _get_sdk_tracer_provider_class()
+    if SDKTracerProvider is None:
         # If we can't import the SDK TracerProvider, tracing is disabled
         return False
 
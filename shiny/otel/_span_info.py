@@ -0,0 +1,103 @@
+"""
+Lazily computed span names and attributes for reactive functions.
+
+Reactive calcs, effects, outputs, and extended tasks each record a span per execution,
+named after (and pointing at the source of) the user's function. Finding the source
+means reading and parsing the file, which is far too slow to do for every object that
+is created when most apps never trace at all, so it is deferred until a span is
+actually recorded.
+"""
+
+from __future__ import annotations
+
+from contextlib import AbstractAsyncContextManager
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from opentelemetry.trace import Span
+
+from ._attributes import extract_source_ref, get_session_id_attrs
+from ._collect import OtelCollectLevel
+from ._core import is_otel_tracing_enabled
+from ._labels import create_otel_span_name
+from ._span_wrappers import NO_SPAN, shiny_otel_span
+
+if TYPE_CHECKING:
+    from ..session import Session
+
+__all__ = ("OtelSpanInfo",)
+
+
+class OtelSpanInfo:
+    """
+    The span name and attributes for a reactive function, computed on first use.
+
+    Parameters
+    ----------
+    func
+        The user's function.
+    label_type
+        The type of reactive computation (e.g., "reactive.calc", "output").
+    session
+        The session the function belongs to, for the namespace in the name and the
+        ``session.id`` attribute.
+    modifier
+        Optional modifier to include in the name (e.g., "event").
+    """
+
+    __slots__ = ("_func", "_label_type", "_session", "_modifier", "_label", "_attrs")
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        label_type: str,
+        session: Session | None = None,
+        modifier: Optional[str] = None,
+    ) -> None:
+        self._func = func
+        self._label_type = label_type
+        self._session = session
+        self._modifier = modifier
+        self._label: Optional[str] = None
+        self._attrs: Optional[dict[str, Any]] = None
+
+    @property
+    def label(self) -> str:
+        """The span name, like ``"reactive.calc mod1:my_calc"``."""
+        if self._label is None:
+            self._label = create_otel_span_name(
+                self._func,
+                self._label_type,
+                session=self._session,
+                modifier=self._modifier,
+            )
+        return self._label
+
+    @property
+    def attrs(self) -> dict[str, Any]:
+        """The ``session.id`` and source reference attributes of the span."""
+        if self._attrs is None:
+            self._attrs = {
+                **get_session_id_attrs(self._session),
+                **extract_source_ref(self._func),
+            }
+        return self._attrs
+
+    def span(
+        self,
+        required_level: OtelCollectLevel,
+        collection_level: Optional[OtelCollectLevel] = None,
+    ) -> AbstractAsyncContextManager[Span | None]:
+        """
+        A span (see :func:`~shiny.otel._span_wrappers.shiny_otel_span`) for one
+        execution of the function. When OpenTelemetry isn't tracing, this is the
+        shared no-op span, and the name and attributes aren't computed.
+        """
+        if not is_otel_tracing_enabled():
+            return NO_SPAN
+        return shiny_otel_span(
+            self.label,
+            attributes=self.attrs,
+            infer_session_id=False,
+            required_level=required_level,
+            collection_level=collection_level,
+        )
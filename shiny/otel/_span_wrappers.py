@@ -54,7 +54,7 @@ See Also
 
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
 from typing import Any, AsyncGenerator, AsyncIterable, Callable, Dict, Mapping, Union
 
 from opentelemetry.trace import Span, Status, StatusCode
@@ -63,22 +63,26 @@ from ._collect import OtelCollectLevel, get_level
 from ._constants import ATTR_SESSION_ID
 from ._core import get_otel_tracer, is_otel_tracing_enabled
 
-__all__ = ("shiny_otel_span", "shiny_otel_span_stream")
+__all__ = ("NO_SPAN", "shiny_otel_span", "shiny_otel_span_stream")
 
 # Type aliases for parameters
 AttributesValue = Mapping[str, Any] | None
 AttributesType = Union[AttributesValue, Callable[[], AttributesValue]]
 
+# The no-op span context manager, used when OpenTelemetry isn't tracing. Callers whose
+# span name or attributes are costly to compute can use it directly, without computing
+# them, when `is_otel_tracing_enabled()` is false.
+NO_SPAN: AbstractAsyncContextManager[None] = nullcontext()
 
-@asynccontextmanager
-async def shiny_otel_span(
+
+def shiny_otel_span(
     name: str,
     *,
     attributes: AttributesType = None,
     infer_session_id: bool,
     required_level: OtelCollectLevel = OtelCollectLevel.SESSION,
     collection_level: OtelCollectLevel | None = None,
-) -> AsyncGenerator[Span | None, None]:
+) -> AbstractAsyncContextManager[Span | None]:
     """
     Context manager for creating and managing a Shiny OpenTelemetry span.
 
@@ -91,7 +95,9 @@ async def shiny_otel_span(
     - Ends the span when the context exits
 
     If collection is disabled or the SDK is not configured, this becomes a no-op
-    context manager that yields None.
+    context manager that yields None. (When the SDK is not configured, that is a
+    shared, stateless context manager, so an untraced app pays almost nothing per
+    span.)
 
     Exception handling respects Shiny's error semantics:
     - Silent exceptions (SilentException, etc.) are not recorded in spans
@@ -116,10 +122,11 @@ async def shiny_otel_span(
     required_level
         The minimum collect level required for this span. Defaults to SESSION.
 
-    Yields
-    ------
-    Span | None
-        The created span instance, or None if collection is disabled.
+    Returns
+    -------
+    AbstractAsyncContextManager[Span | None]
+        An async context manager that yields the created span instance, or None if
+        collection is disabled.
 
     Examples
     --------
@@ -147,11 +154,26 @@ async def shiny_otel_span(
             await session_work()
     ```
     """
-    # First check if OTel is enabled at all
     if not is_otel_tracing_enabled():
-        yield None
-        return
+        return NO_SPAN
+    return _shiny_otel_span(
+        name,
+        attributes=attributes,
+        infer_session_id=infer_session_id,
+        required_level=required_level,
+        collection_level=collection_level,
+    )
+
 
+@asynccontextmanager
+async def _shiny_otel_span(
+    name: str,
+    *,
+    attributes: AttributesType = None,
+    infer_session_id: bool,
+    required_level: OtelCollectLevel = OtelCollectLevel.SESSION,
+    collection_level: OtelCollectLevel | None = None,
+) -> AsyncGenerator[Span | None, None]:
     # Use provided collection_level or get current level
     current_level = collection_level if collection_level is not None else get_level()
 
@@ -8,6 +8,8 @@ from ._core import (  # noqa: F401
     get_current_context,  # pyright: ignore[reportUnusedImport]
 )
 from ._poll import poll, file_reader
+from ._debounce import debounce, throttle
+from ._cache import cache, bind_cache, CacheBackend, MemoryCache, DiskCache
 from ._reactives import (  # noqa: F401
     value,
     Value,
@@ -31,6 +33,13 @@ __all__ = (
     "on_flushed",
     "poll",
     "file_reader",
+    "debounce",
+    "throttle",
+    "cache",
+    "bind_cache",
+    "CacheBackend",
+    "MemoryCache",
+    "DiskCache",
     "value",
     "Value",
     "calc",
@@ -0,0 +1,567 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Literal,
+    Optional,
+    TypeVar,
+    cast,
+)
+
+from .. import _utils
+from .._docstring import add_example, no_example
+from ..types import MISSING, MISSING_TYPE
+from ._reactives import Calc_
+
+if TYPE_CHECKING:
+    from ..render.renderer import Renderer
+
+__all__ = (
+    "cache",
+    "bind_cache",
+    "CacheBackend",
+    "MemoryCache",
+    "DiskCache",
+)
+
+T = TypeVar("T")
+
+CacheKeyFn = Callable[[], object] | Callable[[], Awaitable[object]]
+CacheScope = Literal["app", "session"]
+
+
+class CacheBackend(ABC):
+    """
+    A store for the values cached by :func:`~shiny.reactive.cache`.
+
+    Keys are strings (hashes of the cache key), and values are whatever the cached calc
+    or function returned, or the output that a renderer sent to the browser.
+
+    Attributes
+    ----------
+    hits
+        The number of lookups that found a value.
+    misses
+        The number of lookups that didn't.
+    evictions
+        The number of values removed to respect the cache's limits (or because they
+        expired).
+    """
+
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    @abstractmethod
+    def get(self, key: str) -> Any | MISSING_TYPE:
+        """
+        Return the value for `key`, or ``MISSING`` if it isn't cached. Implementations
+        should update `hits` and `misses`.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store `value` for `key`, evicting other values if necessary.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove all values from the cache.
+        """
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} hits={self.hits} misses={self.misses} "
+            f"evictions={self.evictions}>"
+        )
+
+
+class MemoryCache(CacheBackend):
+    """
+    An in-memory, least-recently-used cache.
+
+    Values are shared (not copied) between everyone who reads them, so they shouldn't
+    be modified.
+
+    Parameters
+    ----------
+    max_entries
+        The maximum number of values to keep. When it's exceeded, the least recently
+        used value is evicted.
+    ttl
+        If given, values expire this many seconds after they're stored.
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl: Optional[float] = None) -> None:
+        super().__init__()
+        if max_entries < 1:
+            raise ValueError("`max_entries` must be at least 1.")
+        self.max_entries: int = max_entries
+        self.ttl: Optional[float] = ttl
+        # Each value is stored with the time at which it expires
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any | MISSING_TYPE:
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] <= time.monotonic():
+            del self._entries[key]
+            self.evictions += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return MISSING
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key: str, value: Any) -> None:
+        expires = float("inf") if self.ttl is None else time.monotonic() + self.ttl
+        self._entries[key] = (value, expires)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class DiskCache(CacheBackend):
+    """
+    A cache that pickles values to files in a directory, so they can be shared by
+    several processes (e.g. the workers of a deployed app) and survive restarts.
+
+    The least recently used files are evicted when the cache exceeds its limits. The
+    hit, miss, and eviction counts are those of this object (i.e., of this process).
+
+    To keep ``set()`` cheap, the total size and number of files are tracked as values
+    are stored, and the directory is only scanned when they go over the limits. Files
+    written by other processes are counted at the next scan, so a shared directory
+    can briefly exceed the limits.
+
+    Parameters
+    ----------
+    directory
+        The directory to store the values in. It's created if it doesn't exist. If
+        ``None``, a new temporary directory is used.
+    max_size
+        The maximum total size of the files, in bytes.
+    max_entries
+        The maximum number of files.
+    ttl
+        If given, values expire this many seconds after they're stored.
+    """
+
+    _suffix = ".pickle"
+
+    def __init__(
+        self,
+        directory: Optional[str | os.PathLike[str]] = None,
+        *,
+        max_size: int = 1024**3,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        super().__init__()
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix="shiny-cache-")
+        self.directory: Path = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size: int = max_size
+        self.max_entries: Optional[int] = max_entries
+        self.ttl: Optional[float] = ttl
+        # Running totals of the files in the directory, as last scanned plus the
+        # changes made by this object since
+        self._size: int = 0
+        self._n: int = 0
+        self._prune()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{self._suffix}"
+
+    def get(self, key: str) -> Any | MISSING_TYPE:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                expires, value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            return MISSING
+
+        if expires is not None and expires <= time.time():
+            self._remove(path)
+            self.evictions += 1
+            self.misses += 1
+            return MISSING
+
+        # The modification time records when the file was last used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        expires = None if self.ttl is None else time.time() + self.ttl
+        # Write to a temporary file first, so readers never see a partial file
+        path = self._path(key)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((expires, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+                size = f.tell()
+            old_size = _file_size(path)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        self._size += size - (old_size or 0)
+        if old_size is None:
+            self._n += 1
+        if self._over_limits():
+            self._prune()
+
+    def _over_limits(self) -> bool:
+        return self._size > self.max_size or (
+            self.max_entries is not None and self._n > self.max_entries
+        )
+
+    def _remove(self, path: Path) -> None:
+        size = _file_size(path)
+        try:
+            path.unlink()
+        except OSError:
+            return
+        self._size -= size or 0
+        self._n -= 1
+
+    def _prune(self) -> None:
+        files: list[tuple[float, int, str]] = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(self._suffix):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        self._size = sum(size for _, size, _ in files)
+        self._n = len(files)
+        if not self._over_limits():
+            return
+
+        # Oldest first
+        files.sort()
+        for _, size, path in files:
+            if not self._over_limits():
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._size -= size
+            self._n -= 1
+            self.evictions += 1
+
+    def clear(self) -> None:
+        for path in self.directory.glob(f"*{self._suffix}"):
+            path.unlink(missing_ok=True)
+        self._size = 0
+        self._n = 0
+
+
+def _file_size(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return None
+
+
+# The cache for calcs and functions that aren't created in a session
+_default_cache: Optional[MemoryCache] = None
+
+
+def _resolve_cache(cache: CacheScope | CacheBackend) -> CacheBackend:
+    global _default_cache
+
+    if isinstance(cache, CacheBackend):
+        return cache
+    if cache == "session":
+        # Calcs and renderers are created per session, so their cache is too
+        return MemoryCache()
+    if cache != "app":
+        raise ValueError('`cache` must be "app", "session", or a CacheBackend object.')
+
+    from ..session import get_current_session
+
+    session = get_current_session()
+    if session is not None and not session.is_stub_session():
+        return session.app.cache
+    if _default_cache is None:
+        _default_cache = MemoryCache()
+    return _default_cache
+
+
+def _hash_key(namespace: str, key: object) -> str:
+    try:
+        data = pickle.dumps((namespace, key), protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        raise TypeError(
+            f"The cache key for '{namespace}' couldn't be pickled. Cache keys must be "
+            "picklable (e.g. str, numbers, and tuples, lists and dicts of them)."
+        ) from e
+    return hashlib.sha256(data).hexdigest()
+
+
+def _fn_namespace(fn: Callable[..., object]) -> str:
+    return f"{getattr(fn, '__module__', '')}.{getattr(fn, '__qualname__', repr(fn))}"
+
+
+async def _call_key(key: CacheKeyFn) -> object:
+    if _utils.is_async_callable(key):
+        return await key()
+    return key()
+
+
+@no_example()
+def bind_cache(
+    x: T,
+    key: CacheKeyFn,
+    *,
+    cache: CacheScope | CacheBackend = "app",
+) -> T:
+    """
+    Cache the values of a reactive calc, renderer, or function by a key.
+
+    Reactive calcs and renderers only remember their most recent value, in a single
+    session. With `bind_cache()`, values are kept in a cache that (by default) is
+    shared by every session of the app, keyed by the value of the `key` function.
+    When the key matches a cached value, that value is used without running the calc,
+    render function, or function, so (for example) a slow query that many users ask
+    for runs only once.
+
+    `key` is called reactively, in place of the cached object: the result is
+    invalidated when the key's reactive dependencies change. When the value is taken
+    from the cache, the object's own reactive dependencies aren't read, so the key must
+    include everything that the value depends on.
+
+    Parameters
+    ----------
+    x
+        A :func:`~shiny.reactive.calc`, a renderer (like
+        :class:`~shiny.render.plot`), or a no-argument function. (Sync and async are
+        both supported.) It is modified in place (or wrapped, for a function), and
+        returned.
+    key
+        A no-argument function (or async function) that returns the cache key, which
+        must be picklable. The key is combined with the name of the calc or function
+        (and for renderers, the output's id), so different objects can share a cache.
+        For :class:`~shiny.render.plot`, the plot's size is added to the key. The
+        values of :class:`~shiny.render.text`, :class:`~shiny.render.code`,
+        :class:`~shiny.render.plot`, :class:`~shiny.render.image`, and
+        :class:`~shiny.render.table` are shared by all sessions; the values of other
+        renderers (like :class:`~shiny.render.download` and
+        :class:`~shiny.render.ui`) may belong to a session, so they're only reused
+        within the session that rendered them. (:class:`~shiny.render.data_frame`
+        can't be cached.)
+    cache
+        Where to keep the values. ``"app"`` (the default) uses :attr:`shiny.App.cache`
+        (or, outside of a session, a process-wide :class:`MemoryCache`), which is shared
+        by all sessions. ``"session"`` gives the object its own :class:`MemoryCache`. A
+        :class:`~shiny.reactive.CacheBackend` (like
+        :class:`~shiny.reactive.MemoryCache` or :class:`~shiny.reactive.DiskCache`) may
+        also be given.
+
+    Returns
+    -------
+    :
+        The object, `x`, now cached.
+
+    Note
+    ----
+    Errors (including :func:`~shiny.req`) aren't cached. With the in-memory caches,
+    a cached value is shared (not copied) between sessions, so it shouldn't be
+    modified.
+
+    See Also
+    --------
+    * :func:`~shiny.reactive.cache`
+    """
+    from ..render.renderer import Renderer
+
+    backend = _resolve_cache(cache)
+
+    if isinstance(x, Calc_):
+        calc = cast(Calc_[Any], x)
+        calc_fn = calc._fn
+        namespace = _fn_namespace(calc_fn)
+
+        async def cached_calc_fn() -> Any:
+            hashed = _hash_key(namespace, await _call_key(key))
+            value = backend.get(hashed)
+            if isinstance(value, MISSING_TYPE):
+                value = await calc_fn()
+                backend.set(hashed, value)
+            return value
+
+        calc._fn = cached_calc_fn
+
+        # Keep the sync fast path of sync calcs, as long as the key is sync too
+        calc_sync_fn = calc._sync_fn
+        if calc_sync_fn is None or _utils.is_async_callable(key):
+            calc._sync_fn = None
+        else:
+
+            def cached_calc_sync_fn() -> Any:
+                hashed = _hash_key(namespace, key())
+                value = backend.get(hashed)
+                if isinstance(value, MISSING_TYPE):
+                    value = calc_sync_fn()
+                    backend.set(hashed, value)
+                return value
+
+            calc._sync_fn = cached_calc_sync_fn
+        return x  # pyright: ignore[reportUnknownVariableType]
+
+    if isinstance(x, Renderer):
+        _bind_renderer_cache(cast(Renderer[Any], x), key, backend)
+        return x  # pyright: ignore[reportUnknownVariableType]
+
+    if not callable(x):
+        raise TypeError(
+            "`bind_cache()` requires a reactive calc, a renderer, or a function."
+        )
+
+    fn: Callable[[], Any] = x
+    _utils.validate_no_params(fn, "reactive.cache")
+    namespace = _fn_namespace(fn)
+
+    if _utils.is_async_callable(fn):
+        async_fn = fn
+
+        async def cached_async() -> Any:
+            hashed = _hash_key(namespace, await _call_key(key))
+            value = backend.get(hashed)
+            if isinstance(value, MISSING_TYPE):
+                value = await async_fn()
+                backend.set(hashed, value)
+            return value
+
+        cached_async.__name__ = fn.__name__
+        cached_async.__doc__ = fn.__doc__
+        return cached_async  # pyright: ignore[reportReturnType]
+
+    if _utils.is_async_callable(key):
+        raise TypeError("An async `key` can only be used with async functions.")
+
+    def cached_sync() -> Any:
+        hashed = _hash_key(namespace, key())
+        value = backend.get(hashed)
+        if isinstance(value, MISSING_TYPE):
+            value = fn()
+            backend.set(hashed, value)
+        return value
+
+    cached_sync.__name__ = fn.__name__
+    cached_sync.__doc__ = fn.__doc__
+    return cached_sync  # pyright: ignore[reportReturnType]
+
+
+def _bind_renderer_cache(
+    renderer: Renderer[Any], key: CacheKeyFn, backend: CacheBackend
+) -> None:
+    from ..render import data_frame
+    from ..session import require_active_session
+
+    if isinstance(renderer, data_frame):
+        raise TypeError(
+            "`bind_cache()` can't cache a `render.data_frame`, because rendering it "
+            "also sets up the data frame's state in the session."
+        )
+    # Unless the renderer says otherwise, its values may belong to the session they
+    # were rendered in (e.g. download URLs contain the session's id), so they are
+    # only reused within the same session
+    per_session = not renderer._cache_across_sessions
+
+    render = renderer.render
+    fn_namespace = _fn_namespace(renderer.fn._orig_fn)
+
+    async def cached_render() -> Any:
+        session = require_active_session(None)
+        namespace = f"{fn_namespace}:{session.ns(renderer.output_id)}"
+        if per_session:
+            namespace += f":{session.id}"
+        key_value = (await _call_key(key), renderer._cache_key())
+        hashed = _hash_key(namespace, key_value)
+        value = backend.get(hashed)
+        if isinstance(value, MISSING_TYPE):
+            value = await render()
+            backend.set(hashed, value)
+        return value
+
+    renderer.render = cached_render
+
+
+@add_example()
+def cache(
+    key: CacheKeyFn,
+    *,
+    cache: CacheScope | CacheBackend = "app",
+) -> Callable[[T], T]:
+    """
+    Cache the values of a reactive calc, renderer, or function by a key.
+
+    A decorator form of :func:`~shiny.reactive.bind_cache`; see it for details. Place it
+    above ``@reactive.calc`` or a ``@render.*`` decorator:
+
+    ```python
+    @reactive.cache(key=lambda: (input.region(), input.dates()))
+    @reactive.calc
+    def sales():
+        return run_slow_query(input.region(), input.dates())
+    ```
+
+    Parameters
+    ----------
+    key
+        A no-argument function (or async function) that returns the cache key, which
+        must be picklable.
+    cache
+        Where to keep the values: ``"app"`` (the default), ``"session"``, or a
+        :class:`~shiny.reactive.CacheBackend`.
+
+    Returns
+    -------
+    :
+        A decorator that caches the object it's applied to.
+
+    See Also
+    --------
+    * :func:`~shiny.reactive.bind_cache`
+    """
+
+    def wrapper(x: T) -> T:
+        return bind_cache(x, key, cache=cache)
+
+    return wrapper
@@ -13,12 +13,23 @@ __all__ = (
 
 import asyncio
 import contextlib
+import contextvars
+import heapq
+import inspect
 import time
 import traceback
 import typing
 import warnings
 from contextvars import ContextVar
-from typing import TYPE_CHECKING, Awaitable, Callable, Generator, Optional, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Generator,
+    Literal,
+    Optional,
+    TypeVar,
+)
 
 from .. import _utils
 from .._datastructures import PriorityQueueFIFO
@@ -33,6 +44,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
+FlushMode = Literal["sequential", "concurrent"]
+
 
 class ReactiveWarning(RuntimeWarning):
     pass
@@ -45,11 +58,28 @@ warnings.simplefilter("always", ReactiveWarning)
 class Context:
     """A reactive context"""
 
-    def __init__(self) -> None:
+    # A session creates one of these for every calc/effect/output execution, so keep
+    # them small: no instance `__dict__`, and no callback lists until they're needed.
+    __slots__ = (
+        "id",
+        "_domain",
+        "_invalidated",
+        "_invalidate_callbacks",
+        "_flush_callbacks",
+        "_recorder",
+    )
+
+    def __init__(self, domain: Optional[ReactiveDomain] = None) -> None:
         self.id: int = _reactive_environment.next_id()
+        # The domain whose pending-flush queue this context is scheduled on. Contexts
+        # without a domain (e.g. those created by calcs or `isolate()`) are never
+        # scheduled, but fall back to the app-global domain if they are.
+        self._domain: Optional[ReactiveDomain] = domain
         self._invalidated: bool = False
-        self._invalidate_callbacks: list[Callable[[], None]] = []
-        self._flush_callbacks: list[Callable[[], Awaitable[None]]] = []
+        self._invalidate_callbacks: Optional[list[Callable[[], None]]] = None
+        self._flush_callbacks: Optional[list[Callable[[], Awaitable[None]]]] = None
+        # Set while `record_dependencies()` is active.
+        self._recorder: Optional[DependencyRecorder] = None
 
     def __call__(self) -> typing.ContextManager[None]:
         return _reactive_environment.use_context(self)
@@ -63,53 +93,126 @@ class Context:
 
         self._invalidated = True
 
-        for cb in self._invalidate_callbacks:
+        callbacks = self._invalidate_callbacks
+        if callbacks is None:
+            return
+        for cb in callbacks:
             cb()
 
-        self._invalidate_callbacks.clear()
+        callbacks.clear()
 
     def on_invalidate(self, func: Callable[[], None]) -> None:
         """Register a function to be called when this context is invalidated"""
+        if self._recorder is not None:
+            self._recorder._n_invalidate_callbacks += 1
         if self._invalidated:
             func()
+        elif self._invalidate_callbacks is None:
+            self._invalidate_callbacks = [func]
         else:
             self._invalidate_callbacks.append(func)
 
     def add_pending_flush(self, priority: int) -> None:
         """Tell the reactive environment that this context should be flushed the
         next time flushReact() called."""
-        _reactive_environment.add_pending_flush(self, priority)
+        domain = self._domain or _reactive_environment.global_domain
+        domain.add_pending_flush(self, priority)
 
     def on_flush(self, func: Callable[[], Awaitable[None]]) -> None:
         """Register a function to be called when this context is flushed."""
-        self._flush_callbacks.append(func)
+        if self._flush_callbacks is None:
+            self._flush_callbacks = [func]
+        else:
+            self._flush_callbacks.append(func)
 
     async def execute_flush_callbacks(self) -> None:
         """Execute all flush callbacks"""
-        for cb in self._flush_callbacks:
+        callbacks = self._flush_callbacks
+        if callbacks is None:
+            return
+        for cb in callbacks:
             await cb()
 
-        self._flush_callbacks.clear()
+        callbacks.clear()
+
+    @contextlib.contextmanager
+    def record_dependencies(self) -> Generator[DependencyRecorder, None, None]:
+        """Record the reactive values and calcs that are read in this context, and the
+        values that were read, until the `with` block exits."""
+        recorder = DependencyRecorder()
+        self._recorder = recorder
+        try:
+            yield recorder
+        finally:
+            self._recorder = None
+
+
+class DependencyRecorder:
+    """
+    The reactive reads made in a context while :meth:`Context.record_dependencies` is
+    active.
+
+    Each read is stored as a function that reads the same dependency again (possibly
+    returning an awaitable), along with the value that it returned. Reading them again
+    in order is enough to tell whether a deterministic computation would see the same
+    values, as long as every dependency it took came from a recorded read; `complete`
+    is ``False`` if it didn't (for example, if it called
+    :func:`~shiny.reactive.invalidate_later`).
+    """
+
+    def __init__(self) -> None:
+        self.reads: list[tuple[Callable[[], object], object]] = []
+        self._n_dependents: int = 0
+        self._n_invalidate_callbacks: int = 0
+
+    def record(self, read: Callable[[], object], value: object) -> None:
+        self.reads.append((read, value))
+
+    @property
+    def values(self) -> tuple[object, ...]:
+        return tuple(value for _, value in self.reads)
+
+    @property
+    def complete(self) -> bool:
+        # Each new registration with `Dependents` adds one invalidation callback, so
+        # any others came from somewhere that doesn't record its reads.
+        return self._n_invalidate_callbacks == self._n_dependents
+
+    async def replay(self) -> tuple[object, ...]:
+        """Read the recorded dependencies again, in order, and return their values."""
+        values: list[object] = []
+        for read, _ in self.reads:
+            value = read()
+            if inspect.isawaitable(value):
+                value = await value
+            values.append(value)
+        return tuple(values)
 
 
 class Dependents:
+    __slots__ = ("_dependents",)
+
     def __init__(self) -> None:
-        self._dependents: dict[int, Context] = {}
+        # Most values and calcs have at most a handful of readers, and many are never
+        # read at all, so the dict isn't allocated until the first one registers.
+        self._dependents: Optional[dict[int, Context]] = None
 
-    def register(self) -> None:
+    def register(self) -> Context:
         ctx: Context = get_current_context()
 
-        if ctx.id in self._dependents:
+        dependents = self._dependents
+        if dependents is None:
+            dependents = self._dependents = {}
+        elif ctx.id in dependents:
             # This context is already registered; no need to register it.
-            return
+            return ctx
 
-        self._dependents[ctx.id] = ctx
+        dependents[ctx.id] = ctx
+        if ctx._recorder is not None:
+            ctx._recorder._n_dependents += 1
 
-        def on_invalidate_cb() -> None:
-            if ctx.id in self._dependents:
-                del self._dependents[ctx.id]
-
-        ctx.on_invalidate(on_invalidate_cb)
+        ctx.on_invalidate(_RemoveDependent(dependents, ctx.id))
+        return ctx
 
     def invalidate(self) -> None:
         # TODO: Check sort order
@@ -117,31 +220,77 @@ class Dependents:
         # over the list. It's done this way instead of iterating over keys because it's
         # possible that a dependent is removed from the dict while iterating over it.
         # https://github.com/posit-dev/py-shiny/issues/26
-        ids = sorted(self._dependents.keys())
-        for dep_ctx in [self._dependents[id] for id in ids]:
+        dependents = self._dependents
+        if not dependents:
+            return
+        ids = sorted(dependents.keys())
+        for dep_ctx in [dependents[id] for id in ids]:
             dep_ctx.invalidate()
 
 
-class ReactiveEnvironment:
-    """The reactive environment"""
+class _RemoveDependent:
+    # The callback that removes a context from a `Dependents` when it's invalidated.
+    # One of these is created for every read, so it's a small object rather than a
+    # closure.
+    __slots__ = ("_dependents", "_id")
 
-    def __init__(self) -> None:
-        self._current_context: ContextVar[Optional[Context]] = ContextVar(
-            "current_context", default=None
-        )
-        self._next_id: int = 0
+    def __init__(self, dependents: dict[int, Context], id: int) -> None:
+        self._dependents = dependents
+        self._id = id
+
+    def __call__(self) -> None:
+        self._dependents.pop(self._id, None)
+
+
+class ReactiveDomain:
+    """
+    A unit of reactive scheduling.
+
+    Each session owns a domain, and reactives that aren't tied to a session (top-level
+    calcs, polls, and effects) belong to the app-global domain. A domain has its own
+    pending-flush queue and its own lock, so a slow flush in one session doesn't hold
+    up input handling in every other session.
+
+    Parameters
+    ----------
+    name
+        A name for the domain, used for debugging.
+    flush_mode
+        How pending contexts are run during a flush. With ``"sequential"`` (the
+        default) each context's flush callbacks are awaited one at a time. With
+        ``"concurrent"``, all contexts that share the same priority are run together
+        with :func:`asyncio.gather`, so independent async effects (for example,
+        outputs that each await a database query) overlap. Priority levels are still
+        flushed strictly in order.
+    max_concurrency
+        In ``"concurrent"`` mode, the maximum number of contexts that run at once.
+    """
+
+    def __init__(
+        self,
+        name: str = "global",
+        *,
+        flush_mode: FlushMode = "sequential",
+        max_concurrency: int = 10,
+    ) -> None:
+        self.name: str = name
+        self.flush_mode: FlushMode = flush_mode
+        self.max_concurrency: int = max_concurrency
         self._pending_flush_queue: PriorityQueueFIFO[Context] = PriorityQueueFIFO()
+        self._flush_requested: bool = False
         self._lock: Optional[asyncio.Lock] = None
         self._flushed_callbacks = _utils.AsyncCallbacks()
+        self._deferred_flush_task: Optional[asyncio.Task[None]] = None
+
+    def __repr__(self) -> str:
+        return f"<ReactiveDomain {self.name!r}>"
 
     @property
     def lock(self) -> asyncio.Lock:
         """
-        Lock that protects this ReactiveEnvironment. It must be lazily created, because
-        at the time the module is loaded, there generally isn't a running asyncio loop
-        yet. This causes the asyncio.Lock to be created with a different loop than it
-        will be invoked from later; when that happens, acquire() will succeed if there's
-        no contention, but throw a "hey you're on the wrong loop" error if there is.
+        Lock that protects this domain's part of the reactive graph. Lazily created for
+        the same reason as the old environment-wide lock: at the time the domain is
+        created, there may not be a running asyncio loop yet.
         """
         if self._lock is None:
             # Ensure we have a loop; get_running_loop() throws an error if we don't
@@ -149,6 +298,91 @@ class ReactiveEnvironment:
             self._lock = asyncio.Lock()
         return self._lock
 
+    def add_pending_flush(self, ctx: Context, priority: int) -> None:
+        self._pending_flush_queue.put(priority, ctx)
+        _reactive_environment._mark_pending(self)
+
+    def request_flush(self) -> None:
+        """
+        Mark this domain as needing a flush even if no contexts are pending (e.g.
+        because a session has queued outbound messages).
+        """
+        self._flush_requested = True
+        _reactive_environment._mark_pending(self)
+
+    def needs_flush(self) -> bool:
+        return self._flush_requested or not self._pending_flush_queue.empty()
+
+    def on_flushed(
+        self, func: Callable[[], Awaitable[None]], once: bool = False
+    ) -> Callable[[], None]:
+        """Register a function to be called each time this domain is flushed."""
+        return self._flushed_callbacks.register(func, once=once)
+
+    async def _flush(self) -> None:
+        self._flush_requested = False
+        if self.flush_mode == "concurrent" and self.max_concurrency > 1:
+            await self._flush_concurrent()
+        else:
+            await self._flush_sequential()
+        await self._flushed_callbacks.invoke()
+
+    async def _flush_sequential(self) -> None:
+        # Sequential flush: instead of storing the tasks in a list and calling gather()
+        # on them later, just run each effect in sequence.
+        while not self._pending_flush_queue.empty():
+            ctx = self._pending_flush_queue.get()
+            await ctx.execute_flush_callbacks()
+
+    async def _flush_concurrent(self) -> None:
+        # Concurrent flush: run all contexts at the current highest priority together,
+        # and wait for them all to finish before moving on to the next priority level.
+        # Contexts that are invalidated while a batch runs are picked up afterwards.
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(ctx: Context) -> None:
+            async with semaphore:
+                await ctx.execute_flush_callbacks()
+
+        while not self._pending_flush_queue.empty():
+            batch = self._pending_flush_queue.get_same_priority()
+            if len(batch) == 1:
+                await batch[0].execute_flush_callbacks()
+            else:
+                await asyncio.gather(*(run(ctx) for ctx in batch))
+
+    def _schedule_deferred_flush(self) -> None:
+        # Another task holds this domain's lock; flush once it's released. The holder
+        # may already be past its own flush, so we can't rely on it to pick this up.
+        if (
+            self._deferred_flush_task is not None
+            and not self._deferred_flush_task.done()
+        ):
+            return
+
+        async def _flush_when_free() -> None:
+            async with self.lock:
+                if self.needs_flush():
+                    _reactive_environment._mark_pending(self)
+                    await _reactive_environment.flush(domain=self)
+
+        self._deferred_flush_task = asyncio.create_task(_flush_when_free())
+
+
+class ReactiveEnvironment:
+    """The reactive environment"""
+
+    def __init__(self) -> None:
+        self._current_context: ContextVar[Optional[Context]] = ContextVar(
+            "current_context", default=None
+        )
+        self._next_id: int = 0
+        self.global_domain: ReactiveDomain = ReactiveDomain("global")
+        # Domains with pending contexts (or an explicit flush request), in the order
+        # in which they became pending. Used as an ordered set.
+        self._pending_domains: dict[ReactiveDomain, None] = {}
+        self._flushed_callbacks = _utils.AsyncCallbacks()
+
     def next_id(self) -> int:
         """Return the next available id"""
         id = self._next_id
@@ -170,13 +404,36 @@ class ReactiveEnvironment:
             raise RuntimeError("No current reactive context")
         return ctx
 
+    def current_domain(self) -> ReactiveDomain:
+        """Return the domain of the current session, or the app-global domain"""
+        from ..session import get_current_session
+
+        return session_domain(get_current_session())
+
     def on_flushed(
         self, func: Callable[[], Awaitable[None]], once: bool = False
     ) -> Callable[[], None]:
         return self._flushed_callbacks.register(func, once=once)
 
-    async def flush(self) -> None:
-        """Flush all pending operations"""
+    def _mark_pending(self, domain: ReactiveDomain) -> None:
+        self._pending_domains[domain] = None
+
+    def pending_domains(self) -> list[ReactiveDomain]:
+        """Return the domains that currently need a flush"""
+        return list(self._pending_domains)
+
+    async def flush(self, domain: Optional[ReactiveDomain] = None) -> None:
+        """
+        Flush all pending operations.
+
+        The caller is assumed to hold the lock of ``domain`` (by default, the domain of
+        the current session), which is flushed first. Other pending domains are flushed
+        in turn if their locks are free; otherwise their flush is deferred until the
+        current holder releases the lock. Domains with nothing pending are skipped.
+        """
+        if domain is None:
+            domain = self.current_domain()
+
         # Wrap entire flush cycle in reactive_update span (or no-op if not collecting)
         async with shiny_otel_span(
             "reactive_update",
@@ -184,18 +441,27 @@ class ReactiveEnvironment:
             required_level=OtelCollectLevel.REACTIVE_UPDATE,
             collection_level=_get_env_level(),
         ):
-            await self._flush_sequential()
+            await self._flush_pending_domains(domain)
             await self._flushed_callbacks.invoke()
 
-    async def _flush_sequential(self) -> None:
-        # Sequential flush: instead of storing the tasks in a list and calling gather()
-        # on them later, just run each effect in sequence.
-        while not self._pending_flush_queue.empty():
-            ctx = self._pending_flush_queue.get()
-            await ctx.execute_flush_callbacks()
-
-    def add_pending_flush(self, ctx: Context, priority: int) -> None:
-        self._pending_flush_queue.put(priority, ctx)
+    async def _flush_pending_domains(self, held: ReactiveDomain) -> None:
+        while self._pending_domains:
+            if held in self._pending_domains:
+                target = held
+            else:
+                target = next(iter(self._pending_domains))
+            del self._pending_domains[target]
+
+            if target is held:
+                await target._flush()
+            elif target.lock.locked():
+                target._schedule_deferred_flush()
+            else:
+                # The lock is free, so acquire() completes without yielding. We never
+                # wait on another domain's lock while holding our own, so domains can't
+                # deadlock on each other.
+                async with target.lock:
+                    await target._flush()
 
     @contextlib.contextmanager
     def isolate(self) -> Generator[None, None, None]:
@@ -209,6 +475,211 @@ class ReactiveEnvironment:
 _reactive_environment = ReactiveEnvironment()
 
 
+def session_domain(session: "Session | None") -> ReactiveDomain:
+    """
+    Return the reactive domain that ``session`` schedules its effects on. Reactives
+    without a session use the app-global domain.
+    """
+    if session is None:
+        return _reactive_environment.global_domain
+    return session._reactive_domain
+
+
+class _Timer:
+    """A pending :func:`~shiny.reactive.invalidate_later` call."""
+
+    __slots__ = ("deadline", "seq", "ctx", "domain", "session", "done")
+
+    def __init__(
+        self,
+        deadline: float,
+        seq: int,
+        ctx: Context,
+        domain: ReactiveDomain,
+        session: "Session | None",
+    ) -> None:
+        self.deadline = deadline
+        self.seq = seq
+        self.ctx = ctx
+        self.domain = domain
+        self.session = session
+        # Set once the timer has fired or been cancelled. Done timers are left in the
+        # heap, and skipped when they reach the top.
+        self.done = False
+
+    def __lt__(self, other: _Timer) -> bool:
+        return (self.deadline, self.seq) < (other.deadline, other.seq)
+
+
+class _TimerScheduler:
+    """
+    Runs the timers of all :func:`~shiny.reactive.invalidate_later` calls from a single
+    task, instead of one task per call.
+
+    Timers are kept in a heap ordered by deadline. The task sleeps until the earliest
+    deadline; when it wakes, every timer that is due is fired together: the contexts
+    are invalidated and each affected domain is flushed once (rather than once per
+    timer). Cancelling a timer just marks it as done, and when no timers are left the
+    task exits.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[_Timer] = []
+        self._seq: int = 0
+        self._n_live: int = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        # The deadline the task is currently sleeping until
+        self._wake_at: float = float("inf")
+        # Live timers by domain, so that all of a session's timers can be cancelled
+        # when it ends. Each session registers a single `on_ended` callback.
+        self._by_domain: dict[ReactiveDomain, set[_Timer]] = {}
+        self._flush_tasks: set[asyncio.Future[None]] = set()
+
+    def schedule(
+        self, deadline: float, ctx: Context, session: "Session | None"
+    ) -> _Timer:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Timers from another (presumably closed) event loop can never fire
+            self.__init__()
+            self._loop = loop
+
+        domain = session_domain(session)
+        timer = _Timer(deadline, self._seq, ctx, domain, session)
+        self._seq += 1
+        heapq.heappush(self._heap, timer)
+        self._n_live += 1
+
+        domain_timers = self._by_domain.get(domain)
+        if domain_timers is None:
+            domain_timers = self._by_domain[domain] = set()
+            if session is not None:
+                session.on_ended(lambda: self._cancel_domain(domain))
+        domain_timers.add(timer)
+
+        ctx.on_invalidate(lambda: self.cancel(timer))
+
+        if self._task is None or self._task.done():
+            self._start()
+        elif deadline < self._wake_at:
+            # The task is sleeping until a later deadline; restart it
+            self._task.cancel()
+            self._start()
+        return timer
+
+    def cancel(self, timer: _Timer) -> None:
+        if timer.done:
+            return
+        self._retire(timer)
+        if self._n_live == 0:
+            self._heap.clear()
+            if self._task is not None:
+                self._task.cancel()
+                self._task = None
+        elif len(self._heap) > 2 * self._n_live + 64:
+            # Mostly cancelled timers; drop them so the heap doesn't grow unboundedly.
+            # Compact in place, as the running task holds on to the list.
+            self._heap[:] = [t for t in self._heap if not t.done]
+            heapq.heapify(self._heap)
+
+    def _cancel_domain(self, domain: ReactiveDomain) -> None:
+        for timer in list(self._by_domain.get(domain, ())):
+            self.cancel(timer)
+        self._by_domain.pop(domain, None)
+
+    def _retire(self, timer: _Timer) -> None:
+        timer.done = True
+        self._n_live -= 1
+        domain_timers = self._by_domain.get(timer.domain)
+        if domain_timers is not None:
+            domain_timers.discard(timer)
+
+    def _start(self) -> None:
+        self._wake_at = self._heap[0].deadline
+        # Run the task in an empty context, rather than that of whichever session
+        # happened to start it
+        self._task = contextvars.Context().run(asyncio.create_task, self._run())
+
+    async def _run(self) -> None:
+        heap = self._heap
+        while True:
+            while heap and heap[0].done:
+                heapq.heappop(heap)
+            if not heap:
+                self._wake_at = float("inf")
+                return
+            self._wake_at = heap[0].deadline
+            delay = self._wake_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            now = time.monotonic()
+            due: dict[ReactiveDomain, list[_Timer]] = {}
+            while heap and heap[0].deadline <= now:
+                timer = heapq.heappop(heap)
+                if timer.done:
+                    continue
+                self._retire(timer)
+                due.setdefault(timer.domain, []).append(timer)
+            if due:
+                self._fire(due)
+
+    def _fire(self, due: dict[ReactiveDomain, list[_Timer]]) -> None:
+        flush_domain: Optional[ReactiveDomain] = None
+        for domain, timers in due.items():
+            if domain.lock.locked():
+                # Another task is working on this domain; wait for it
+                session = timers[0].session
+                self._spawn(self._invalidate_and_flush(domain, timers, session))
+                continue
+            # The lock is free, and we don't yield here, so this is the same as
+            # invalidating while holding it
+            for timer in timers:
+                timer.ctx.invalidate()
+            if flush_domain is None:
+                flush_domain = domain
+
+        if flush_domain is not None:
+            # A single flush covers every domain that was invalidated above
+            session = due[flush_domain][0].session
+            self._spawn(self._invalidate_and_flush(flush_domain, [], session))
+
+    def _spawn(self, coro: Awaitable[None]) -> None:
+        # Hold a reference to the task until it's done, so it can't be garbage collected
+        task = asyncio.ensure_future(coro)
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    @staticmethod
+    async def _invalidate_and_flush(
+        domain: ReactiveDomain,
+        timers: list[_Timer],
+        session: "Session | None",
+    ) -> None:
+        from ..session import session_context
+
+        try:
+            async with domain.lock:
+                for timer in timers:
+                    timer.ctx.invalidate()
+                with session_context(session):
+                    # Detach from any active OTel span so the flush's reactive_update
+                    # span starts as a root span. The flush is timer-driven, not
+                    # caused by a user action, so it should have no parent.
+                    with detached_otel_context():
+                        await _reactive_environment.flush(domain=domain)
+        except asyncio.CancelledError:
+            raise
+        except BaseException:
+            traceback.print_exc()
+            raise
+
+
+_timer_scheduler = _TimerScheduler()
+
+
 @add_example()
 @contextlib.contextmanager
 def isolate() -> Generator[None, None, None]:
@@ -307,8 +778,14 @@ def lock() -> asyncio.Lock:
     :class:`~reactive.value` and call :func:`~shiny.reactive.flush` from a different
     :class:`~asyncio.Task` than the one that is running the Shiny
     :class:`~shiny.Session`.
+
+    Note
+    ----
+    Each session has its own reactive domain, with its own lock. This returns the lock
+    for the current session's domain (or the app-global domain, when called outside of
+    a session), so holding it doesn't block other sessions.
     """
-    return _reactive_environment.lock
+    return _reactive_environment.current_domain().lock
 
 
 @add_example()
@@ -345,56 +822,6 @@ def invalidate_later(
         session = get_current_session()
 
     ctx = get_current_context()
-    # Pass an absolute time to our subtask, rather than passing the delay directly, in
-    # case the subtask doesn't get a chance to start sleeping until a significant amount
-    # of time has passed.
-    deadline = time.monotonic() + delay
-
-    cancellable = True
-    # unsub is used to unsubscribe from session.on_ended when time expires. We don't
-    # want a ton of event handler registrations sitting there uselessly, keeping object
-    # graphs from being gc'd.
-    unsub: Optional[Callable[[], None]] = None
-
-    async def _task(ctx: Context, deadline: float) -> None:
-        nonlocal cancellable
-        try:
-            delay = deadline - time.monotonic()
-            try:
-                await asyncio.sleep(delay)
-            except asyncio.CancelledError:
-                # This happens when cancel_task is called due to the session ending, or
-                # the context being invalidated due to some other reason. There's no
-                # reason for us to keep waiting at that point, as ctx.invalidate() can
-                # only be a no-op.
-                return
-
-            async with lock():
-                # Prevent the ctx.invalidate() from killing our own task. (Another way
-                # to accomplish this is to unregister our ctx.on_invalidate handler, but
-                # ctx.on_invalidate doesn't currently allow unregistration.)
-                cancellable = False
-
-                # Detach from any active OTel span so the flush's reactive_update
-                # span starts as a root span. The flush is timer-driven, not
-                # caused by a user action, so it should have no parent.
-                with detached_otel_context():
-                    ctx.invalidate()
-                    await flush()
-
-        except BaseException:
-            traceback.print_exc()
-            raise
-        finally:
-            if unsub:
-                unsub()
-
-    task = asyncio.create_task(_task(ctx, deadline))
-
-    def cancel_task():
-        if cancellable and not task.cancelled():
-            task.cancel()
-
-    ctx.on_invalidate(cancel_task)
-    if session:
-        unsub = session.on_ended(cancel_task)
+    # All calls share one timer task, which invalidates `ctx` (and flushes) once the
+    # deadline has passed, unless `ctx` is invalidated or the session ends first.
+    _timer_scheduler.schedule(time.monotonic() + delay, ctx, session)
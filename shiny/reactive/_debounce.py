@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, Callable, Generic, Optional, TypeVar, cast
+
+from .. import _utils, otel, reactive
+from .._docstring import add_example
+from ..types import MISSING, MISSING_TYPE
+from ._reactives import Calc_
+
+if TYPE_CHECKING:
+    from .. import Session
+
+__all__ = ("debounce", "throttle")
+
+T = TypeVar("T")
+
+
+@add_example()
+def debounce(
+    delay_secs: float,
+    *,
+    priority: int = 100,
+    session: MISSING_TYPE | Session | None = MISSING,
+) -> Callable[[Callable[[], T]], Callable[[], T]]:
+    """
+    Slow down a reactive expression, so that it only updates once its value has stopped
+    changing for a while.
+
+    Decorate a no-argument function that reads reactive values and/or calcs (or a
+    :func:`~shiny.reactive.calc`) with `@reactive.debounce()` to get a reactive
+    :func:`~shiny.reactive.calc` that returns the same value, but that doesn't
+    invalidate its callers until `delay_secs` have passed without the decorated
+    function being invalidated. This is useful when a rapidly changing input (like a
+    text box that the user is typing in, or a slider that is being dragged) feeds an
+    expensive computation: with `debounce()`, the computation only runs once the input
+    settles.
+
+    Parameters
+    ----------
+    delay_secs
+        The number of seconds that the decorated function must go without being
+        invalidated before the result is invalidated.
+    priority
+        Debouncing is implemented using :func:`~shiny.reactive.effect` objects; use the
+        `priority` argument to control the order of their execution versus other
+        Effects in your app. See :func:`~shiny.reactive.effect` for more details.
+    session
+        A :class:`~shiny.Session` instance. If not provided, a session is inferred via
+        :func:`~shiny.session.get_current_session`. The timer and effects that debounce
+        the function stop when the session ends.
+
+    Returns
+    -------
+    :
+        A decorator that should be applied to a no-argument function (which may be a
+        regular function or a co-routine function). The result of the decorator is a
+        reactive :func:`~shiny.reactive.calc`.
+
+    Note
+    ----
+    The decorated function is re-run as soon as it is invalidated (to find out whether
+    it's still changing), so it should be inexpensive; the point is to delay whatever
+    depends on it. If it isn't already a :func:`~shiny.reactive.calc`, it is wrapped in
+    one, so it isn't run again when the debounced result is read. Errors from the
+    decorated function are raised when the result is read, after the delay.
+
+    See Also
+    --------
+    * :func:`~shiny.reactive.throttle`
+    * :func:`~shiny.reactive.invalidate_later`
+    """
+
+    def wrapper(fn: Callable[[], T]) -> Callable[[], T]:
+        _utils.validate_no_params(fn, "reactive.debounce")
+        result = _TriggeredCalc(fn, session)
+
+        with otel.suppress():
+            # The time at which the result should be invalidated, if it's pending
+            when: reactive.Value[Optional[float]] = reactive.Value(None)
+
+            @reactive.effect(priority=priority, session=session)
+            async def _():
+                # Take a dependency on the source, and (if it has changed since the
+                # result was computed) start the delay again
+                await result.read_source()
+                if not result.is_current():
+                    when.set(time.monotonic() + delay_secs)
+
+            @reactive.effect(priority=priority, session=session)
+            def _():
+                deadline = when()
+                if deadline is None:
+                    return
+                now = time.monotonic()
+                if now >= deadline:
+                    result.invalidate()
+                    with reactive.isolate():
+                        when.set(None)
+                else:
+                    reactive.invalidate_later(deadline - now, session=session)
+
+        return result.calc
+
+    return wrapper
+
+
+@add_example()
+def throttle(
+    delay_secs: float,
+    *,
+    priority: int = 100,
+    session: MISSING_TYPE | Session | None = MISSING,
+) -> Callable[[Callable[[], T]], Callable[[], T]]:
+    """
+    Slow down a reactive expression, so that it updates at most once in any period.
+
+    Decorate a no-argument function that reads reactive values and/or calcs (or a
+    :func:`~shiny.reactive.calc`) with `@reactive.throttle()` to get a reactive
+    :func:`~shiny.reactive.calc` that returns the same value, but that invalidates its
+    callers at most once every `delay_secs`. Unlike
+    :func:`~shiny.reactive.debounce`, a function that keeps changing still updates
+    regularly (at the start of each period, and once more at the end of the last one),
+    which suits inputs like a slider that is being dragged, when intermediate results
+    are still useful.
+
+    Parameters
+    ----------
+    delay_secs
+        The minimum number of seconds between invalidations of the result.
+    priority
+        Throttling is implemented using :func:`~shiny.reactive.effect` objects; use the
+        `priority` argument to control the order of their execution versus other
+        Effects in your app. See :func:`~shiny.reactive.effect` for more details.
+    session
+        A :class:`~shiny.Session` instance. If not provided, a session is inferred via
+        :func:`~shiny.session.get_current_session`. The timer and effects that throttle
+        the function stop when the session ends.
+
+    Returns
+    -------
+    :
+        A decorator that should be applied to a no-argument function (which may be a
+        regular function or a co-routine function). The result of the decorator is a
+        reactive :func:`~shiny.reactive.calc`.
+
+    Note
+    ----
+    As with :func:`~shiny.reactive.debounce`, the decorated function is re-run as soon
+    as it is invalidated, so it should be inexpensive. If it isn't already a
+    :func:`~shiny.reactive.calc`, it is wrapped in one.
+
+    See Also
+    --------
+    * :func:`~shiny.reactive.debounce`
+    * :func:`~shiny.reactive.invalidate_later`
+    """
+
+    def wrapper(fn: Callable[[], T]) -> Callable[[], T]:
+        _utils.validate_no_params(fn, "reactive.throttle")
+        result = _TriggeredCalc(fn, session)
+
+        with otel.suppress():
+            # Whether the source has changed since the result was last invalidated
+            pending: reactive.Value[bool] = reactive.Value(False)
+            last_triggered: Optional[float] = None
+
+            def blackout_left() -> float:
+                if last_triggered is None:
+                    return 0
+                return max(0, last_triggered + delay_secs - time.monotonic())
+
+            def fire() -> None:
+                nonlocal last_triggered
+                last_triggered = time.monotonic()
+                result.invalidate()
+                with reactive.isolate():
+                    pending.set(False)
+
+            @reactive.effect(priority=priority, session=session)
+            async def _():
+                await result.read_source()
+                with reactive.isolate():
+                    if pending() or result.is_current():
+                        return
+                if blackout_left() > 0:
+                    pending.set(True)
+                else:
+                    fire()
+
+            @reactive.effect(priority=priority, session=session)
+            def _():
+                if not pending():
+                    return
+                left = blackout_left()
+                if left > 0:
+                    reactive.invalidate_later(left, session=session)
+                else:
+                    fire()
+
+        return result.calc
+
+    return wrapper
+
+
+class _TriggeredCalc(Generic[T]):
+    """
+    A calc that returns the value of `fn` (wrapped in a calc, if it isn't one), but
+    isn't invalidated when `fn` is; only when `invalidate()` is called.
+    """
+
+    def __init__(self, fn: Callable[[], T], session: MISSING_TYPE | Session | None):
+        if isinstance(fn, Calc_):
+            self.source = cast(Calc_[T], fn)
+        else:
+            self.source = reactive.calc(session=session)(fn)
+        with otel.suppress():
+            self._trigger: reactive.Value[int] = reactive.Value(0)
+        # The execution of the source that the result was computed from
+        self._seen_exec_count: Optional[int] = None
+
+        source = self.source
+        if _utils.is_async_callable(self.source):
+
+            async def result_async() -> Any:
+                self._trigger()
+                with reactive.isolate():
+                    try:
+                        return await source.get_value()
+                    finally:
+                        self._seen_exec_count = source._exec_count
+
+            result_async.__name__ = source.__name__
+            self.calc = cast(
+                Callable[[], T], reactive.calc(session=session)(result_async)
+            )
+        else:
+
+            def result_sync() -> T:
+                self._trigger()
+                with reactive.isolate():
+                    try:
+                        return source()
+                    finally:
+                        self._seen_exec_count = source._exec_count
+
+            result_sync.__name__ = source.__name__
+            self.calc = reactive.calc(session=session)(result_sync)
+
+    async def read_source(self) -> None:
+        # Read the source (taking a dependency on it), ignoring any error: the error is
+        # raised to whoever reads the result
+        try:
+            await self.source.get_value()
+        except Exception:
+            pass
+
+    def is_current(self) -> bool:
+        """Whether the result is up to date with the source (or hasn't been computed
+        yet)."""
+        return self._seen_exec_count in (None, self.source._exec_count)
+
+    def invalidate(self) -> None:
+        with reactive.isolate():
+            self._trigger.set(self._trigger() + 1)
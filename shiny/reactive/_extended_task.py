@@ -18,12 +18,10 @@ from .._docstring import add_example
 from .._typing_extensions import ParamSpec
 from .._utils import is_async_callable
 from .._validation import req
-from ..otel._attributes import extract_source_ref, get_session_id_attrs
 from ..otel._collect import OtelCollectLevel
 from ..otel._core import emit_otel_log, is_otel_tracing_enabled
 from ..otel._function_attrs import resolve_func_otel_level
-from ..otel._labels import create_otel_span_name
-from ..otel._span_wrappers import shiny_otel_span
+from ..otel._span_info import OtelSpanInfo
 from ._core import Context, flush, lock
 from ._reactives import Value, isolate
 
@@ -46,6 +44,8 @@ class DenialContext(Context):
     that code run outside of reactive.lock doesn't inadvertedly read reactive sources.
     """
 
+    __slots__ = ()
+
     def on_invalidate(self, func: Callable[[], None]) -> None:
         raise RuntimeError(
             "You're not allowed to read reactive sources from inside a Extended Task. "
@@ -61,21 +61,11 @@ class ExtendedTask(Generic[P, R]):
         self._func = func
         self._task: Optional[asyncio.Task[R]] = None
 
-        # Extract OpenTelemetry attributes at initialization time
+        # The span name and attributes are only computed when they're first needed
         from ..session import get_current_session
 
-        session = get_current_session()
-        self._otel_attrs: dict[str, Any] = {
-            **get_session_id_attrs(session),
-            **extract_source_ref(func),
-        }
-
-        # Generate label for task execution span
-        self._otel_label: str = create_otel_span_name(
-            func, "extended_task", session=session
-        )
-        self._otel_log_label: str = self._otel_label.replace(
-            "extended_task", "extended_task queued", 1
+        self._otel_span_info = OtelSpanInfo(
+            func, "extended_task", session=get_current_session()
         )
 
         # Extract collection level from function attribute (e.g., set by `@otel.suppress` or `@otel.collect` decorators)
@@ -166,17 +156,25 @@ class ExtendedTask(Generic[P, R]):
         self._task = asyncio.create_task(self._execution_wrapper(*args, **kwargs))
         self._task.add_done_callback(self._done_callback)
 
+    @property
+    def _otel_label(self) -> str:
+        return self._otel_span_info.label
+
+    @property
+    def _otel_log_label(self) -> str:
+        return self._otel_label.replace("extended_task", "extended_task queued", 1)
+
+    @property
+    def _otel_attrs(self) -> dict[str, Any]:
+        return self._otel_span_info.attrs
+
     async def _execution_wrapper(self, *args: P.args, **kwargs: P.kwargs) -> R:
         """
         Wraps the user code in a context that denies access to reactive sources,
         and creates an OpenTelemetry span to track the task execution.
         """
-        async with shiny_otel_span(
-            self._otel_label,
-            attributes=self._otel_attrs,
-            infer_session_id=False,
-            required_level=OtelCollectLevel.REACTIVITY,
-            collection_level=self._otel_level,
+        async with self._otel_span_info.span(
+            OtelCollectLevel.REACTIVITY, collection_level=self._otel_level
         ):
             with DenialContext()():
                 return await self._func(*args, **kwargs)
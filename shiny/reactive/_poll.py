@@ -1,9 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import functools
+import importlib.util
 import os
+import traceback
 from operator import eq
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional, TypeVar, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Hashable,
+    Optional,
+    TypeVar,
+    cast,
+)
 
 from .. import _utils, otel, reactive
 from .._docstring import add_example
@@ -25,6 +38,7 @@ def poll(
     equals: Callable[[Any, Any], bool] = eq,
     priority: int = 0,
     session: MISSING_TYPE | Session | None = MISSING,
+    shared: bool = False,
 ) -> Callable[[Callable[[], T]], Callable[[], T]]:
     """
     Create a reactive polling object.
@@ -47,7 +61,8 @@ def poll(
     and will automatically invalidate when the polling function detects a change.
     Polling objects also cache the results of the read function; for this reason, apps
     where all sessions depend on the same data source may want to declare the polling
-    object at the top level of app.py (outside of the server function).
+    object at the top level of app.py (outside of the server function), or to pass
+    `shared=True`.
 
     Both `poll_func` and the decorated (data reading) function can read reactive values
     and :func:`~shiny.reactive.calc` objects. Any invalidations triggered by reactive
@@ -82,6 +97,14 @@ def poll(
         :func:`~shiny.session.get_current_session`. If there is no current session (i.e.
         `poll` is being created outside of the server function), the lifetime of this
         reactive poll object will not be tied to any specific session.
+    shared
+        If `True`, a single polling object is shared by the whole process, even when
+        `poll` is called inside the server function: the first call creates it (not
+        tied to any session), and later calls with the same functions (by module and
+        qualified name) and `interval_secs` return it. `poll_func` is then called once
+        per interval, and the data read once per change, for all sessions. Because of
+        this, neither function should depend on anything specific to a session (like
+        its inputs). `session` is ignored.
 
     Returns
     -------
@@ -97,6 +120,46 @@ def poll(
     * :func:`~shiny.reactive.file_reader`
     """
 
+    def wrapper(fn: Callable[[], T]) -> Callable[[], T]:
+        _utils.validate_no_params(fn, "reactive.poll")
+
+        if not shared:
+            return _poll(poll_func, fn, interval_secs, equals, priority, session)
+        key = ("poll", _qualname(poll_func), _qualname(fn), interval_secs)
+        return _shared_poll(
+            key, lambda: _poll(poll_func, fn, interval_secs, equals, priority, None)
+        )
+
+    return wrapper
+
+
+# Polls created with `shared=True`, by the functions they were created from.
+_shared_polls: dict[Hashable, Callable[[], Any]] = {}
+
+
+def _shared_poll(
+    key: Hashable, create: Callable[[], Callable[[], T]]
+) -> Callable[[], T]:
+    result = _shared_polls.get(key)
+    if result is None:
+        result = _shared_polls[key] = create()
+    return result
+
+
+def _qualname(fn: Callable[..., Any]) -> str:
+    return f"{getattr(fn, '__module__', '')}.{getattr(fn, '__qualname__', repr(fn))}"
+
+
+def _poll(
+    poll_func: Callable[[], Any] | Callable[[], Awaitable[Any]],
+    fn: Callable[[], T],
+    interval_secs: Optional[float],
+    equals: Callable[[Any, Any], bool],
+    priority: int,
+    session: MISSING_TYPE | Session | None,
+) -> Callable[[], T]:
+    # With `interval_secs=None`, `poll_func` is only called again when one of its
+    # reactive dependencies changes.
     with otel.suppress():
         with reactive.isolate():
             last_value: reactive.Value[Any] = reactive.Value(poll_func())
@@ -157,53 +220,49 @@ def poll(
                 # that it can be exposed to whoever's trying to use the poll object.
                 last_error.set(e)
             finally:
-                reactive.invalidate_later(interval_secs)
-
-        def wrapper(fn: Callable[[], T]) -> Callable[[], T]:
-            _utils.validate_no_params(fn, "reactive.poll")
+                if interval_secs is not None:
+                    reactive.invalidate_later(interval_secs)
 
-            if _utils.is_async_callable(fn):
+    if _utils.is_async_callable(fn):
 
-                @reactive.calc(session=session)
-                @functools.wraps(fn)
-                async def result_async() -> T:
-                    # If an error occurred, raise it
-                    err = last_error.get()
-                    if err is not None:
-                        raise err
+        @reactive.calc(session=session)
+        @functools.wraps(fn)
+        async def result_async() -> T:
+            # If an error occurred, raise it
+            err = last_error.get()
+            if err is not None:
+                raise err
 
-                    # Take dependency on polling result
-                    last_value.get()
+            # Take dependency on polling result
+            last_value.get()
 
-                    # Note that we also depend on the main function
-                    return await fn()
+            # Note that we also depend on the main function
+            return await fn()
 
-                # In this code path, the cast is necessary because result_async() has an
-                # incorrect signature due to limitations in Python's type hints. In this
-                # path, T is already an Awaitable. The signature should really be `async def
-                # result_async() -> Awaited[T]`, but there's no Awaited type in Python. So
-                # instead we'll just cast() it.
-                return cast(Callable[[], T], result_async)
+        # In this code path, the cast is necessary because result_async() has an
+        # incorrect signature due to limitations in Python's type hints. In this
+        # path, T is already an Awaitable. The signature should really be `async def
+        # result_async() -> Awaited[T]`, but there's no Awaited type in Python. So
+        # instead we'll just cast() it.
+        return cast(Callable[[], T], result_async)
 
-            else:
-
-                @reactive.calc(session=session)
-                @functools.wraps(fn)
-                def result_sync() -> T:
-                    # If an error occurred, raise it
-                    err = last_error.get()
-                    if err is not None:
-                        raise err
+    else:
 
-                    # Take dependency on polling result
-                    last_value.get()
+        @reactive.calc(session=session)
+        @functools.wraps(fn)
+        def result_sync() -> T:
+            # If an error occurred, raise it
+            err = last_error.get()
+            if err is not None:
+                raise err
 
-                    # Note that we also depend on the main function
-                    return fn()
+            # Take dependency on polling result
+            last_value.get()
 
-                return result_sync
+            # Note that we also depend on the main function
+            return fn()
 
-        return wrapper
+        return result_sync
 
 
 @add_example()
@@ -215,6 +274,8 @@ def file_reader(
     *,
     priority: int = 1,
     session: MISSING_TYPE | Session | None = MISSING,
+    watch: bool = False,
+    shared: bool = False,
 ) -> Callable[[Callable[[], T]], Callable[[], T]]:
     """
     Create a reactive file reader.
@@ -258,6 +319,16 @@ def file_reader(
         :func:`~shiny.session.get_current_session`. If there is no current session (i.e.
         `poll` is being created outside of the server function), the lifetime of this
         reactive poll object will not be tied to any specific session.
+    watch
+        If `True`, use filesystem change notifications (via the `watchfiles` package)
+        to find out when the file changes, instead of checking it every
+        `interval_secs`. A single watcher serves every file reader in the process.
+        (If `watchfiles` isn't installed, the file is checked every `interval_secs`.)
+    shared
+        If `True`, a single file reader is shared by the whole process, even when
+        `file_reader` is called inside the server function, so the file is checked
+        and read once for all sessions. See the `shared` argument of
+        :func:`~shiny.reactive.poll` for details.
 
     Returns
     -------
@@ -299,39 +370,110 @@ def file_reader(
             "os.PathLike, or a no-argument function that returns one of those types."
         )
 
+    watcher = _file_watcher if watch and _file_watcher.available() else None
+    # Without a watcher, the file is checked every `interval_secs`. With one, it's only
+    # checked when the watcher reports a change.
+    interval = interval_secs if watcher is None else None
+
     def check_timestamp():
         path = filepath_fn()
+        if watcher is not None:
+            watcher.watch(path)
         return (path, os.path.getmtime(path), os.path.getsize(path))
 
     def wrapper(fn: Callable[[], T]) -> Callable[[], T]:
         _utils.validate_no_params(fn, "reactive.file_reader")
 
-        if _utils.is_async_callable(fn):
+        if not shared:
+            return _poll(check_timestamp, fn, interval, eq, priority, session)
+        path_key: str
+        if filepath_fn is filepath:
+            path_key = _qualname(filepath_fn)
+        else:
+            path_key = os.path.abspath(os.fspath(filepath_fn()))
+        key = ("file_reader", path_key, _qualname(fn), interval)
+        return _shared_poll(
+            key, lambda: _poll(check_timestamp, fn, interval, eq, priority, None)
+        )
 
-            @poll(
-                check_timestamp,
-                interval_secs=interval_secs,
-                priority=priority,
-                session=session,
-            )
-            @functools.wraps(fn)
-            async def reader_async():
-                return await fn()
+    return wrapper
 
-            # See poll() for explanation of why this cast is needed.
-            return cast(Callable[[], T], reader_async)
-        else:
 
-            @poll(
-                check_timestamp,
-                interval_secs=interval_secs,
-                priority=priority,
-                session=session,
-            )
-            @functools.wraps(fn)
-            def reader():
-                return fn()
+class _FileWatcher:
+    """
+    Watches the files of every `file_reader(watch=True)` in the process, with a single
+    `watchfiles` task, and invalidates the readers of a file when it changes.
+    """
 
-            return reader
+    def __init__(self) -> None:
+        # A counter for each watched file, which is incremented when it changes
+        self._changes: dict[str, reactive.Value[int]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._dirs: frozenset[str] = frozenset()
+
+    @staticmethod
+    def available() -> bool:
+        return importlib.util.find_spec("watchfiles") is not None
+
+    def watch(self, path: str | os.PathLike[str]) -> None:
+        """Take a reactive dependency on changes to the file at `path`."""
+        path = os.path.abspath(os.fspath(path))
+        changes = self._changes.get(path)
+        if changes is None:
+            with otel.suppress():
+                changes = self._changes[path] = reactive.Value(0)
+        changes()
+        self._ensure_running()
+
+    def _ensure_running(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Called at import time; watching starts when the reader is first polled
+            return
+        # Directories are watched, rather than the files themselves, so that files
+        # that are replaced (as many editors and tools do) are still followed.
+        dirs = frozenset(os.path.dirname(path) for path in self._changes)
+        running = self._task is not None and not self._task.done()
+        if running and loop is self._loop and dirs == self._dirs:
+            return
+
+        if self._stop is not None and loop is self._loop:
+            self._stop.set()
+        self._loop = loop
+        self._dirs = dirs
+        self._stop = asyncio.Event()
+        # Run the task in an empty context, rather than that of whichever session
+        # happened to start it
+        self._task = contextvars.Context().run(
+            asyncio.create_task, self._run(dirs, self._stop)
+        )
 
-    return wrapper
+    async def _run(self, dirs: frozenset[str], stop: asyncio.Event) -> None:
+        import watchfiles
+
+        from ._core import _reactive_environment, session_domain
+
+        domain = session_domain(None)
+        try:
+            async for changes in watchfiles.awatch(
+                *dirs, watch_filter=None, recursive=False, stop_event=stop
+            ):
+                paths = {os.path.abspath(path) for _, path in changes}
+                changed = [self._changes[p] for p in paths if p in self._changes]
+                if not changed:
+                    continue
+                async with domain.lock:
+                    with reactive.isolate():
+                        for value in changed:
+                            value.set(value() + 1)
+                    await _reactive_environment.flush(domain=domain)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            traceback.print_exc()
+
+
+_file_watcher = _FileWatcher()
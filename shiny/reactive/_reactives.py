@@ -17,9 +17,12 @@ __all__ = (
 
 import asyncio
 import functools
+import sys
 import traceback
+import typing
 import warnings
 import weakref
+from contextlib import AbstractAsyncContextManager
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -27,6 +30,7 @@ from typing import (
     Callable,
     Generic,
     Optional,
+    Protocol,
     TypeVar,
     cast,
     overload,
@@ -36,17 +40,17 @@ from .. import _utils
 from .._docstring import add_example
 from .._utils import is_async_callable, run_coro_sync
 from .._validation import req
-from ..otel._attributes import SourceRefAttrs, extract_source_ref, get_session_id_attrs
+from ..otel._attributes import SourceRefAttrs, get_session_id_attrs
 from ..otel._collect import OtelCollectLevel, get_level
+from ..otel._constants import ATTR_SESSION_ID
 from ..otel._core import emit_otel_log, is_otel_tracing_enabled
 from ..otel._function_attrs import resolve_func_otel_level
 from ..otel._labels import (
     create_otel_label,
-    create_otel_span_name,
     get_otel_label_modifier,
     set_otel_label_modifier,
 )
-from ..otel._span_wrappers import shiny_otel_span
+from ..otel._span_info import OtelSpanInfo
 from ..types import (
     MISSING,
     MISSING_TYPE,
@@ -54,22 +58,37 @@ from ..types import (
     NotifyException,
     SilentException,
 )
-from ._core import Context, Dependents, ReactiveWarning, isolate
+from ._core import Context, Dependents, ReactiveWarning, isolate, session_domain
 from ._utils import is_user_code_frame
 
 
+def _user_call_site() -> tuple[str, int] | None:
+    """
+    The file and line of the innermost frame of user code (not Shiny's) calling into
+    Shiny, found by walking up from the caller of the caller of this function.
+    """
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        # `Value[int](0)` is called through `typing`'s generic alias, so skip that too
+        if filename != typing.__file__ and is_user_code_frame(filename):
+            return filename, frame.f_lineno
+        frame = frame.f_back
+    return None
+
+
 def _weak_destroy_callback(
-    method: Callable[[], None],
+    reactive: _Destroyable,
     session: Session,
-) -> Callable[[], None]:
+) -> Callable[[], Awaitable[None]]:
     """
     Build the ``on_destroy`` callback that a reactive registers with its session.
 
-    The bound method is wrapped in a ``weakref.WeakMethod`` so the callback does
-    not prevent the owning reactive from being garbage collected. If the reactive
-    has already been collected, the wrapper silently no-ops.
+    The reactive is only weakly referenced, so the callback does not prevent it from
+    being garbage collected. If the reactive has already been collected, the callback
+    silently no-ops.
 
-    The wrapper also no-ops when the session is closed. A whole-session close is
+    The callback also no-ops when the session is closed. A whole-session close is
     not a destroy: every consumer in the session is already gone (effects are
     destroyed via ``on_ended``, and the session can no longer flush), so the
     reactive is left intact and reclaimed by ordinary garbage collection.
@@ -78,16 +97,58 @@ def _weak_destroy_callback(
     refresh, an ``asyncio`` task, a ``loop.call_later()`` callback -- with an
     unavoidable, racy :class:`DestroyedReactiveError`.
     """
-    ref = weakref.WeakMethod(method)
+    return _WeakDestroyCallback(reactive, session)
+
+
+class _Destroyable(Protocol):
+    def destroy(self) -> None: ...
 
-    def wrapper() -> None:
-        if session._is_closed():
+
+class _WeakDestroyCallback:
+    # One of these is registered for every value, calc, and effect in a session, so
+    # it's a small object rather than a closure over a `WeakMethod`. It's also async,
+    # so that `on_destroy()` doesn't need to wrap it in another function.
+    __slots__ = ("_ref", "_session")
+
+    def __init__(self, reactive: _Destroyable, session: Session) -> None:
+        self._ref = weakref.ref(reactive)
+        self._session = session
+
+    async def __call__(self) -> None:
+        if self._session._is_closed():
             return
-        fn = ref()
-        if fn is not None:
-            fn()
+        reactive = self._ref()
+        if reactive is not None:
+            reactive.destroy()
+
 
-    return wrapper
+def _noop() -> None:
+    pass
+
+
+class _InstanceDoc:
+    """
+    A ``__doc__`` for classes with ``__slots__`` whose instances take the docstring of
+    the function they wrap.
+
+    A class's own docstring is stored in its ``__doc__`` attribute, so without an
+    instance ``__dict__`` there's nowhere to put an instance's ``__doc__``. This gives
+    the class docstring when looked up on the class, and the ``_doc`` slot when looked
+    up on an instance.
+    """
+
+    __slots__ = ("_class_doc",)
+
+    def __init__(self, class_doc: str | None) -> None:
+        self._class_doc = class_doc
+
+    def __get__(self, obj: Any, objtype: Any = None) -> str | None:
+        if obj is None:
+            return self._class_doc
+        return obj._doc
+
+    def __set__(self, obj: Any, value: str | None) -> None:
+        obj._doc = value
 
 
 class DestroyedReactiveError(Exception):
@@ -159,6 +220,23 @@ class Value(Generic[T]):
     * :func:`~shiny.reactive.effect`
     """
 
+    # Every input (and many reactive values per module) is one of these, so no
+    # instance `__dict__`. `__weakref__` is for the `on_destroy` callback.
+    __slots__ = (
+        "_value",
+        "_read_only",
+        "_value_dependents",
+        "_is_set_dependents",
+        "_name_value",
+        "_name_site",
+        "_otel_level",
+        "_otel_session_id",
+        "_otel_namespace",
+        "_otel_label",
+        "_destroyed",
+        "__weakref__",
+    )
+
     # These overloads are necessary so that the following hold:
     # - Value() is marked by the type checker as an error, because the type T is
     #   unknown. (It is not a run-time error.)
@@ -197,19 +275,22 @@ class Value(Generic[T]):
         # Optional name for OpenTelemetry logging and debugging
         # Priority during initialization: 1) explicit name parameter, 2) inferred from assignment, 3) None
         # Can be overwritten later by Inputs class when value is added/accessed
-        self._name: str | None
-        if name is not None:
-            self._name = name
-        else:
-            self._name = self._try_infer_name()
+        # Inferring the name means reading the source of the caller, so only the
+        # caller's location is recorded here and the name is inferred on first use.
+        self._name_value: str | None = name
+        self._name_site: tuple[str, int] | None = (
+            _user_call_site() if name is None else None
+        )
 
         # Capture collection level at initialization time
         # This determines whether value updates will emit OTel logs
         session = get_current_session()
         self._otel_level: OtelCollectLevel = get_level()
-        self._otel_attrs: dict[str, Any] = {**get_session_id_attrs(session)}
-        if read_only:
-            self._otel_attrs["read-only"] = True
+        # Only the session ID is kept: the log attributes are built when a log is
+        # emitted, and most values never emit one
+        self._otel_session_id: str | None = get_session_id_attrs(session).get(
+            ATTR_SESSION_ID
+        )
 
         self._otel_namespace: str | None = None
         if session is not None:
@@ -226,14 +307,28 @@ class Value(Generic[T]):
             # Unset the value on session/module destroy so dependents are
             # invalidated and the stored value is freed. (Not on session close --
             # see `_weak_destroy_callback`.)
-            session.on_destroy(_weak_destroy_callback(self.destroy, session))
-
-    def _try_infer_name(self) -> str | None:
+            session.on_destroy(_weak_destroy_callback(self, session))
+
+    @property
+    def _name(self) -> str | None:
+        if self._name_site is not None:
+            self._name_value = self._try_infer_name(*self._name_site)
+            self._name_site = None
+        return self._name_value
+
+    @_name.setter
+    def _name(self, name: str | None) -> None:
+        self._name_value = name
+        self._name_site = None
+
+    @classmethod
+    def _try_infer_name(cls, filename: str, lineno: int) -> str | None:
         """
-        Attempt to infer the variable name from the call stack.
+        Attempt to infer the variable name from the line where Value() was called.
 
-        This examines the frame where Value() was instantiated and tries
-        to parse the assignment statement to extract the variable name.
+        `filename` and `lineno` are the location of the innermost user code frame
+        when the Value was instantiated; this tries to parse the assignment statement
+        there to extract the variable name.
 
         Returns None if the name cannot be reliably determined.
 
@@ -262,61 +357,45 @@ class Value(Generic[T]):
         - reactive.Value(0)  # No assignment
         - Complex expressions
         """
-        import inspect
+        import linecache
         import re
 
         try:
-            # Walk up the stack: [0] = _try_infer_name, [1] = __init__, [2] = caller
-            for frame_info in inspect.stack()[2:]:
-                filename = frame_info.filename
-
-                # Skip internal shiny code, keep user code
-                if not is_user_code_frame(filename):
-                    continue
+            # Get the source line
+            line = linecache.getline(filename, lineno).strip()
+            if not line:
+                return None
+
+            # Pattern 1: var_name = [reactive.]Value(...) or [reactive.]value(...)
+            # Also handles type annotations: var_name: Type = [reactive.]Value(...)
+            # [\[\(] at the end anchors to either a function call `Value(`
+            # or a generic subscript `Value[int](`, preventing matches
+            # against identifiers like ValueFactory or value2
+            match = re.match(
+                r"^(\w+)\s*(?::[^=]+)?\s*=\s*(?:reactive\.)?[Vv]alue\s*[\[\(]",
+                line,
+            )
+            if match:
+                return match.group(1)
 
-                # Get the source line
-                if frame_info.code_context:
-                    line = frame_info.code_context[0].strip()
-
-                    # Pattern 1: var_name = [reactive.]Value(...) or [reactive.]value(...)
-                    # Also handles type annotations: var_name: Type = [reactive.]Value(...)
-                    # [\[\(] at the end anchors to either a function call `Value(`
-                    # or a generic subscript `Value[int](`, preventing matches
-                    # against identifiers like ValueFactory or value2
-                    match = re.match(
-                        r"^(\w+)\s*(?::[^=]+)?\s*=\s*(?:reactive\.)?[Vv]alue\s*[\[\(]",
-                        line,
-                    )
-                    if match:
-                        return match.group(1)
-
-                    # Pattern 2: self.var_name = [reactive.]Value(...) or [reactive.]value(...)
-                    # Also handles type annotations: self.var_name: Type = [reactive.]Value(...)
-                    # [\[\(] at the end anchors to either a function call `Value(`
-                    # or a generic subscript `Value[int](`, preventing matches
-                    # against identifiers like ValueFactory or value2
-                    match = re.match(
-                        r"^\w+\.(\w+)\s*(?::[^=]+)?\s*=\s*(?:reactive\.)?[Vv]alue\s*[\[\(]",
-                        line,
-                    )
-                    if match:
-                        return match.group(1)
-
-                    # If the line is a bare Value/value call (e.g., from a
-                    # multiline assignment where the target is on a previous
-                    # line), look backwards in the source file for the
-                    # assignment target.
-                    if re.search(r"\b[Vv]alue\b", line):
-                        name = self._try_infer_name_from_preceding_lines(
-                            filename, frame_info.lineno
-                        )
-                        if name is not None:
-                            return name
-                        break
-                    continue
+            # Pattern 2: self.var_name = [reactive.]Value(...) or [reactive.]value(...)
+            # Also handles type annotations: self.var_name: Type = [reactive.]Value(...)
+            # [\[\(] at the end anchors to either a function call `Value(`
+            # or a generic subscript `Value[int](`, preventing matches
+            # against identifiers like ValueFactory or value2
+            match = re.match(
+                r"^\w+\.(\w+)\s*(?::[^=]+)?\s*=\s*(?:reactive\.)?[Vv]alue\s*[\[\(]",
+                line,
+            )
+            if match:
+                return match.group(1)
 
-                # Stop after first user code frame with no source context
-                break
+            # If the line is a bare Value/value call (e.g., from a
+            # multiline assignment where the target is on a previous
+            # line), look backwards in the source file for the
+            # assignment target.
+            if re.search(r"\b[Vv]alue\b", line):
+                return cls._try_infer_name_from_preceding_lines(filename, lineno)
 
         except Exception:
             # If anything fails, silently return None
@@ -407,14 +486,19 @@ class Value(Generic[T]):
         import inspect
 
         try:
-            # Stack: [0] = _extract_caller_source_ref, [1] = _set, [2] = caller
-            for frame_info in inspect.stack()[2:]:
-                filename = frame_info.filename
+            # Walk the frames directly: `inspect.stack()` would read the source of
+            # every frame on the stack
+            frame = sys._getframe(1)
+            while frame is not None:
+                filename = frame.f_code.co_filename
 
                 # Skip internal shiny code, keep user code
                 if not is_user_code_frame(filename):
+                    frame = frame.f_back
                     continue
 
+                frame_info = inspect.getframeinfo(frame, context=0)
+
                 # Found a user code frame - extract attributes
                 attrs: SourceRefAttrs = {}
                 attrs["code.file.path"] = filename
@@ -466,11 +550,13 @@ class Value(Generic[T]):
                 f"Reactive value '{self._name}' has been destroyed."
             )
 
-        self._value_dependents.register()
+        ctx = self._value_dependents.register()
 
         if isinstance(self._value, MISSING_TYPE):
             raise SilentException
 
+        if ctx._recorder is not None:
+            ctx._recorder.record(self.get, self._value)
         return self._value
 
     def set(self, value: T) -> bool:
@@ -550,8 +636,12 @@ class Value(Generic[T]):
         # Build attributes dict with session ID and source reference
         # Skip source ref extraction for read-only values (inputs) since the
         # caller is always internal framework code (starlette/asyncio), not user code
-        attrs: dict[str, Any] = {**self._otel_attrs}
-        if not self._read_only:
+        attrs: dict[str, Any] = {}
+        if self._otel_session_id is not None:
+            attrs[ATTR_SESSION_ID] = self._otel_session_id
+        if self._read_only:
+            attrs["read-only"] = True
+        else:
             attrs.update(self._extract_caller_source_ref())
 
         emit_otel_log(
@@ -609,8 +699,11 @@ class Value(Generic[T]):
         if self._destroyed:
             return False
 
-        self._is_set_dependents.register()
-        return not isinstance(self._value, MISSING_TYPE)
+        ctx = self._is_set_dependents.register()
+        is_set = not isinstance(self._value, MISSING_TYPE)
+        if ctx._recorder is not None:
+            ctx._recorder.record(self.is_set, is_set)
+        return is_set
 
     def freeze(self) -> None:
         """
@@ -651,6 +744,30 @@ class Calc_(Generic[T]):
     (instead, use the :func:`~shiny.reactive.calc` decorator).
     """
 
+    __slots__ = (
+        "__name__",
+        "_doc",
+        "_fn",
+        "_is_async",
+        "_sync_fn",
+        "_dependents",
+        "_invalidated",
+        "_running",
+        "_most_recent_ctx_id",
+        "_ctx",
+        "_exec_count",
+        "_update_task",
+        "_update_done",
+        "_destroyed",
+        "_session",
+        "_value",
+        "_error",
+        "_otel_span_info",
+        "_otel_level",
+        "__weakref__",
+    )
+    __doc__ = _InstanceDoc(__doc__)  # pyright: ignore[reportAssignmentType]
+
     def __init__(
         self,
         fn: CalcFunction[T],
@@ -660,13 +777,16 @@ class Calc_(Generic[T]):
         _utils.validate_no_params(fn, "reactive.calc", stacklevel=5)
 
         self.__name__ = fn.__name__
-        self.__doc__ = fn.__doc__
+        self._doc: str | None = fn.__doc__
 
         # The CalcAsync subclass will pass in an async function, but it tells the
         # static type checker that it's synchronous. wrap_async() is smart -- if is
         # passed an async function, it will not change it.
         self._fn: CalcFunctionAsync[T] = _utils.wrap_async(fn)
         self._is_async: bool = _utils.is_async_callable(fn)
+        # For sync calcs, the function itself, so that reads can run it without going
+        # through a coroutine (see `__call__()`).
+        self._sync_fn: Optional[CalcFunction[T]] = None if self._is_async else fn
 
         self._dependents: Dependents = Dependents()
         self._invalidated: bool = True
@@ -674,6 +794,11 @@ class Calc_(Generic[T]):
         self._most_recent_ctx_id: int = -1
         self._ctx: Optional[Context] = None
         self._exec_count: int = 0
+        # For async calcs: the task currently (re)computing the value, and an event
+        # that is set when it's done. When effects are flushed concurrently, other
+        # readers wait for that result instead of computing it a second time.
+        self._update_task: Optional[asyncio.Task[Any]] = None
+        self._update_done: Optional[asyncio.Event] = None
         # Guards destroy() idempotency and __call__/get_value access.
         # Once destroyed, the calc raises DestroyedReactiveError on access.
         self._destroyed: bool = False
@@ -698,14 +823,9 @@ class Calc_(Generic[T]):
         self._value: list[T] = []
         self._error: list[Exception] = []
 
-        # Extract OpenTelemetry attributes at initialization time
-        self._otel_attrs = {
-            **self._extract_otel_attrs(fn),
-            **get_session_id_attrs(session),
-        }
-
-        # Extract modifier from function attribute and generate label
-        self._otel_label: str = create_otel_span_name(
+        # The span name and attributes (including the modifier from the function's
+        # attributes) are only computed when they're first needed
+        self._otel_span_info = OtelSpanInfo(
             fn,
             "reactive.calc",
             session=self._session,
@@ -721,9 +841,7 @@ class Calc_(Generic[T]):
             # Invalidate context and dependents on session/module destroy so
             # the calc is permanently destroyed and references are freed. (Not on
             # session close -- see `_weak_destroy_callback`.)
-            self._session.on_destroy(
-                _weak_destroy_callback(self.destroy, self._session)
-            )
+            self._session.on_destroy(_weak_destroy_callback(self, self._session))
 
     def destroy(self) -> None:
         """
@@ -758,17 +876,72 @@ class Calc_(Generic[T]):
             raise DestroyedReactiveError(
                 f"Reactive calc '{self._otel_label}' has been destroyed."
             )
+        if self._sync_fn is not None and self._update_done is None:
+            # Nothing async is involved, so skip the coroutine machinery of
+            # get_value().
+            return self._get_value_sync()
         # Run the Coroutine (synchronously), and then return the value.
         # If the Coroutine yields control, then an error will be raised.
         return _utils.run_coro_sync(self.get_value())
 
+    def _get_value_sync(self) -> T:
+        # Same as get_value(), for sync calcs
+        ctx = self._dependents.register()
+
+        if self._invalidated or self._running:
+            if is_otel_tracing_enabled():
+                # Run the function in a span
+                _utils.run_coro_sync(self.update_value())
+            else:
+                self._update_value_sync()
+
+        if self._error:
+            raise self._error[0]
+
+        if ctx._recorder is not None:
+            ctx._recorder.record(self.get_value, self._value[0])
+        return self._value[0]
+
+    def _update_value_sync(self) -> None:
+        # Same as update_value(), for sync calcs when OpenTelemetry isn't tracing
+        assert self._sync_fn is not None
+        self._ctx = Context()
+        self._most_recent_ctx_id = self._ctx.id
+
+        self._ctx.on_invalidate(self._on_invalidate_cb)
+
+        self._exec_count += 1
+        self._invalidated = False
+
+        was_running = self._running
+        self._running = True
+
+        from ..session import session_context
+
+        with session_context(self._session):
+            try:
+                with self._ctx():
+                    self._error.clear()
+                    try:
+                        self._value.append(self._sync_fn())
+                    except Exception as err:
+                        self._error.append(err)
+            finally:
+                self._running = was_running
+
     # TODO: should this be private?
     async def get_value(self) -> T:
         if self._destroyed:
             raise DestroyedReactiveError(
                 f"Reactive calc '{self._otel_label}' has been destroyed."
             )
-        self._dependents.register()
+        ctx = self._dependents.register()
+
+        if (
+            self._update_done is not None
+            and self._update_task is not asyncio.current_task()
+        ):
+            await self._update_done.wait()
 
         if self._invalidated or self._running:
             await self.update_value()
@@ -776,6 +949,8 @@ class Calc_(Generic[T]):
         if self._error:
             raise self._error[0]
 
+        if ctx._recorder is not None:
+            ctx._recorder.record(self.get_value, self._value[0])
         return self._value[0]
 
     # TODO: should this be private?
@@ -791,21 +966,25 @@ class Calc_(Generic[T]):
         was_running = self._running
         self._running = True
 
+        owns_update = self._is_async and self._update_done is None
+        if owns_update:
+            self._update_task = asyncio.current_task()
+            self._update_done = asyncio.Event()
+
         from ..session import session_context
 
         with session_context(self._session):
-            async with shiny_otel_span(
-                self._otel_label,
-                attributes=self._otel_attrs,
-                infer_session_id=False,
-                required_level=OtelCollectLevel.REACTIVITY,
-                collection_level=self._otel_level,
-            ):
+            async with self._otel_span():
                 try:
                     with self._ctx():
                         await self._run_func()
                 finally:
                     self._running = was_running
+                    if owns_update:
+                        assert self._update_done is not None
+                        self._update_done.set()
+                        self._update_task = None
+                        self._update_done = None
 
     def _on_invalidate_cb(self) -> None:
         self._invalidated = True
@@ -822,9 +1001,18 @@ class Calc_(Generic[T]):
         except Exception as err:
             self._error.append(err)
 
-    def _extract_otel_attrs(self, fn: Callable[..., Any]) -> SourceRefAttrs:
-        """Extract OpenTelemetry attributes from the reactive function."""
-        return extract_source_ref(fn)
+    @property
+    def _otel_label(self) -> str:
+        return self._otel_span_info.label
+
+    @property
+    def _otel_attrs(self) -> dict[str, Any]:
+        return self._otel_span_info.attrs
+
+    def _otel_span(self) -> AbstractAsyncContextManager[object]:
+        return self._otel_span_info.span(
+            OtelCollectLevel.REACTIVITY, collection_level=self._otel_level
+        )
 
 
 class CalcAsync_(Calc_[T]):
@@ -837,6 +1025,9 @@ class CalcAsync_(Calc_[T]):
     (instead, use the :func:`~shiny.reactive.calc` decorator).
     """
 
+    __slots__ = ()
+    __doc__ = _InstanceDoc(__doc__)  # pyright: ignore[reportAssignmentType]
+
     def __init__(
         self,
         fn: CalcFunctionAsync[T],
@@ -963,6 +1154,27 @@ class Effect_:
     (instead, use the :func:`Effect` decorator).
     """
 
+    __slots__ = (
+        "__name__",
+        "_doc",
+        "_fn",
+        "_is_async",
+        "_sync_fn",
+        "_priority",
+        "_suspended",
+        "_on_resume",
+        "_invalidate_callbacks",
+        "_destroyed",
+        "_ctx",
+        "_exec_count",
+        "_session",
+        "_domain",
+        "_otel_span_info",
+        "_otel_level",
+        "__weakref__",
+    )
+    __doc__ = _InstanceDoc(__doc__)  # pyright: ignore[reportAssignmentType]
+
     def __init__(
         self,
         fn: EffectFunction | EffectFunctionAsync,
@@ -972,7 +1184,7 @@ class Effect_:
         session: "MISSING_TYPE | Session | None" = MISSING,
     ) -> None:
         self.__name__ = fn.__name__
-        self.__doc__ = fn.__doc__
+        self._doc: str | None = fn.__doc__
 
         from ..render.renderer import Renderer
         from ..session import Session
@@ -991,12 +1203,16 @@ class Effect_:
         self._fn: EffectFunctionAsync = _utils.wrap_async(fn)
         # This indicates whether the user's effect function (before wrapping) is async.
         self._is_async: bool = _utils.is_async_callable(fn)
+        self._sync_fn: Optional[EffectFunction] = (
+            None if self._is_async else cast(EffectFunction, fn)
+        )
 
         self._priority: int = priority
         self._suspended = suspended
-        self._on_resume: Callable[[], None] = lambda: None
+        self._on_resume: Callable[[], None] = _noop
 
-        self._invalidate_callbacks: list[Callable[[], None]] = []
+        # Allocated by the first `on_invalidate()`, which most effects never call
+        self._invalidate_callbacks: Optional[list[Callable[[], None]]] = None
         self._destroyed: bool = False
         self._ctx: Optional[Context] = None
         self._exec_count: int = 0
@@ -1018,6 +1234,7 @@ class Effect_:
             return
 
         self._session = session
+        self._domain = session_domain(self._session)
 
         if self._session is not None:
             # TODO-future: Investigate using a weak reference for on_ended too.
@@ -1025,19 +1242,12 @@ class Effect_:
             # where effects are guaranteed to be destroyed at session end. That
             # `on_ended` registration is also what destroys effects on session
             # close, since the `on_destroy` one no-ops there.
-            self._session.on_ended(self.destroy)
-            self._session.on_destroy(
-                _weak_destroy_callback(self.destroy, self._session)
-            )
-
-        # Extract OpenTelemetry attributes at initialization time
-        self._otel_attrs: dict[str, Any] = {
-            **get_session_id_attrs(self._session),
-            **self._extract_otel_attrs(fn),
-        }
+            self._session.on_ended(self._destroy_on_ended)
+            self._session.on_destroy(_weak_destroy_callback(self, self._session))
 
-        # Extract modifier from function attribute and generate label
-        self._otel_label: str = create_otel_span_name(
+        # The span name and attributes (including the modifier from the function's
+        # attributes) are only computed when they're first needed
+        self._otel_span_info = OtelSpanInfo(
             fn,
             "reactive.effect",
             session=self._session,
@@ -1051,7 +1261,7 @@ class Effect_:
         self._create_context().invalidate()
 
     def _create_context(self) -> Context:
-        ctx = Context()
+        ctx = Context(self._domain)
 
         # Store the context explicitly in Effect object
         # TODO: More explanation here
@@ -1062,8 +1272,9 @@ class Effect_:
             # anymore.
             self._ctx = None
 
-            for cb in self._invalidate_callbacks:
-                cb()
+            if self._invalidate_callbacks is not None:
+                for cb in self._invalidate_callbacks:
+                    cb()
 
             if self._destroyed:
                 return
@@ -1096,16 +1307,14 @@ class Effect_:
         from ..session import session_context
 
         with session_context(self._session):
-            async with shiny_otel_span(
-                self._otel_label,
-                attributes=self._otel_attrs,
-                infer_session_id=False,
-                required_level=OtelCollectLevel.REACTIVITY,
-                collection_level=self._otel_level,
-            ):
+            async with self._otel_span():
                 try:
                     with ctx():
-                        await self._fn()
+                        if self._sync_fn is not None:
+                            # Sync effects don't need a coroutine
+                            self._sync_fn()
+                        else:
+                            await self._fn()
 
                         # Yield so that messages can be sent to the client if necessary.
                         # https://github.com/posit-dev/py-shiny/issues/1381
@@ -1147,7 +1356,10 @@ class Effect_:
         callback
             A callback that will be called when this reactive effect is invalidated.
         """
-        self._invalidate_callbacks.append(callback)
+        if self._invalidate_callbacks is None:
+            self._invalidate_callbacks = [callback]
+        else:
+            self._invalidate_callbacks.append(callback)
 
     def destroy(self) -> None:
         """
@@ -1167,6 +1379,10 @@ class Effect_:
         if self._ctx is not None:
             self._ctx.invalidate()
 
+    async def _destroy_on_ended(self) -> None:
+        # Async, so that `on_ended()` doesn't need to wrap `destroy()` in a function
+        self.destroy()
+
     def suspend(self) -> None:
         """
         Suspend the effect.
@@ -1189,7 +1405,7 @@ class Effect_:
         if self._suspended:
             self._suspended = False
             self._on_resume()
-            self._on_resume = lambda: None
+            self._on_resume = _noop
 
     def set_priority(self, priority: int = 0) -> None:
         """
@@ -1210,9 +1426,18 @@ class Effect_:
         """
         self._priority = priority
 
-    def _extract_otel_attrs(self, fn: Callable[..., Any]) -> SourceRefAttrs:
-        """Extract OpenTelemetry attributes from the reactive function."""
-        return extract_source_ref(fn)
+    @property
+    def _otel_label(self) -> str:
+        return self._otel_span_info.label
+
+    @property
+    def _otel_attrs(self) -> dict[str, Any]:
+        return self._otel_span_info.attrs
+
+    def _otel_span(self) -> AbstractAsyncContextManager[object]:
+        return self._otel_span_info.span(
+            OtelCollectLevel.REACTIVITY, collection_level=self._otel_level
+        )
 
 
 @overload
@@ -6,11 +6,15 @@ This module contains helper functions used by reactive classes.
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 __all__ = ("is_user_code_frame",)
 
 
+# Cached, since it is called for each frame when walking the stack (e.g., whenever a
+# reactive.Value is created)
+@functools.lru_cache(maxsize=1024)
 def is_user_code_frame(filename: str) -> bool:
     """
     Check if a filename represents user code (not internal shiny package code).
@@ -23,6 +23,9 @@ from ._deprecated import (  # noqa: F401
 from ._express import (
     express,
 )
+from ._plot_cache import (
+    PlotCache,
+)
 from ._render import (
     code,
     download,
@@ -42,6 +45,7 @@ __all__ = (
     "text",
     "code",
     "plot",
+    "PlotCache",
     "image",
     "table",
     "ui",
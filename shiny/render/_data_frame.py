@@ -312,6 +312,26 @@ class data_frame(
     and column indices.
 
     The key is defined as `(row_index, column_index)`.
+
+    The dictionary is updated in place; use `._reset_cell_patches()` to start over.
+    """
+
+    _cell_patch_delta: dict[tuple[int, int], CellPatch]
+    """
+    The patches set since `._nw_data_patched()` last ran, keyed like `._cell_patch_map`.
+    """
+
+    _patched_cache: (
+        tuple[
+            DataFrame[IntoDataFrameT],
+            dict[tuple[int, int], CellPatch],
+            DataFrame[IntoDataFrameT],
+        ]
+        | None
+    )
+    """
+    The most recently patched data: the data and the cell patch map it was computed
+    from, and the patched data.
     """
 
     @reactive_calc_method
@@ -336,12 +356,29 @@ class data_frame(
         """
         Reactive calculation of the data frame's patched data.
 
+        Each edit only changes a few cells, so the new patches are applied to the
+        previously patched data, when it was patched from the same data. Only the
+        patched columns are copied.
+
         Returns
         -------
         :
             The data frame with all the user's edit patches applied to it.
         """
-        return apply_frame_patches(self._nw_data(), self.cell_patches())
+        nw_data = self._nw_data()
+        cell_patch_map = self._cell_patch_map()
+
+        cache = self._patched_cache
+        if cache is not None and cache[0] is nw_data and cache[1] is cell_patch_map:
+            patched = apply_frame_patches(
+                cache[2], list(self._cell_patch_delta.values())
+            )
+        else:
+            patched = apply_frame_patches(nw_data, self.cell_patches())
+
+        self._cell_patch_delta.clear()
+        self._patched_cache = (nw_data, cell_patch_map, patched)
+        return patched
 
     @reactive_calc_method
     def data_patched(self) -> IntoDataFrameT:
@@ -560,9 +597,14 @@ class data_frame(
         column_filter = self._get_session().input[f"{self.output_id}_column_filter"]()
         return tuple(column_filter)
 
+    def _reset_cell_patches(self) -> None:
+        self._cell_patch_map.set({})
+        self._cell_patch_delta = {}
+        self._patched_cache = None
+
     def _reset_reactives(self) -> None:
         self._value.set(None)
-        self._cell_patch_map.set({})
+        self._reset_cell_patches()
         self._updated_data.unset()
 
     def _init_reactives(self) -> None:
@@ -571,6 +613,8 @@ class data_frame(
             # Init
             self._value = reactive.Value(None)
             self._cell_patch_map = reactive.Value({})
+            self._cell_patch_delta = {}
+            self._patched_cache = None
             self._updated_data = reactive.Value()  # Create with no value
 
             # Update the styles any time the cell patch map or new data updates
@@ -774,8 +818,10 @@ class data_frame(
         :
             A list of processed (by the session) patches to apply to the data frame.
         """
-        # Use copy to set the new value
-        cell_patch_map = self._cell_patch_map().copy()
+        # Update the map in place rather than copying it for every edit. The new
+        # patches are also recorded in the delta for `._nw_data_patched()`
+        cell_patch_map = self._cell_patch_map()
+        cell_patch_delta = self._cell_patch_delta
 
         for patch in patches:
             row_index = patch["row_index"]
@@ -793,9 +839,10 @@ class data_frame(
             # TODO-render.data_frame; See https://pandas.pydata.org/pandas-docs/stable/user_guide/basics.html#object-conversion
 
             cell_patch_map[(row_index, column_index)] = patch
+            cell_patch_delta[(row_index, column_index)] = patch
 
-        # Once all patches are set, update the cell patch map with new version
-        self._cell_patch_map.set(cell_patch_map)
+        # Once all patches are set, invalidate the (same) cell patch map
+        self._cell_patch_map._set(cell_patch_map, force=True)
 
         # Upgrade any HTML-like content to `CellHtml` json objects
         # for sending to the client
@@ -934,7 +981,7 @@ class data_frame(
         # Reset patches & set new data
         # Perform only after serializing the frame
         # (which performs sanity checks. E.g. `data is not None`
-        self._cell_patch_map.set({})
+        self._reset_cell_patches()
         self._updated_data.set(data)
 
         await self._send_message_to_browser(
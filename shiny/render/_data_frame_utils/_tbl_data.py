@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any, List, SupportsIndex, TypedDict, cast
 import narwhals.stable.v1 as nw
 import orjson
 
+from ..._json import RawJSON
 from ..._typing_extensions import TypeIs
 from ...session import Session, require_active_session
 from ...types import Jsonifiable, JsonifiableDict, ListOrTuple
@@ -34,6 +35,7 @@ __all__ = (
     "apply_frame_patches",
     "serialize_dtype",
     "serialize_frame",
+    "serialize_frame_data",
     "subset_frame",
 )
 
@@ -136,11 +138,6 @@ def apply_frame_patches(
 
     # Apply the patches
 
-    # Copy the data to make sure the original data is not modified in place.
-    # If https://github.com/narwhals-dev/narwhals/issues/1154 is resolved, this
-    # should be able to be removed.
-    nw_data = nw_data.clone()
-
     # # https://discord.com/channels/1235257048170762310/1235257049626181656/1283415086722977895
     # # Using narwhals >= v1.7.0
     # @nw.narwhalify
@@ -177,10 +174,15 @@ def apply_frame_patches(
     # Upgrade the Scatter info to new column Series objects.
     # `nw_data[:, i]` selects positionally; the resulting Series keeps the column's
     # name, which is what `with_columns()` below matches on.
+    #
+    # Only the patched columns are copied (so the original data is not modified in
+    # place, https://github.com/narwhals-dev/narwhals/issues/1154). The new frame
+    # shares all other columns with `nw_data`.
     scatter_columns = [
-        nw_data[:, column_index].scatter(
-            scatter_values["row_indexes"], scatter_values["values"]
-        )
+        nw_data[:, column_index]
+        .to_frame()
+        .clone()[:, 0]
+        .scatter(scatter_values["row_indexes"], scatter_values["values"])
         for column_index, scatter_values in cell_patches_by_column.items()
     ]
     # Apply patches to the nw data
@@ -250,18 +252,27 @@ def serialize_frame(into_data: IntoDataFrame) -> FrameJson:
         serialize_dtype(data.get_column(col_name)) for col_name in data.columns
     ]
 
-    # TODO-future-barret; Swich serialization to "by column", rather than "by row"
-    # * This would allow for a single column to be serialized in a single operation
-    #   * This would allow for each column to capture the `"html"` type hint properly
-    #     for object and unknown columns. Currently, there is no way to determine which
-    #     cells are HTML-like during orjson serialization.
-    # * Even better, would be to move `orjson` serialization to the websocket
-    #   serialization.
-    #   * No need to serialize to JSON, then unserialize, then serialize again when
-    #     sending it to the client!
-    #   * The only serialization would occur during "send to browser"
-    #   * This approach would lose the ability to upgrade the column type hints to "html"
-    data_rows = data.rows(named=False)
+    data_val, html_deps = serialize_frame_data(data)
+
+    return {
+        "columns": data.columns,
+        "data": data_val,
+        "typeHints": type_hints,
+        "htmlDeps": html_deps,
+    }
+
+
+def serialize_frame_data(
+    data: DataFrame[Any],
+) -> tuple[RawJSON, list[RenderedDependency]]:
+    """
+    Serialize the rows of a data frame, returning the pre-encoded data (an array of
+    rows, each an array of `len(columns)` values) and the (deduplicated) HTML
+    dependencies of any HTML cells.
+
+    The values are converted one column at a time, and then zipped into rows, rather
+    than building each row from the data frame's (slow, for pandas) row iterator.
+    """
 
     session: Session | None = None
     html_deps: list[RenderedDependency] = []
@@ -288,24 +299,22 @@ def serialize_frame(into_data: IntoDataFrame) -> FrameJson:
         # All other values are serialized as strings
         return str(val)
 
-    data_val = orjson.loads(
-        orjson.dumps(
-            data_rows,
-            default=default_orjson_serializer,
-            # option=(orjson.OPT_NAIVE_UTC),
+    if data.implementation.is_polars():
+        # Polars builds the row tuples natively
+        data_rows = data.rows(named=False)
+    else:
+        data_rows = list(
+            zip(*(data.get_column(col_name).to_list() for col_name in data.columns))
         )
-    )
+    # The data is sent to the browser as pre-encoded JSON, which the session's JSON
+    # codec splices into the outgoing message without decoding it again
+    data_val = RawJSON(orjson.dumps(data_rows, default=default_orjson_serializer))
 
     deduped_html_deps = (
         _resolve_processed_dependencies(html_deps) if len(html_deps) > 1 else html_deps
     )
 
-    return {
-        "columns": data.columns,
-        "data": data_val,
-        "typeHints": type_hints,
-        "htmlDeps": deduped_html_deps,
-    }
+    return data_val, deduped_html_deps
 
 
 # as_col_indexes -----------------------------------------------------------------------
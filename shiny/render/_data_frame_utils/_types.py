@@ -21,6 +21,7 @@ from narwhals.stable.v1.typing import IntoDataFrame as IntoDataFrame
 from narwhals.stable.v1.typing import IntoDataFrameT as IntoDataFrameT
 from narwhals.stable.v1.typing import IntoExpr as IntoExpr
 
+from ..._json import RawJSON
 from ..._typing_extensions import Annotated, NotRequired, Required, TypedDict
 from ...types import Jsonifiable, JsonifiableDict, ListOrTuple
 
@@ -159,7 +160,7 @@ class FrameJsonOptions(TypedDict):
 class FrameJson(TypedDict):
     columns: Required[list[str]]  # column names
     # index: Required[list[Any]]  # pandas index values
-    data: Required[list[list[Jsonifiable]]]  # each entry is a row of len(columns)
+    data: Required[RawJSON]  # pre-encoded; each entry is a row of len(columns)
     typeHints: Required[
         list[FrameDtype]
     ]  # each entry is a hint for the type of the column
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+__all__ = ("PlotCache",)
+
+from collections import OrderedDict
+from typing import Hashable, Optional, cast
+
+from ..types import ImgData
+from ._try_render_plot import PlotSizeInfo, _ContainerSize
+
+
+class PlotCache:
+    """
+    A bounded cache of the images rendered by :class:`~shiny.render.plot`.
+
+    Pass ``cache=True`` to :class:`~shiny.render.plot` to give a plot its own cache, or
+    pass a `PlotCache` object to share a cache among plots, and (when it's created
+    outside of the server function) among sessions.
+
+    Images are keyed on the output's id, the values of the reactive inputs, values, and
+    calcs that the plot function read, and the size and pixel ratio of the plot. If the
+    plot function reads the same values as before (for example, when the browser window
+    is resized back to a size it has already been drawn at), the cached image is sent
+    without calling the plot function or saving the plot again. Values are compared by
+    equality if they're hashable, and otherwise by identity (so a data frame returned by
+    a calc only matches itself). For this to be correct, the plot should depend only on
+    the reactive values it reads; plots that take other reactive dependencies (like
+    :func:`~shiny.reactive.invalidate_later`) aren't cached.
+
+    When the cache holds `max_size` images, the least recently used image is evicted.
+    The cache keeps a reference to the values in its keys.
+
+    Parameters
+    ----------
+    max_size
+        The maximum number of images to keep.
+
+    Attributes
+    ----------
+    hits
+        The number of renders that were served from the cache.
+    misses
+        The number of renders that had to draw the plot.
+    """
+
+    def __init__(self, max_size: int = 100) -> None:
+        if max_size < 1:
+            raise ValueError("`max_size` must be at least 1.")
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._images: OrderedDict[Hashable, ImgData] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def __repr__(self) -> str:
+        return (
+            f"<PlotCache size={len(self)}/{self.max_size} "
+            f"hits={self.hits} misses={self.misses}>"
+        )
+
+    def get(self, key: Hashable) -> Optional[ImgData]:
+        img = self._images.get(key)
+        if img is not None:
+            self._images.move_to_end(key)
+        return img
+
+    def set(self, key: Hashable, img: ImgData) -> None:
+        self._images[key] = img
+        self._images.move_to_end(key)
+        while len(self._images) > self.max_size:
+            self._images.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all images from the cache, and reset the counters."""
+        self._images.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def plot_cache_key(
+    output_name: str,
+    values: tuple[object, ...],
+    plot_size_info: PlotSizeInfo,
+    alt: Optional[str],
+    kwargs: dict[str, object],
+) -> Hashable:
+    """
+    The key for a plot. `plot_size_info` must be resolved (see
+    :meth:`PlotSizeInfo.resolved`).
+    """
+    return (
+        output_name,
+        tuple(_cache_token(value) for value in values),
+        plot_size_info.user_specified_size_px,
+        tuple(
+            cast(_ContainerSize, fn).size_px
+            for fn in plot_size_info._container_size_px_fn
+        ),
+        plot_size_info.pixelratio,
+        alt,
+        tuple((name, _cache_token(value)) for name, value in sorted(kwargs.items())),
+    )
+
+
+def _cache_token(value: object) -> Hashable:
+    # The type is included so that, for example, `True` and `1` don't match
+    try:
+        hash(value)
+    except TypeError:
+        return _Identity(value)
+    return (type(value), value)
+
+
+class _Identity:
+    """Compares (and hashes) by the identity of an unhashable value."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: object) -> None:
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Identity) and other.value is self.value
+
+    def __hash__(self) -> int:
+        return id(self.value)
@@ -2,9 +2,17 @@ from __future__ import annotations
 
 import base64
 import os
-import sys
 import typing
-from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Hashable,
+    Literal,
+    Optional,
+    Union,
+    cast,
+)
 
 from htmltools import Tag, TagAttrValue, TagChild
 
@@ -20,14 +28,18 @@ from .. import ui as _ui
 from .._docstring import add_example
 from .._typing_extensions import Self
 from ..module import ResolvedId
+from ..reactive._core import DependencyRecorder, get_current_context
 from ..session import require_active_session
 from ..session._session import DownloadHandler, DownloadInfo
 from ..types import MISSING, MISSING_TYPE, ImgData
+from ._plot_cache import PlotCache, plot_cache_key
 from ._try_render_plot import (
+    PlotExecutor,
     PlotSizeInfo,
-    try_render_matplotlib,
-    try_render_pil,
-    try_render_plotnine,
+    discard_plot,
+    render_plot_in_executor,
+    resolve_plot_executor,
+    try_render_plot,
 )
 from .renderer import Jsonifiable, Renderer, ValueFn
 from .renderer._utils import (
@@ -85,6 +97,8 @@ class text(Renderer[str]):
     * :func:`~shiny.ui.output_text`
     """
 
+    _cache_across_sessions = True
+
     def auto_output_ui(
         self,
         *,
@@ -146,6 +160,8 @@ class code(Renderer[str]):
     * :func:`~shiny.ui.output_code`
     """
 
+    _cache_across_sessions = True
+
     def auto_output_ui(
         self,
         *,
@@ -199,6 +215,22 @@ class plot(Renderer[object]):
         determined by the size of the corresponding :func:`~shiny.ui.output_plot`. (You
         should not need to use this argument in most Shiny apps--set the desired height
         on :func:`~shiny.ui.output_plot` instead.)
+    executor
+        Where to rasterize the plot. With ``"inline"``, the plot is saved to PNG on the
+        event loop, which blocks every session in the process while it runs. With
+        ``"thread"`` or ``"process"``, it is saved in a (process-wide) pool of threads or
+        processes while the event loop carries on; a
+        :class:`concurrent.futures.Executor` may also be given. The plot function itself
+        always runs on the event loop. Plots passed to a ``"process"`` pool must be
+        picklable, and plotnine plots (which are drawn with pyplot) are only offloaded
+        to processes. If ``MISSING`` (the default), :attr:`~shiny.App.plot_executor` is
+        used.
+    cache
+        Whether to cache the rendered images, so that a plot which reads the same
+        reactive values at the same size as before isn't drawn again. ``True`` gives
+        this plot its own :class:`~shiny.render.PlotCache`; a :class:`PlotCache` object
+        may also be given, to share it with other plots or sessions. See
+        :class:`~shiny.render.PlotCache` for how images are matched.
     **kwargs
         Additional keyword arguments passed to the relevant method for saving the image
         (e.g., for matplotlib, arguments to ``savefig()``; for PIL and plotnine,
@@ -234,6 +266,8 @@ class plot(Renderer[object]):
     * :class:`~shiny.render.image`
     """
 
+    _cache_across_sessions = True
+
     def auto_output_ui(
         self,
         *,
@@ -258,13 +292,37 @@ class plot(Renderer[object]):
         alt: Optional[str] = None,
         width: float | None | MISSING_TYPE = MISSING,
         height: float | None | MISSING_TYPE = MISSING,
+        executor: PlotExecutor | MISSING_TYPE = MISSING,
+        cache: bool | PlotCache = False,
         **kwargs: object,
     ) -> None:
         super().__init__(_fn)
         self.alt = alt
         self.width = width
         self.height = height
+        self.executor: PlotExecutor | MISSING_TYPE = executor
+        self.cache: PlotCache | None = (
+            cache if isinstance(cache, PlotCache) else PlotCache() if cache else None
+        )
         self.kwargs = kwargs
+        # The reactive reads made by the last call to the plot function (if cached)
+        self._cache_reads: DependencyRecorder | None = None
+
+    def _cache_key(self) -> object:
+        session = require_active_session(None)
+        output_name = session.ns(self.output_id)
+        inputs = session.root_scope().input
+        return (
+            inputs[ResolvedId(".clientdata_pixelratio")](),
+            tuple(
+                (
+                    inputs[ResolvedId(f".clientdata_output_{output_name}_{dim}")]()
+                    if size is MISSING or size is None
+                    else size
+                )
+                for dim, size in (("width", self.width), ("height", self.height))
+            ),
+        )
 
     async def render(self) -> dict[str, Jsonifiable] | Jsonifiable | None:
         is_userfn_async = self.fn.is_async()
@@ -310,61 +368,78 @@ class plot(Renderer[object]):
             pixelratio=pixelratio,
         )
 
-        # Call the user function to get the plot object.
-        x = await self.fn()
+        cache_key: Hashable = None
+        if self.cache is not None:
+            # The size is part of the key, so it's read up front
+            plot_size_info = plot_size_info.resolved()
 
-        # Note that x might be None; it could be a matplotlib.pyplot
-
-        # Try each type of renderer in turn. The reason we do it this way is to avoid
-        # importing modules that aren't already loaded. That could slow things down, or
-        # worse, cause an error if the module isn't installed.
-        #
-        # Each try_render function should indicate whether it was able to make sense of
-        # the x value (or, in the case of matplotlib, possibly it decided to use the
-        # global pyplot figure) by returning a tuple that starts with True. The second
-        # tuple element may be None in this case, which means the try_render function
-        # explicitly wants the plot to be blanked.
-        #
-        # If a try_render function returns a tuple that starts with False, then the next
-        # try_render function should be tried. If none succeed, an error is raised.
-        ok: bool
-        result: ImgData | None
+            # If the plot function would read the same values as last time, and that
+            # image is still cached, there's no need to call it
+            if self._cache_reads is not None:
+                try:
+                    values = await self._cache_reads.replay()
+                except Exception:
+                    values = None
+                if values is not None:
+                    img = self.cache.get(
+                        plot_cache_key(output_name, values, plot_size_info, alt, kwargs)
+                    )
+                    if img is not None:
+                        self.cache.hits += 1
+                        return imgdata_to_jsonifiable(img)
+
+            with get_current_context().record_dependencies() as reads:
+                x = await self.fn()
+
+            self._cache_reads = reads if reads.complete else None
+            if self._cache_reads is not None:
+                cache_key = plot_cache_key(
+                    output_name, reads.values, plot_size_info, alt, kwargs
+                )
+                img = self.cache.get(cache_key)
+                if img is not None:
+                    # Another session (or an earlier run) drew this plot
+                    discard_plot(x, allow_global=not is_userfn_async)
+                    self.cache.hits += 1
+                    return imgdata_to_jsonifiable(img)
+            self.cache.misses += 1
+        else:
+            # Call the user function to get the plot object.
+            x = await self.fn()
 
-        def cast_result(result: ImgData | None) -> dict[str, Jsonifiable] | None:
-            if result is None:
-                return None
-            return imgdata_to_jsonifiable(result)
+        # Note that x might be None; it could be a matplotlib.pyplot
 
-        if "plotnine" in sys.modules:
-            ok, result = try_render_plotnine(
-                x,
-                plot_size_info=plot_size_info,
-                alt=alt,
-                **kwargs,
-            )
-            if ok:
-                return cast_result(result)
+        # Rasterize the plot, either inline or in the executor. If none of the
+        # renderers can make sense of the x value, an error is raised below.
+        executor = resolve_plot_executor(
+            session.app.plot_executor
+            if isinstance(self.executor, MISSING_TYPE)
+            else self.executor
+        )
 
-        if "matplotlib" in sys.modules:
-            ok, result = try_render_matplotlib(
+        if executor is None:
+            ok, result = try_render_plot(
                 x,
                 plot_size_info=plot_size_info,
                 allow_global=not is_userfn_async,
                 alt=alt,
                 **kwargs,
             )
-            if ok:
-                return cast_result(result)
-
-        if "PIL" in sys.modules:
-            ok, result = try_render_pil(
+        else:
+            ok, result = await render_plot_in_executor(
                 x,
+                executor,
                 plot_size_info=plot_size_info,
+                allow_global=not is_userfn_async,
                 alt=alt,
                 **kwargs,
             )
-            if ok:
-                return cast_result(result)
+        if ok:
+            if result is None:
+                return None
+            if self.cache is not None and cache_key is not None:
+                self.cache.set(cache_key, result)
+            return imgdata_to_jsonifiable(result)
 
         # This check must happen last because
         # matplotlib might be able to plot even if x is `None`
@@ -409,6 +484,8 @@ class image(Renderer[ImgData]):
     * :class:`~shiny.render.plot`
     """
 
+    _cache_across_sessions = True
+
     def auto_output_ui(self, **kwargs: object):
         return _ui.output_image(
             self.output_id,
@@ -493,6 +570,8 @@ class table(Renderer[IntoDataFrame]):
     * :func:`~shiny.ui.output_table` for the corresponding UI component to this render function.
     """
 
+    _cache_across_sessions = True
+
     def auto_output_ui(self, **kwargs: TagAttrValue) -> Tag:
         return _ui.output_table(self.output_id, **kwargs)
         # TODO: Deal with kwargs
@@ -719,6 +798,10 @@ class download_button(_DownloadBase):
     return a filename (str) to send an existing file, or ``yield`` one or more strings
     or bytestrings for a generated file (in which case pass a ``filename`` argument).
 
+    Existing files are served with support for HTTP range requests, so that browsers can
+    resume an interrupted download. To do the same for a generated file, return a
+    :class:`~shiny.types.SeekableContent` that can read any part of it.
+
     Parameters
     ----------
     filename
@@ -756,6 +839,7 @@ class download_button(_DownloadBase):
     --------
     * :class:`~shiny.render.download_link`
     * :func:`~shiny.ui.download_button`
+    * :class:`~shiny.types.SeekableContent`
     """
 
     def auto_output_ui(
@@ -1,15 +1,37 @@
 from __future__ import annotations
 
+import asyncio
 import base64
+import functools
 import io
+import multiprocessing
+import sys
 import warnings
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, Union, cast
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 from ..types import ImgData, PlotnineFigure
 from ._coordmap import get_coordmap, get_coordmap_plotnine
 
 TryPlotResult = Tuple[bool, Union[ImgData, None]]
 
+PlotExecutor = Union[Literal["inline", "thread", "process"], Executor]
+"""
+Where `@render.plot` rasterizes plots: `"inline"` on the event loop, `"thread"` or
+`"process"` in a pool shared by the whole Python process, or in the given
+:class:`concurrent.futures.Executor`.
+"""
+
 
 if TYPE_CHECKING:
     from matplotlib.figure import Figure
@@ -45,6 +67,33 @@ class PlotSizeInfo:
         self.user_specified_size_px = user_specified_size_px
         self.pixelratio = pixelratio
 
+    def resolved(self, *, container_size: bool = True) -> PlotSizeInfo:
+        """
+        Return a copy that holds the container size rather than the functions that read
+        it. Reading the container size takes a reactive dependency, so this must be
+        called from the session's event loop; the copy can then be used from any thread
+        (or pickled for another process).
+
+        Parameters
+        ----------
+        container_size
+            Whether to read the container size (for the dimensions the user didn't
+            specify). If `False`, the copy raises an error if the size is needed.
+        """
+        width, height = (
+            (
+                self._container_size_px_fn[i]()
+                if container_size and self.user_specified_size_px[i] is None
+                else None
+            )
+            for i in (0, 1)
+        )
+        return PlotSizeInfo(
+            container_size_px_fn=(_ContainerSize(width), _ContainerSize(height)),
+            user_specified_size_px=self.user_specified_size_px,
+            pixelratio=self.pixelratio,
+        )
+
     def get_img_size_px(
         self,
         fig_initial_size_inches: tuple[float, float],
@@ -120,6 +169,17 @@ class PlotSizeInfo:
         return container_size_px, "100%"
 
 
+class _ContainerSize:
+    # A picklable stand-in for a function that reads the container size
+    def __init__(self, size_px: float | None):
+        self.size_px = size_px
+
+    def __call__(self) -> float:
+        if self.size_px is None:
+            raise RuntimeError("The container size of the plot was not resolved.")
+        return self.size_px
+
+
 # Try to render a matplotlib object (or the global figure, if it's been used). If `fig`
 # is not a matplotlib object, return (False, None). If there's an error in rendering,
 # return None. If successful in rendering, return an ImgData object.
@@ -137,98 +197,114 @@ def try_render_matplotlib(
         return (False, None)
 
     try:
-        import matplotlib
-        import matplotlib.pyplot as plt  # pyright: ignore[reportUnusedImport] # noqa: F401
+        return (
+            True,
+            render_matplotlib_figure(
+                fig, plot_size_info=plot_size_info, alt=alt, **kwargs
+            ),
+        )
 
-        pixelratio = plot_size_info.pixelratio
+    finally:
+        import matplotlib.pyplot
 
-        fig_initial_size_inches = cast_to_size_tuple(plt.rcParams["figure.figsize"])
+        matplotlib.pyplot.close(fig)  # pyright: ignore[reportUnknownMemberType]
 
-        fig_result_size_inches = cast_to_size_tuple(
-            fig.get_size_inches(),  # pyright: ignore[reportUnknownMemberType]
-        )
 
-        ppi_out = get_desired_dpi_from_fig(fig)
+# Render a matplotlib figure to PNG. This doesn't use pyplot (or close the figure), so
+# it can run in a worker thread, given a figure that no other thread is using.
+def render_matplotlib_figure(
+    fig: Figure,
+    *,
+    plot_size_info: PlotSizeInfo,
+    alt: Optional[str],
+    **kwargs: object,
+) -> ImgData:
+    import matplotlib
 
-        width, height, width_attr, height_attr = plot_size_info.get_img_size_px(
-            fig_initial_size_inches, fig_result_size_inches, ppi_out
-        )
-        fig.set_size_inches(
-            width / ppi_out,
-            height / ppi_out,
-        )
-        fig.set_dpi(ppi_out * pixelratio)
-
-        # Calculating accurate coordinate mappings requires that the layout engine
-        # (if there is one) adjusts the figure's subplot parameters.
-        # e.g. "tight" layout.
-        # When there is no layout engine, "tight" layout is often helpful
-        layout_engine = None
-        # get_layout_engine was added in matplotlib 3.6
-        if hasattr(fig, "get_layout_engine"):
-            layout_engine = fig.get_layout_engine()
-            if layout_engine:
-                if not layout_engine.adjust_compatible:
-                    # In most cases, this branch will override the constained layout.
-                    # which is usually a very deliberate choice by the user
-                    fig.set_layout_engine(  # pyright: ignore[reportUnknownMemberType]
-                        layout="tight"
-                    )
-                    warnings.warn(
-                        f"'{type(layout_engine)}' layout engine is not compatible with shiny. "
-                        "The figure layout has been changed to tight.",
-                        stacklevel=1,
-                    )
-            else:
+    pixelratio = plot_size_info.pixelratio
+
+    fig_initial_size_inches = cast_to_size_tuple(matplotlib.rcParams["figure.figsize"])
+
+    fig_result_size_inches = cast_to_size_tuple(
+        fig.get_size_inches(),  # pyright: ignore[reportUnknownMemberType]
+    )
+
+    ppi_out = get_desired_dpi_from_fig(fig)
+
+    width, height, width_attr, height_attr = plot_size_info.get_img_size_px(
+        fig_initial_size_inches, fig_result_size_inches, ppi_out
+    )
+    fig.set_size_inches(
+        width / ppi_out,
+        height / ppi_out,
+    )
+    fig.set_dpi(ppi_out * pixelratio)
+
+    # Calculating accurate coordinate mappings requires that the layout engine
+    # (if there is one) adjusts the figure's subplot parameters.
+    # e.g. "tight" layout.
+    # When there is no layout engine, "tight" layout is often helpful
+    layout_engine = None
+    # get_layout_engine was added in matplotlib 3.6
+    if hasattr(fig, "get_layout_engine"):
+        layout_engine = fig.get_layout_engine()
+        if layout_engine:
+            if not layout_engine.adjust_compatible:
+                # In most cases, this branch will override the constained layout.
+                # which is usually a very deliberate choice by the user
                 fig.set_layout_engine(  # pyright: ignore[reportUnknownMemberType]
                     layout="tight"
                 )
-        else:
-            # This branch needed for matplotlib <3.6. Eventually we will be able to
-            # remove this code path.
-
-            # Suppress the message `UserWarning: The figure layout has changed to tight`
-            with warnings.catch_warnings():
-                warnings.filterwarnings(
-                    action="ignore",
-                    category=UserWarning,
-                    message="The figure layout has changed to tight",
+                warnings.warn(
+                    f"'{type(layout_engine)}' layout engine is not compatible with shiny. "
+                    "The figure layout has been changed to tight.",
+                    stacklevel=1,
                 )
-            plt.tight_layout()  # pyright: ignore[reportUnknownMemberType]
-
-        with io.BytesIO() as buf:
-            fig.savefig(  # pyright: ignore[reportUnknownMemberType]
-                buf,
-                format="png",
-                dpi=ppi_out * pixelratio,
-                **kwargs,  # pyright: ignore[reportArgumentType, reportGeneralTypeIssues]
+        else:
+            fig.set_layout_engine(  # pyright: ignore[reportUnknownMemberType]
+                layout="tight"
             )
-            buf.seek(0)
-            data = base64.b64encode(buf.read())
-            data_str = data.decode("utf-8")
-
-        # Calculating accurate coordinate mappings requires the figure to be
-        # drawn/saved first, which runs the layout engine.
-        coordmap = get_coordmap(fig)
+    else:
+        # This branch needed for matplotlib <3.6. Eventually we will be able to
+        # remove this code path.
+
+        # Suppress the message `UserWarning: The figure layout has changed to tight`
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                action="ignore",
+                category=UserWarning,
+                message="The figure layout has changed to tight",
+            )
+        fig.tight_layout()
 
-        res: ImgData = {
-            "src": "data:image/png;base64," + data_str,
-            "width": width_attr,
-            "height": height_attr,
-        }
+    with io.BytesIO() as buf:
+        fig.savefig(  # pyright: ignore[reportUnknownMemberType]
+            buf,
+            format="png",
+            dpi=ppi_out * pixelratio,
+            **kwargs,  # pyright: ignore[reportArgumentType, reportGeneralTypeIssues]
+        )
+        buf.seek(0)
+        data = base64.b64encode(buf.read())
+        data_str = data.decode("utf-8")
 
-        if alt is not None:
-            res["alt"] = alt
+    # Calculating accurate coordinate mappings requires the figure to be
+    # drawn/saved first, which runs the layout engine.
+    coordmap = get_coordmap(fig)
 
-        if coordmap is not None:
-            res["coordmap"] = coordmap
+    res: ImgData = {
+        "src": "data:image/png;base64," + data_str,
+        "width": width_attr,
+        "height": height_attr,
+    }
 
-        return (True, res)
+    if alt is not None:
+        res["alt"] = alt
 
-    finally:
-        import matplotlib.pyplot
+    if coordmap is not None:
+        res["coordmap"] = coordmap
 
-        matplotlib.pyplot.close(fig)  # pyright: ignore[reportUnknownMemberType]
+    return res
 
 
 def get_matplotlib_figure(
@@ -406,6 +482,203 @@ def try_render_plotnine(
     return (True, res)
 
 
+def try_render_plot(
+    x: object,
+    *,
+    plot_size_info: PlotSizeInfo,
+    allow_global: bool,
+    alt: Optional[str],
+    **kwargs: object,
+) -> TryPlotResult:
+    """
+    Try each type of renderer in turn.
+
+    The reason we do it this way is to avoid importing modules that aren't already
+    loaded. That could slow things down, or worse, cause an error if the module isn't
+    installed.
+
+    Each try_render function should indicate whether it was able to make sense of the x
+    value (or, in the case of matplotlib, possibly it decided to use the global pyplot
+    figure) by returning a tuple that starts with True. The second tuple element may be
+    None in this case, which means the try_render function explicitly wants the plot to
+    be blanked.
+
+    If a try_render function returns a tuple that starts with False, then the next
+    try_render function should be tried. If none succeed, `(False, None)` is returned.
+    """
+    if "plotnine" in sys.modules:
+        ok, result = try_render_plotnine(
+            x,
+            plot_size_info=plot_size_info,
+            alt=alt,
+            **kwargs,
+        )
+        if ok:
+            return (ok, result)
+
+    if "matplotlib" in sys.modules:
+        ok, result = try_render_matplotlib(
+            x,
+            plot_size_info=plot_size_info,
+            allow_global=allow_global,
+            alt=alt,
+            **kwargs,
+        )
+        if ok:
+            return (ok, result)
+
+    if "PIL" in sys.modules:
+        ok, result = try_render_pil(
+            x,
+            plot_size_info=plot_size_info,
+            alt=alt,
+            **kwargs,
+        )
+        if ok:
+            return (ok, result)
+
+    return (False, None)
+
+
+_plot_executors: dict[str, Executor] = {}
+
+
+def resolve_plot_executor(executor: PlotExecutor) -> Executor | None:
+    """
+    Return the executor to rasterize plots in, or `None` to rasterize them inline.
+
+    The `"thread"` and `"process"` pools are created on first use, and shared by every
+    app in the Python process.
+    """
+    if isinstance(executor, Executor):
+        return executor
+    if executor == "inline":
+        return None
+    if executor not in ("thread", "process"):
+        raise ValueError(
+            '`executor` must be "inline", "thread", "process", or a '
+            "`concurrent.futures.Executor` object."
+        )
+
+    if executor not in _plot_executors:
+        if executor == "thread":
+            _plot_executors[executor] = ThreadPoolExecutor(
+                thread_name_prefix="shiny-plot"
+            )
+        else:
+            # Forking a process that runs an event loop (and other threads) isn't safe
+            _plot_executors[executor] = ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context("spawn")
+            )
+    return _plot_executors[executor]
+
+
+async def render_plot_in_executor(
+    x: object,
+    executor: Executor,
+    *,
+    plot_size_info: PlotSizeInfo,
+    allow_global: bool,
+    alt: Optional[str],
+    **kwargs: object,
+) -> TryPlotResult:
+    """
+    Rasterize a plot object in `executor`, and await the result.
+
+    Everything that touches the session or pyplot happens here, on the event loop:
+    the container size is read (taking its reactive dependencies), and a matplotlib
+    figure is found and closed in pyplot. The worker is then the only user of the
+    figure. plotnine draws its figures with pyplot, so unless `executor` runs in
+    other processes, plotnine plots are rendered inline.
+    """
+    is_ggplot = False
+    if "plotnine" in sys.modules:
+        from plotnine.ggplot import ggplot
+
+        is_ggplot = isinstance(x, ggplot)
+
+    is_pil = False
+    if "PIL" in sys.modules:
+        import PIL.Image
+
+        is_pil = isinstance(x, PIL.Image.Image)
+
+    fig: Figure | None = None
+    if "matplotlib" in sys.modules and not is_ggplot and not is_pil:
+        fig = get_matplotlib_figure(x, allow_global)
+
+    if (is_ggplot and not isinstance(executor, ProcessPoolExecutor)) or not (
+        is_ggplot or is_pil or fig is not None
+    ):
+        # Render inline, which also handles the objects that can't be rendered
+        return try_render_plot(
+            x,
+            plot_size_info=plot_size_info,
+            allow_global=allow_global,
+            alt=alt,
+            **kwargs,
+        )
+
+    if fig is not None:
+        import matplotlib.pyplot
+
+        matplotlib.pyplot.close(fig)  # pyright: ignore[reportUnknownMemberType]
+        x = fig
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor,
+        functools.partial(
+            _try_render_detached_plot,
+            x,
+            plot_size_info=plot_size_info.resolved(container_size=not is_pil),
+            alt=alt,
+            **kwargs,
+        ),
+    )
+
+
+def _try_render_detached_plot(
+    x: object,
+    *,
+    plot_size_info: PlotSizeInfo,
+    alt: Optional[str],
+    **kwargs: object,
+) -> TryPlotResult:
+    # Runs in the executor, without touching pyplot: `x` is a figure that has been
+    # closed in pyplot, a PIL image, or (in another process) a plotnine plot
+    if "matplotlib" in sys.modules:
+        from matplotlib.figure import Figure
+
+        if isinstance(x, Figure):
+            return (
+                True,
+                render_matplotlib_figure(
+                    x, plot_size_info=plot_size_info, alt=alt, **kwargs
+                ),
+            )
+
+    return try_render_plot(
+        x,
+        plot_size_info=plot_size_info,
+        allow_global=False,
+        alt=alt,
+        **kwargs,
+    )
+
+
+def discard_plot(x: object, allow_global: bool) -> None:
+    """
+    Close the pyplot figure (if any) of a plot object that won't be rendered.
+    """
+    if "matplotlib" in sys.modules:
+        fig = get_matplotlib_figure(x, allow_global)
+        if fig is not None:
+            import matplotlib.pyplot
+
+            matplotlib.pyplot.close(fig)  # pyright: ignore[reportUnknownMemberType]
+
+
 # This is a weird one... the default dpi is not set to rcParam["figure.dpi"], but rather
 # to rcParam["figure.dpi"] * fig.canvas.device_pixel_ratio (which is 2.0 on my Mac with
 # the 'MacOSX' mpl backend). We want to undo that scaling, as it makes the text
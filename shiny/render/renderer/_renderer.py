@@ -112,6 +112,14 @@ class Renderer(Generic[IT]):
     # Idea: Possibly use a chained method of `.ui_kwargs()`? https://github.com/posit-dev/py-shiny/issues/971
     _auto_output_ui_kwargs: dict[str, Any] = dict()
 
+    _cache_across_sessions: bool = False
+    """
+    Whether a value cached with :func:`~shiny.reactive.bind_cache` may be reused by
+    other sessions. Only set this to `True` when the rendered value doesn't depend on
+    the session (e.g. it doesn't contain the session's id or register anything with
+    it); otherwise, values are only reused within the session that rendered them.
+    """
+
     __name__: str
     """
     Name of output function supplied. (The value **will not** contain a module prefix.)
@@ -313,6 +321,14 @@ class Renderer(Generic[IT]):
         rendered = await self.transform(value)
         return rendered
 
+    def _cache_key(self) -> object:
+        """
+        Reactive inputs to the rendered output, other than the ones that the value
+        function reads (such as the size of a plot). They're added to the key when the
+        renderer is cached with :func:`~shiny.reactive.bind_cache`.
+        """
+        return None
+
     # ######
     # Tagify-like methods
     # ######
@@ -36,6 +36,7 @@ from htmltools import TagChild, TagList
 from starlette.requests import HTTPConnection, Request
 from starlette.responses import (
     HTMLResponse,
+    JSONResponse,
     PlainTextResponse,
     Response,
     StreamingResponse,
@@ -46,7 +47,20 @@ from .. import _utils, reactive, render
 from .._connection import Connection, ConnectionClosed
 from .._deprecated import warn_deprecated
 from .._docstring import add_example
-from .._fileupload import FileInfo, FileUploadManager
+from .._fileupload import (
+    FileInfo,
+    FileUploadManager,
+    FileUploadOperation,
+    UploadSizeError,
+)
+from .._http_range import (
+    file_reader,
+    file_validators,
+    range_response,
+    seekable_response,
+    validator_headers,
+)
+from .._json import JSONCodec, RawJSON, resolve_json_codec
 from .._namespaces import Id, Root
 from .._typing_extensions import NotRequired, TypedDict
 from .._utils import wrap_async
@@ -57,26 +71,23 @@ from ..bookmark._serializers import serializer_file_input
 from ..http_staticfiles import FileResponse
 from ..input_handler import input_handlers
 from ..module import ResolvedId
-from ..otel._attributes import (
-    extract_http_attributes,
-    extract_source_ref,
-    get_session_id_attrs,
-)
+from ..otel._attributes import extract_http_attributes, get_session_id_attrs
 from ..otel._collect import OtelCollectLevel, _get_env_level
 from ..otel._decorators import suppress as otel_suppress
 from ..otel._function_attrs import resolve_func_otel_level
-from ..otel._labels import create_otel_label, create_otel_span_name
+from ..otel._labels import create_otel_label
+from ..otel._span_info import OtelSpanInfo
 from ..otel._span_wrappers import shiny_otel_span, shiny_otel_span_stream
 from ..reactive import Effect_, Value, effect
 from ..reactive import flush as reactive_flush
 from ..reactive import isolate
-from ..reactive._core import lock
-from ..reactive._core import on_flushed as reactive_on_flushed
+from ..reactive._core import FlushMode, ReactiveDomain
 from ..render.renderer import Renderer, RendererT
 from ..testmode import _snapshot_preprocess_file_input
 from ..types import (
     Jsonifiable,
     SafeException,
+    SeekableContent,
     SilentCancelOutputException,
     SilentException,
     SilentOperationInProgressException,
@@ -138,14 +149,20 @@ class ClientMessageOther(ClientMessage):
 # 1. A string, which will be interpreted as a path
 # 2. A regular Iterable of bytes or strings (i.e. a generator function)
 # 3. An AsyncIterable of bytes or strings (i.e. an async generator function)
+# 4. A SeekableContent, for generated content that can be served in parts
 #
 # (Not currently supported is Awaitable[str], could be added easily enough if needed.)
 DownloadHandler = Callable[
     [],
-    Union[str, Iterable[Union[bytes, str]], AsyncIterable[Union[bytes, str]]],
+    Union[
+        str,
+        Iterable[Union[bytes, str]],
+        AsyncIterable[Union[bytes, str]],
+        SeekableContent,
+    ],
 ]
 
-DynamicRouteHandler = Callable[[Request], ASGIApp]
+DynamicRouteHandler = Callable[[Request], Union[ASGIApp, SeekableContent]]
 
 
 @dataclasses.dataclass
@@ -210,6 +227,182 @@ class OutBoundMessageQueues:
         self.input_messages.append({"id": id, "message": message})
 
 
+# The position of each message type in the client's handler dispatch order (see
+# `addMessageHandler()` in shiny.js). Only message types listed here are ever packed
+# into a shared frame; anything else always gets a frame of its own.
+_FRAME_HANDLER_ORDER: dict[str, int] = {
+    "values": 0,
+    "errors": 1,
+    "inputMessages": 2,
+    "progress": 5,
+    "busy": 12,
+    "recalculating": 13,
+}
+
+# The order in which the client updates its output progress state for a single
+# frame: "recalculating" first, then the flush (values/errors), then "progress".
+_FRAME_STATE_ORDER: dict[str, int] = {
+    "recalculating": 0,
+    "values": 1,
+    "errors": 1,
+    "progress": 2,
+}
+
+
+@dataclasses.dataclass
+class OutBoundFrame:
+    parts: list[str]
+    keys: set[str]
+    nbytes: int
+    handler_pos: int
+    state_pos: int
+    mergeable: bool
+
+    def encode(self) -> str:
+        if len(self.parts) == 1:
+            return self.parts[0]
+        # Each part is an encoded JSON object with keys disjoint from the others, so
+        # splicing their members together yields the merged object.
+        return "{" + ",".join(part[1:-1] for part in self.parts) + "}"
+
+
+class OutBoundMessageBuffer:
+    """
+    Packs outbound messages into as few websocket frames as the client allows.
+
+    The client dispatches the keys of a frame in a fixed order, one message per key,
+    so a message is only added to the pending frame when the result is processed in
+    exactly the same order as sending the two frames separately would be. `busy`
+    messages only toggle page-level state, so they may join any frame that doesn't
+    already carry one.
+
+    Frames are kept under `max_bytes`, and once that much is buffered it should be
+    sent without waiting for the end of the tick.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024):
+        self.max_bytes = max_bytes
+        self._frames: list[OutBoundFrame] = []
+        self.nbytes: int = 0
+
+        # Counters since the last `reset_counters()`
+        self.messages_sent: int = 0
+        self.frames_sent: int = 0
+        self.bytes_sent: int = 0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def add(self, message: dict[str, object], message_str: str) -> None:
+        keys = set(message.keys())
+        nbytes = len(message_str)
+        mergeable = len(keys) > 0 and all(k in _FRAME_HANDLER_ORDER for k in keys)
+        handler_pos = max((_FRAME_HANDLER_ORDER.get(k, -1) for k in keys), default=-1)
+        state_pos = max((_FRAME_STATE_ORDER.get(k, -1) for k in keys), default=-1)
+
+        self.nbytes += nbytes
+        if self._frames and mergeable:
+            frame = self._frames[-1]
+            if self._can_merge(frame, keys, nbytes):
+                frame.parts.append(message_str)
+                frame.keys |= keys
+                frame.nbytes += nbytes
+                if keys != {"busy"}:
+                    frame.handler_pos = max(frame.handler_pos, handler_pos)
+                frame.state_pos = max(frame.state_pos, state_pos)
+                return
+
+        self._frames.append(
+            OutBoundFrame(
+                parts=[message_str],
+                keys=keys,
+                nbytes=nbytes,
+                handler_pos=-1 if keys == {"busy"} else handler_pos,
+                state_pos=state_pos,
+                mergeable=mergeable,
+            )
+        )
+
+    def _can_merge(self, frame: OutBoundFrame, keys: set[str], nbytes: int) -> bool:
+        if not frame.mergeable or frame.keys & keys:
+            return False
+        if frame.nbytes + nbytes > self.max_bytes:
+            return False
+        if keys == {"busy"}:
+            return True
+        # Everything in the new message must be dispatched after everything already in
+        # the frame (ignoring `busy`), both by the handlers and by the output progress
+        # state machine.
+        non_busy = keys - {"busy"}
+        if min(_FRAME_HANDLER_ORDER[k] for k in non_busy) <= frame.handler_pos:
+            return False
+        state_keys = [_FRAME_STATE_ORDER[k] for k in keys if k in _FRAME_STATE_ORDER]
+        if state_keys and min(state_keys) < frame.state_pos:
+            return False
+        return True
+
+    def take(self) -> list[str]:
+        """Remove and return all pending frames, encoded and ready to send."""
+        frames = [frame.encode() for frame in self._frames]
+        self.messages_sent += sum(len(frame.parts) for frame in self._frames)
+        self.frames_sent += len(frames)
+        self.bytes_sent += sum(len(frame) for frame in frames)
+        self._frames.clear()
+        self.nbytes = 0
+        return frames
+
+    def is_full(self) -> bool:
+        return self.nbytes >= self.max_bytes
+
+    def reset_counters(self) -> OutBoundFlushStats:
+        """Reset the counters, returning their values since the last reset."""
+        stats = OutBoundFlushStats(
+            messages=self.messages_sent,
+            frames=self.frames_sent,
+            bytes=self.bytes_sent,
+        )
+        self.messages_sent = self.frames_sent = self.bytes_sent = 0
+        return stats
+
+
+@dataclasses.dataclass(frozen=True)
+class OutBoundFlushStats:
+    messages: int = 0
+    frames: int = 0
+    bytes: int = 0
+
+
+# Inputs named `.clientdata_output_{name}_hidden` report whether an output is hidden.
+_HIDDEN_PREFIX = ".clientdata_output_"
+_HIDDEN_SUFFIX = "_hidden"
+
+# Input types whose every value is an event (a click), even though each one differs from
+# the last.
+_EVENT_INPUT_TYPES = ("shiny.action", "bslib.toolbar.button", "bslib.taskbutton")
+
+
+def _merge_update(data: dict[str, object], new_data: dict[str, object]) -> bool:
+    """
+    Merge the inputs of an update message into those of an earlier one, with the later
+    values winning. Returns False (and leaves `data` unchanged) if that could lose an
+    event: a value that carries `priority: "event"`, an input that's set again to the
+    same value (which the client only resends for `priority: "event"` inputs), or an
+    action or task button.
+    """
+    for key, value in new_data.items():
+        if (
+            isinstance(value, dict)
+            and typing.cast("dict[str, object]", value).get("priority") == "event"
+        ):
+            return False
+        if key not in data:
+            continue
+        if key.endswith(_EVENT_INPUT_TYPES) or data[key] == value:
+            return False
+    data.update(new_data)
+    return True
+
+
 # ======================================================================================
 # Session abstract base class
 # ======================================================================================
@@ -242,6 +435,7 @@ class Session(ABC):
     # TODO: not sure these should be directly exposed
     _outbound_message_queues: OutBoundMessageQueues
     _downloads: dict[str, DownloadInfo]
+    _reactive_domain: ReactiveDomain
 
     @abstractmethod
     def is_stub_session(self) -> bool:
@@ -300,6 +494,62 @@ class Session(ABC):
             )
         self._send_message_sync({"allowReconnect": value})
 
+    def set_flush_mode(
+        self, mode: FlushMode, *, max_concurrency: Optional[int] = None
+    ) -> None:
+        """
+        Set how this session runs its pending reactive effects during a flush.
+
+        Parameters
+        ----------
+        mode
+            With ``"sequential"``, effects (including outputs) run one at a time. With
+            ``"concurrent"``, effects that share the same priority run concurrently;
+            effects with a higher priority still finish before effects with a lower
+            priority start.
+        max_concurrency
+            In ``"concurrent"`` mode, the maximum number of effects that run at the same
+            time. If ``None``, the current limit (by default,
+            :attr:`~shiny.App.flush_max_concurrency`) is kept.
+
+        Note
+        ----
+        The setting applies to the whole session, including its modules. The app-wide
+        default is :attr:`~shiny.App.flush_mode`.
+        """
+        if mode not in ("sequential", "concurrent"):
+            raise ValueError(
+                f'`mode` must be "sequential" or "concurrent", not {mode!r}.'
+            )
+        if max_concurrency is not None:
+            if max_concurrency < 1:
+                raise ValueError("`max_concurrency` must be at least 1.")
+            self._reactive_domain.max_concurrency = max_concurrency
+        self._reactive_domain.flush_mode = mode
+
+    @abstractmethod
+    def set_coalesce_input_updates(self, value: bool) -> None:
+        """
+        Set whether input updates that arrive together are merged.
+
+        Parameters
+        ----------
+        value
+            If ``True``, input update messages that are already waiting when one is
+            processed are merged into it, with the latest value of each input winning,
+            and reactives are flushed once for all of them. If ``False``, each message
+            is applied and flushed separately.
+
+        Note
+        ----
+        A message isn't merged if it sets an input that's already being set to the same
+        value, or that's an action or task button, or if a value carries
+        ``priority: "event"``, since those are events that each need to be seen. The
+        app-wide default is :attr:`~shiny.App.coalesce_input_updates`, which is
+        ``False``.
+        """
+        ...
+
     @abstractmethod
     def _is_closed(self) -> bool:
         """
@@ -590,6 +840,14 @@ class Session(ABC):
         that, if there is a lot of contention for the main thread).
         """
 
+    def _send_message_buffered(self, message: dict[str, object]) -> None:
+        """
+        Same as _send_message_sync, except that the message may be held back until the
+        next message is sent (or the end of the current event loop tick) so that it can
+        share a websocket frame with other messages.
+        """
+        self._send_message_sync(message)
+
     @add_example(example_name="session_on_flush")
     @abstractmethod
     def on_flush(
@@ -684,7 +942,9 @@ class Session(ABC):
         handler
             The function to call when a request is made to the route. This function
             should take a single argument (a :class:`starlette.requests.Request` object)
-            and return a :class:`starlette.types.ASGIApp` object.
+            and return a :class:`starlette.types.ASGIApp` object, or a
+            :class:`~shiny.types.SeekableContent` to serve content that clients can
+            request parts of (such as a video that they can seek within).
 
 
         Returns
@@ -886,7 +1146,18 @@ class AppSession(Session):
         self.id: str = id
         self._conn: Connection = conn
         self._debug: bool = debug
+        self._json_codec: JSONCodec = resolve_json_codec(app.json_codec)
         self._busy_count: int = 0
+        # Each session flushes its own reactive domain, under its own lock, so that
+        # a slow flush here doesn't hold up other sessions.
+        self._reactive_domain: ReactiveDomain = ReactiveDomain(
+            name=id,
+            flush_mode=app.flush_mode,
+            max_concurrency=app.flush_max_concurrency,
+        )
+        self._coalesce_input_updates: bool = app.coalesce_input_updates
+        # The number of input update messages that were merged into an earlier one
+        self._coalesced_updates: int = 0
         self._message_handlers: dict[
             str,
             tuple[Callable[..., Awaitable[Jsonifiable]], Session],
@@ -934,8 +1205,19 @@ class AppSession(Session):
         self._outbound_message_queues = OutBoundMessageQueues(
             record_test_values=app._test_mode
         )
-
-        self._file_upload_manager: FileUploadManager = FileUploadManager()
+        # Control messages (busy, output progress) are buffered and sent together
+        # with the next flush, or at the end of the current event loop tick.
+        self._outbound_buffer = OutBoundMessageBuffer()
+        self._outbound_send_lock = asyncio.Lock()
+        self._outbound_drain_scheduled: bool = False
+        self._last_flush_stats = OutBoundFlushStats()
+
+        self._file_upload_manager: FileUploadManager = FileUploadManager(
+            max_file_size=app.upload_max_file_size,
+            max_session_size=app.upload_max_session_size,
+            spool_size=app.upload_spool_size,
+            hash=app.upload_hash,
+        )
         self._on_ended_callbacks = _utils.AsyncCallbacks()
         self._has_run_session_ended_tasks: bool = False
         self._downloads: dict[str, DownloadInfo] = {}
@@ -962,6 +1244,9 @@ class AppSession(Session):
         # Clear file upload directories, if present
         self.on_ended(self._file_upload_manager.rm_upload_dir)
 
+    def set_coalesce_input_updates(self, value: bool) -> None:
+        self._coalesce_input_updates = value
+
     def _is_closed(self) -> bool:
         # `_has_run_session_ended_tasks` is set before any teardown callback
         # runs, so teardown itself can tell a close from an explicit destroy().
@@ -1029,15 +1314,21 @@ class AppSession(Session):
                     }
                 )
 
+                # A message that was received while merging updates, but couldn't be
+                # merged; it's handled next.
+                next_message: Optional[str] = None
+
                 while True:
-                    message: str = await self._conn.receive()
+                    message: str
+                    if next_message is not None:
+                        message, next_message = next_message, None
+                    else:
+                        message = await self._conn.receive()
                     if self._debug:
                         print("RECV: " + message, flush=True)
 
                     try:
-                        message_obj = json.loads(
-                            message, object_hook=_utils.lists_to_tuples
-                        )
+                        message_obj = self._json_codec.loads(message)
                     except json.JSONDecodeError:
                         warnings.warn(
                             "ERROR: Invalid JSON message", SessionWarning, stacklevel=2
@@ -1050,7 +1341,7 @@ class AppSession(Session):
                         )
                         return
 
-                    async with lock():
+                    async with self._reactive_domain.lock:
                         if message_obj["method"] == "init":
                             verify_state(ConnectionState.Start)
 
@@ -1068,10 +1359,10 @@ class AppSession(Session):
                             else:
                                 self.bookmark._set_restore_context(RestoreContext())
 
-                            # When a reactive flush occurs, flush the session's outputs,
-                            # errors, etc. to the client. Note that this is
-                            # `reactive._core.on_flushed`, not `self.on_flushed`.
-                            unreg = reactive_on_flushed(self._flush)
+                            # When this session's reactive domain is flushed, flush the
+                            # session's outputs, errors, etc. to the client. Note that
+                            # this is the domain's `on_flushed`, not `self.on_flushed`.
+                            unreg = self._reactive_domain.on_flushed(self._flush)
                             # When the session ends, stop flushing outputs on reactive
                             # flush.
                             stack.callback(unreg)
@@ -1104,9 +1395,12 @@ class AppSession(Session):
                             verify_state(ConnectionState.Running)
 
                             message_obj = typing.cast(ClientMessageUpdate, message_obj)
+                            data = message_obj["data"]
+                            if self._coalesce_input_updates:
+                                next_message = await self._merge_ready_updates(data)
                             # Set the session context for otel logging purposes
                             with session_context(self):
-                                self._manage_inputs(message_obj["data"])
+                                self._manage_inputs(data)
 
                         elif "tag" in message_obj and "args" in message_obj:
                             verify_state(ConnectionState.Running)
@@ -1145,7 +1439,35 @@ class AppSession(Session):
             finally:
                 await self._run_session_ended_tasks()
 
+    async def _merge_ready_updates(self, data: dict[str, object]) -> Optional[str]:
+        """
+        Merge the input update messages that have already arrived into `data`, so that
+        they're all handled with a single flush. Returns the first message that
+        couldn't be merged (if any), which should be handled next.
+        """
+        while True:
+            message = await self._conn.receive_ready()
+            if message is None:
+                return None
+            try:
+                message_obj = self._json_codec.loads(message)
+            except json.JSONDecodeError:
+                return message
+            if not isinstance(message_obj, dict):
+                return message
+            message_obj = typing.cast(ClientMessageUpdate, message_obj)
+            if message_obj.get("method") != "update" or not _merge_update(
+                data, message_obj["data"]
+            ):
+                return message
+
+            if self._debug:
+                print("RECV: " + message, flush=True)
+            self._coalesced_updates += 1
+
     def _manage_inputs(self, data: dict[str, object]) -> None:
+        # Outputs whose hidden state the client has sent
+        hidden_changed: list[str] = []
         for key, val in data.items():
             keys = key.split(":")
             if len(keys) > 2:
@@ -1169,7 +1491,11 @@ class AppSession(Session):
             # https://github.com/rstudio/shiny/blob/75a63716e578976965daeadde81af7166a50faac/R/shiny.R#L728
             self.input[ResolvedId(keys[0])]._set(val, force=True)
 
-        self.output._manage_hidden()
+            if key.startswith(_HIDDEN_PREFIX) and key.endswith(_HIDDEN_SUFFIX):
+                hidden_changed.append(key[len(_HIDDEN_PREFIX) : -len(_HIDDEN_SUFFIX)])
+
+        if hidden_changed:
+            self.output._manage_hidden(hidden_changed)
 
     def _is_hidden(self, name: str) -> bool:
         with isolate():
@@ -1279,6 +1605,32 @@ class AppSession(Session):
     # ==========================================================================
     # Handling /session/{session_id}/{action}/{subpath} requests
     # ==========================================================================
+    async def _handle_upload_chunk(
+        self, request: Request, upload_op: FileUploadOperation
+    ) -> ASGIApp:
+        # A request of the chunked upload protocol (see `_fileupload.py`): a POST
+        # writes one chunk of a file, and a GET reports what's been received.
+        try:
+            index = int(request.query_params["file"])
+            if request.method == "POST":
+                offset = int(request.query_params["offset"])
+                # Reject a chunk that's too large before reading any of it, if the
+                # client says how large it is (it's checked as it's read, too)
+                content_length = request.headers.get("content-length")
+                upload_op.check_chunk_size(
+                    index, offset, 0 if content_length is None else int(content_length)
+                )
+                await upload_op.stream_file_chunk(index, offset, request.stream())
+            received, complete = upload_op.file_received(index)
+        except UploadSizeError as e:
+            return PlainTextResponse(str(e), 413)
+        except (KeyError, ValueError) as e:
+            return PlainTextResponse(str(e), 400)
+
+        return JSONResponse(
+            {"received": [list(r) for r in received], "complete": complete}
+        )
+
     async def _handle_request(
         self, request: Request, action: str, subpath: Optional[str]
     ) -> ASGIApp:
@@ -1291,7 +1643,7 @@ class AppSession(Session):
     async def _handle_request_impl(
         self, request: Request, action: str, subpath: Optional[str]
     ) -> ASGIApp:
-        if action == "upload" and request.method == "POST":
+        if action == "upload" and request.method in ("GET", "POST"):
             if subpath is None or subpath == "":
                 return HTMLResponse("<h1>Bad Request</h1>", 400)
 
@@ -1300,12 +1652,22 @@ class AppSession(Session):
             if not upload_op:
                 return HTMLResponse("<h1>Bad Request</h1>", 400)
 
+            if "file" in request.query_params:
+                return await self._handle_upload_chunk(request, upload_op)
+            if request.method != "POST":
+                return HTMLResponse("<h1>Bad Request</h1>", 400)
+
             # The FileUploadOperation can have multiple files; each one will
-            # have a separate POST request. Each call to  `with upload_op` will
-            # open up each file (in sequence) for writing.
-            with upload_op:
-                async for chunk in request.stream():
-                    upload_op.write_chunk(chunk)
+            # have a separate POST request. Each call to  `async with upload_op` will
+            # open up each file (in sequence) for writing. The data is written in a
+            # worker thread, so a large upload doesn't block other sessions.
+            try:
+                async with upload_op:
+                    async for chunk in request.stream():
+                        await upload_op.write_chunk(chunk)
+            except UploadSizeError as e:
+                # The partial file has been removed
+                return PlainTextResponse(str(e), 413)
 
             return PlainTextResponse("OK", 200)
 
@@ -1333,6 +1695,10 @@ class AppSession(Session):
                                 )
                                 filename = download_id
 
+                        if content_type is None and isinstance(
+                            contents, SeekableContent
+                        ):
+                            content_type = contents.media_type
                         if content_type is None:
                             content_type = _utils.guess_mime_type(filename)
                         content_disposition_filename = urllib.parse.quote(filename)
@@ -1376,52 +1742,52 @@ class AppSession(Session):
                                 infer_session_id=False,
                                 required_level=OtelCollectLevel.REACTIVITY,
                             ):
-                                file_response = FileResponse(
-                                    Path(contents),
+                                size, etag, last_modified = file_validators(contents)
+                                # A 206, 304, or 416 for range and conditional
+                                # requests (e.g., resuming a download)
+                                file_response = range_response(
+                                    request,
+                                    size=size,
+                                    read=file_reader(contents),
                                     headers=headers,
                                     media_type=content_type,
+                                    etag=etag,
+                                    last_modified=last_modified,
                                 )
+                                if file_response is None:
+                                    file_response = FileResponse(
+                                        Path(contents),
+                                        headers={
+                                            **headers,
+                                            **validator_headers(etag, last_modified),
+                                        },
+                                        media_type=content_type,
+                                    )
                             return file_response
 
-                        wrapped_contents: AsyncIterable[bytes]
-
-                        if isinstance(contents, AsyncIterable):
-                            # Need to wrap the app-author-provided iterator in a
-                            # callback that installs the appropriate context mgrs.
-                            # We already use this context mgrs further up in the
-                            # implementation of handle_request(), but the iterators
-                            # aren't invoked until after handle_request() returns.
-                            async def wrap_content_async() -> AsyncIterable[bytes]:
-                                with session_context(self):
-                                    with isolate():
-                                        async for chunk in contents:
-                                            if isinstance(chunk, str):
-                                                yield chunk.encode(download.encoding)
-                                            else:
-                                                yield chunk
-
-                            wrapped_contents = wrap_content_async()
-
-                        else:  # isinstance(contents, Iterable):
-
-                            async def wrap_content_sync() -> AsyncIterable[bytes]:
-                                with session_context(self):
-                                    with isolate():
-                                        for chunk in contents:
-                                            if isinstance(chunk, str):
-                                                yield chunk.encode(download.encoding)
-                                            else:
-                                                yield chunk
-
-                            wrapped_contents = wrap_content_sync()
-
-                        wrapped_contents = shiny_otel_span_stream(
-                            download_label,
-                            wrapped_contents,
-                            attributes=otel_attrs,
-                            infer_session_id=False,
-                            required_level=OtelCollectLevel.REACTIVITY,
-                        )
+                        def wrap_contents(
+                            contents: (
+                                Iterable[bytes | str] | AsyncIterable[bytes | str]
+                            ),
+                        ) -> AsyncIterable[bytes]:
+                            return shiny_otel_span_stream(
+                                download_label,
+                                self._wrap_iterable(contents, download.encoding),
+                                attributes=otel_attrs,
+                                infer_session_id=False,
+                                required_level=OtelCollectLevel.REACTIVITY,
+                            )
+
+                        if isinstance(contents, SeekableContent):
+                            return seekable_response(
+                                request,
+                                contents,
+                                headers=headers,
+                                media_type=content_type,
+                                wrap=wrap_contents,
+                            )
+
+                        wrapped_contents = wrap_contents(contents)
 
                         # In streaming downloads, we send a 200 response, but if an
                         # error occurs in the middle of it, the client needs to know.
@@ -1445,9 +1811,19 @@ class AppSession(Session):
             with session_context(self):
                 with isolate():
                     if _utils.is_async_callable(handler):
-                        return await handler(request)
+                        result = await handler(request)
                     else:
-                        return handler(request)
+                        result = handler(request)
+
+            if isinstance(result, SeekableContent):
+                return seekable_response(
+                    request,
+                    result,
+                    headers={},
+                    media_type=result.media_type or "application/octet-stream",
+                    wrap=lambda contents: self._wrap_iterable(contents, "utf-8"),
+                )
+            return result
 
         elif action == "dataobj" and subpath == "shinytest" and request.method == "GET":
             if not self.app._test_mode:
@@ -1456,6 +1832,39 @@ class AppSession(Session):
 
         return HTMLResponse("<h1>Not Found</h1>", 404)
 
+    def _wrap_iterable(
+        self,
+        contents: Iterable[bytes | str] | AsyncIterable[bytes | str],
+        encoding: str,
+    ) -> AsyncIterable[bytes]:
+        # Need to wrap the app-author-provided iterator in a callback that installs the
+        # appropriate context mgrs. We already use these context mgrs in
+        # _handle_request_impl(), but the iterators aren't invoked until after it
+        # returns.
+        if isinstance(contents, AsyncIterable):
+
+            async def wrap_content_async() -> AsyncIterable[bytes]:
+                with session_context(self):
+                    with isolate():
+                        async for chunk in contents:
+                            if isinstance(chunk, str):
+                                yield chunk.encode(encoding)
+                            else:
+                                yield chunk
+
+            return wrap_content_async()
+
+        async def wrap_content_sync() -> AsyncIterable[bytes]:
+            with session_context(self):
+                with isolate():
+                    for chunk in contents:
+                        if isinstance(chunk, str):
+                            yield chunk.encode(encoding)
+                        else:
+                            yield chunk
+
+        return wrap_content_sync()
+
     async def _handle_test_snapshot(self, request: Request) -> ASGIApp:
         # `format`: py-shiny only ever emits JSON. R additionally supports "rds",
         # but there is no RDS equivalent in Python, so any non-"json" value
@@ -1565,21 +1974,50 @@ class AppSession(Session):
         await self._send_message({"custom": {type: message}})
 
     async def _send_message(self, message: dict[str, object]) -> None:
-        message_str = json.dumps(message)
-        if self._debug:
-            print(
-                "SEND: "
-                + re.sub(
-                    "(?m)base64,[a-zA-Z0-9+/=]+", "[base64 data]", message_str + "\n"
-                ),
-                end="",
-                flush=True,
-            )
-        await self._conn.send(message_str)
+        # Anything already buffered goes out first (possibly in the same frame).
+        self._outbound_buffer.add(message, self._json_codec.dumps(message))
+        await self._send_buffered_messages()
 
     def _send_message_sync(self, message: dict[str, object]) -> None:
         _utils.run_coro_hybrid(self._send_message(message))
 
+    def _send_message_buffered(self, message: dict[str, object]) -> None:
+        """
+        Queue a message to be sent with the next message, or at the end of the current
+        event loop tick, whichever comes first. Consecutive buffered messages share a
+        websocket frame when the client protocol allows it.
+        """
+        self._outbound_buffer.add(message, self._json_codec.dumps(message))
+        if self._outbound_buffer.is_full():
+            _utils.run_coro_hybrid(self._send_buffered_messages())
+        elif not self._outbound_drain_scheduled:
+            self._outbound_drain_scheduled = True
+            asyncio.get_running_loop().call_soon(self._drain_outbound_buffer)
+
+    def _drain_outbound_buffer(self) -> None:
+        self._outbound_drain_scheduled = False
+        if len(self._outbound_buffer) == 0:
+            return
+        fut = _utils.run_coro_hybrid(self._send_buffered_messages())
+        # Nobody awaits this; a closed connection is handled by the session loop.
+        fut.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+    async def _send_buffered_messages(self) -> None:
+        async with self._outbound_send_lock:
+            for frame in self._outbound_buffer.take():
+                if self._debug:
+                    print(
+                        "SEND: "
+                        + re.sub(
+                            "(?m)base64,[a-zA-Z0-9+/=]+",
+                            "[base64 data]",
+                            frame + "\n",
+                        ),
+                        end="",
+                        flush=True,
+                    )
+                await self._conn.send(frame)
+
     def _print_error_message(self, message: str | Exception) -> None:
         print(str(message), file=sys.stderr)
 
@@ -1635,6 +2073,7 @@ class AppSession(Session):
                 await self._send_message(message)
             finally:
                 self._outbound_message_queues.reset()
+                self._last_flush_stats = self._outbound_buffer.reset_counters()
         finally:
             with session_context(self):
                 await self._flushed_callbacks.invoke()
@@ -1642,12 +2081,12 @@ class AppSession(Session):
     def _increment_busy_count(self) -> None:
         self._busy_count += 1
         if self._busy_count == 1:
-            self._send_message_sync({"busy": "busy"})
+            self._send_message_buffered({"busy": "busy"})
 
     def _decrement_busy_count(self) -> None:
         self._busy_count -= 1
         if self._busy_count == 0:
-            self._send_message_sync({"busy": "idle"})
+            self._send_message_buffered({"busy": "idle"})
 
     # ==========================================================================
     # On session ended
@@ -1818,6 +2257,7 @@ class SessionProxy(Session):
         self.clientdata = ClientData(self)
         self._outbound_message_queues = root_session._outbound_message_queues
         self._downloads = root_session._downloads
+        self._reactive_domain = root_session._reactive_domain
 
         self.bookmark = BookmarkProxy(self)
 
@@ -1832,6 +2272,9 @@ class SessionProxy(Session):
     def _is_closed(self) -> bool:
         return self._root_session._is_closed()
 
+    def set_coalesce_input_updates(self, value: bool) -> None:
+        self._root_session.set_coalesce_input_updates(value)
+
     def on_destroy(
         self, fn: Callable[[], None] | Callable[[], Awaitable[None]]
     ) -> None:
@@ -1976,6 +2419,9 @@ class SessionProxy(Session):
     def _send_message_sync(self, message: dict[str, object]) -> None:
         self._root_session._send_message_sync(message)
 
+    def _send_message_buffered(self, message: dict[str, object]) -> None:
+        self._root_session._send_message_buffered(message)
+
     def on_flushed(
         self,
         fn: Callable[[], None] | Callable[[], Awaitable[None]],
@@ -2037,7 +2483,14 @@ def _snapshot_safe_value(value: Any) -> Any:
     snapshot.
     """
     try:
-        return orjson.loads(orjson.dumps(value, default=str))
+        return orjson.loads(
+            orjson.dumps(
+                value,
+                default=lambda x: (
+                    orjson.Fragment(x.json) if isinstance(x, RawJSON) else str(x)
+                ),
+            )
+        )
     except Exception as e:
         return {"__shiny_serialization_error__": str(e)}
 
@@ -2656,14 +3109,12 @@ class Outputs:
             # renderer is a Renderer object. Give it a bit of metadata.
             renderer._set_output_metadata(output_id=output_id)
 
-            # Gather otel info for inner method
+            # Gather otel info for inner method (the span name and attributes are
+            # only computed when they're first needed)
             renderer_func = getattr(renderer.fn, "_orig_fn", renderer.fn)
-            output_otel_label = create_otel_span_name(
-                func=renderer_func,
-                label_type="output",
-                session=self._session,
+            output_otel_span_info = OtelSpanInfo(
+                renderer_func, "output", session=self._session
             )
-            output_otel_attrs = extract_source_ref(renderer_func)
             output_otel_level = resolve_func_otel_level(renderer_func)
 
             renderer._on_register()
@@ -2682,21 +3133,14 @@ class Outputs:
                     )
 
                 session = require_real_session()
-                output_attrs = {
-                    **get_session_id_attrs(session),
-                    **output_otel_attrs,
-                }
 
-                await session._send_message(
+                session._send_message_buffered(
                     {"recalculating": {"name": output_name, "status": "recalculating"}}
                 )
 
                 try:
-                    async with shiny_otel_span(
-                        output_otel_label,
-                        attributes=output_attrs,
-                        infer_session_id=False,
-                        required_level=OtelCollectLevel.REACTIVITY,
+                    async with output_otel_span_info.span(
+                        OtelCollectLevel.REACTIVITY,
                         collection_level=output_otel_level,
                     ):
                         with session.clientdata._output_name_ctx(output_name):
@@ -2733,7 +3177,7 @@ class Outputs:
                     }
                     session._outbound_message_queues.set_error(output_name, err_message)
 
-                await session._send_message(
+                session._send_message_buffered(
                     {
                         "recalculating": {
                             "name": output_name,
@@ -2743,8 +3187,8 @@ class Outputs:
                 )
 
             output_obs.on_invalidate(
-                lambda: require_real_session()._send_progress(
-                    "binding", {"id": output_name}
+                lambda: require_real_session()._send_message_buffered(
+                    {"progress": {"type": "binding", "message": {"id": output_name}}}
                 )
             )
 
@@ -2779,9 +3223,17 @@ class Outputs:
             self._outputs[key].effect.destroy()
             del self._outputs[key]
 
-    def _manage_hidden(self) -> None:
-        "Suspends execution of hidden outputs and resumes execution of visible outputs."
-        for name, output in self._outputs.items():
+    def _manage_hidden(self, names: Optional[Iterable[str]] = None) -> None:
+        """
+        Suspends execution of hidden outputs and resumes execution of visible outputs.
+        Only the outputs in `names` (by default, all outputs) are checked.
+        """
+        if names is None:
+            names = list(self._outputs)
+        for name in names:
+            output = self._outputs.get(name)
+            if output is None:
+                continue
             if self._should_suspend(name):
                 output.effect.suspend()
             else:
@@ -8,16 +8,21 @@ __all__ = (
     "Jsonifiable",
     "FileInfo",
     "ImgData",
+    "SeekableContent",
     "SafeException",
     "SilentException",
     "SilentCancelOutputException",
 )
 
+from datetime import datetime
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterable,
     BinaryIO,
+    Callable,
     Dict,
+    Iterable,
     List,
     Literal,
     NamedTuple,
@@ -72,6 +77,16 @@ class FileInfo(TypedDict):
     """The MIME type of the file."""
     datapath: str
     """The path to the file on the server."""
+    sha256: NotRequired[str]
+    """
+    The SHA-256 hex digest of the file's data, if the app's
+    :attr:`~shiny.App.upload_hash` is ``"sha256"``.
+    """
+    crc32: NotRequired[str]
+    """
+    The CRC-32 checksum of the file's data (as 8 hex digits), if the app's
+    :attr:`~shiny.App.upload_hash` is ``"crc32"``.
+    """
 
 
 @add_example(example_name="output_image")
@@ -98,6 +113,59 @@ class ImgData(TypedDict):
     """TODO """
 
 
+class SeekableContent:
+    """
+    Content that can be read starting from any byte offset.
+
+    Return this from a :class:`~shiny.render.download_button` function, or from a
+    :meth:`~shiny.Session.dynamic_route` handler, to serve generated content that clients
+    can request parts of. This lets browsers resume an interrupted download, and seek
+    within a video, audio file, or PDF without first downloading all of it.
+
+    Parameters
+    ----------
+    size
+        The size of the content, in bytes.
+    read
+        A function that takes a ``start`` and ``end`` byte offset, and returns an
+        iterable (or async iterable, such as a generator) of the bytes from ``start`` up
+        to, but not including, ``end``. It must produce exactly ``end - start`` bytes.
+    etag
+        An HTTP entity tag (such as ``'"v1"'``) that identifies this version of the
+        content. If given, a client that already has this version gets a 304 (Not
+        Modified) response instead of the content. Only give an ``etag`` if the content
+        is always the same for a given tag.
+    last_modified
+        When the content last changed, as a :class:`~datetime.datetime` or seconds since
+        the epoch. Like ``etag``, this lets clients avoid downloading the content again.
+    media_type
+        The MIME type of the content. For downloads, the ``media_type`` given to
+        :class:`~shiny.render.download_button` takes precedence.
+
+    See Also
+    --------
+    * :class:`~shiny.render.download_button`
+    * :meth:`~shiny.Session.dynamic_route`
+    """
+
+    def __init__(
+        self,
+        size: int,
+        read: Callable[[int, int], Iterable[bytes] | AsyncIterable[bytes]],
+        *,
+        etag: Optional[str] = None,
+        last_modified: Optional[datetime | float] = None,
+        media_type: Optional[str] = None,
+    ):
+        if size < 0:
+            raise ValueError("`size` must not be negative.")
+        self.size = size
+        self.read = read
+        self.etag = etag
+        self.last_modified = last_modified
+        self.media_type = media_type
+
+
 @add_example()
 class SafeException(Exception):
     """
@@ -22,7 +22,7 @@ __all__ = (
 import json
 import re
 from datetime import date
-from typing import TYPE_CHECKING, Literal, Mapping, Optional, cast, overload
+from typing import TYPE_CHECKING, Literal, Optional, cast, overload
 
 from htmltools import TagChild, TagList, tags
 from starlette.requests import Request
@@ -30,7 +30,6 @@ from starlette.responses import JSONResponse, Response
 
 from .._deprecated import warn_deprecated
 from .._docstring import add_example, doc_format, no_example
-from .._typing_extensions import NotRequired, TypedDict
 from .._utils import drop_none
 from ..input_handler import input_handlers
 from ..module import ResolvedId, resolve_id
@@ -40,6 +39,7 @@ from ._input_check_radio import ChoicesArg, _generate_options
 from ._input_date import _as_date_attr
 from ._input_select import SelectChoicesArg, _normalize_choices, _render_choices
 from ._input_slider import SliderStepArg, SliderValueArg, _as_numeric, _slider_type
+from ._selectize_index import FlatSelectChoice, SearchField, selectize_search_index
 from ._utils import JSEval, _session_on_flush_send_msg, extract_js_keys
 
 if TYPE_CHECKING:
@@ -709,12 +709,6 @@ def update_select(
     session.send_input_message(id, drop_none(msg))
 
 
-class FlatSelectChoice(TypedDict):
-    label: str
-    value: str
-    optgroup: NotRequired[str]
-
-
 @add_example()
 @doc_format(note=_note)
 def update_selectize(
@@ -778,34 +772,25 @@ def update_selectize(
             id, label=label, choices=choices, selected=selected, session=session
         )
 
-    # Transform choices to a list of dicts (this is the form the client wants)
-    # [{"label": "Foo", "value": "foo", "optgroup": "foo"}, ...]
-    flat_choices: list[FlatSelectChoice] = []
-    if choices is not None:
-        for k, v in _normalize_choices(choices).items():
-            if not isinstance(v, Mapping):
-                flat_choices.append(FlatSelectChoice(value=k, label=v))
-            else:  # The optgroup case
-                flat_choices.extend(
-                    [
-                        FlatSelectChoice(optgroup=k, value=k2, label=v2)
-                        for (k2, v2) in v.items()
-                    ]
-                )
+    # The choices, as a list of dicts (this is the form the client wants)
+    # [{"label": "Foo", "value": "foo", "optgroup": "foo"}, ...], indexed for searching.
+    # The index is shared with other sessions that are sent the same choices.
+    index = selectize_search_index(choices) if choices is not None else None
 
     selected_values = selected
     if isinstance(selected, str):
         selected_values = [selected]
 
     # Find any selected choices now so we have them ready to send to the client
-    if selected_values is None:
+    if selected_values is None or index is None:
         selected_choices: list[FlatSelectChoice] = []
     else:
-        selected_choices = [x for x in flat_choices if x["value"] in selected_values]
+        selected_choices = index.with_values(selected_values)
+    selected_set = set(selected_values or [])
 
     def selectize_choices_json(request: Request) -> Response:
-        if choices is None:
-            return Response([], status_code=200)
+        if index is None:
+            return JSONResponse([], status_code=200)
 
         # N.B. relevant query parameters that shiny.js setscan be found here
         # https://github.com/rstudio/shiny/blob/78d77ce/srcts/src/bindings/input/selectInput.ts#L138-L142
@@ -823,7 +808,7 @@ def update_selectize(
         max_options = int(qparams.get("maxop", 1000))
 
         # i.e. searchConjunction (defaults to 'and', but can also be 'or')
-        conjunction = any if qparams.get("conju", "and") == "or" else all
+        conjunction = "or" if qparams.get("conju", "and") == "or" else "and"
 
         # i.e. searchFields (defaults to ['label'])
         search_fields_raw: object = json.loads(qparams.get("field", '["label"]'))
@@ -855,27 +840,23 @@ def update_selectize(
                 "The selectize.js valueField option must be set to 'value'"
             )
 
+        # Stop once there are more than the max number of options (with the selected
+        # choices, which are added after the matches)
+        n_matches = max(0, max_options + 1 - len(selected_choices))
         filtered_choices: list[FlatSelectChoice] = []
-        for choice in flat_choices:
-            # Short-circuit if we've reached the max number of options
-            if (len(filtered_choices) + len(selected_choices)) > max_options:
-                break
-
-            # If this is a selected value, *don't* add it here (add after this loop)
-            if selected_values and choice["value"] in selected_values:
-                continue
-
-            match = False
-            for f in search_fields:
-                val = cast(Optional[str], choice.get(f, None))
-                # optgroup could be requested, but not necessarily present/relevant
-                if val is None:
+        if n_matches > 0:
+            for i in index.search(
+                keywords,
+                fields=cast("list[SearchField]", search_fields),
+                conjunction=conjunction,
+            ):
+                choice = index.choices[i]
+                # If this is a selected value, *don't* add it here (add after this loop)
+                if choice["value"] in selected_set:
                     continue
-                if conjunction([x in val.lower() for x in keywords]):
-                    match = True
-
-            if match:
                 filtered_choices.append(choice)
+                if len(filtered_choices) >= n_matches:
+                    break
 
         if selected_choices:
             filtered_choices.extend(selected_choices)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+from typing import Iterable, Iterator, Literal, Mapping, Optional, Sequence
+
+from .._typing_extensions import NotRequired, TypedDict
+from ._input_select import SelectChoicesArg, _normalize_choices
+
+SearchField = Literal["label", "value", "optgroup"]
+
+# Separates the choices in a field's search text. Search terms never contain it
+# (queries are split on whitespace), so a match can't span two choices.
+_SEP = "\n"
+
+
+class FlatSelectChoice(TypedDict):
+    label: str
+    value: str
+    optgroup: NotRequired[str]
+
+
+class SelectizeSearchIndex:
+    """
+    The choices of a server-side selectize input, flattened into the form the client
+    wants (``[{"label": "Foo", "value": "foo", "optgroup": "foo"}, ...]``) and indexed
+    for searching.
+
+    For each field that is searched, the lower-cased values of all of the choices are
+    joined into a single string, so a search term is found with one (C-level) scan of
+    that string rather than a Python-level loop over the choices. Matches are produced
+    lazily and in the order of the choices, so a search stops once it has enough.
+    """
+
+    def __init__(self, choices: SelectChoicesArg) -> None:
+        flat_choices: list[FlatSelectChoice] = []
+        for k, v in _normalize_choices(choices).items():
+            if not isinstance(v, Mapping):
+                flat_choices.append({"value": k, "label": v})
+            else:  # The optgroup case
+                flat_choices.extend(
+                    [
+                        {"optgroup": k, "value": k2, "label": v2}
+                        for (k2, v2) in v.items()
+                    ]
+                )
+        self.choices: list[FlatSelectChoice] = flat_choices
+        self._fields: dict[SearchField, _FieldIndex] = {}
+        self._value_positions: Optional[dict[str, list[int]]] = None
+
+    def __len__(self) -> int:
+        return len(self.choices)
+
+    def with_values(self, values: Iterable[str]) -> list[FlatSelectChoice]:
+        """The choices with any of the given values, in order."""
+        if self._value_positions is None:
+            positions: dict[str, list[int]] = {}
+            for i, choice in enumerate(self.choices):
+                positions.setdefault(choice["value"], []).append(i)
+            self._value_positions = positions
+
+        found = sorted(
+            {i for value in values for i in self._value_positions.get(value, [])}
+        )
+        return [self.choices[i] for i in found]
+
+    def search(
+        self,
+        keywords: Iterable[str],
+        *,
+        fields: Sequence[SearchField] = ("label",),
+        conjunction: Literal["and", "or"] = "and",
+    ) -> Iterator[int]:
+        """
+        Yield (in order) the position of each choice that matches: a choice matches if,
+        for any of the `fields`, the field contains all (or, with ``conjunction="or"``,
+        any) of the lower-cased `keywords`.
+        """
+        keywords = set(keywords)
+        matches = [self._field(field).search(keywords, conjunction) for field in fields]
+        if len(matches) == 1:
+            return matches[0]
+        return _dedupe(heapq.merge(*matches))
+
+    def _field(self, field: SearchField) -> _FieldIndex:
+        if field not in self._fields:
+            self._fields[field] = _FieldIndex(
+                [choice.get(field, None) for choice in self.choices]
+            )
+        return self._fields[field]
+
+
+class _FieldIndex:
+    """The lower-cased values of one field of every choice."""
+
+    def __init__(self, values: list[Optional[str]]) -> None:
+        self.values = [None if v is None else str(v).lower() for v in values]
+        # Choices without this field (e.g. no optgroup) take up an empty slot in the
+        # text, but never match
+        self.present = [v is not None for v in self.values]
+        self.text = _SEP.join(v or "" for v in self.values)
+        # The offset in `text` of each choice's value
+        self.starts = list(
+            accumulate((len(v or "") + len(_SEP) for v in self.values[:-1]), initial=0)
+        )
+
+    def search(
+        self, keywords: set[str], conjunction: Literal["and", "or"]
+    ) -> Iterator[int]:
+        # The empty string matches everything (as in `"" in value`)
+        if "" in keywords:
+            if conjunction == "or" or len(keywords) == 1:
+                return (i for i, present in enumerate(self.present) if present)
+            keywords = keywords - {""}
+
+        if any(_SEP in kw for kw in keywords):
+            return self._scan(keywords, conjunction)
+
+        if conjunction == "or":
+            return _dedupe(heapq.merge(*(self._find(kw) for kw in keywords)))
+        return self._find_all(sorted(keywords, key=len, reverse=True))
+
+    def _next(self, keyword: str, i: int) -> Optional[int]:
+        # The first choice at or after `i` that contains `keyword` (which isn't empty,
+        # so it can't match a choice that doesn't have this field)
+        pos = self.text.find(keyword, self.starts[i])
+        if pos == -1:
+            return None
+        return bisect_right(self.starts, pos, i) - 1
+
+    def _find(self, keyword: str) -> Iterator[int]:
+        n = len(self.starts)
+        i = self._next(keyword, 0) if n else None
+        while i is not None:
+            yield i
+            if i + 1 >= n:
+                return
+            i = self._next(keyword, i + 1)
+
+    def _find_all(self, keywords: list[str]) -> Iterator[int]:
+        # The choices that contain every keyword, found by leapfrogging: each keyword
+        # jumps ahead to the next choice that contains it, until they all agree
+        n = len(self.starts)
+        i = 0
+        while i < n:
+            for kw in keywords:
+                j = self._next(kw, i)
+                if j is None:
+                    return
+                if j != i:
+                    i = j
+                    break
+            else:
+                yield i
+                i += 1
+
+    def _scan(
+        self, keywords: set[str], conjunction: Literal["and", "or"]
+    ) -> Iterator[int]:
+        test = any if conjunction == "or" else all
+        for i, value in enumerate(self.values):
+            if value is not None and test(kw in value for kw in keywords):
+                yield i
+
+
+def _dedupe(positions: Iterable[int]) -> Iterator[int]:
+    last = -1
+    for i in positions:
+        if i != last:
+            yield i
+            last = i
+
+
+# Indexes are shared by every session that's sent the same choices
+_search_indexes: OrderedDict[int, SelectizeSearchIndex] = OrderedDict()
+_SEARCH_INDEX_CACHE_SIZE = 16
+
+
+def selectize_search_index(choices: SelectChoicesArg) -> SelectizeSearchIndex:
+    """
+    Get the search index for `choices`, reusing the index that was built for the same
+    choices (if it's still cached), so the search text of each field is only built once.
+
+    Indexes are found by their content, not by the identity of the `choices` object,
+    so a list that is modified in place gets a new index.
+    """
+    index = SelectizeSearchIndex(choices)
+    key = hash(tuple(tuple(choice.items()) for choice in index.choices))
+    cached = _search_indexes.get(key)
+    # Guard against hash collisions
+    if cached is not None and cached.choices == index.choices:
+        _search_indexes.move_to_end(key)
+        return cached
+    _search_indexes[key] = index
+    _search_indexes.move_to_end(key)
+    while len(_search_indexes) > _SEARCH_INDEX_CACHE_SIZE:
+        _search_indexes.popitem(last=False)
+    return index
@@ -0,0 +1,125 @@
+"""
+Per-read overhead of synchronous reactive calcs.
+
+Builds a deep chain of calcs (each reading the one before it) and a wide fan-out (many
+calcs reading one shared calc, all read by one more), and times reading the result
+both when every calc has to recompute and when every calc is already up to date.
+Compares the coroutine path, which ran each read through `run_coro_sync(get_value())`
+(and the span's async context manager), against the synchronous path that sync calcs
+take when OpenTelemetry isn't tracing. Prints the time per calc read.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import timeit
+from typing import Callable
+
+from shiny import reactive
+from shiny.reactive import Calc_
+
+
+def make_step(prev: Callable[[], int]) -> Calc_[int]:
+    @reactive.calc
+    def step() -> int:
+        return prev() + 1
+
+    return step
+
+
+def make_chain(depth: int) -> tuple[reactive.Value[int], list[Calc_[int]]]:
+    v = reactive.Value(0)
+    calcs: list[Calc_[int]] = []
+    prev: Callable[[], int] = v
+    for _ in range(depth):
+        prev = make_step(prev)
+        calcs.append(prev)
+    return v, calcs
+
+
+def make_fan_out(width: int) -> tuple[reactive.Value[int], list[Calc_[int]]]:
+    v = reactive.Value(0)
+
+    @reactive.calc
+    def base() -> int:
+        return v()
+
+    leaves = [make_step(base) for _ in range(width)]
+
+    @reactive.calc
+    def total() -> int:
+        return sum(leaf() for leaf in leaves)
+
+    return v, [base, *leaves, total]
+
+
+def use_coroutine_path(calcs: list[Calc_[int]]) -> None:
+    # The sync path is only taken by calcs that have a sync function
+    for c in calcs:
+        c._sync_fn = None
+
+
+def time_reads(
+    v: reactive.Value[int], calcs: list[Calc_[int]], n_reads: int, repeat: int
+) -> tuple[float, float]:
+    """Return the seconds per calc read, when recomputing and when up to date."""
+    top = calcs[-1]
+
+    def recompute() -> float:
+        with reactive.isolate():
+            v.set(v() + 1)
+        # Invalidates every calc, but doesn't read them
+        asyncio.run(reactive.flush())
+        start = time.perf_counter()
+        with reactive.isolate():
+            top()
+        return time.perf_counter() - start
+
+    def up_to_date() -> None:
+        with reactive.isolate():
+            for _ in range(n_reads):
+                top()
+
+    recompute_secs = min(recompute() for _ in range(repeat))
+    # Each up-to-date read of the top calc is a single read
+    current_secs = min(timeit.repeat(up_to_date, number=1, repeat=repeat))
+    return recompute_secs / len(calcs), current_secs / n_reads
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=100)
+    parser.add_argument("--width", type=int, default=2000)
+    parser.add_argument("--reads", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    for name, make, size in (
+        ("chain", make_chain, args.depth),
+        ("fan-out", make_fan_out, args.width),
+    ):
+        results: dict[str, tuple[float, float]] = {}
+        for label in ("coroutine", "sync"):
+            v, calcs = make(size)
+            if label == "coroutine":
+                use_coroutine_path(calcs)
+            results[label] = time_reads(v, calcs, args.reads, args.repeat)
+            recompute, current = results[label]
+            print(
+                f"{name:>8} {label:>9}: {recompute * 1e6:6.2f} us/read recomputing,"
+                f" {current * 1e6:6.2f} us/read up to date"
+            )
+        (old_recompute, old_current), (new_recompute, new_current) = (
+            results["coroutine"],
+            results["sync"],
+        )
+        print(
+            f"{name:>8} {'speedup':>9}: {old_recompute / new_recompute:6.2f}x"
+            f" recomputing, {old_current / new_current:6.2f}x up to date"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Data frame serialization.
+
+Compares the previous by-row serialization (`DataFrame.rows()` encoded by `orjson`)
+against the column-at-a-time serializer, for a mostly numeric frame. Prints the time
+taken and the size of the encoded data.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import Callable
+
+import numpy as np
+import orjson
+
+from shiny.render._data_frame_utils._tbl_data import as_data_frame, serialize_frame_data
+
+
+def make_frame(backend: str, n_rows: int, n_cols: int):
+    rng = np.random.default_rng(0)
+    data: dict[str, object] = {}
+    for i in range(n_cols):
+        if i % 10 == 9:
+            data[f"str{i}"] = [f"label {j % 100}" for j in range(n_rows)]
+        elif i % 2 == 0:
+            data[f"int{i}"] = rng.integers(0, 1_000_000, n_rows)
+        else:
+            data[f"float{i}"] = rng.random(n_rows)
+
+    if backend == "polars":
+        import polars as pl
+
+        return as_data_frame(pl.DataFrame(data))
+
+    import pandas as pd
+
+    return as_data_frame(pd.DataFrame(data))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--cols", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    def report(
+        label: str, fn: Callable[[], str | bytes], baseline: float | None
+    ) -> float:
+        secs = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        nbytes = len(fn())
+        baseline = baseline or secs
+        print(
+            f"{label:>24}: {secs * 1000:8.1f} ms  ({baseline / secs:5.1f}x)"
+            f"  {nbytes / 1e6:8.1f} MB"
+        )
+        return baseline
+
+    for backend in ("pandas", "polars"):
+        df = make_frame(backend, args.rows, args.cols)
+        print(f"\n{backend}: {args.rows} rows x {args.cols} columns")
+
+        baseline = report(
+            "DataFrame.rows()",
+            lambda df=df: orjson.dumps(df.rows(named=False), default=str),
+            None,
+        )
+        report(
+            "serialize_frame_data()",
+            lambda df=df: serialize_frame_data(df)[0].json,
+            baseline,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Bytes transferred to load the HTML dependencies of a default `page_sidebar()` app.
+
+Requests the app's page, and then every stylesheet and script that it links to under
+the app's `lib/` prefix, the way a browser would: first as an uncompressed response
+(the way they were served before), then with ``Accept-Encoding: gzip``, and with
+``br`` (if the `brotli` package is installed). Compressed copies are made on the first
+request for each file, so the files are requested once before measuring. Also reports
+how many requests a repeat visit makes: by default, every file is revalidated (and gets
+a 304), except for Shiny's own files, which are cached as immutable.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import re
+import tempfile
+from typing import Any
+
+from shiny import App
+from shiny import _dependency_files as dependency_files
+from shiny import ui
+
+
+async def get(app: App, path: str, **headers: str) -> tuple[int, dict[str, str], bytes]:
+    """Return the status, headers, and body of a response."""
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(k.encode(), v.encode()) for k, v in headers.items()],
+    }
+    status = 0
+    response_headers: dict[str, str] = {}
+    body: list[bytes] = []
+
+    async def receive() -> dict[str, Any]:
+        await asyncio.Event().wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            response_headers.update(
+                (k.decode().lower(), v.decode()) for k, v in message["headers"]
+            )
+        else:
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)  # pyright: ignore[reportArgumentType]
+    return status, response_headers, b"".join(body)
+
+
+async def dependency_paths(app: App) -> list[str]:
+    _, _, page = await get(app, "/")
+    hrefs = re.findall(r'(?:href|src)="(lib/[^"]+)"', page.decode())
+    return sorted(set("/" + href for href in hrefs))
+
+
+async def transferred(app: App, paths: list[str], accept_encoding: str) -> int:
+    total = 0
+    for path in paths:
+        _, _, body = await get(app, path, **{"accept-encoding": accept_encoding})
+        total += len(body)
+    return total
+
+
+async def wait_for_compression(app: App) -> None:
+    routes = [getattr(route, "app", None) for route in app._dependency_handler.routes]
+    files = [r for r in routes if isinstance(r, dependency_files.DependencyFiles)]
+    while any(asset.pending for f in files for asset in f._assets.values()):
+        await asyncio.sleep(0.01)
+
+
+async def run() -> None:
+    app = App(ui.page_sidebar(ui.sidebar("Sidebar"), "Main"), None)
+    paths = await dependency_paths(app)
+    print(f"{len(paths)} dependency files linked from the page")
+
+    encodings = ["identity", "gzip"]
+    if dependency_files._ENCODINGS["br"][1] is not None:
+        encodings.append("br")
+    # Make the compressed copies
+    for encoding in encodings:
+        await transferred(app, paths, encoding)
+        await wait_for_compression(app)
+
+    identity = 0
+    for encoding in encodings:
+        total = await transferred(app, paths, encoding)
+        identity = identity or total
+        print(
+            f"  {encoding:>8}: {total / 1024:9.1f} KiB"
+            f" ({total / identity:6.1%} of uncompressed)"
+        )
+
+    # A repeat visit: immutable files aren't requested, and the rest are revalidated
+    n_immutable = n_revalidated = 0
+    for path in paths:
+        _, headers, _ = await get(app, path, **{"accept-encoding": "gzip"})
+        if "immutable" in headers["cache-control"]:
+            n_immutable += 1
+            continue
+        status, _, _ = await get(
+            app, path, **{"accept-encoding": "gzip", "if-none-match": headers["etag"]}
+        )
+        n_revalidated += status == 304
+    print("Repeat visit:")
+    print(
+        f"  {n_revalidated} requests (all 304), {n_immutable} immutable files skipped"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.parse_args()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # Don't use (or fill) the real cache
+        dependency_files.default_cache_dir = lambda: cache_dir
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
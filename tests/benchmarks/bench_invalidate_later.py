@@ -0,0 +1,126 @@
+"""
+Timers from `reactive.invalidate_later()` with many sessions.
+
+Each session has a few effects that re-run on a timer (like `reactive.poll()` does).
+Compares the previous implementation, which started an asyncio task (and registered an
+`on_ended` callback) for every call and flushed once per timer, against the shared
+timer scheduler, which fires every timer that is due with one flush. Prints the CPU
+time spent per thousand timer firings.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Callable, Optional
+
+from shiny import App, Inputs, Outputs, Session, reactive, ui
+from shiny._connection import MockConnection
+from shiny.reactive._core import (
+    Context,
+    _reactive_environment,
+    get_current_context,
+    session_domain,
+)
+from shiny.session import get_current_session
+
+TimerFn = Callable[[float], None]
+
+
+def previous_invalidate_later(delay: float) -> None:
+    session = get_current_session()
+    ctx = get_current_context()
+    domain = session_domain(session)
+    deadline = time.monotonic() + delay
+    cancellable = True
+    unsub: Optional[Callable[[], None]] = None
+
+    async def _task(ctx: Context, deadline: float) -> None:
+        nonlocal cancellable
+        try:
+            try:
+                await asyncio.sleep(deadline - time.monotonic())
+            except asyncio.CancelledError:
+                return
+            async with domain.lock:
+                cancellable = False
+                ctx.invalidate()
+                await _reactive_environment.flush(domain=domain)
+        finally:
+            if unsub:
+                unsub()
+
+    task = asyncio.create_task(_task(ctx, deadline))
+
+    def cancel_task():
+        if cancellable and not task.cancelled():
+            task.cancel()
+
+    ctx.on_invalidate(cancel_task)
+    if session:
+        unsub = session.on_ended(cancel_task)
+
+
+def make_app(timer: TimerFn, n_timers: int, interval: float, runs: list[int]) -> App:
+    def server(input: Inputs, output: Outputs, session: Session):
+        for _i in range(n_timers):
+
+            @reactive.effect
+            def _():
+                timer(interval)
+                runs[0] += 1
+
+    return App(ui.TagList(), server)
+
+
+async def run(timer: TimerFn, n_sessions: int, n_timers: int, secs: float) -> float:
+    runs = [0]
+    app = make_app(timer, n_timers, interval=0.05, runs=runs)
+    conns: list[MockConnection] = []
+    tasks: list[asyncio.Task[None]] = []
+    for _ in range(n_sessions):
+        conn = MockConnection()
+
+        async def send(message: str) -> None:
+            pass
+
+        conn.send = send
+        session = app._create_session(conn)
+        conn.cause_receive(json.dumps({"method": "init", "data": {}}))
+        conns.append(conn)
+        tasks.append(asyncio.create_task(session._run()))
+
+    await asyncio.sleep(0.2)
+    start_runs = runs[0]
+    start = time.process_time()
+    await asyncio.sleep(secs)
+    cpu = time.process_time() - start
+    n_fired = runs[0] - start_runs
+
+    for conn in conns:
+        conn.cause_disconnect()
+    await asyncio.gather(*tasks)
+    return cpu / n_fired * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--timers", type=int, default=3)
+    parser.add_argument("--secs", type=float, default=3)
+    args = parser.parse_args()
+
+    results: dict[str, float] = {}
+    for label, timer in (
+        ("per-call task", previous_invalidate_later),
+        ("shared", reactive.invalidate_later),
+    ):
+        results[label] = asyncio.run(run(timer, args.sessions, args.timers, args.secs))
+        print(f"{label:>14}: {results[label] * 1000:7.2f} ms CPU per 1000 timers")
+    print(f"{'speedup':>14}: {results['per-call task'] / results['shared']:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
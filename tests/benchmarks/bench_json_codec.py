@@ -0,0 +1,76 @@
+"""
+Websocket message encoding and decoding.
+
+Compares the previous stdlib `json` path (`object_hook=lists_to_tuples` on decode, and
+a data frame's rows round-tripped through `orjson.loads()` before `json.dumps()`)
+against the `orjson` codec, which converts lists in a single pass and splices the
+pre-encoded rows into the message.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+
+import orjson
+
+from shiny._json import OrjsonCodec, RawJSON, StdlibJSONCodec
+from shiny._utils import lists_to_tuples
+
+
+def make_update_message(n_inputs: int) -> str:
+    data: dict[str, object] = {}
+    for i in range(n_inputs):
+        data[f"num{i}"] = i
+        data[f"select{i}"] = [f"choice{j}" for j in range(5)]
+        data[f"range{i}"] = [i, i + 10]
+        data[f".clientdata_output_out{i}_hidden"] = False
+    return json.dumps({"method": "update", "data": data})
+
+
+def make_rows(n_rows: int) -> list[list[object]]:
+    return [[i, f"name {i}", i * 0.5, i % 2 == 0, None] for i in range(n_rows)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--inputs", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    def report(label: str, fn: object, baseline: float | None) -> float:
+        secs = min(timeit.repeat(fn, number=1, repeat=args.repeat))  # type: ignore
+        baseline = baseline or secs
+        print(f"{label:>32}: {secs * 1000:8.2f} ms  ({baseline / secs:5.1f}x)")
+        return baseline
+
+    update = make_update_message(args.inputs)
+    print(f"Decoding an update message with {args.inputs * 4} inputs")
+    baseline = report(
+        "json.loads(object_hook=...)",
+        lambda: json.loads(update, object_hook=lists_to_tuples),
+        None,
+    )
+    report("StdlibJSONCodec.loads", lambda: StdlibJSONCodec().loads(update), baseline)
+    report("OrjsonCodec.loads", lambda: OrjsonCodec().loads(update), baseline)
+
+    rows = make_rows(args.rows)
+    print(f"\nEncoding a flush with a {args.rows}-row data frame")
+
+    def previous() -> str:
+        data = orjson.loads(orjson.dumps(rows))
+        return json.dumps({"values": {"df": {"data": data}}, "errors": {}})
+
+    def spliced(codec: StdlibJSONCodec | OrjsonCodec) -> str:
+        data = RawJSON(orjson.dumps(rows))
+        return codec.dumps({"values": {"df": {"data": data}}, "errors": {}})
+
+    baseline = report("orjson round trip + json.dumps", previous, None)
+    report("StdlibJSONCodec + RawJSON", lambda: spliced(StdlibJSONCodec()), baseline)
+    report("OrjsonCodec + RawJSON", lambda: spliced(OrjsonCodec()), baseline)
+
+
+if __name__ == "__main__":
+    main()
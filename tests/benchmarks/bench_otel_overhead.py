@@ -0,0 +1,155 @@
+"""
+Cost of Shiny's OpenTelemetry instrumentation at session start and on each flush.
+
+Each session's server function creates reactive values, calcs, effects, and outputs,
+all of which have spans (and, for values, names inferred from the source). Times
+starting sessions, and then updating an input and flushing, first with OpenTelemetry
+off (no SDK `TracerProvider`, as in most deployments), and then with an SDK
+`TracerProvider` recording every span. The span names and source attributes are only
+computed once tracing is on, so being off should cost close to nothing: the script
+fails if it's not faster than being on.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any
+
+from shiny import App, Inputs, Outputs, Session, reactive, render, ui
+from shiny._connection import MockConnection
+
+
+def make_app(n: int) -> App:
+    def server(input: Inputs, output: Outputs, session: Session):
+        def add_objects(i: int) -> None:
+            counter = reactive.value(0)
+
+            @reactive.calc
+            def doubled() -> int:
+                return input.x() * 2
+
+            @reactive.effect
+            def _():
+                counter.set(doubled())
+
+            @output(id=f"out{i}")
+            @render.text
+            def _() -> str:
+                return str(doubled() + counter())
+
+        for i in range(n):
+            add_objects(i)
+
+    return App(ui.TagList(), server)
+
+
+class Client:
+    """A session on a mock connection, and the output values sent to it."""
+
+    def __init__(self, app: App, n: int) -> None:
+        self.n = n
+        self.conn = MockConnection()
+        self.values: dict[str, Any] = {}
+        self.conn.send = self._send
+        self.session = app._create_session(self.conn)
+        self.task: asyncio.Task[None] | None = None
+
+    async def _send(self, message: str) -> None:
+        self.values.update(json.loads(message).get("values", {}))
+
+    async def wait_for(self, x: int) -> None:
+        expected = str(x * 4)
+        while len(self.values) < self.n or any(
+            v != expected for v in self.values.values()
+        ):
+            await asyncio.sleep(0)
+
+    async def start(self) -> None:
+        data = {
+            "x": 0,
+            **{f".clientdata_output_out{i}_hidden": False for i in range(self.n)},
+        }
+        self.conn.cause_receive(json.dumps({"method": "init", "data": data}))
+        self.task = asyncio.create_task(self.session._run())
+        await self.wait_for(0)
+
+    async def update(self, x: int) -> None:
+        self.conn.cause_receive(json.dumps({"method": "update", "data": {"x": x}}))
+        await self.wait_for(x)
+
+    async def stop(self) -> None:
+        self.conn.cause_disconnect()
+        assert self.task is not None
+        await self.task
+
+
+async def run(n_sessions: int, n_objects: int, n_updates: int) -> tuple[float, float]:
+    """Return the seconds per session start and per update."""
+    app = make_app(n_objects)
+    clients = [Client(app, n_objects) for _ in range(n_sessions)]
+
+    start = time.perf_counter()
+    for client in clients:
+        await client.start()
+    start_secs = (time.perf_counter() - start) / n_sessions
+
+    start = time.perf_counter()
+    for x in range(1, n_updates + 1):
+        for client in clients:
+            await client.update(x)
+    update_secs = (time.perf_counter() - start) / (n_updates * n_sessions)
+
+    for client in clients:
+        await client.stop()
+    return start_secs, update_secs
+
+
+def enable_tracing() -> None:
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(InMemorySpanExporter()))
+    trace.set_tracer_provider(provider)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--objects", type=int, default=50)
+    parser.add_argument("--updates", type=int, default=10)
+    args = parser.parse_args()
+
+    from shiny.otel._core import is_otel_tracing_enabled
+
+    results: dict[str, tuple[float, float]] = {}
+    # The TracerProvider can only be set once, so "off" has to run first
+    for label in ("off", "on"):
+        if label == "on":
+            enable_tracing()
+        assert is_otel_tracing_enabled() == (label == "on")
+        results[label] = asyncio.run(run(args.sessions, args.objects, args.updates))
+        start_secs, update_secs = results[label]
+        print(
+            f"OTel {label:>3}: {start_secs * 1000:7.2f} ms per session start,"
+            f" {update_secs * 1000:7.2f} ms per update and flush"
+        )
+
+    (off_start, off_update), (on_start, on_update) = results["off"], results["on"]
+    print(
+        f"  on / off: {on_start / off_start:7.2f}x session start,"
+        f" {on_update / off_update:7.2f}x update and flush"
+    )
+    assert off_start < on_start, "Session start is no faster with OpenTelemetry off"
+    assert off_update < on_update, "Flushing is no faster with OpenTelemetry off"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Event loop latency while plots render.
+
+Renders several matplotlib figures concurrently, inline on the event loop and in a
+thread or process pool (`@render.plot(executor=...)`), while a heartbeat task measures
+how late the event loop wakes it up. With inline rendering, every other session in
+the process waits for each figure to be rasterized.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+import numpy as np
+from matplotlib.figure import Figure
+
+from shiny.render._try_render_plot import (
+    PlotExecutor,
+    PlotSizeInfo,
+    render_plot_in_executor,
+    resolve_plot_executor,
+    try_render_plot,
+)
+
+
+def make_figure(n_points: int) -> Figure:
+    rng = np.random.default_rng(0)
+    fig = Figure()
+    ax = fig.subplots()
+    ax.scatter(  # pyright: ignore[reportUnknownMemberType]
+        rng.random(n_points), rng.random(n_points), s=2, alpha=0.3
+    )
+    return fig
+
+
+async def render(executor: PlotExecutor, n_points: int) -> None:
+    fig = make_figure(n_points)
+    size = PlotSizeInfo(
+        container_size_px_fn=(lambda: 800, lambda: 600),
+        user_specified_size_px=(None, None),
+        pixelratio=2,
+    )
+    resolved = resolve_plot_executor(executor)
+    if resolved is None:
+        ok, _ = try_render_plot(fig, plot_size_info=size, allow_global=False, alt=None)
+    else:
+        ok, _ = await render_plot_in_executor(
+            fig, resolved, plot_size_info=size, allow_global=False, alt=None
+        )
+    assert ok
+
+
+async def measure(executor: PlotExecutor, n_plots: int, n_points: int):
+    interval = 0.005
+    lags: list[float] = []
+    done = False
+
+    async def heartbeat() -> None:
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            lags.append(time.perf_counter() - start - interval)
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0.05)
+    start = time.perf_counter()
+    await asyncio.gather(*(render(executor, n_points) for _ in range(n_plots)))
+    elapsed = time.perf_counter() - start
+    done = True
+    await beat
+    return elapsed, max(lags), float(np.percentile(lags, 99))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--plots", type=int, default=8)
+    parser.add_argument("--points", type=int, default=50_000)
+    args = parser.parse_args()
+
+    print(f"Rendering {args.plots} plots of {args.points} points concurrently")
+    for executor in ("inline", "thread", "process"):
+        # Warm up the pool (and imports in the worker processes)
+        asyncio.run(measure(executor, 2, 10))
+        elapsed, max_lag, p99_lag = asyncio.run(
+            measure(executor, args.plots, args.points)
+        )
+        print(
+            f"{executor:>8}: {elapsed * 1000:8.0f} ms total, event loop lag "
+            f"max {max_lag * 1000:6.1f} ms, p99 {p99_lag * 1000:6.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
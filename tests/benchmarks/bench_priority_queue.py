@@ -0,0 +1,70 @@
+"""
+Pending-flush queue throughput.
+
+Compares the heap-backed `PriorityQueueFIFO` against the previous implementation,
+which wrapped the thread-safe `queue.PriorityQueue` (taking a `threading.Condition`
+lock on every `put`/`get`/`empty`), over flushes of many contexts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from queue import PriorityQueue
+from typing import Generic, TypeVar
+
+from shiny._datastructures import PriorityQueueFIFO
+
+T = TypeVar("T")
+
+
+class LockingPriorityQueueFIFO(Generic[T]):
+    """The previous, `queue.PriorityQueue`-backed implementation."""
+
+    def __init__(self) -> None:
+        self._pq: PriorityQueue[tuple[int, int, T]] = PriorityQueue()
+        self._counter: int = 0
+
+    def put(self, priority: int, item: T) -> None:
+        self._counter += 1
+        self._pq.put((-priority, self._counter, item))
+
+    def get(self) -> T:
+        return self._pq.get()[2]
+
+    def empty(self) -> bool:
+        return self._pq.empty()
+
+
+def flush_one_by_one(queue_cls: type, n: int) -> None:
+    # Mirrors `ReactiveDomain._flush_sequential()`.
+    q = queue_cls()
+    for i in range(n):
+        q.put(i % 3, i)
+    while not q.empty():
+        q.get()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--contexts", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    n = args.contexts
+
+    cases = {
+        "queue.PriorityQueue": lambda: flush_one_by_one(LockingPriorityQueueFIFO, n),
+        "heapq put/get": lambda: flush_one_by_one(PriorityQueueFIFO, n),
+    }
+    baseline = None
+    for label, fn in cases.items():
+        secs = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        baseline = baseline or secs
+        print(
+            f"{label:>22}: {secs * 1000:8.2f} ms per {n} contexts"
+            f"  ({baseline / secs:5.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
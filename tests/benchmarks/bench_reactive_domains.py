@@ -0,0 +1,99 @@
+"""
+Tail latency of input handling with many concurrent sessions.
+
+A fraction of the sessions run a slow async effect (e.g. a database query) on every
+update. With a single process-wide reactive domain, every other session's input
+messages queue up behind those flushes; with per-session domains they don't.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from shiny import App, Inputs, Outputs, Session, reactive, ui
+from shiny._connection import MockConnection
+from shiny.reactive._core import ReactiveDomain
+
+
+def make_app(slow_secs: float) -> App:
+    def server(input: Inputs, output: Outputs, session: Session):
+        @reactive.effect
+        async def _():
+            input.x()
+            if input.slow():
+                await asyncio.sleep(slow_secs)
+
+    return App(ui.TagList(), server)
+
+
+async def run(
+    n_sessions: int, n_updates: int, slow_frac: float, shared: bool
+) -> list[float]:
+    app = make_app(slow_secs=0.02)
+    shared_domain = ReactiveDomain("shared")
+    latencies: list[float] = []
+    tasks: list[asyncio.Task[None]] = []
+    conns: list[MockConnection] = []
+    sent_at: dict[int, float] = {}
+
+    n_slow = int(n_sessions * slow_frac)
+    for i in range(n_sessions):
+        conn = MockConnection()
+
+        async def send(message: str, i: int = i) -> None:
+            if '"values"' in message and i in sent_at:
+                latencies.append(time.perf_counter() - sent_at.pop(i))
+
+        conn.send = send
+        session = app._create_session(conn)
+        if shared:
+            # Emulate the old behavior: one lock and one queue for every session.
+            session._reactive_domain = shared_domain
+        conn.cause_receive(
+            json.dumps({"method": "init", "data": {"x": 0, "slow": i < n_slow}})
+        )
+        conns.append(conn)
+        tasks.append(asyncio.create_task(session._run()))
+
+    await asyncio.sleep(0.1)
+
+    for update in range(1, n_updates + 1):
+        for i, conn in enumerate(conns):
+            sent_at[i] = time.perf_counter()
+            conn.cause_receive(json.dumps({"method": "update", "data": {"x": update}}))
+        while sent_at:
+            await asyncio.sleep(0.001)
+
+    for conn in conns:
+        conn.cause_disconnect()
+    await asyncio.gather(*tasks)
+    return latencies
+
+
+def report(label: str, latencies: list[float]) -> None:
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(f"{label:>12}: p50 {p50 * 1000:8.2f} ms   p99 {p99 * 1000:8.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=300)
+    parser.add_argument("--updates", type=int, default=5)
+    parser.add_argument("--slow-frac", type=float, default=0.05)
+    args = parser.parse_args()
+
+    for shared in (True, False):
+        latencies = asyncio.run(
+            run(args.sessions, args.updates, args.slow_frac, shared=shared)
+        )
+        report("shared" if shared else "per-session", latencies)
+
+
+if __name__ == "__main__":
+    main()
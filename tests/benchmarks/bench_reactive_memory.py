@@ -0,0 +1,156 @@
+"""
+Memory held by each session of a representative app.
+
+Each session gets a `Value` for every input and every `.clientdata_*` key, and its
+server function creates a few calcs, effects, and outputs per input, each of which
+holds a `Context` for its current execution. Starts many sessions on mock connections,
+waits for every output to be sent, and reports the bytes allocated (and still held)
+per session, as measured by `tracemalloc`. Also reports the size of each of the core
+reactive objects on its own.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import tracemalloc
+from typing import Any, Callable
+
+from shiny import App, Inputs, Outputs, Session, reactive, render, ui
+from shiny._connection import MockConnection
+from shiny.reactive._core import Context, Dependents
+
+
+def make_app(n_inputs: int) -> App:
+    def server(input: Inputs, output: Outputs, session: Session):
+        def add_objects(i: int) -> None:
+            counter = reactive.value(0)
+
+            @reactive.calc
+            def doubled() -> int:
+                return input[f"x{i}"]() * 2
+
+            @reactive.effect
+            def _():
+                counter.set(doubled())
+
+            @output(id=f"out{i}")
+            @render.text
+            def _() -> str:
+                return str(doubled() + counter())
+
+        for i in range(n_inputs):
+            add_objects(i)
+
+    return App(ui.TagList(), server)
+
+
+class Client:
+    """A session on a mock connection, and the number of output values sent to it."""
+
+    def __init__(self, app: App, n_inputs: int) -> None:
+        self.n_inputs = n_inputs
+        self.conn = MockConnection()
+        self.outputs: set[str] = set()
+        self.conn.send = self._send
+        self.session = app._create_session(self.conn)
+        self.task: asyncio.Task[None] | None = None
+
+    async def _send(self, message: str) -> None:
+        self.outputs.update(json.loads(message).get("values", {}))
+
+    async def start(self) -> None:
+        data = {
+            **{f"x{i}": i for i in range(self.n_inputs)},
+            **{
+                f".clientdata_output_out{i}_hidden": False for i in range(self.n_inputs)
+            },
+        }
+        self.conn.cause_receive(json.dumps({"method": "init", "data": data}))
+        self.task = asyncio.create_task(self.session._run())
+        while len(self.outputs) < self.n_inputs:
+            await asyncio.sleep(0)
+
+    async def stop(self) -> None:
+        self.conn.cause_disconnect()
+        assert self.task is not None
+        await self.task
+
+
+def allocated() -> int:
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+async def bytes_per_session(n_sessions: int, n_inputs: int) -> float:
+    app = make_app(n_inputs)
+    # Start (and stop) one session first, so that one-time allocations like imports
+    # and caches aren't counted
+    warmup = Client(app, n_inputs)
+    await warmup.start()
+    await warmup.stop()
+    del warmup
+
+    before = allocated()
+    clients = [Client(app, n_inputs) for _ in range(n_sessions)]
+    for client in clients:
+        await client.start()
+    per_session = (allocated() - before) / n_sessions
+
+    for client in clients:
+        await client.stop()
+    return per_session
+
+
+def bytes_per_object(make: Callable[[], Any], n: int = 10_000) -> float:
+    before = allocated()
+    objects = [make() for _ in range(n)]
+    size = allocated() - before
+    del objects
+    return size / n
+
+
+def make_calc() -> reactive.Calc_[int]:
+    @reactive.calc
+    def calc() -> int:
+        return 1
+
+    return calc
+
+
+def make_effect() -> reactive.Effect_:
+    @reactive.effect
+    def effect() -> None:
+        pass
+
+    return effect
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--inputs", type=int, default=500)
+    args = parser.parse_args()
+
+    tracemalloc.start()
+
+    per_session = asyncio.run(bytes_per_session(args.sessions, args.inputs))
+    print(f"{args.inputs} inputs, each with a calc, an effect, a value, and an output:")
+    print(f"  {per_session / 1024:9.1f} KiB per session")
+    print(f"  {per_session / args.inputs:9.1f} bytes per input")
+
+    print("Size of each object (including what it allocates when it's created):")
+    for name, make in (
+        ("Context", Context),
+        ("Dependents", Dependents),
+        ("Value", lambda: reactive.Value(0)),
+        ("Calc_", make_calc),
+        ("Effect_", make_effect),
+    ):
+        print(f"  {name:>10}: {bytes_per_object(make):7.1f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Server-side selectize search.
+
+Compares the previous per-request scan of the choices (lower-casing every label and
+testing each search term in Python) against the prebuilt search index, for queries
+that match many, few, and no choices. Both stop after `maxOptions` matches.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import timeit
+
+from shiny.ui._selectize_index import FlatSelectChoice, SelectizeSearchIndex
+
+
+def previous_search(
+    flat_choices: list[FlatSelectChoice], query: str, max_options: int
+) -> list[FlatSelectChoice]:
+    keywords = set(re.split(r"\s+", query.lower()))
+    filtered: list[FlatSelectChoice] = []
+    for choice in flat_choices:
+        if len(filtered) > max_options:
+            break
+        if all([x in choice["label"].lower() for x in keywords]):
+            filtered.append(choice)
+    return filtered
+
+
+def index_search(
+    index: SelectizeSearchIndex, query: str, max_options: int
+) -> list[FlatSelectChoice]:
+    keywords = set(re.split(r"\s+", query.lower()))
+    filtered: list[FlatSelectChoice] = []
+    for i in index.search(keywords):
+        filtered.append(index.choices[i])
+        if len(filtered) > max_options:
+            break
+    return filtered
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--choices", type=int, default=400_000)
+    parser.add_argument("--max-options", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    choices = {
+        f"sku-{i:07d}": f"Widget {i % 977} size {i % 13} SKU{i:07d}"
+        for i in range(args.choices)
+    }
+
+    def build() -> SelectizeSearchIndex:
+        index = SelectizeSearchIndex(choices)
+        index.search({"x"})  # The label index is built on the first search
+        return index
+
+    secs = min(timeit.repeat(build, number=1, repeat=3))
+    index = build()
+    print(
+        f"{args.choices} choices; building the index (once, for all sessions): "
+        f"{secs * 1000:.1f} ms\n"
+    )
+
+    for query in ("widget", "widget 97", "sku0399", "no such thing"):
+        expected = previous_search(index.choices, query, args.max_options)
+        assert index_search(index, query, args.max_options) == expected
+        before = min(
+            timeit.repeat(
+                lambda query=query: previous_search(
+                    index.choices, query, args.max_options
+                ),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        after = min(
+            timeit.repeat(
+                lambda query=query: index_search(index, query, args.max_options),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        print(
+            f"{query!r:>16} ({len(expected):>4} matches): "
+            f"{before * 1000:8.2f} ms -> {after * 1000:7.2f} ms"
+            f"  ({before / after:6.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
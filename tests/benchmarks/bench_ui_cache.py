@@ -0,0 +1,106 @@
+"""
+Time to serve the page of an app whose `ui` is a function, with and without a page cache.
+
+The UI is a `page_sidebar()` with a few dozen inputs, cards, and value boxes, which is
+rendered (including resolving its HTML dependencies) for every request unless
+`App.ui_cache_key` is set. Times requests for the page from a handful of user groups,
+first with no cache, then with a cache keyed on the group, and then with repeat
+visitors sending the ETag they got (for a 304 response).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+from starlette.requests import Request
+
+from shiny import App, ui
+
+
+def app_ui(request: Request):
+    group = request.headers.get("x-group", "none")
+    return ui.page_sidebar(
+        ui.sidebar(
+            *[
+                ui.input_select(f"sel{i}", f"Select {i}", ["a", "b", "c"])
+                for i in range(10)
+            ],
+            *[ui.input_slider(f"sl{i}", f"Slider {i}", 0, 100, 50) for i in range(10)],
+        ),
+        ui.layout_columns(
+            *[ui.value_box(f"Metric {i}", f"{i * 100}") for i in range(4)],
+        ),
+        *[
+            ui.card(ui.card_header(f"Card {i} for {group}"), ui.output_plot(f"plot{i}"))
+            for i in range(10)
+        ],
+        title="Dashboard",
+    )
+
+
+async def get(app: App, **headers: str) -> tuple[int, dict[str, str]]:
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(k.encode(), v.encode()) for k, v in headers.items()],
+    }
+    status = 0
+    response_headers: dict[str, str] = {}
+
+    async def receive() -> dict[str, Any]:
+        await asyncio.Event().wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            response_headers.update(
+                (k.decode(), v.decode()) for k, v in message["headers"]
+            )
+
+    await app(scope, receive, send)  # pyright: ignore[reportArgumentType]
+    return status, response_headers
+
+
+async def ms_per_request(
+    app: App, n_requests: int, n_groups: int, revalidate: bool
+) -> float:
+    etags: dict[str, str] = {}
+    start = time.perf_counter()
+    for i in range(n_requests):
+        headers = {"x-group": str(i % n_groups)}
+        if revalidate and headers["x-group"] in etags:
+            headers["if-none-match"] = etags[headers["x-group"]]
+        _, response_headers = await get(app, **headers)
+        if "etag" in response_headers:
+            etags[headers["x-group"]] = response_headers["etag"]
+    return (time.perf_counter() - start) / n_requests * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--groups", type=int, default=5)
+    args = parser.parse_args()
+
+    for label, cached, revalidate in (
+        ("no cache", False, False),
+        ("cache", True, False),
+        ("cache+304", True, True),
+    ):
+        app = App(app_ui, None)
+        if cached:
+            app.ui_cache_key = lambda request: request.headers.get("x-group")
+        ms = asyncio.run(ms_per_request(app, args.requests, args.groups, revalidate))
+        print(f"{label:>10}: {ms:7.2f} ms per page request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Throughput of file uploads, and how much they delay the rest of the event loop.
+
+Feeds a large file to a session's upload operation in request-sized chunks (yielding to
+the event loop between chunks, as a real request body does), while a ticker task
+measures how late its timer callbacks run. Compares the previous implementation, which
+wrote each chunk to the file on the event loop, against the current one, which writes
+(and optionally hashes) in a worker thread. Prints the upload throughput and the worst
+event-loop lag seen by the ticker.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from typing import Awaitable, Callable, Optional
+
+from shiny._fileupload import FileUploadManager, UploadHash
+
+UploadFn = Callable[[list[bytes]], Awaitable[None]]
+
+
+async def previous_upload(chunks: list[bytes]) -> None:
+    with tempfile.TemporaryDirectory() as dir:
+        with open(os.path.join(dir, "0.bin"), "ab") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                await asyncio.sleep(0)
+
+
+def current_upload(hash: Optional[UploadHash]) -> UploadFn:
+    async def upload(chunks: list[bytes]) -> None:
+        manager = FileUploadManager(hash=hash)
+        size = sum(len(chunk) for chunk in chunks)
+        job_id = manager.create_upload_operation(
+            [{"name": "0.bin", "size": size, "type": "", "datapath": ""}]
+        )
+        upload_op = manager.get_upload_operation(job_id)
+        assert upload_op is not None
+        async with upload_op:
+            for chunk in chunks:
+                await upload_op.write_chunk(chunk)
+                await asyncio.sleep(0)
+        upload_op.finish()
+        await manager.rm_upload_dir()
+
+    return upload
+
+
+async def ticker(interval: float, lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def run(upload: UploadFn, chunks: list[bytes]) -> tuple[float, float]:
+    """Return the seconds to upload, and the worst event loop lag."""
+    lags: list[float] = []
+    stop = asyncio.Event()
+    tick = asyncio.create_task(ticker(0.001, lags, stop))
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await upload(chunks)
+    secs = time.perf_counter() - start
+    stop.set()
+    await tick
+    return secs, max(lags)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mb", type=int, default=512, help="Size of the upload")
+    parser.add_argument("--chunk-kb", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    chunk = os.urandom(args.chunk_kb * 1024)
+    chunks = [chunk] * (args.mb * 1024 // args.chunk_kb)
+
+    for label, upload in (
+        ("previous", previous_upload),
+        ("thread", current_upload(None)),
+        ("thread+sha256", current_upload("sha256")),
+        ("thread+crc32", current_upload("crc32")),
+    ):
+        results = [asyncio.run(run(upload, chunks)) for _ in range(args.repeat)]
+        secs = min(secs for secs, _ in results)
+        lag = max(lag for _, lag in results)
+        print(
+            f"{label:>14}: {args.mb / secs:7.1f} MB/s,"
+            f" worst event loop lag {lag * 1000:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
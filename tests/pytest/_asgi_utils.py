@@ -0,0 +1,63 @@
+"""Helpers for calling ASGI apps (and responses) directly in tests."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from starlette.types import ASGIApp, Scope
+
+
+class Result:
+    """The status, headers, and body that an ASGI app responded with."""
+
+    def __init__(self, status: int, headers: dict[str, str], body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    @property
+    def text(self) -> str:
+        return self.body.decode()
+
+
+def http_scope(path: str = "/", query: str = "", **headers: str) -> dict[str, Any]:
+    """
+    The scope of a GET request. Header names are given with `_` in place of `-`
+    (e.g. `if_none_match="..."`).
+    """
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [
+            (k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()
+        ],
+    }
+
+
+async def call_asgi(app: ASGIApp, scope: Scope) -> Result:
+    """Call `app` with `scope`, from a client that never disconnects."""
+    messages: list[dict[str, Any]] = []
+
+    async def receive() -> dict[str, Any]:
+        await asyncio.Event().wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        messages.append(message)
+
+    await app(scope, receive, send)  # pyright: ignore[reportArgumentType]
+    start = messages[0]
+    return Result(
+        start["status"],
+        {k.decode(): v.decode() for k, v in start["headers"]},
+        b"".join(m.get("body", b"") for m in messages[1:]),
+    )
+
+
+async def get(app: ASGIApp, path: str = "/", query: str = "", **headers: str) -> Result:
+    """Make a GET request of `app`."""
+    return await call_asgi(app, http_scope(path, query, **headers))
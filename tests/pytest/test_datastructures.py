@@ -17,3 +17,19 @@ def test_priority_queue_fifo():
     assert q.get() == "7"
     assert q.get() == "9"
     assert q.get() == "8"
+
+
+def test_priority_queue_fifo_get_same_priority():
+    q: PriorityQueueFIFO[str] = PriorityQueueFIFO()
+
+    q.put(0, "c")
+    q.put(1, "b1")
+    q.put(2, "a")
+    q.put(1, "b2")
+    assert len(q) == 4
+
+    assert q.get_same_priority() == ["a"]
+    assert q.get_same_priority() == ["b1", "b2"]
+    assert q.get_same_priority() == ["c"]
+    assert q.empty()
+    assert q.get_same_priority() == []
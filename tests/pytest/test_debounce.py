@@ -0,0 +1,173 @@
+"""Tests for reactive.debounce() and reactive.throttle()."""
+
+import pytest
+
+from shiny import reactive
+from shiny.reactive import Value, calc, debounce, effect, flush, isolate, throttle
+
+from .mocktime import MockTime
+
+
+@pytest.mark.asyncio
+async def test_debounce():
+    mock_time = MockTime()
+    with mock_time():
+        n = Value(0)
+        source_runs = 0
+
+        @debounce(1)
+        def debounced() -> int:
+            nonlocal source_runs
+            source_runs += 1
+            return n()
+
+        seen: list[int] = []
+
+        @effect()
+        def _():
+            seen.append(debounced())
+
+        await flush()
+        assert seen == [0]
+
+        # Each change restarts the delay
+        for i in range(1, 5):
+            n.set(i)
+            await flush()
+            await mock_time.advance_time(0.5)
+        assert seen == [0]
+
+        await mock_time.advance_time(0.6)
+        assert seen == [0, 4]
+        # The source ran once for each change, and its result was reused
+        assert source_runs == 5
+
+        # Nothing more happens until the next change
+        await mock_time.advance_time(10)
+        assert seen == [0, 4]
+
+        n.set(5)
+        await flush()
+        await mock_time.advance_time(1)
+        assert seen == [0, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_debounce_calc_and_error():
+    mock_time = MockTime()
+    with mock_time():
+        n = Value(0)
+
+        @debounce(1)
+        @calc
+        def debounced() -> int:
+            if n() < 0:
+                raise ValueError("negative")
+            return n()
+
+        with isolate():
+            assert debounced() == 0
+
+        n.set(-1)
+        await flush()
+        with isolate():
+            assert debounced() == 0
+
+        await mock_time.advance_time(1)
+        with isolate():
+            with pytest.raises(ValueError, match="negative"):
+                debounced()
+
+
+@pytest.mark.asyncio
+async def test_debounce_async():
+    mock_time = MockTime()
+    with mock_time():
+        n = Value(0)
+
+        @debounce(1)
+        async def debounced() -> int:
+            return n()
+
+        seen: list[int] = []
+
+        @effect()
+        async def _():
+            seen.append(await debounced())
+
+        await flush()
+        n.set(1)
+        await flush()
+        assert seen == [0]
+        await mock_time.advance_time(1)
+        assert seen == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_throttle():
+    mock_time = MockTime()
+    with mock_time():
+        n = Value(0)
+
+        @throttle(1)
+        def throttled() -> int:
+            return n()
+
+        seen: list[int] = []
+
+        @effect()
+        def _():
+            seen.append(throttled())
+
+        await flush()
+        assert seen == [0]
+
+        # A change after a quiet period goes through at once
+        await mock_time.advance_time(2)
+        n.set(1)
+        await flush()
+        assert seen == [0, 1]
+
+        # Changes during the blackout are held until it ends, and then only the latest
+        # is seen
+        for i in range(2, 6):
+            await mock_time.advance_time(0.2)
+            n.set(i)
+            await flush()
+        assert seen == [0, 1]
+        await mock_time.advance_time(0.2)
+        assert seen == [0, 1, 5]
+
+        # A value that keeps changing still updates once a period
+        for i in range(6, 16):
+            n.set(i)
+            await flush()
+            await mock_time.advance_time(0.25)
+        assert seen == [0, 1, 5, 9, 13]
+        await mock_time.advance_time(0.5)
+        assert seen == [0, 1, 5, 9, 13, 15]
+
+
+@pytest.mark.asyncio
+async def test_debounce_timer_stops():
+    # Once the delay has passed, the timer isn't rescheduled
+    mock_time = MockTime()
+    with mock_time():
+        n = Value(0)
+        runs = 0
+
+        @reactive.debounce(0.5)
+        def debounced() -> int:
+            return n()
+
+        @effect()
+        def _():
+            nonlocal runs
+            runs += 1
+            debounced()
+
+        await flush()
+        n.set(1)
+        await flush()
+        await mock_time.advance_time(100)
+        assert runs == 2
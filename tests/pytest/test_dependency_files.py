@@ -0,0 +1,201 @@
+"""Tests for `shiny._dependency_files`."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import os
+import re
+from pathlib import Path
+
+import pytest
+from htmltools import HTMLDependency
+
+from shiny import App, __version__, ui
+from shiny._dependency_files import DependencyFiles, accepted_encodings, is_immutable
+
+from ._asgi_utils import get
+
+JS = b"window.x = " + b"[" + b"1, 2, 3, " * 1000 + b"];\n"
+
+
+def make_files(tmp_path: Path) -> tuple[DependencyFiles, App]:
+    www = tmp_path / "www"
+    www.mkdir()
+    (www / "app.js").write_bytes(JS)
+    (www / "tiny.css").write_bytes(b"body { margin: 0; }")
+    (www / "image.png").write_bytes(os.urandom(4096))
+    app = App(ui.TagList(), None)
+    files = DependencyFiles(directory=www, app=app, cache_dir=str(tmp_path / "cache"))
+    return files, app
+
+
+async def wait_for_compression(files: DependencyFiles) -> None:
+    while any(asset.pending for asset in files._assets.values()):
+        await asyncio.sleep(0.01)
+
+
+def test_accepted_encodings():
+    assert accepted_encodings("") == set()
+    assert accepted_encodings("gzip, deflate, br") == {"gzip", "deflate", "br"}
+    assert accepted_encodings("GZIP;q=0.5, br;q=0, identity") == {"gzip", "identity"}
+    assert accepted_encodings("*") == {"br", "gzip"}
+
+
+@pytest.mark.asyncio
+async def test_compressed_lazily_and_cached(tmp_path: Path):
+    files, _ = make_files(tmp_path)
+
+    # The first request is sent uncompressed, while a compressed copy is made
+    resp = await get(files, "/app.js", accept_encoding="gzip")
+    assert resp.status == 200
+    assert resp.body == JS
+    assert "content-encoding" not in resp.headers
+    assert resp.headers["vary"] == "Accept-Encoding"
+    assert resp.headers["content-type"].startswith("text/javascript")
+    assert re.fullmatch(r'"[0-9a-f]{32}"', resp.headers["etag"])
+    etag = resp.headers["etag"]
+    await wait_for_compression(files)
+    assert os.listdir(tmp_path / "cache") == [etag.strip('"') + ".gz"]
+
+    resp = await get(files, "/app.js", accept_encoding="gzip, deflate")
+    assert resp.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(resp.body) == JS
+    assert len(resp.body) < len(JS) / 10
+    assert resp.headers["etag"] == etag[:-1] + '-gzip"'
+    assert resp.headers["content-type"].startswith("text/javascript")
+
+    # Each variant has its own ETag
+    resp = await get(
+        files, "/app.js", accept_encoding="gzip", if_none_match=etag[:-1] + '-gzip"'
+    )
+    assert resp.status == 304
+    resp = await get(files, "/app.js", if_none_match=etag)
+    assert resp.status == 304
+    resp = await get(files, "/app.js", accept_encoding="gzip", if_none_match=etag)
+    assert resp.status == 200
+
+    # The cached copy is found by a new process (and used for the first request)
+    files2 = DependencyFiles(
+        directory=tmp_path / "www", app=files._app, cache_dir=str(tmp_path / "cache")
+    )
+    resp = await get(files2, "/app.js", accept_encoding="gzip")
+    assert resp.headers["content-encoding"] == "gzip"
+
+    # Small files and binary files aren't compressed
+    for path in ("/tiny.css", "/image.png"):
+        resp = await get(files, path, accept_encoding="gzip")
+        assert "content-encoding" not in resp.headers
+        assert "vary" not in resp.headers
+    await wait_for_compression(files)
+    assert len(os.listdir(tmp_path / "cache")) == 1
+
+
+@pytest.mark.asyncio
+async def test_compressed_sidecars(tmp_path: Path):
+    www = tmp_path / "www"
+    www.mkdir()
+    (www / "app.js").write_bytes(JS)
+    # Written at build time
+    (www / "app.js.br").write_bytes(b"brotli")
+    (www / "app.js.gz").write_bytes(b"gzip")
+    os.utime(www / "app.js.gz", ns=(0, 0))
+    files = DependencyFiles(
+        directory=www, app=App(ui.TagList(), None), cache_dir=str(tmp_path / "cache")
+    )
+
+    resp = await get(files, "/app.js", accept_encoding="gzip, br")
+    assert resp.headers["content-encoding"] == "br"
+    assert resp.body == b"brotli"
+    resp = await get(files, "/app.js", accept_encoding="gzip, br;q=0")
+    # The .gz copy is older than the file, so it's ignored
+    assert "content-encoding" not in resp.headers
+    await wait_for_compression(files)
+    resp = await get(files, "/app.js", accept_encoding="gzip")
+    assert resp.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(resp.body) == JS
+
+
+@pytest.mark.asyncio
+async def test_cache_control(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    files, app = make_files(tmp_path)
+    immutable_files = DependencyFiles(
+        directory=tmp_path / "www",
+        app=app,
+        cache_dir=str(tmp_path / "cache"),
+        immutable=True,
+    )
+
+    # Revalidated (with the ETag) by default
+    resp = await get(files, "/tiny.css")
+    assert resp.headers["cache-control"] == "no-cache"
+    resp = await get(immutable_files, "/tiny.css")
+    assert resp.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+    app.dependency_max_age = 60
+    resp = await get(files, "/tiny.css")
+    assert resp.headers["cache-control"] == "public, max-age=60"
+    resp = await get(immutable_files, "/tiny.css")
+    assert resp.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+    monkeypatch.setenv("SHINY_AUTORELOAD_PORT", "8001")
+    resp = await get(files, "/tiny.css")
+    assert resp.headers["cache-control"] == "no-cache"
+    resp = await get(immutable_files, "/tiny.css")
+    assert resp.headers["cache-control"] == "no-cache"
+
+    # A changed file gets a new ETag
+    etag = resp.headers["etag"]
+    (tmp_path / "www" / "tiny.css").write_bytes(b"body { margin: 1px; }")
+    resp = await get(files, "/tiny.css", if_none_match=etag)
+    assert resp.status == 200
+    assert resp.headers["etag"] != etag
+
+    app.dependency_compression = False
+    resp = await get(files, "/app.js", accept_encoding="gzip")
+    assert "content-encoding" not in resp.headers
+    assert "vary" not in resp.headers
+    assert files._assets[str(tmp_path / "www" / "app.js")].pending == set()
+
+
+@pytest.mark.asyncio
+async def test_app_serves_dependency_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(
+        "shiny._dependency_files.default_cache_dir", lambda: str(tmp_path)
+    )
+    app = App(ui.page_sidebar(ui.sidebar("Sidebar"), "Main"), None)
+    page = await get(app, "/")
+    hrefs = re.findall(r'(?:href|src)="(lib/[^"]+\.(?:css|js))"', page.body.decode())
+    assert any("bootstrap" in href for href in hrefs)
+
+    # Only Shiny's own dependencies, which are versioned with Shiny, are immutable
+    immutable = [href for href in hrefs if f"-{__version__}/" in href]
+    assert any("lib/shiny-" in href for href in immutable)
+    for href in hrefs:
+        resp = await get(app, "/" + href)
+        assert resp.status == 200
+        if href in immutable:
+            assert "immutable" in resp.headers["cache-control"]
+        else:
+            assert resp.headers["cache-control"] == "no-cache"
+        assert "etag" in resp.headers
+
+
+def test_is_immutable(tmp_path: Path):
+    assert is_immutable(
+        HTMLDependency(
+            "shiny", __version__, source={"package": "shiny", "subdir": "www/shared"}
+        )
+    )
+    # Bootstrap's version doesn't change when Shiny's build of it does
+    assert not is_immutable(
+        HTMLDependency(
+            "bootstrap", "5.3.8", source={"package": "shiny", "subdir": "www/shared"}
+        )
+    )
+    assert not is_immutable(
+        HTMLDependency("mine", __version__, source={"subdir": str(tmp_path)})
+    )
+    assert not is_immutable(HTMLDependency("head", "1.0", head="<meta>"))
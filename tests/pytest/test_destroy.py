@@ -23,6 +23,7 @@ from shiny.reactive import (
     invalidate_later,
     isolate,
 )
+from shiny.reactive._core import ReactiveDomain
 from shiny.reactive._reactives import DestroyedReactiveError, Effect_
 from shiny.render.renderer import Renderer
 from shiny.session._session import (
@@ -555,6 +556,7 @@ def _make_mock_root_session() -> Session:
             self.output = Outputs(cast(Session, self), ns=ResolvedId(""), outputs={})
             self._outbound_message_queues = MockOutboundQueues()
             self._downloads: dict[str, Any] = {}
+            self._reactive_domain = ReactiveDomain("mock_session_id")
             self._message_handlers: dict[str, Any] = {}
             self._dynamic_routes: dict[str, Any] = {}
             self.bookmark = MockBookmark()
@@ -0,0 +1,328 @@
+"""Tests for `shiny._fileupload`."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import zlib
+from typing import Any, Optional, cast
+
+import pytest
+from starlette.requests import Request
+from starlette.responses import Response
+
+from shiny import App, _fileupload, ui
+from shiny._connection import MockConnection
+from shiny._fileupload import FileUploadManager, UploadSizeError, _add_range
+from shiny.types import FileInfo, SafeException
+
+
+def file_infos(*sizes: int) -> list[FileInfo]:
+    return [
+        {"name": f"f{i}.bin", "size": size, "type": "", "datapath": ""}
+        for i, size in enumerate(sizes)
+    ]
+
+
+def start_upload(manager: FileUploadManager, *sizes: int):
+    job_id = manager.create_upload_operation(file_infos(*sizes))
+    upload_op = manager.get_upload_operation(job_id)
+    assert upload_op is not None
+    return upload_op
+
+
+@pytest.mark.asyncio
+async def test_small_files_are_written_once_complete():
+    manager = FileUploadManager(spool_size=100, hash="sha256")
+    upload_op = start_upload(manager, 60)
+    chunks = [b"a" * 30, b"b" * 30]
+
+    async with upload_op:
+        for chunk in chunks:
+            await upload_op.write_chunk(chunk)
+        # Still in memory
+        path = upload_op._file_infos[0]["datapath"]
+        assert not os.path.exists(path)
+
+    [info] = upload_op.finish()
+    with open(info["datapath"], "rb") as f:
+        assert f.read() == b"".join(chunks)
+    assert info.get("sha256") == hashlib.sha256(b"".join(chunks)).hexdigest()
+    await manager.rm_upload_dir()
+
+
+@pytest.mark.asyncio
+async def test_large_files_are_written_as_received():
+    manager = FileUploadManager(spool_size=100, hash="crc32")
+    chunks = [os.urandom(200_000) for _ in range(5)]
+    upload_op = start_upload(manager, sum(len(c) for c in chunks), 3)
+
+    async with upload_op:
+        for chunk in chunks:
+            await upload_op.write_chunk(chunk)
+        path = upload_op._file_infos[0]["datapath"]
+        assert os.path.exists(path)
+    async with upload_op:
+        await upload_op.write_chunk(b"xyz")
+
+    info, small_info = upload_op.finish()
+    data = b"".join(chunks)
+    with open(info["datapath"], "rb") as f:
+        assert f.read() == data
+    assert info.get("crc32") == f"{zlib.crc32(data):08x}"
+    assert small_info.get("crc32") == f"{zlib.crc32(b'xyz'):08x}"
+    assert "sha256" not in info
+    await manager.rm_upload_dir()
+
+
+@pytest.mark.asyncio
+async def test_upload_size_limits():
+    manager = FileUploadManager(max_file_size=100, max_session_size=150, spool_size=10)
+    assert issubclass(UploadSizeError, SafeException)
+
+    # Declared sizes are checked up front
+    with pytest.raises(UploadSizeError, match="maximum upload size of 100"):
+        manager.create_upload_operation(file_infos(101))
+    with pytest.raises(UploadSizeError, match="maximum total upload size of 150"):
+        manager.create_upload_operation(file_infos(80, 80))
+
+    # The data itself is checked as it's received (the declared size may be wrong),
+    # and a file that's too large is removed and doesn't count
+    upload_op = start_upload(manager, 50, 50)
+    with pytest.raises(UploadSizeError):
+        async with upload_op:
+            await upload_op.write_chunk(b"a" * 60)
+            await upload_op.write_chunk(b"a" * 60)
+    assert not os.listdir(upload_op._dir)
+    assert manager._n_bytes == 0
+    async with upload_op:
+        await upload_op.write_chunk(b"a" * 90)
+    assert manager._n_bytes == 90
+
+    # The session limit covers all of the session's uploads
+    upload_op = start_upload(manager, 50)
+    with pytest.raises(UploadSizeError, match="maximum total upload size"):
+        async with upload_op:
+            await upload_op.write_chunk(b"b" * 61)
+    with pytest.raises(RuntimeError, match="Not all files"):
+        upload_op.finish()
+    assert manager._n_bytes == 90
+    await manager.rm_upload_dir()
+
+
+def test_add_range():
+    ranges: list[tuple[int, int]] = []
+    ranges = _add_range(ranges, 10, 20)
+    ranges = _add_range(ranges, 30, 40)
+    assert ranges == [(10, 20), (30, 40)]
+    # Overlapping and adjacent ranges are merged
+    assert _add_range(ranges, 15, 25) == [(10, 25), (30, 40)]
+    assert _add_range(ranges, 20, 30) == [(10, 40)]
+    assert _add_range(ranges, 0, 50) == [(0, 50)]
+    assert _add_range(ranges, 12, 18) == ranges
+
+
+@pytest.mark.asyncio
+async def test_chunked_upload_in_parallel():
+    manager = FileUploadManager(hash="sha256")
+    data = [os.urandom(10_000), os.urandom(2_500), b""]
+    upload_op = start_upload(manager, *(len(d) for d in data))
+    chunk_size = 1000
+
+    # Every chunk of every file at once, in reverse order, with some chunks repeated
+    writes = [
+        upload_op.write_file_chunk(i, offset, d[offset : offset + chunk_size])
+        for i, d in enumerate(data)
+        for offset in range(0, max(len(d), 1), chunk_size)
+    ]
+    writes.extend(
+        upload_op.write_file_chunk(0, offset, data[0][offset : offset + 1500])
+        for offset in (0, 4000, 8500)
+    )
+    await asyncio.gather(*reversed(writes))
+
+    infos = upload_op.finish()
+    assert manager._n_bytes == sum(len(d) for d in data)
+    for info, d in zip(infos, data):
+        with open(info["datapath"], "rb") as f:
+            assert f.read() == d
+        assert info.get("sha256") == hashlib.sha256(d).hexdigest()
+    await manager.rm_upload_dir()
+
+
+@pytest.mark.asyncio
+async def test_chunked_upload_resume():
+    manager = FileUploadManager(max_session_size=100)
+    data = os.urandom(100)
+    upload_op = start_upload(manager, 100)
+    other_op = start_upload(manager, 100)
+
+    assert upload_op.file_received(0) == ([], False)
+    await upload_op.write_file_chunk(0, 0, data[:30])
+    await upload_op.write_file_chunk(0, 60, data[60:80])
+    assert upload_op.file_received(0) == ([(0, 30), (60, 80)], False)
+    # The whole file counts against the session's limit as soon as it's started
+    assert manager._n_bytes == 100
+    with pytest.raises(RuntimeError, match="Not all files"):
+        upload_op.finish()
+
+    # Send what's missing (overlapping what was already sent)
+    await upload_op.write_file_chunk(0, 20, data[20:70])
+    await upload_op.write_file_chunk(0, 80, data[80:])
+    assert upload_op.file_received(0) == ([(0, 100)], True)
+    [info] = upload_op.finish()
+    with open(info["datapath"], "rb") as f:
+        assert f.read() == data
+
+    with pytest.raises(ValueError, match="past the end"):
+        await upload_op.write_file_chunk(0, 90, data[:20])
+    with pytest.raises(ValueError, match="no file 1"):
+        await upload_op.write_file_chunk(1, 0, b"")
+    # Only one of the uploads fits in the session's limit
+    with pytest.raises(UploadSizeError):
+        await other_op.write_file_chunk(0, 0, data[:10])
+    await manager.rm_upload_dir()
+
+
+@pytest.mark.asyncio
+async def test_chunked_upload_is_written_as_received():
+    manager = FileUploadManager()
+    pieces = [os.urandom(100_000) for _ in range(8)]
+    upload_op = start_upload(manager, sum(len(p) for p in pieces))
+    seen: list[list[tuple[int, int]]] = []
+
+    async def chunks():
+        for piece in pieces:
+            seen.append(upload_op.file_received(0)[0])
+            yield piece
+
+    await upload_op.stream_file_chunk(0, 0, chunks())
+    # Earlier parts of the chunk were written (and counted as received) while the
+    # rest of it was still arriving
+    assert seen[-1] != []
+    assert seen[-1][0][0] == 0 and seen[-1][0][1] < 800_000
+    [info] = upload_op.finish()
+    with open(info["datapath"], "rb") as f:
+        assert f.read() == b"".join(pieces)
+    await manager.rm_upload_dir()
+
+
+def upload_request(
+    *chunks: bytes,
+    method: str = "POST",
+    query_string: bytes = b"",
+    headers: Optional[list[tuple[bytes, bytes]]] = None,
+) -> Request:
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": True} for chunk in chunks
+    ]
+    messages.append({"type": "http.request", "body": b"", "more_body": False})
+
+    async def receive() -> dict[str, Any]:
+        return messages.pop(0)
+
+    return Request(
+        {
+            "type": "http",
+            "method": method,
+            "headers": headers or [],
+            "path": "/",
+            "query_string": query_string,
+        },
+        receive,  # pyright: ignore[reportArgumentType]
+    )
+
+
+@pytest.mark.asyncio
+async def test_session_upload_request_too_large():
+    app = App(ui.TagList(), None)
+    app.upload_max_file_size = 10
+    session = app._create_session(MockConnection())
+    manager = session._file_upload_manager
+    assert manager.max_file_size == 10
+
+    job_id = manager.create_upload_operation(file_infos(5))
+    resp = cast(
+        Response,
+        await session._handle_request_impl(
+            upload_request(b"a" * 6, b"b" * 6), "upload", job_id
+        ),
+    )
+    assert resp.status_code == 413
+    assert b"maximum upload size of 10" in resp.body
+
+    resp = cast(
+        Response,
+        await session._handle_request_impl(upload_request(b"abc"), "upload", job_id),
+    )
+    assert resp.status_code == 200
+    upload_op = manager.get_upload_operation(job_id)
+    assert upload_op is not None
+    [info] = upload_op.finish()
+    with open(info["datapath"], "rb") as f:
+        assert f.read() == b"abc"
+    await manager.rm_upload_dir()
+
+
+@pytest.mark.asyncio
+async def test_session_chunked_upload_requests():
+    session = App(ui.TagList(), None)._create_session(MockConnection())
+    manager = session._file_upload_manager
+    job_id = manager.create_upload_operation(file_infos(6))
+
+    async def request(
+        *chunks: bytes, method: str = "POST", query_string: bytes
+    ) -> Response:
+        req = upload_request(*chunks, method=method, query_string=query_string)
+        return cast(Response, await session._handle_request_impl(req, "upload", job_id))
+
+    resp = await request(b"def", query_string=b"file=0&offset=3")
+    assert resp.status_code == 200
+    assert json.loads(bytes(resp.body)) == {"received": [[3, 6]], "complete": False}
+
+    resp = await request(method="GET", query_string=b"file=0")
+    assert json.loads(bytes(resp.body)) == {"received": [[3, 6]], "complete": False}
+
+    resp = await request(b"abcd", query_string=b"file=0&offset=3")
+    assert resp.status_code == 400
+    resp = await request(b"abc", query_string=b"file=1&offset=0")
+    assert resp.status_code == 400
+    resp = await request(b"abc", query_string=b"file=0")
+    assert resp.status_code == 400
+
+    resp = await request(b"a", b"bc", query_string=b"file=0&offset=0")
+    assert json.loads(bytes(resp.body)) == {"received": [[0, 6]], "complete": True}
+    upload_op = manager.get_upload_operation(job_id)
+    assert upload_op is not None
+    [info] = upload_op.finish()
+    with open(info["datapath"], "rb") as f:
+        assert f.read() == b"abcdef"
+    await manager.rm_upload_dir()
+
+
+@pytest.mark.asyncio
+async def test_session_chunked_upload_too_large(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(_fileupload, "MAX_CHUNK_SIZE", 4)
+    session = App(ui.TagList(), None)._create_session(MockConnection())
+    manager = session._file_upload_manager
+    job_id = manager.create_upload_operation(file_infos(10))
+
+    async def request(*chunks: bytes, headers: list[tuple[bytes, bytes]]) -> Response:
+        req = upload_request(*chunks, query_string=b"file=0&offset=0", headers=headers)
+        return cast(Response, await session._handle_request_impl(req, "upload", job_id))
+
+    # Rejected by its Content-Length, before any of it is read
+    resp = await request(b"abcde", headers=[(b"content-length", b"5")])
+    assert resp.status_code == 413
+    assert b"maximum of 4 bytes" in resp.body
+    assert json.loads(bytes((await request(headers=[])).body))["received"] == []
+
+    # Rejected as it's read
+    resp = await request(b"ab", b"cde", headers=[])
+    assert resp.status_code == 413
+
+    resp = await request(b"abcd", headers=[(b"content-length", b"4")])
+    assert resp.status_code == 200
+    await manager.rm_upload_dir()
@@ -0,0 +1,198 @@
+"""Tests for `shiny._http_range`, and range requests for downloads and dynamic routes."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+import pytest
+from starlette.requests import Request
+
+from shiny import App, Inputs, Outputs, Session, render, ui
+from shiny._connection import MockConnection
+from shiny._http_range import _RangeNotSatisfiable, parse_range
+from shiny.session import session_context
+from shiny.types import SeekableContent
+
+from ._asgi_utils import Result, call_asgi, http_scope
+
+DATA = bytes(range(256)) * 4
+
+
+def test_parse_range():
+    size = 1000
+    assert parse_range("bytes=0-99", size) == [(0, 100)]
+    assert parse_range("bytes=900-", size) == [(900, 1000)]
+    assert parse_range("bytes=-100", size) == [(900, 1000)]
+    assert parse_range("bytes=-5000", size) == [(0, 1000)]
+    # The end is clamped to the size
+    assert parse_range("bytes=990-2000", size) == [(990, 1000)]
+    # Ranges are sorted, and overlapping or adjacent ones merged
+    assert parse_range("bytes=500-599, 0-9,10-19,550-700", size) == [
+        (0, 20),
+        (500, 701),
+    ]
+    # Ranges past the end are dropped, unless they all are
+    assert parse_range("bytes=0-9,2000-3000", size) == [(0, 10)]
+    with pytest.raises(_RangeNotSatisfiable):
+        parse_range("bytes=1000-", size)
+    with pytest.raises(_RangeNotSatisfiable):
+        parse_range("bytes=-100", 0)
+
+    # Invalid headers are ignored
+    for header in ("items=0-1", "bytes=", "bytes=1", "bytes=a-b", "bytes=5-2"):
+        assert parse_range(header, size) is None
+    assert parse_range("bytes=" + ",".join(["0-1"] * 101), size) is None
+
+
+def make_request(path: str, **headers: str) -> Request:
+    return Request(http_scope(path, **headers))
+
+
+async def get(session: Any, action: str, name: str, **headers: str) -> Result:
+    request = make_request(f"/session/{session.id}/{action}/{name}", **headers)
+    response = await session._handle_request_impl(request, action, name)
+    return await call_asgi(response, request.scope)
+
+
+def make_session(
+    tmp_path: Path, etag: Optional[str] = None, media_type: Optional[str] = None
+) -> tuple[Any, list[tuple[int, int]]]:
+    path = tmp_path / "data.bin"
+    path.write_bytes(DATA)
+    reads: list[tuple[int, int]] = []
+
+    def read(start: int, end: int) -> Iterator[bytes]:
+        reads.append((start, end))
+        for i in range(start, end, 100):
+            yield DATA[i : min(i + 100, end)]
+
+    def server(input: Inputs, output: Outputs, session: Session):
+        @render.download_button()
+        def file():
+            return str(path)
+
+        @render.download_button(filename="data.bin")
+        def generated():
+            return SeekableContent(len(DATA), read, etag=etag, media_type=media_type)
+
+        session.dynamic_route(
+            "video",
+            lambda request: SeekableContent(
+                len(DATA), read, etag=etag, media_type="video/mp4"
+            ),
+        )
+
+    session = App(ui.TagList(), server)._create_session(MockConnection())
+    with session_context(session):
+        server(session.input, session.output, session)
+    return session, reads
+
+
+@pytest.mark.asyncio
+async def test_file_download_ranges(tmp_path: Path):
+    session, _ = make_session(tmp_path)
+
+    full = await get(session, "download", "file")
+    assert full.status == 200
+    assert full.body == DATA
+    assert full.headers["accept-ranges"] == "bytes"
+    assert full.headers["cache-control"] == "no-store"
+    etag = full.headers["etag"]
+    last_modified = full.headers["last-modified"]
+
+    part = await get(session, "download", "file", range="bytes=100-199")
+    assert part.status == 206
+    assert part.body == DATA[100:200]
+    assert part.headers["content-range"] == f"bytes 100-199/{len(DATA)}"
+    assert part.headers["content-length"] == "100"
+
+    # If-Range only serves the range if the file hasn't changed
+    part = await get(session, "download", "file", range="bytes=-10", if_range=etag)
+    assert part.status == 206
+    assert part.body == DATA[-10:]
+    resp = await get(session, "download", "file", range="bytes=-10", if_range='"x"')
+    assert resp.status == 200
+    assert resp.body == DATA
+
+    resp = await get(session, "download", "file", range="bytes=5000-")
+    assert resp.status == 416
+    assert resp.headers["content-range"] == f"bytes */{len(DATA)}"
+
+    resp = await get(session, "download", "file", if_none_match=etag)
+    assert resp.status == 304
+    assert resp.body == b""
+    resp = await get(session, "download", "file", if_modified_since=last_modified)
+    assert resp.status == 304
+
+    # A new version of the file gets a new ETag
+    os.utime(tmp_path / "data.bin", ns=(0, 0))
+    resp = await get(session, "download", "file", if_none_match=etag)
+    assert resp.status == 200
+    assert resp.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_multipart_ranges(tmp_path: Path):
+    session, _ = make_session(tmp_path)
+    resp = await get(session, "download", "file", range="bytes=0-9,500-649")
+    assert resp.status == 206
+    content_type = resp.headers["content-type"]
+    assert content_type.startswith("multipart/byteranges; boundary=")
+    boundary = content_type.split("boundary=")[1].encode()
+    assert int(resp.headers["content-length"]) == len(resp.body)
+
+    parts = resp.body.split(b"--" + boundary)
+    assert parts[0] == b"" and parts[-1] == b"--\r\n"
+    ranges = [(0, 10), (500, 650)]
+    for part, (start, end) in zip(parts[1:-1], ranges):
+        head, _, body = part.partition(b"\r\n\r\n")
+        assert f"Content-Range: bytes {start}-{end - 1}/{len(DATA)}".encode() in head
+        assert body == DATA[start:end] + b"\r\n"
+
+
+@pytest.mark.asyncio
+async def test_seekable_download(tmp_path: Path):
+    session, reads = make_session(tmp_path, media_type="video/mp4")
+
+    full = await get(session, "download", "generated")
+    assert full.status == 200
+    assert full.body == DATA
+    assert full.headers["content-length"] == str(len(DATA))
+    assert full.headers["content-type"] == "video/mp4"
+    assert full.headers["content-disposition"] == 'attachment; filename="data.bin"'
+    # Without an ETag, it mustn't be cached
+    assert full.headers["cache-control"] == "no-store"
+    assert "etag" not in full.headers
+
+    reads.clear()
+    part = await get(session, "download", "generated", range="bytes=250-")
+    assert part.status == 206
+    assert part.body == DATA[250:]
+    # Only the requested range was generated
+    assert reads == [(250, len(DATA))]
+
+
+@pytest.mark.asyncio
+async def test_seekable_dynamic_route_etag(tmp_path: Path):
+    session, reads = make_session(tmp_path, etag='"v1"')
+
+    full = await get(session, "dynamic_route", "video")
+    assert full.status == 200
+    assert full.body == DATA
+    assert full.headers["content-type"] == "video/mp4"
+    assert full.headers["etag"] == '"v1"'
+    assert full.headers["cache-control"] == "no-cache"
+
+    reads.clear()
+    resp = await get(session, "dynamic_route", "video", if_none_match='W/"v1"')
+    assert resp.status == 304
+    assert resp.headers["etag"] == '"v1"'
+    assert reads == []
+
+    part = await get(
+        session, "dynamic_route", "video", range="bytes=1000-1023", if_range='"v1"'
+    )
+    assert part.status == 206
+    assert part.body == DATA[1000:]
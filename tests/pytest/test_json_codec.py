@@ -0,0 +1,92 @@
+"""Tests for the websocket JSON codecs in `shiny._json`."""
+
+import json
+import math
+
+import pytest
+
+from shiny import App, ui
+from shiny._connection import MockConnection
+from shiny._json import (
+    JSONCodec,
+    OrjsonCodec,
+    RawJSON,
+    StdlibJSONCodec,
+    resolve_json_codec,
+)
+from shiny._utils import lists_to_tuples
+
+CODECS = [StdlibJSONCodec(), OrjsonCodec()]
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda c: c.name)
+def test_loads_matches_lists_to_tuples_hook(codec: JSONCodec):
+    msg = json.dumps(
+        {
+            "method": "update",
+            "data": {
+                "x": [1, [2, 3], {"y": [4]}],
+                "z": {"w": []},
+                "s": "a",
+            },
+        }
+    )
+    res = codec.loads(msg)
+    assert res == json.loads(msg, object_hook=lists_to_tuples)
+    assert res["data"]["x"] == (1, (2, 3), {"y": (4,)})
+    assert res["data"]["z"]["w"] == ()
+
+    # Like the `object_hook`, a top-level list is left as a list
+    top = codec.loads('[{"a": [1]}, [2]]')
+    assert top == [{"a": (1,)}, [2]]
+    assert type(top) is list
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda c: c.name)
+def test_loads_invalid_json(codec: JSONCodec):
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads("{not json")
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda c: c.name)
+def test_dumps_splices_raw_json(codec: JSONCodec):
+    raw = RawJSON(b'[[1,"a"],[2,"b"]]')
+    res = codec.dumps({"values": {"df": {"data": raw}, "df2": raw}, "n": (1, 2)})
+    assert json.loads(res) == {
+        "values": {"df": {"data": [[1, "a"], [2, "b"]]}, "df2": [[1, "a"], [2, "b"]]},
+        "n": [1, 2],
+    }
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda c: c.name)
+def test_dumps_unserializable(codec: JSONCodec):
+    with pytest.raises(TypeError):
+        codec.dumps({"x": object()})
+
+
+def test_orjson_codec_differences():
+    codec = OrjsonCodec()
+    assert json.loads(codec.dumps({1: "a"})) == {"1": "a"}
+    # Unlike `json`, `orjson` produces valid JSON for NaN
+    assert codec.dumps([math.nan]) == "[null]"
+    # Falls back to `json` for values that `orjson` can't encode
+    assert codec.dumps({"big": 2**70, "raw": RawJSON("[1]")}) == (
+        '{"big": 1180591620717411303424, "raw": [1]}'
+    )
+
+
+def test_resolve_json_codec():
+    assert isinstance(resolve_json_codec("orjson"), OrjsonCodec)
+    assert isinstance(resolve_json_codec("json"), StdlibJSONCodec)
+    codec = StdlibJSONCodec()
+    assert resolve_json_codec(codec) is codec
+    with pytest.raises(ValueError):
+        resolve_json_codec("msgpack")  # pyright: ignore[reportArgumentType]
+
+
+def test_session_uses_app_json_codec():
+    app = App(ui.TagList(), None)
+    assert app._create_session(MockConnection())._json_codec.name == "orjson"
+
+    app.json_codec = "json"
+    assert app._create_session(MockConnection())._json_codec.name == "json"
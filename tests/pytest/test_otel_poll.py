@@ -98,7 +98,7 @@ class TestPollCalcSpan:
 
                 assert isinstance(current_time, Calc_)
 
-                with patch("shiny.reactive._reactives.shiny_otel_span") as mock_span:
+                with patch("shiny.otel._span_info.shiny_otel_span") as mock_span:
                     mock_span.return_value.__aenter__ = AsyncMock(return_value=None)
                     mock_span.return_value.__aexit__ = AsyncMock(return_value=None)
 
@@ -120,7 +120,7 @@ class TestPollCalcSpan:
 
                 assert isinstance(get_latest, Calc_)
 
-                with patch("shiny.reactive._reactives.shiny_otel_span") as mock_span:
+                with patch("shiny.otel._span_info.shiny_otel_span") as mock_span:
                     mock_span.return_value.__aenter__ = AsyncMock(return_value=None)
                     mock_span.return_value.__aexit__ = AsyncMock(return_value=None)
 
@@ -143,7 +143,7 @@ class TestPollCalcSpan:
 
                 assert isinstance(poll_fn, Calc_)
 
-                with patch("shiny.reactive._reactives.shiny_otel_span") as mock_span:
+                with patch("shiny.otel._span_info.shiny_otel_span") as mock_span:
                     mock_span.return_value.__aenter__ = AsyncMock(return_value=None)
                     mock_span.return_value.__aexit__ = AsyncMock(return_value=None)
 
@@ -166,7 +166,7 @@ class TestPollCalcSpan:
 
                 assert isinstance(poll_fn, Calc_)
 
-                with patch("shiny.reactive._reactives.shiny_otel_span") as mock_span:
+                with patch("shiny.otel._span_info.shiny_otel_span") as mock_span:
                     mock_span.return_value.__aenter__ = AsyncMock(return_value=None)
                     mock_span.return_value.__aexit__ = AsyncMock(return_value=None)
 
@@ -524,8 +524,8 @@ class TestCalcSpans:
                 calc = Calc_(my_calc)
 
                 # Mock span wrapper to verify it's called
-                # Must patch at the import location in _reactives module
-                with patch("shiny.reactive._reactives.shiny_otel_span") as mock_span:
+                # Must patch at the import location in the span info module
+                with patch("shiny.otel._span_info.shiny_otel_span") as mock_span:
                     # Configure mock to act as async context manager
                     mock_span.return_value.__aenter__ = AsyncMock(return_value=None)
                     mock_span.return_value.__aexit__ = AsyncMock(return_value=None)
@@ -553,8 +553,8 @@ class TestCalcSpans:
                 calc = Calc_(my_calc)
 
                 # Mock span wrapper to verify it's not called
-                # Must patch at the import location in _reactives module
-                with patch("shiny.reactive._reactives.shiny_otel_span") as mock_span:
+                # Must patch at the import location in the span info module
+                with patch("shiny.otel._span_info.shiny_otel_span") as mock_span:
                     # Execute the calc
                     await calc.update_value()
 
@@ -574,8 +574,8 @@ class TestCalcSpans:
                 calc = Calc_(my_calc)
 
                 # Mock span wrapper to capture attributes
-                # Must patch at the import location in _reactives module
-                with patch("shiny.reactive._reactives.shiny_otel_span") as mock_span:
+                # Must patch at the import location in the span info module
+                with patch("shiny.otel._span_info.shiny_otel_span") as mock_span:
                     # Configure mock
                     mock_span.return_value.__aenter__ = AsyncMock(return_value=None)
                     mock_span.return_value.__aexit__ = AsyncMock(return_value=None)
@@ -642,7 +642,7 @@ class TestCalcSpans:
 
                 calc = Calc_(my_calc, session=mock_session)
 
-                with patch("shiny.reactive._reactives.shiny_otel_span") as mock_span:
+                with patch("shiny.otel._span_info.shiny_otel_span") as mock_span:
                     mock_span.return_value.__aenter__ = AsyncMock(return_value=None)
                     mock_span.return_value.__aexit__ = AsyncMock(return_value=None)
 
@@ -655,6 +655,45 @@ class TestCalcSpans:
                     assert attrs[ATTR_SESSION_ID] == "test-session-xyz"
 
 
+class TestLazySpanInfo:
+    """Span names and attributes are only computed when a span is recorded"""
+
+    @pytest.mark.asyncio
+    async def test_span_info_not_computed_when_tracing_disabled(self):
+        with patch_otel_tracing_state(tracing_enabled=False):
+            with (
+                patch("shiny.otel._span_info.extract_source_ref") as mock_extract,
+                patch("shiny.otel._span_info.create_otel_span_name") as mock_name,
+            ):
+
+                def my_calc():
+                    return 42
+
+                def my_effect():
+                    pass
+
+                calc = Calc_(my_calc)
+                effect = Effect_(my_effect, session=None)
+                await calc.update_value()
+                await effect._run()
+
+                mock_extract.assert_not_called()
+                mock_name.assert_not_called()
+
+    def test_span_info_computed_once(self):
+        def my_calc():
+            return 42
+
+        calc = Calc_(my_calc)
+        with patch(
+            "shiny.otel._span_info.extract_source_ref", wraps=extract_source_ref
+        ) as mock_extract:
+            assert calc._otel_attrs["code.function.name"] == "my_calc"
+            assert calc._otel_attrs["code.function.name"] == "my_calc"
+            mock_extract.assert_called_once()
+        assert calc._otel_label == "reactive.calc my_calc"
+
+
 class TestEffectSpans:
     """Reactive Effect execution span tests"""
 
@@ -671,8 +710,8 @@ class TestEffectSpans:
                 effect = Effect_(my_effect, session=None)
 
                 # Mock span wrapper to verify it's called
-                # Must patch at the import location in _reactives module
-                with patch("shiny.reactive._reactives.shiny_otel_span") as mock_span:
+                # Must patch at the import location in the span info module
+                with patch("shiny.otel._span_info.shiny_otel_span") as mock_span:
                     # Configure mock to act as async context manager
                     mock_span.return_value.__aenter__ = AsyncMock(return_value=None)
                     mock_span.return_value.__aexit__ = AsyncMock(return_value=None)
@@ -701,8 +740,8 @@ class TestEffectSpans:
                 effect = Effect_(my_effect, session=None)
 
                 # Mock span wrapper to verify it's not called
-                # Must patch at the import location in _reactives module
-                with patch("shiny.reactive._reactives.shiny_otel_span") as mock_span:
+                # Must patch at the import location in the span info module
+                with patch("shiny.otel._span_info.shiny_otel_span") as mock_span:
                     # Execute the effect
                     await effect._run()
 
@@ -722,8 +761,8 @@ class TestEffectSpans:
                 effect = Effect_(my_effect, session=None)
 
                 # Mock span wrapper to capture attributes
-                # Must patch at the import location in _reactives module
-                with patch("shiny.reactive._reactives.shiny_otel_span") as mock_span:
+                # Must patch at the import location in the span info module
+                with patch("shiny.otel._span_info.shiny_otel_span") as mock_span:
                     # Configure mock
                     mock_span.return_value.__aenter__ = AsyncMock(return_value=None)
                     mock_span.return_value.__aexit__ = AsyncMock(return_value=None)
@@ -790,7 +829,7 @@ class TestEffectSpans:
 
                 effect = Effect_(my_effect, session=mock_session)
 
-                with patch("shiny.reactive._reactives.shiny_otel_span") as mock_span:
+                with patch("shiny.otel._span_info.shiny_otel_span") as mock_span:
                     mock_span.return_value.__aenter__ = AsyncMock(return_value=None)
                     mock_span.return_value.__aexit__ = AsyncMock(return_value=None)
 
@@ -832,10 +871,8 @@ class TestExtendedTaskSpans:
                     return 42
 
                 # Mock span wrapper to verify it's called
-                # Must patch at the import location in _extended_task module
-                with patch(
-                    "shiny.reactive._extended_task.shiny_otel_span"
-                ) as mock_span:
+                # Must patch at the import location in the span info module
+                with patch("shiny.otel._span_info.shiny_otel_span") as mock_span:
                     # Configure mock to act as async context manager
                     mock_span.return_value.__aenter__ = AsyncMock(return_value=None)
                     mock_span.return_value.__aexit__ = AsyncMock(return_value=None)
@@ -856,9 +893,15 @@ class TestExtendedTaskSpans:
                     with isolate():
                         assert task.status() == "success"
 
-                    # Verify span was created
-                    mock_span.assert_called_once()
-                    call_args = mock_span.call_args
+                    # Verify span was created (effects left over from other tests
+                    # may also record spans while the task's result is flushed)
+                    task_calls = [
+                        c
+                        for c in mock_span.call_args_list
+                        if c[0][0].startswith("extended_task")
+                    ]
+                    assert len(task_calls) == 1
+                    call_args = task_calls[0]
                     # Verify the label string was passed
                     label = call_args[0][0]
                     assert label == "extended_task my_task"
@@ -879,10 +922,8 @@ class TestExtendedTaskSpans:
                     return 42
 
                 # Mock span wrapper to verify it's called (but returns no-op at low level)
-                # Must patch at the import location in _extended_task module
-                with patch(
-                    "shiny.reactive._extended_task.shiny_otel_span"
-                ) as mock_span:
+                # Must patch at the import location in the span info module
+                with patch("shiny.otel._span_info.shiny_otel_span") as mock_span:
                     # Configure mock to act as async context manager
                     mock_span.return_value.__aenter__ = AsyncMock(return_value=None)
                     mock_span.return_value.__aexit__ = AsyncMock(return_value=None)
@@ -1138,9 +1179,7 @@ class TestExtendedTaskSpans:
                 ):
                     task = ExtendedTask(my_task)
 
-                with patch(
-                    "shiny.reactive._extended_task.shiny_otel_span"
-                ) as mock_span:
+                with patch("shiny.otel._span_info.shiny_otel_span") as mock_span:
                     mock_span.return_value.__aenter__ = AsyncMock(return_value=None)
                     mock_span.return_value.__aexit__ = AsyncMock(return_value=None)
 
@@ -1155,8 +1194,13 @@ class TestExtendedTaskSpans:
                     with isolate():
                         assert task.status() == "success"
 
-                    mock_span.assert_called_once()
-                    call_args = mock_span.call_args
+                    task_calls = [
+                        c
+                        for c in mock_span.call_args_list
+                        if c[0][0].startswith("extended_task")
+                    ]
+                    assert len(task_calls) == 1
+                    call_args = task_calls[0]
                     attrs = call_args[1]["attributes"]
                     assert ATTR_SESSION_ID in attrs
                     assert attrs[ATTR_SESSION_ID] == "test-session-xyz"
@@ -15,6 +15,7 @@ which don't have complete type stubs available.
 
 # pyright: reportUnknownMemberType=false, reportUnknownArgumentType=false, reportUnknownVariableType=false, reportUnknownParameterType=false, reportMissingParameterType=false
 
+import linecache
 import os
 from typing import Iterator, Tuple
 from unittest.mock import Mock, patch
@@ -778,6 +779,15 @@ class TestValueNaming:
         assert my_input._name == "input.id"
         assert my_input._name != original_name
 
+    def test_name_inferred_on_first_use(self):
+        """Test that the source is only read when the name is first needed"""
+        with patch("linecache.getline", wraps=linecache.getline) as getline:
+            lazy_counter = reactive.Value(0)
+            getline.assert_not_called()
+            assert lazy_counter._name == "lazy_counter"
+            assert lazy_counter._name == "lazy_counter"
+            getline.assert_called_once()
+
     def test_inputs_sets_name_with_prefix(self, mock_session: Mock):
         """Test that Inputs class sets names with 'input.' prefix"""
         from shiny._namespaces import ResolvedId
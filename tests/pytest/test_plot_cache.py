@@ -0,0 +1,221 @@
+"""Tests for caching the images rendered by `@render.plot`."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Callable
+
+import pytest
+from matplotlib.figure import Figure
+
+from shiny import App, Inputs, Outputs, Session, reactive, render, ui
+from shiny._connection import MockConnection
+from shiny.render._plot_cache import PlotCache, _cache_token, _Identity
+from shiny.types import ImgData
+
+
+class _PlotSession:
+    """Runs a session of `app`, and collects the values sent for output `p`."""
+
+    def __init__(self, app: App) -> None:
+        self.conn = MockConnection()
+        self.plots: list[dict[str, Any]] = []
+
+        async def send(message: str) -> None:
+            values = json.loads(message).get("values", {})
+            if "p" in values:
+                self.plots.append(values["p"])
+
+        self.conn.send = send
+        self.session = app._create_session(self.conn)
+
+    async def start(self, **inputs: object) -> dict[str, Any]:
+        clientdata = {
+            ".clientdata_output_p_hidden": False,
+            ".clientdata_output_p_width": 300,
+            ".clientdata_output_p_height": 200,
+            ".clientdata_pixelratio": 1,
+            **inputs,
+        }
+        self.conn.cause_receive(json.dumps({"method": "init", "data": clientdata}))
+        self.task = asyncio.create_task(self.session._run())
+        return await self._next_plot()
+
+    async def update(self, **inputs: object) -> dict[str, Any]:
+        self.conn.cause_receive(json.dumps({"method": "update", "data": inputs}))
+        return await self._next_plot()
+
+    async def _next_plot(self) -> dict[str, Any]:
+        n = len(self.plots)
+        for _ in range(500):
+            await asyncio.sleep(0.01)
+            if len(self.plots) > n:
+                return self.plots[-1]
+        raise AssertionError("The plot was not rendered")
+
+    async def close(self) -> None:
+        self.conn.cause_disconnect()
+        await self.task
+
+
+def _plot_app(
+    cache: bool | PlotCache, calls: list[object], plot_fn: Callable[[Inputs], object]
+) -> App:
+    def server(input: Inputs, output: Outputs, session: Session):
+        @output(id="p")
+        @render.plot(cache=cache)
+        def _():
+            calls.append(None)
+            return plot_fn(input)
+
+    return App(ui.TagList(), server)
+
+
+def _line_plot(input: Inputs) -> Figure:
+    fig = Figure()
+    ax = fig.subplots()
+    ax.plot([1, 2, 3], [3, 1, input.n()])  # pyright: ignore[reportUnknownMemberType]
+    return fig
+
+
+@pytest.mark.asyncio
+async def test_plot_cache_resize():
+    cache = PlotCache()
+    calls: list[object] = []
+    sess = _PlotSession(_plot_app(cache, calls, _line_plot))
+
+    first = await sess.start(n=2)
+    wide = await sess.update(**{".clientdata_output_p_width": 400})
+    assert wide != first
+    assert len(calls) == 2
+
+    # Back to a size that has been drawn: the plot function isn't called
+    assert await sess.update(**{".clientdata_output_p_width": 300}) == first
+    assert len(calls) == 2
+
+    await sess.close()
+    assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
+
+
+@pytest.mark.asyncio
+async def test_plot_cache_input_change():
+    cache = PlotCache()
+    calls: list[object] = []
+    sess = _PlotSession(_plot_app(cache, calls, _line_plot))
+
+    first = await sess.start(n=2)
+    second = await sess.update(n=5)
+    assert second != first
+    assert await sess.update(n=2) == first
+    assert len(calls) == 2
+
+    await sess.close()
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_plot_cache_shared_across_sessions():
+    cache = PlotCache()
+    calls: list[object] = []
+    app = _plot_app(cache, calls, _line_plot)
+
+    sess1 = _PlotSession(app)
+    first = await sess1.start(n=2)
+    await sess1.close()
+
+    # The new session calls the plot function (to find out what it reads), but the
+    # image comes from the cache
+    sess2 = _PlotSession(app)
+    assert await sess2.start(n=2) == first
+    await sess2.close()
+
+    assert len(calls) == 2
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_plot_cache_reads_calcs():
+    calls: list[object] = []
+    cache = PlotCache()
+
+    def server(input: Inputs, output: Outputs, session: Session):
+        @reactive.calc
+        def data() -> list[int]:
+            return [3, 1, input.n()]
+
+        @output(id="p")
+        @render.plot(cache=cache)
+        def _():
+            calls.append(None)
+            fig = Figure()
+            fig.subplots().plot(data())  # pyright: ignore[reportUnknownMemberType]
+            return fig
+
+    sess = _PlotSession(App(ui.TagList(), server))
+    first = await sess.start(n=2)
+    await sess.update(**{".clientdata_output_p_height": 250})
+    assert await sess.update(**{".clientdata_output_p_height": 200}) == first
+    assert len(calls) == 2
+
+    # The calc's value is a new list, which (being unhashable) isn't matched
+    await sess.update(n=2)
+    assert len(calls) == 3
+
+    await sess.close()
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+@pytest.mark.asyncio
+async def test_plot_cache_skips_invalidate_later():
+    calls: list[object] = []
+    cache = PlotCache()
+
+    def plot(input: Inputs) -> Figure:
+        reactive.invalidate_later(60)
+        return _line_plot(input)
+
+    sess = _PlotSession(_plot_app(cache, calls, plot))
+    first = await sess.start(n=2)
+    await sess.update(**{".clientdata_output_p_width": 400})
+    assert await sess.update(**{".clientdata_output_p_width": 300}) == first
+    await sess.close()
+
+    assert len(calls) == 3
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_plot_cache_true():
+    calls: list[object] = []
+    sess = _PlotSession(_plot_app(True, calls, _line_plot))
+    first = await sess.start(n=2)
+    await sess.update(n=3)
+    assert await sess.update(n=2) == first
+    await sess.close()
+    assert len(calls) == 2
+
+
+def test_plot_cache_evicts_least_recently_used():
+    cache = PlotCache(max_size=2)
+    img_a: ImgData = {"src": "a"}
+    img_b: ImgData = {"src": "b"}
+    img_c: ImgData = {"src": "c"}
+    cache.set("a", img_a)
+    cache.set("b", img_b)
+    assert cache.get("a") is img_a
+    cache.set("c", img_c)
+    assert cache.get("b") is None
+    assert cache.get("a") is img_a
+    assert cache.get("c") is img_c
+
+    with pytest.raises(ValueError):
+        PlotCache(max_size=0)
+
+
+def test_cache_token():
+    assert _cache_token(1) == _cache_token(1)
+    assert _cache_token(1) != _cache_token(True)
+    value = [1, 2]
+    assert _cache_token(value) == _Identity(value)
+    assert _cache_token(value) != _cache_token([1, 2])
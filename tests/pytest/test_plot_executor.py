@@ -0,0 +1,145 @@
+"""Tests for rasterizing `@render.plot` plots in an executor."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+import matplotlib.pyplot as plt
+import PIL.Image
+import pytest
+from matplotlib.figure import Figure
+
+from shiny import App, Inputs, Outputs, Session, render, ui
+from shiny._connection import MockConnection
+from shiny.render._try_render_plot import (
+    PlotExecutor,
+    PlotSizeInfo,
+    resolve_plot_executor,
+)
+from shiny.types import MISSING, MISSING_TYPE
+
+
+async def _render_plot(
+    plot_fn: Callable[[], object],
+    executor: PlotExecutor | MISSING_TYPE,
+    *,
+    app_executor: PlotExecutor = "inline",
+) -> dict[str, Any]:
+    def server(input: Inputs, output: Outputs, session: Session):
+        @output(id="p")
+        @render.plot(executor=executor, alt="A plot")
+        def _():
+            return plot_fn()
+
+    app = App(ui.TagList(), server)
+    app.plot_executor = app_executor
+    conn = MockConnection()
+    sent: list[str] = []
+
+    async def send(message: str) -> None:
+        sent.append(message)
+
+    conn.send = send
+    sess = app._create_session(conn)
+    clientdata = {
+        ".clientdata_output_p_hidden": False,
+        ".clientdata_output_p_width": 300,
+        ".clientdata_output_p_height": 200,
+        ".clientdata_pixelratio": 1,
+    }
+    conn.cause_receive(json.dumps({"method": "init", "data": clientdata}))
+    task = asyncio.create_task(sess._run())
+    values: dict[str, Any] = {}
+    for _ in range(500):
+        await asyncio.sleep(0.01)
+        for message in sent:
+            values.update(json.loads(message).get("values", {}))
+        if "p" in values:
+            break
+    conn.cause_disconnect()
+    await task
+    return values["p"]
+
+
+def _figure() -> Figure:
+    fig = Figure()
+    ax = fig.subplots()
+    ax.plot([1, 2, 3], [3, 1, 2])  # pyright: ignore[reportUnknownMemberType]
+    return fig
+
+
+@pytest.mark.asyncio
+async def test_render_plot_in_thread_matches_inline():
+    inline = await _render_plot(_figure, "inline")
+    threaded = await _render_plot(_figure, "thread")
+
+    assert threaded["src"].startswith("data:image/png;base64,")
+    assert threaded == inline
+    assert threaded["width"] == "100%"
+    assert threaded["alt"] == "A plot"
+    assert "coordmap" in threaded
+
+
+@pytest.mark.asyncio
+async def test_render_plot_uses_app_executor():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        res = await _render_plot(_figure, MISSING, app_executor=executor)
+    assert res["src"].startswith("data:image/png;base64,")
+
+
+@pytest.mark.asyncio
+async def test_render_plot_in_thread_detaches_pyplot_figure():
+    def plot():
+        plt.plot([1, 2, 3])  # pyright: ignore[reportUnknownMemberType]
+
+    res = await _render_plot(plot, "thread")
+    assert res["src"].startswith("data:image/png;base64,")
+    assert plt.get_fignums() == []
+
+
+@pytest.mark.asyncio
+async def test_render_pil_image_in_process():
+    def plot():
+        return PIL.Image.new("RGB", (20, 10), color="red")
+
+    inline = await _render_plot(plot, "inline")
+    res = await _render_plot(plot, "process")
+    assert res == inline
+
+
+def test_resolve_plot_executor():
+    assert resolve_plot_executor("inline") is None
+    assert resolve_plot_executor("thread") is resolve_plot_executor("thread")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert resolve_plot_executor(executor) is executor
+    with pytest.raises(ValueError, match="executor"):
+        resolve_plot_executor("threads")  # pyright: ignore[reportArgumentType]
+
+
+def test_plot_size_info_resolved():
+    calls: list[str] = []
+
+    def size(dim: str, value: float):
+        def fn() -> float:
+            calls.append(dim)
+            return value
+
+        return fn
+
+    info = PlotSizeInfo(
+        container_size_px_fn=(size("width", 300), size("height", 200)),
+        user_specified_size_px=(None, 100),
+        pixelratio=2,
+    )
+
+    resolved = info.resolved()
+    assert calls == ["width"]
+    assert resolved.get_img_size_px((7, 5), (7, 5), 100) == (300, 100, "100%", "100px")
+
+    unresolved = info.resolved(container_size=False)
+    assert calls == ["width"]
+    with pytest.raises(RuntimeError, match="not resolved"):
+        unresolved.get_img_size_px((7, 5), (7, 5), 100)
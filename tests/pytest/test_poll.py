@@ -1,8 +1,10 @@
 """Tests for polling-related functionality."""
 
+import asyncio
 import os
 import tempfile
 from enum import Enum
+from pathlib import Path
 from random import random
 from types import TracebackType
 from typing import Any, Callable, Dict, Optional, Type, cast
@@ -12,6 +14,7 @@ import pytest
 from shiny import Session, _utils, session
 from shiny._namespaces import Root
 from shiny.reactive import Value, effect, file_reader, flush, isolate, poll
+from shiny.reactive._core import ReactiveDomain
 
 from .mocktime import MockTime
 
@@ -29,6 +32,7 @@ class OnEndedSessionCallbacks:
 
     def __init__(self):
         self._on_ended_callbacks = _utils.Callbacks()
+        self._reactive_domain = ReactiveDomain("on_ended_session")
         # Unfortunately we have to lie here and say we're a session. Obvously, any
         # attempt to call anything but session.on_ended() will fail.
         self._session_context = session.session_context(cast(Session, self))
@@ -416,3 +420,78 @@ async def test_file_reader_error():
 
                 with pytest.raises(FileNotFoundError):
                     read_file()
+
+
+@pytest.mark.asyncio
+async def test_poll_shared():
+    poll_invocations = 0
+    read_invocations = 0
+
+    def shared_poll_func():
+        nonlocal poll_invocations
+        poll_invocations += 1
+        return 0
+
+    def server() -> Callable[[], int]:
+        # Declared inside the "server function", as each session would
+        @poll(shared_poll_func, shared=True)
+        def shared_reader() -> int:
+            nonlocal read_invocations
+            read_invocations += 1
+            return 1
+
+        return shared_reader
+
+    mock_time = MockTime()
+    with mock_time():
+        readers: list[Callable[[], int]] = []
+        for _ in range(3):
+            async with OnEndedSessionCallbacks():
+                readers.append(server())
+        assert readers[0] is readers[1] is readers[2]
+
+        await flush()
+        invocations_before = poll_invocations
+        with isolate():
+            assert [reader() for reader in readers] == [1, 1, 1]
+        assert read_invocations == 1
+
+        # One poller for every session, even after they've ended
+        await mock_time.advance_time(1.01)
+        assert poll_invocations == invocations_before + 1
+
+
+@pytest.mark.asyncio
+async def test_file_reader_watch(tmp_path: Path):
+    # Real filesystem notifications, so this uses real time
+    path = tmp_path / "data.txt"
+    path.write_text("hello\n")
+    invocations = 0
+
+    @file_reader(path, watch=True)
+    def read_watched_file():
+        nonlocal invocations
+        invocations += 1
+        return path.read_text()
+
+    contents: list[str] = []
+
+    @effect()
+    def show():
+        contents.append(read_watched_file())
+
+    await flush()
+    assert contents == ["hello\n"]
+
+    path.write_text("hello\ngoodbye\n")
+    for _ in range(100):
+        await asyncio.sleep(0.05)
+        if len(contents) > 1:
+            break
+    assert contents == ["hello\n", "hello\ngoodbye\n"]
+
+    # Changes to other files in the directory don't cause the file to be read again
+    (tmp_path / "other.txt").write_text("x")
+    await asyncio.sleep(0.5)
+    assert invocations == 2
+    show.destroy()
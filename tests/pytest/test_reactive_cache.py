@@ -0,0 +1,311 @@
+"""Tests for reactive.cache() / reactive.bind_cache() and the cache backends."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from shiny import App, Inputs, Outputs, Session, reactive, render, ui
+from shiny._connection import MockConnection
+from shiny.reactive import (
+    DiskCache,
+    MemoryCache,
+    Value,
+    bind_cache,
+    calc,
+    flush,
+    isolate,
+)
+from shiny.render.renderer import Renderer
+from shiny.types import MISSING
+
+from .mocktime import MockTime
+
+
+def _make_cached_calc(
+    key: Value[int], cache: MemoryCache, runs: list[int]
+) -> reactive.Calc_[int]:
+    # Each call makes a new calc from the same function, like each session does
+    @reactive.cache(key=lambda: key(), cache=cache)
+    @calc
+    def doubled() -> int:
+        runs.append(key())
+        return key() * 2
+
+    return doubled
+
+
+@pytest.mark.asyncio
+async def test_cache_calc_shared():
+    cache = MemoryCache()
+    runs: list[int] = []
+    key = Value(1)
+
+    calc1 = _make_cached_calc(key, cache, runs)
+    calc2 = _make_cached_calc(key, cache, runs)
+    with isolate():
+        assert calc1() == 2
+        assert calc2() == 2
+    assert runs == [1]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # The key is reactive: changing it invalidates the calc, which recomputes
+    key.set(2)
+    await flush()
+    with isolate():
+        assert calc1() == 4
+        assert calc2() == 4
+    assert runs == [1, 2]
+
+    # Going back to an earlier key is a hit
+    key.set(1)
+    await flush()
+    with isolate():
+        assert calc1() == 2
+    assert runs == [1, 2]
+    assert (cache.hits, cache.misses) == (3, 2)
+
+
+@pytest.mark.asyncio
+async def test_cache_calc_errors_not_cached():
+    cache = MemoryCache()
+    runs = 0
+    key = Value(1)
+
+    @reactive.cache(key=lambda: key(), cache=cache)
+    @calc
+    def failing() -> int:
+        nonlocal runs
+        runs += 1
+        raise ValueError("boom")
+
+    for _ in range(2):
+        with isolate():
+            with pytest.raises(ValueError):
+                failing()
+        key.set(2)
+        await flush()
+        key.set(1)
+        await flush()
+    assert runs == 2
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_async_calc_and_functions():
+    cache = MemoryCache()
+    key = Value("a")
+    runs: list[str] = []
+
+    @reactive.cache(key=lambda: key(), cache=cache)
+    @calc
+    async def upper() -> str:
+        runs.append(key())
+        return key().upper()
+
+    with isolate():
+        assert await upper() == "A"
+        assert await upper() == "A"
+
+    def plain() -> str:
+        runs.append("plain")
+        return key() * 2
+
+    cached_plain = bind_cache(plain, lambda: key(), cache=cache)
+    with isolate():
+        assert cached_plain() == "aa"
+        assert cached_plain() == "aa"
+
+    async def plain_async() -> str:
+        runs.append("plain_async")
+        return key() * 3
+
+    cached_async = bind_cache(plain_async, lambda: key(), cache=cache)
+    with isolate():
+        assert await cached_async() == "aaa"
+        assert await cached_async() == "aaa"
+
+    assert runs == ["a", "plain", "plain_async"]
+
+
+def test_cache_unpicklable_key():
+    @reactive.cache(key=lambda: (lambda: 1), cache="session")
+    def fn() -> int:
+        return 1
+
+    with isolate():
+        with pytest.raises(TypeError, match="couldn't be pickled"):
+            fn()
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_lru_and_ttl():
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert (cache.hits, cache.misses, cache.evictions) == (2, 1, 1)
+
+    mock_time = MockTime()
+    with mock_time():
+        cache = MemoryCache(ttl=10)
+        cache.set("a", None)
+        await mock_time.advance_time(5)
+        assert cache.get("a") is None
+        await mock_time.advance_time(5)
+        assert cache.get("a") is MISSING
+        assert cache.evictions == 1
+
+    with pytest.raises(ValueError):
+        MemoryCache(max_entries=0)
+
+
+def test_disk_cache(tmp_path: Path):
+    cache = DiskCache(tmp_path, max_entries=2)
+    cache.set("a", {"x": [1, 2]})
+    # Another process (or object) sees the same values
+    assert DiskCache(tmp_path).get("a") == {"x": [1, 2]}
+    assert cache.get("missing") is MISSING
+
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert len(list(tmp_path.glob("*.pickle"))) == 2
+    assert cache.evictions == 1
+
+    cache.clear()
+    assert cache.get("c") is MISSING
+
+    expiring = DiskCache(tmp_path, ttl=0)
+    expiring.set("a", 1)
+    assert expiring.get("a") is MISSING
+    assert expiring.evictions == 1
+
+    small = DiskCache(tmp_path, max_size=10)
+    small.set("big", "x" * 100)
+    assert small.get("big") is MISSING
+
+
+def test_disk_cache_scans_only_over_limits(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    cache = DiskCache(tmp_path, max_entries=3)
+    scans: list[str] = []
+    scandir = os.scandir
+
+    def counting_scandir(path: Any):
+        scans.append(path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Replacing a value doesn't add a file
+    cache.set("a", 3)
+    cache.set("c", 4)
+    assert scans == []
+    assert cache.evictions == 0
+
+    cache.set("d", 5)
+    assert len(scans) == 1
+    assert cache.evictions == 1
+    assert len(list(tmp_path.glob("*.pickle"))) == 3
+
+
+async def _render_output(app: App, n: int, id: str = "txt") -> tuple[str, Any]:
+    """Run a session, and return its id and the value of output `id`."""
+    conn = MockConnection()
+    values: dict[str, Any] = {}
+
+    async def send(message: str) -> None:
+        values.update(json.loads(message).get("values", {}))
+
+    conn.send = send
+    sess = app._create_session(conn)
+    data = {"n": n, f".clientdata_output_{id}_hidden": False}
+    conn.cause_receive(json.dumps({"method": "init", "data": data}))
+    task = asyncio.create_task(sess._run())
+    for _ in range(500):
+        await asyncio.sleep(0.01)
+        if id in values:
+            break
+    conn.cause_disconnect()
+    await task
+    return sess.id, values[id]
+
+
+async def _render_text(app: App, n: int) -> Any:
+    return (await _render_output(app, n))[1]
+
+
+@pytest.mark.asyncio
+async def test_cache_renderer_shared_across_sessions():
+    runs: list[int] = []
+
+    def server(input: Inputs, output: Outputs, session: Session):
+        @output(id="txt")
+        @reactive.cache(key=lambda: input.n())
+        @render.text
+        def _():
+            runs.append(input.n())
+            return f"n = {input.n()}"
+
+    app = App(ui.TagList(), server)
+    assert await _render_text(app, 1) == "n = 1"
+    assert await _render_text(app, 1) == "n = 1"
+    assert await _render_text(app, 2) == "n = 2"
+    assert runs == [1, 2]
+    assert isinstance(app.cache, MemoryCache)
+    assert (app.cache.hits, app.cache.misses) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_cache_session_bound_renderers():
+    def server(input: Inputs, output: Outputs, session: Session):
+        @reactive.cache(key=lambda: "same for everyone")
+        @render.download_button(filename="data.txt")
+        def dl():
+            yield "data"
+
+    # Each session gets its own download URL, even though the key is shared
+    app = App(ui.TagList(), server)
+    id1, url1 = await _render_output(app, 1, "dl")
+    id2, url2 = await _render_output(app, 1, "dl")
+    assert id1 != id2
+    assert url1.startswith(f"session/{id1}/download/dl")
+    assert url2.startswith(f"session/{id2}/download/dl")
+
+    class render_value(Renderer[str]):
+        async def transform(self, value: str) -> str:
+            return value
+
+    runs: list[int] = []
+
+    def server2(input: Inputs, output: Outputs, session: Session):
+        @output(id="txt")
+        @reactive.cache(key=lambda: "same for everyone")
+        @render_value
+        def _():
+            runs.append(input.n())
+            return "value"
+
+    # Renderers that don't opt in to sharing are cached per session
+    app = App(ui.TagList(), server2)
+    assert await _render_text(app, 1) == "value"
+    assert await _render_text(app, 2) == "value"
+    assert runs == [1, 2]
+
+    with pytest.raises(TypeError, match="data_frame"):
+
+        @reactive.cache(key=lambda: 1)
+        @render.data_frame
+        def df():
+            return None
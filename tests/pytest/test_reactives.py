@@ -1,14 +1,18 @@
 """Tests for `shiny.reactive`."""
 
 import asyncio
-from typing import List
+from typing import Callable, List, cast
+from unittest.mock import patch
 
 import pytest
 
-from shiny import App, render, req, ui
+from shiny import App, Session, render, req, ui
 from shiny._connection import MockConnection
+from shiny._namespaces import Root
+from shiny._utils import run_coro_sync
 from shiny.reactive import Value, calc, effect, event, flush, invalidate_later, isolate
-from shiny.reactive._core import ReactiveWarning
+from shiny.reactive._core import Context, ReactiveDomain, ReactiveWarning
+from shiny.reactive._reactives import Effect_
 from shiny.types import ActionButtonValue, SilentException
 
 from .mocktime import MockTime
@@ -808,6 +812,131 @@ async def test_invalidate_later_invalidation():
         assert obs1._exec_count == 2
 
 
+@pytest.mark.asyncio
+async def test_invalidate_later_shared_timer():
+    from shiny.reactive import on_flushed
+    from shiny.reactive._core import _timer_scheduler
+
+    mock_time = MockTime()
+    with mock_time():
+        stop = Value(False)
+        effects: list[Effect_] = []
+        for _ in range(20):
+
+            @effect()
+            def obs():
+                if not stop():
+                    invalidate_later(1)
+
+            effects.append(obs)
+
+        await flush()
+        tasks_before = len(asyncio.all_tasks())
+        # All of the timers wait in a single task
+        assert _timer_scheduler._n_live == 20
+        assert _timer_scheduler._task is not None
+
+        flushes = 0
+
+        async def count_flush():
+            nonlocal flushes
+            flushes += 1
+
+        unsub = on_flushed(count_flush)
+        await mock_time.advance_time(1)
+        unsub()
+        # Timers that are due together are fired with a single flush
+        assert [obs._exec_count for obs in effects] == [2] * 20
+        assert flushes == 1
+        assert len(asyncio.all_tasks()) == tasks_before
+
+        # When every timer is cancelled, the task exits
+        stop.set(True)
+        await flush()
+        assert _timer_scheduler._n_live == 0
+        assert _timer_scheduler._task is None
+        await mock_time.advance_time(10)
+        assert [obs._exec_count for obs in effects] == [3] * 20
+
+
+@pytest.mark.asyncio
+async def test_invalidate_later_earlier_deadline():
+    # A timer that is due before the one the scheduler is waiting for still fires on
+    # time
+    mock_time = MockTime()
+    with mock_time():
+        fired: list[str] = []
+
+        @effect()
+        def slow():
+            invalidate_later(10)
+            fired.append("slow")
+
+        await flush()
+
+        @effect()
+        def fast():
+            invalidate_later(1)
+            fired.append("fast")
+
+        await flush()
+        await mock_time.advance_time(1)
+        assert fired == ["slow", "fast", "fast"]
+        await mock_time.advance_time(9)
+        assert fired.count("slow") == 2
+        assert fired.count("fast") == 11
+        slow.destroy()
+        fast.destroy()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_later_cancel_many_while_waiting():
+    # Cancelling enough timers compacts the scheduler's heap while its task is
+    # waiting; timers scheduled afterwards must still fire
+    mock_time = MockTime()
+    with mock_time():
+        fired: list[str] = []
+
+        def one_shot(name: str, delay: float):
+            @effect()
+            def obs():
+                if name in fired:
+                    return
+                if obs._exec_count > 1:
+                    fired.append(name)
+                    return
+                invalidate_later(delay)
+
+            return obs
+
+        a = one_shot("a", 0.2)
+        await flush()
+
+        stop = Value(False)
+        cancelled: list[Effect_] = []
+        for _ in range(200):
+
+            @effect()
+            def obs():
+                if not stop():
+                    invalidate_later(5)
+
+            cancelled.append(obs)
+
+        await flush()
+        stop.set(True)
+        await flush()
+
+        b = one_shot("b", 0.4)
+        await flush()
+
+        await mock_time.advance_time(0.8)
+        assert fired == ["a", "b"]
+
+        for obs in (a, b, *cancelled):
+            obs.destroy()
+
+
 @pytest.mark.asyncio
 async def test_mock_time():
     mock_time = MockTime()
@@ -1568,3 +1697,311 @@ def test_event_effect_stacked_warns_only_once():
 
     assert len(w) == 1
     assert w[0].filename == __file__
+
+
+# ======================================================================
+# Reactive domains
+# ======================================================================
+@pytest.mark.asyncio
+async def test_flush_drains_only_pending_domains():
+    domain_a = ReactiveDomain("a")
+    domain_b = ReactiveDomain("b")
+    ran: list[str] = []
+
+    async def on_flushed_a() -> None:
+        ran.append("flushed a")
+
+    async def on_flushed_b() -> None:
+        ran.append("flushed b")
+
+    domain_a.on_flushed(on_flushed_a)
+    domain_b.on_flushed(on_flushed_b)
+
+    async def run_ctx() -> None:
+        ran.append("ctx a")
+
+    ctx = Context(domain_a)
+    ctx.on_flush(run_ctx)
+    ctx.add_pending_flush(0)
+    assert domain_a.needs_flush()
+    assert not domain_b.needs_flush()
+
+    await flush()
+    assert ran == ["ctx a", "flushed a"]
+    assert not domain_a.needs_flush()
+
+    # An explicit flush request marks a domain as pending even with no contexts.
+    domain_b.request_flush()
+    await flush()
+    assert ran == ["ctx a", "flushed a", "flushed b"]
+
+
+@pytest.mark.asyncio
+async def test_flush_defers_domain_whose_lock_is_held():
+    domain = ReactiveDomain("busy")
+    ran: list[str] = []
+
+    async def run_ctx() -> None:
+        ran.append("ran")
+
+    ctx = Context(domain)
+    ctx.on_flush(run_ctx)
+
+    async with domain.lock:
+        ctx.add_pending_flush(0)
+        await flush()
+        # The holder of the lock is mid-update; don't flush out from under it.
+        assert ran == []
+
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert ran == ["ran"]
+
+
+def _domain_session(domain: ReactiveDomain) -> Session:
+    """A bare stand-in session whose effects schedule on `domain`."""
+
+    class DomainSession:
+        ns = Root
+        _reactive_domain = domain
+
+        def is_stub_session(self) -> bool:
+            return False
+
+        def on_ended(self, fn: object) -> Callable[[], None]:
+            return lambda: None
+
+        def on_destroy(self, fn: object) -> None:
+            pass
+
+        def _increment_busy_count(self) -> None:
+            pass
+
+        def _decrement_busy_count(self) -> None:
+            pass
+
+    return cast(Session, DomainSession())
+
+
+@pytest.mark.asyncio
+async def test_concurrent_flush_overlaps_same_priority_effects():
+    domain = ReactiveDomain("concurrent", flush_mode="concurrent")
+    session = _domain_session(domain)
+    a_started = asyncio.Event()
+    b_started = asyncio.Event()
+
+    # Each effect waits for the other one to start. Run sequentially, this would
+    # never finish.
+    @effect(session=session)
+    async def a():
+        a_started.set()
+        await b_started.wait()
+
+    @effect(session=session)
+    async def b():
+        b_started.set()
+        await a_started.wait()
+
+    await asyncio.wait_for(flush(), timeout=5)
+    assert a._exec_count == 1
+    assert b._exec_count == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_flush_respects_priority():
+    domain = ReactiveDomain("concurrent", flush_mode="concurrent")
+    session = _domain_session(domain)
+    log: list[str] = []
+
+    @effect(session=session, priority=0)
+    async def low():
+        log.append("low start")
+        await asyncio.sleep(0)
+        log.append("low end")
+
+    @effect(session=session, priority=1)
+    async def high_1():
+        log.append("high start")
+        await asyncio.sleep(0.01)
+        log.append("high end")
+
+    @effect(session=session, priority=1)
+    async def high_2():
+        log.append("high start")
+        await asyncio.sleep(0)
+        log.append("high end")
+
+    await flush()
+    assert log == ["high start", "high start", "high end", "high end"] + [
+        "low start",
+        "low end",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_flush_max_concurrency():
+    domain = ReactiveDomain("concurrent", flush_mode="concurrent", max_concurrency=2)
+    session = _domain_session(domain)
+    running = 0
+    max_running = 0
+
+    def make_effect():
+        @effect(session=session)
+        async def _():
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+    for _ in range(6):
+        make_effect()
+
+    await flush()
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_effects_share_async_calc_update():
+    domain = ReactiveDomain("concurrent", flush_mode="concurrent")
+    session = _domain_session(domain)
+    v = Value(1)
+    calc_runs = 0
+    results: list[int] = []
+
+    @calc(session=session)
+    async def slow_calc() -> int:
+        nonlocal calc_runs
+        calc_runs += 1
+        await asyncio.sleep(0.01)
+        return v() * 10
+
+    def make_effect():
+        @effect(session=session)
+        async def _():
+            results.append(await slow_calc())
+
+    for _ in range(3):
+        make_effect()
+
+    await flush()
+    assert calc_runs == 1
+    assert results == [10, 10, 10]
+
+    v.set(2)
+    await flush()
+    assert calc_runs == 2
+    assert results[3:] == [20, 20, 20]
+
+
+@pytest.mark.asyncio
+async def test_sync_calc_and_effect_fast_path(monkeypatch: pytest.MonkeyPatch):
+    # With OpenTelemetry off, sync calcs and effects run without coroutines
+    from shiny import _utils
+
+    def no_coro(*args: object) -> None:
+        raise AssertionError("run_coro_sync() shouldn't be called")
+
+    monkeypatch.setattr(_utils, "run_coro_sync", no_coro)
+    monkeypatch.setattr(
+        "shiny.reactive._reactives.is_otel_tracing_enabled", lambda: False
+    )
+
+    v = Value(1)
+    calc_runs = 0
+
+    @calc()
+    def base() -> int:
+        nonlocal calc_runs
+        calc_runs += 1
+        if v() < 0:
+            raise ValueError("negative")
+        return v()
+
+    @calc()
+    def doubled() -> int:
+        return base() * 2
+
+    results: list[int] = []
+
+    @effect()
+    def _():
+        results.append(doubled() + base())
+
+    async def no_fn() -> None:
+        raise AssertionError("The async wrapper shouldn't be called")
+
+    _._fn = no_fn
+
+    await flush()
+    assert results == [3]
+    assert calc_runs == 1
+
+    v.set(2)
+    await flush()
+    assert results == [3, 6]
+    assert calc_runs == 2
+
+    v.set(-1)
+    with isolate():
+        with pytest.raises(ValueError, match="negative"):
+            doubled()
+    # The error is kept, like the value, until the calc is invalidated
+    with isolate():
+        with pytest.raises(ValueError, match="negative"):
+            base()
+    assert calc_runs == 3
+
+
+def test_sync_calc_uses_coroutine_when_tracing():
+    from .otel_helpers import patch_otel_tracing_state
+
+    @calc()
+    def one() -> int:
+        return 1
+
+    with patch_otel_tracing_state(tracing_enabled=True):
+        with patch("shiny._utils.run_coro_sync", wraps=run_coro_sync) as mock_run:
+            with isolate():
+                assert one() == 1
+            mock_run.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_reactives_are_compact():
+    v = Value(1)
+
+    @calc()
+    def doubled() -> int:
+        """Double it."""
+        return v() * 2
+
+    @effect()
+    def _():
+        """Read it."""
+        doubled()
+
+    # No instance `__dict__`, but calcs and effects still take the function's name
+    # and docstring, and the classes keep their own
+    for obj in (v, doubled, _, Context(), v._value_dependents):
+        assert not hasattr(obj, "__dict__")
+    assert (doubled.__name__, doubled.__doc__) == ("doubled", "Double it.")
+    assert (_.__name__, _.__doc__) == ("_", "Read it.")
+    assert Effect_.__doc__ is not None and "side effect" in Effect_.__doc__
+
+    # Nothing is allocated until it's needed
+    ctx = Context()
+    assert ctx._invalidate_callbacks is None and ctx._flush_callbacks is None
+    ctx.invalidate()
+    await ctx.execute_flush_callbacks()
+    assert v._value_dependents._dependents is None
+    assert _._invalidate_callbacks is None
+
+    await flush()
+    deps = v._value_dependents._dependents
+    assert deps is not None and len(deps) == 1
+    # Each dependent is removed when its context is invalidated
+    v.set(2)
+    assert deps == {}
+    await flush()
+    assert len(deps) == 1
@@ -1,6 +1,7 @@
 from typing import Any, Callable, cast
 
 import pandas as pd
+import polars as pl
 import pytest
 from htmltools import TagChild, TagList
 
@@ -165,3 +166,53 @@ async def test_update_cell_value_assertions():
             with pytest.raises(ValueError) as e:
                 await df.update_cell_value("a", row=-1, col=0)
             assert "`row` to be greater than" in str(e.value)
+
+
+@pytest.mark.parametrize("constructor", [pd.DataFrame, pl.DataFrame])
+def test_cell_patches_are_applied_incrementally(constructor: Any):
+    data = constructor({"a": [1, 2, 3], "b": ["x", "y", "z"], "c": [0.5, 1.5, 2.5]})
+
+    @render.data_frame
+    def df():
+        return data
+
+    df._session = test_session
+
+    with session_context(test_session):
+        with reactive.isolate():
+            df._value.set(render.DataGrid(data))
+            cell_patch_map = df._cell_patch_map()
+
+            df._set_cell_patch_map_patches(
+                [{"row_index": 0, "column_index": 0, "value": 10}]
+            )
+            first = df._nw_data_patched()
+            assert first.rows() == [(10, "x", 0.5), (2, "y", 1.5), (3, "z", 2.5)]
+
+            df._set_cell_patch_map_patches(
+                [
+                    {"row_index": 2, "column_index": 1, "value": "Z"},
+                    {"row_index": 2, "column_index": 1, "value": "ZZ"},
+                ]
+            )
+            assert df._cell_patch_delta == {
+                (2, 1): {"row_index": 2, "column_index": 1, "value": "ZZ"}
+            }
+            second = df._nw_data_patched()
+            assert second.rows() == [(10, "x", 0.5), (2, "y", 1.5), (3, "ZZ", 2.5)]
+            assert df._cell_patch_delta == {}
+
+            # The map is updated in place, and the patched data is reused
+            assert df._cell_patch_map() is cell_patch_map
+            assert len(df.cell_patches()) == 2
+            assert first.rows()[2] == (3, "z", 2.5)
+            # The original data is never modified
+            assert as_data_frame(data).rows() == [
+                (1, "x", 0.5),
+                (2, "y", 1.5),
+                (3, "z", 2.5),
+            ]
+
+            # New data starts over
+            df._reset_cell_patches()
+            assert df._nw_data_patched().rows() == as_data_frame(data).rows()
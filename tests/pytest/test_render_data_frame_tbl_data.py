@@ -246,7 +246,8 @@ def test_serialize_frame(df_f: IntoDataFrame):
 
     with session_context(test_session):
         res = serialize_frame(df_nw)
-    assert res == {
+    # The rows are pre-encoded JSON
+    assert {**res, "data": res["data"].loads()} == {
         "columns": [
             "num",
             "chr",
@@ -317,6 +318,28 @@ def test_serialize_frame(df_f: IntoDataFrame):
     }
 
 
+@pytest.mark.parametrize("constructor", [pd.DataFrame, pl.DataFrame])
+def test_serialize_frame_missing_values(constructor: Any):
+    df = as_data_frame(
+        constructor(
+            {
+                "int": [1, None, 3],
+                "float": [1.5, None, float("nan")],
+                "bool": [True, None, False],
+                "str": ["a", None, "c"],
+            }
+        )
+    )
+
+    # Each row is built from the columns, with missing values (and `NaN`) as `null`
+    res = serialize_frame(df)
+    assert res["data"].loads() == [
+        [1, 1.5, True, "a"],
+        [None, None, None, None],
+        [3, None, False, "c"],
+    ]
+
+
 def test_serialize_frame_numeric_column_names():
     # Regression test: numeric column names (e.g. `0`, `1`) previously raised in
     # serialize_frame because `data[col_name]` was interpreted as positional/row
@@ -328,7 +351,7 @@ def test_serialize_frame_numeric_column_names():
 
     assert res["columns"] == [0, 1]
     assert [hint["type"] for hint in res["typeHints"]] == ["string", "numeric"]
-    assert res["data"] == [["a", 1], ["b", 2], ["c", 3]]
+    assert res["data"].loads() == [["a", 1], ["b", 2], ["c", 3]]
 
 
 def test_apply_frame_patches_numeric_column_names():
@@ -416,7 +439,7 @@ def test_serialize_frame_empty_column_name(empty_col_index: int):
         res = serialize_frame(as_data_frame(df))
 
     assert res["columns"] == names
-    assert res["data"] == [[1, 3, 5], [2, 4, 6]]
+    assert res["data"].loads() == [[1, 3, 5], [2, 4, 6]]
 
 
 def test_subset_frame(df_f: IntoDataFrame):
@@ -0,0 +1,128 @@
+"""Tests for the search index behind `update_selectize(server=True)`."""
+
+from __future__ import annotations
+
+import itertools
+import json
+from typing import Any, Literal, Optional, cast
+from urllib.parse import urlencode
+
+import pytest
+from starlette.requests import Request
+from starlette.responses import Response
+
+from shiny import App, ui
+from shiny._connection import MockConnection
+from shiny.session import session_context
+from shiny.ui._selectize_index import (
+    SearchField,
+    SelectizeSearchIndex,
+    selectize_search_index,
+)
+
+CHOICES: Any = {
+    "Fruit": {"apple": "Apple", "banana": "Banana", "cherry": "Red Cherry"},
+    "Vegetables": {"carrot": "Carrot", "pea": "Green Pea", "leek": "Leek"},
+    "kiwi": "Kiwi",
+    "red-pepper": "Red Pepper",
+}
+
+
+def _reference_search(
+    index: SelectizeSearchIndex,
+    keywords: set[str],
+    fields: list[SearchField],
+    conjunction: Literal["and", "or"],
+) -> list[int]:
+    # The linear scan that the index replaces
+    test = any if conjunction == "or" else all
+    res: list[int] = []
+    for i, choice in enumerate(index.choices):
+        for f in fields:
+            val = cast(Optional[str], choice.get(f, None))
+            if val is not None and test([x in val.lower() for x in keywords]):
+                res.append(i)
+                break
+    return res
+
+
+@pytest.mark.parametrize("conjunction", ["and", "or"])
+@pytest.mark.parametrize(
+    "query", ["", "a", "red", "red ch", "RED PE", "e  a ", "fruit", "zzz", "k"]
+)
+def test_search_matches_linear_scan(query: str, conjunction: Literal["and", "or"]):
+    index = SelectizeSearchIndex(CHOICES)
+    keywords = set(query.lower().split(" "))
+    all_fields: list[SearchField] = ["label", "value", "optgroup"]
+    for n in (1, 2, 3):
+        for fields in itertools.permutations(all_fields, n):
+            assert list(
+                index.search(keywords, fields=list(fields), conjunction=conjunction)
+            ) == _reference_search(index, keywords, list(fields), conjunction)
+
+
+def test_search_is_lazy():
+    index = SelectizeSearchIndex([f"item {i}" for i in range(100_000)])
+    matches = index.search({"item"})
+    assert [next(matches) for _ in range(3)] == [0, 1, 2]
+
+
+def test_with_values():
+    index = SelectizeSearchIndex(CHOICES)
+    assert [x["value"] for x in index.with_values(["kiwi", "banana", "nope"])] == [
+        "banana",
+        "kiwi",
+    ]
+
+
+def test_search_index_is_shared():
+    choices = ["a", "b", "c"]
+    index = selectize_search_index(choices)
+    assert selectize_search_index(choices) is index
+    # Equal choices share an index, whatever object they're in
+    assert selectize_search_index(("a", "b", "c")) is index
+    assert selectize_search_index({"a": "a", "b": "b", "c": "c"}) is index
+    assert selectize_search_index({"a": "A", "b": "b", "c": "c"}) is not index
+    assert selectize_search_index({"g": {"a": "a", "b": "b", "c": "c"}}) is not index
+
+    # A list that has since been modified in place gets a new index, even if its
+    # length is unchanged
+    assert list(index.search({"c"})) == [2]
+    choices[2] = "d"
+    edited = selectize_search_index(choices)
+    assert edited is not index
+    assert list(edited.search({"c"})) == []
+    assert list(edited.search({"d"})) == [2]
+    choices.append("e")
+    assert len(selectize_search_index(choices)) == 4
+
+
+def _selectize_route(**kwargs: object):
+    app = App(ui.page_fluid(), None)
+    session = app._create_session(MockConnection())
+    with session_context(session):
+        ui.update_selectize("x", server=True, **kwargs)  # pyright: ignore
+    route = session._dynamic_routes["update_selectize_x"]
+
+    def query(**params: str) -> list[str]:
+        request = Request({"type": "http", "query_string": urlencode(params).encode()})
+        res = route(request)
+        assert isinstance(res, Response)
+        return [x["value"] for x in json.loads(bytes(res.body))]
+
+    return query
+
+
+def test_update_selectize_server_route():
+    query = _selectize_route(choices=CHOICES, selected="kiwi")
+    assert query(query="red") == ["cherry", "red-pepper", "kiwi"]
+    assert query(query="red", field='["value"]') == ["red-pepper", "kiwi"]
+    assert query(query="a e", conju="or", maxop="3") == [
+        "apple",
+        "banana",
+        "cherry",
+        "kiwi",
+    ]
+    assert query(query="a e", conju="and") == ["apple", "pea", "kiwi"]
+
+    assert _selectize_route(choices=None)() == []
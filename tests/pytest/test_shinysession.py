@@ -2,13 +2,19 @@
 
 import asyncio
 import json
+from typing import Any
 
 import pytest
 
-from shiny import App, Inputs, Outputs, Session, module, ui
+from shiny import App, Inputs, Outputs, Session, module, render, ui
 from shiny._connection import MockConnection
 from shiny.express._stub_session import ExpressStubSession
 from shiny.reactive import effect, flush, isolate
+from shiny.session._session import (
+    AppSession,
+    OutBoundFlushStats,
+    OutBoundMessageBuffer,
+)
 from shiny.types import SilentException
 
 
@@ -147,3 +153,355 @@ async def test_input_nonexistent_deps():
     await flush()
     assert result is True
     assert o1._exec_count == 2
+
+
+@pytest.mark.asyncio
+async def test_sessions_flush_in_separate_domains():
+    # A session that is stuck in a slow flush must not hold up other sessions.
+    release = asyncio.Event()
+    b_values: list[int] = []
+
+    def server(input: Inputs, output: Outputs, session: Session):
+        @effect
+        async def _():
+            x = input.x()
+            if input.who() == "a":
+                await release.wait()
+            else:
+                b_values.append(x)
+
+    app = App(ui.TagList(), server)
+    conn_a = MockConnection()
+    conn_b = MockConnection()
+    sess_a = app._create_session(conn_a)
+    sess_b = app._create_session(conn_b)
+    assert sess_a._reactive_domain is not sess_b._reactive_domain
+
+    conn_a.cause_receive('{"method":"init","data":{"who":"a","x":0}}')
+    conn_b.cause_receive('{"method":"init","data":{"who":"b","x":0}}')
+    conn_b.cause_receive('{"method":"update","data":{"x":1}}')
+
+    task_a = asyncio.create_task(sess_a._run())
+    task_b = asyncio.create_task(sess_b._run())
+    for _ in range(100):
+        if b_values == [0, 1]:
+            break
+        await asyncio.sleep(0)
+
+    assert b_values == [0, 1]
+    assert sess_a._reactive_domain.lock.locked()
+
+    release.set()
+    conn_a.cause_disconnect()
+    conn_b.cause_disconnect()
+    await asyncio.gather(task_a, task_b)
+
+
+@pytest.mark.asyncio
+async def test_flush_only_sends_to_pending_sessions():
+    def server(input: Inputs, output: Outputs, session: Session):
+        pass
+
+    app = App(ui.TagList(), server)
+    conns = [MockConnection(), MockConnection()]
+    sent: list[list[str]] = [[], []]
+    for conn, msgs in zip(conns, sent):
+
+        async def send(message: str, msgs: list[str] = msgs) -> None:
+            msgs.append(message)
+
+        conn.send = send
+
+    sessions = [app._create_session(conn) for conn in conns]
+    for conn in conns:
+        conn.cause_receive('{"method":"init","data":{}}')
+    tasks = [asyncio.create_task(sess._run()) for sess in sessions]
+    for _ in range(20):
+        await asyncio.sleep(0)
+    n_sent_b = len(sent[1])
+
+    conns[0].cause_receive('{"method":"update","data":{"x":1}}')
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+    assert any('"values"' in msg for msg in sent[0][-1:])
+    assert len(sent[1]) == n_sent_b
+
+    for conn in conns:
+        conn.cause_disconnect()
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_flush_mode_app_default_and_session_override():
+    app = App(ui.TagList(), None)
+    app.flush_mode = "concurrent"
+    app.flush_max_concurrency = 4
+
+    sess = app._create_session(MockConnection())
+    assert sess._reactive_domain.flush_mode == "concurrent"
+    assert sess._reactive_domain.max_concurrency == 4
+
+    # Module sessions share (and configure) the root session's domain.
+    sess.make_scope("mod").set_flush_mode("sequential", max_concurrency=2)
+    assert sess._reactive_domain.flush_mode == "sequential"
+    assert sess._reactive_domain.max_concurrency == 2
+
+    with pytest.raises(ValueError):
+        sess.set_flush_mode("parallel")  # pyright: ignore[reportArgumentType]
+    with pytest.raises(ValueError):
+        sess.set_flush_mode("concurrent", max_concurrency=0)
+
+
+def _buffer_frames(*messages: dict[str, Any]) -> list[dict[str, Any]]:
+    buf = OutBoundMessageBuffer()
+    for msg in messages:
+        buf.add(msg, json.dumps(msg))
+    return [json.loads(frame) for frame in buf.take()]
+
+
+def test_outbound_buffer_only_merges_order_safe_messages():
+    recalculating: dict[str, Any] = {
+        "recalculating": {"name": "x", "status": "recalculating"}
+    }
+    recalculated: dict[str, Any] = {
+        "recalculating": {"name": "x", "status": "recalculated"}
+    }
+    binding: dict[str, Any] = {"progress": {"type": "binding", "message": {"id": "y"}}}
+    values: dict[str, Any] = {"values": {}, "inputMessages": [], "errors": {}}
+
+    # The same key can never appear twice in a frame
+    assert len(_buffer_frames(recalculating, recalculated)) == 2
+    # The client handles "values" before "recalculating", so they can't be reordered
+    assert len(_buffer_frames(recalculated, values)) == 2
+    # ...but "recalculating" after "progress" keeps the handler order. However, the
+    # client updates output state for "recalculating" before "progress".
+    assert len(_buffer_frames(binding, recalculating)) == 2
+    # "busy" only toggles page-level state, so it can join any frame
+    assert _buffer_frames(binding, {"busy": "busy"}, recalculated) == [
+        {**binding, "busy": "busy"},
+        recalculated,
+    ]
+    assert _buffer_frames({"busy": "busy"}, binding) == [{"busy": "busy", **binding}]
+    assert _buffer_frames(values, {"busy": "idle"}) == [{**values, "busy": "idle"}]
+    # Unknown message types always get their own frame
+    assert len(_buffer_frames({"busy": "idle"}, {"custom": {"a": 1}})) == 2
+
+
+def test_outbound_buffer_respects_max_bytes():
+    buf = OutBoundMessageBuffer(max_bytes=30)
+    buf.add({"busy": "busy"}, json.dumps({"busy": "busy"}))
+    assert not buf.is_full()
+    msg: dict[str, Any] = {"progress": {"type": "binding", "message": {"id": "y"}}}
+    buf.add(msg, json.dumps(msg))
+    assert buf.is_full()
+    assert len(buf.take()) == 2
+
+    stats = buf.reset_counters()
+    assert (stats.messages, stats.frames) == (2, 2)
+    assert stats.bytes == len(json.dumps({"busy": "busy"})) + len(json.dumps(msg))
+    assert buf.reset_counters().frames == 0
+
+
+async def _run_outputs_app(
+    max_bytes: int,
+) -> tuple[list[str], list[OutBoundFlushStats]]:
+    flush_stats: list[OutBoundFlushStats] = []
+
+    def server(input: Inputs, output: Outputs, session: Session):
+        assert isinstance(session, AppSession)
+        session.on_flushed(
+            lambda: flush_stats.append(session._last_flush_stats), once=False
+        )
+
+        def make_output(i: int):
+            @output(id=f"out{i}")
+            @render.text
+            def _():
+                return f"{input.x()}-{i}"
+
+        for i in range(5):
+            make_output(i)
+
+    app = App(ui.TagList(), server)
+    conn = MockConnection()
+    sent: list[str] = []
+
+    async def send(message: str) -> None:
+        sent.append(message)
+
+    conn.send = send
+    sess = app._create_session(conn)
+    sess._outbound_buffer.max_bytes = max_bytes
+    hidden = {f".clientdata_output_out{i}_hidden": False for i in range(5)}
+    conn.cause_receive(json.dumps({"method": "init", "data": {"x": 0, **hidden}}))
+    task = asyncio.create_task(sess._run())
+    for _ in range(100):
+        await asyncio.sleep(0)
+    conn.cause_disconnect()
+    await task
+    return sent, flush_stats
+
+
+def _client_order(frames: list[str]) -> list[str]:
+    # The order in which the client handles the (non-busy) messages in the frames
+    handler_order = ["values", "errors", "inputMessages", "progress", "recalculating"]
+    handled: list[str] = []
+    for frame in frames:
+        msg = json.loads(frame)
+        for key in sorted(
+            msg, key=lambda k: handler_order.index(k) if k in handler_order else -1
+        ):
+            if key not in ("busy", "config"):
+                handled.append(json.dumps({key: msg[key]}))
+    return handled
+
+
+@pytest.mark.asyncio
+async def test_outbound_buffer_coalesces_session_messages():
+    unbuffered, _ = await _run_outputs_app(max_bytes=0)
+    buffered, flush_stats = await _run_outputs_app(max_bytes=64 * 1024)
+
+    assert len(buffered) < len(unbuffered)
+    assert _client_order(buffered) == _client_order(unbuffered)
+
+    # The first flush sends the config message, 5 pairs of recalculating messages,
+    # busy/idle, and the values.
+    stats = flush_stats[0]
+    assert stats.messages == 14
+    assert stats.frames == 12
+    assert stats.bytes == sum(len(frame) for frame in buffered[:12])
+
+
+async def _run_queued_updates(coalesce: bool) -> tuple[AppSession, list[int], int]:
+    seen: list[int] = []
+    clicks = 0
+
+    def server(input: Inputs, output: Outputs, session: Session):
+        @effect
+        def _():
+            seen.append(input.x())
+
+        @effect
+        def _():
+            nonlocal clicks
+            input.btn()
+            clicks += 1
+
+    app = App(ui.TagList(), server)
+    app.coalesce_input_updates = coalesce
+    conn = MockConnection()
+    sess = app._create_session(conn)
+    conn.cause_receive('{"method":"init","data":{"x":0,"btn:shiny.action":0}}')
+    # The client sends these while the server is busy; they queue up
+    for x in range(1, 11):
+        conn.cause_receive(json.dumps({"method": "update", "data": {"x": x}}))
+    # Clicks are events, so they're never merged
+    for n in (1, 2):
+        conn.cause_receive(
+            json.dumps({"method": "update", "data": {"btn:shiny.action": n}})
+        )
+    conn.cause_receive(json.dumps({"method": "update", "data": {"x": 11}}))
+    conn.cause_disconnect()
+    await sess._run()
+    return sess, seen, clicks
+
+
+@pytest.mark.asyncio
+async def test_coalesce_input_updates():
+    sess, seen, clicks = await _run_queued_updates(coalesce=True)
+    # The first update merges the rest of the x updates and the first click, and then
+    # the second click starts a new batch, which the last x update is merged into
+    assert seen == [0, 10, 11]
+    assert clicks == 3
+    assert sess._coalesced_updates == 11
+
+    sess, seen, clicks = await _run_queued_updates(coalesce=False)
+    assert seen == list(range(12))
+    assert clicks == 3
+    assert sess._coalesced_updates == 0
+
+    # Off by default
+    assert App(ui.TagList(), None).coalesce_input_updates is False
+
+    # Module sessions configure the root session
+    sess.make_scope("mod").set_coalesce_input_updates(True)
+    assert sess._coalesce_input_updates is True
+
+
+def test_merge_update():
+    from shiny.session._session import _merge_update
+
+    data: dict[str, object] = {"x": 1, "y": [1, 2]}
+    assert _merge_update(data, {"x": 2, "z": 3})
+    assert data == {"x": 2, "y": [1, 2], "z": 3}
+
+    # A value sent again unchanged is a `priority: "event"` input
+    assert not _merge_update(data, {"x": 4, "y": [1, 2]})
+    assert data == {"x": 2, "y": [1, 2], "z": 3}
+
+    data = {"btn:shiny.action": 1}
+    assert not _merge_update(data, {"btn:shiny.action": 2})
+    data = {"task:bslib.taskbutton": {"value": 1, "autoReset": True}}
+    assert not _merge_update(data, {"task:bslib.taskbutton": {"value": 2}})
+
+    # Values that carry `priority: "event"` are never merged
+    data = {"x": 1}
+    assert not _merge_update(data, {"y": {"value": 1, "priority": "event"}})
+    assert data == {"x": 1}
+
+
+@pytest.mark.asyncio
+async def test_manage_hidden_only_checks_changed_outputs():
+    def server(input: Inputs, output: Outputs, session: Session):
+        for i in range(50):
+
+            @output(id=f"out{i}")
+            @render.text
+            def _():
+                return str(input.x())
+
+    app = App(ui.TagList(), server)
+    conn = MockConnection()
+    sess = app._create_session(conn)
+
+    checked: list[str] = []
+    is_hidden = sess._is_hidden
+
+    def tracking_is_hidden(name: str) -> bool:
+        checked.append(name)
+        return is_hidden(name)
+
+    sess._is_hidden = tracking_is_hidden
+
+    init_data: dict[str, object] = {"x": 0}
+    init_data.update({f".clientdata_output_out{i}_hidden": False for i in range(50)})
+    conn.cause_receive(json.dumps({"method": "init", "data": init_data}))
+    task = asyncio.create_task(sess._run())
+    while len(sess.output._outputs) < 50:
+        await asyncio.sleep(0)
+    await asyncio.sleep(0.05)
+    assert not any(info.effect._suspended for info in sess.output._outputs.values())
+
+    # An ordinary input doesn't cause the outputs' hidden state to be checked
+    checked.clear()
+    conn.cause_receive('{"method":"update","data":{"x":1}}')
+    await asyncio.sleep(0.05)
+    assert checked == []
+
+    # Hiding an output only checks (and suspends) that output
+    conn.cause_receive(
+        '{"method":"update","data":{".clientdata_output_out3_hidden":true}}'
+    )
+    for _ in range(500):
+        if checked:
+            break
+        await asyncio.sleep(0.01)
+    assert checked == ["out3"]
+    suspended = [
+        name for name, info in sess.output._outputs.items() if info.effect._suspended
+    ]
+    assert suspended == ["out3"]
+
+    conn.cause_disconnect()
+    await task
@@ -0,0 +1,198 @@
+"""Tests for caching the page rendered by a function `ui` (`App.ui_cache_key`)."""
+
+from __future__ import annotations
+
+import json
+import re
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pytest
+from htmltools import HTMLDependency
+from starlette.requests import Request
+
+from shiny import App, Inputs, ui
+from shiny._utils import private_random_id
+from shiny.bookmark._bookmark_state import shiny_bookmarks_folder_name
+from shiny.reactive import DiskCache, MemoryCache
+
+from ._asgi_utils import get
+
+
+def make_app(bookmark_store: Any = "disable") -> tuple[App, list[str]]:
+    calls: list[str] = []
+
+    def app_ui(request: Request):
+        calls.append(request.url.query)
+        return ui.page_fluid(
+            ui.input_text("txt", "Text", value="default"),
+            ui.p(f"Group: {request.headers.get('x-group', 'none')}"),
+        )
+
+    def server(input: Inputs):
+        pass
+
+    return App(app_ui, server, bookmark_store=bookmark_store), calls
+
+
+@pytest.mark.asyncio
+async def test_ui_not_cached_by_default():
+    app, calls = make_app()
+    for _ in range(2):
+        resp = await get(app)
+        assert resp.status == 200
+        assert "etag" not in resp.headers
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_ui_cache_key_and_etag():
+    app, calls = make_app()
+    app.ui_cache_key = lambda request: request.headers.get("x-group")
+
+    first = await get(app, x_group="a")
+    assert first.status == 200
+    assert "Group: a" in first.text
+    assert first.headers["cache-control"] == "private, no-cache"
+    etag = first.headers["etag"]
+
+    again = await get(app, x_group="a")
+    assert again.text == first.text
+    assert again.headers["etag"] == etag
+    assert len(calls) == 1
+
+    # A different key gets its own page
+    other = await get(app, x_group="b")
+    assert "Group: b" in other.text
+    assert other.headers["etag"] != etag
+    assert len(calls) == 2
+
+    resp = await get(app, x_group="a", if_none_match=etag)
+    assert resp.status == 304
+    assert resp.text == ""
+    assert resp.headers["etag"] == etag
+    resp = await get(app, x_group="b", if_none_match=etag)
+    assert resp.status == 200
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_ui_cache_bounds():
+    app, calls = make_app()
+
+    async def key(request: Request) -> object:
+        return request.headers.get("x-group")
+
+    app.ui_cache_key = key
+    app.ui_cache = MemoryCache(max_entries=1)
+    await get(app, x_group="a")
+    await get(app, x_group="b")
+    await get(app, x_group="a")
+    assert len(calls) == 3
+
+    app.ui_cache = MemoryCache(ttl=0)
+    await get(app, x_group="a")
+    await get(app, x_group="a")
+    assert len(calls) == 5
+
+
+@pytest.mark.asyncio
+async def test_ui_cache_with_bookmarks():
+    app, calls = make_app("url")
+    # A key that ignores the query string
+    app.ui_cache_key = lambda request: "all"
+
+    plain = await get(app)
+    await get(app, query="foo=bar")
+    assert len(calls) == 1
+
+    # Restoring URL-encoded state renders (and caches) the page for that state
+    state = '_inputs_&txt="restored"'
+    restored = await get(app, query=state)
+    assert 'value="restored"' in restored.text
+    assert restored.headers["etag"] != plain.headers["etag"]
+    await get(app, query=state)
+    assert len(calls) == 2
+    assert 'value="default"' in (await get(app)).text
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_ui_cache_bypassed_for_server_bookmarks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("SHINY_PORT", raising=False)
+    id = private_random_id(prefix="", bytes=8)
+    state_dir = tmp_path / shiny_bookmarks_folder_name / id
+    state_dir.mkdir(parents=True)
+    (state_dir / "input.json").write_text(json.dumps({"txt": "saved"}))
+
+    app, calls = make_app("server")
+    app.ui_cache_key = lambda request: "all"
+
+    for _ in range(2):
+        resp = await get(app, query=f"_state_id_={id}")
+        assert 'value="saved"' in resp.text
+        assert "etag" not in resp.headers
+    assert len(calls) == 2
+    # Saved state can change, so it's never served from the cache
+    (state_dir / "input.json").write_text(json.dumps({"txt": "changed"}))
+    resp = await get(app, query=f"_state_id_={id}")
+    assert 'value="changed"' in resp.text
+
+
+@pytest.mark.asyncio
+async def test_ui_cache_shared_between_apps(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(
+        "shiny._dependency_files.default_cache_dir", lambda: str(tmp_path / "deps")
+    )
+    cache = DiskCache(tmp_path / "pages")
+    app1, calls1 = make_app()
+    app1.ui_cache_key = lambda request: "all"
+    app1.ui_cache = cache
+    page = await get(app1)
+    assert len(calls1) == 1
+
+    # Another process (or a restarted server) gets the page from the cache, and must
+    # still serve the page's dependencies
+    app2, calls2 = make_app()
+    app2.ui_cache_key = lambda request: "all"
+    app2.ui_cache = cache
+    resp = await get(app2)
+    assert resp.text == page.text
+    assert calls2 == []
+    hrefs = re.findall(r'(?:href|src)="(lib/[^"]+\.(?:css|js))"', resp.text)
+    assert any("bootstrap" in href for href in hrefs)
+    for href in hrefs:
+        assert (await get(app2, path="/" + href)).status == 200
+
+    # A page whose dependency files are gone (like a theme compiled to a temporary
+    # directory by the other process) is rendered again
+    calls: list[str] = []
+
+    def themed_ui(request: Request):
+        calls.append(request.url.query)
+        theme_dir = tmp_path / f"theme{len(calls)}"
+        theme_dir.mkdir()
+        (theme_dir / "theme.css").write_text("body { color: red; }")
+        dep = HTMLDependency(
+            "my-theme",
+            "1.0",
+            source={"subdir": str(theme_dir)},
+            stylesheet={"href": "theme.css"},
+        )
+        return ui.page_fluid(dep, "Themed")
+
+    themed = [App(themed_ui, None) for _ in range(2)]
+    for app in themed:
+        app.ui_cache_key = lambda request: "themed"
+        app.ui_cache = cache
+    await get(themed[0])
+    shutil.rmtree(tmp_path / "theme1")
+    await get(themed[1])
+    assert len(calls) == 2
+    assert (await get(themed[1], path="/lib/my-theme-1.0/theme.css")).status == 200